@@ -107,10 +107,14 @@ setup(
     # additional package data files that goes into the package itself
     package_data = {
             '': ['*.json'],
+            'genie.libs.parser': ['parsers_routing/*.json'],
     },
 
     # console entry point
     entry_points = {
+        'console_scripts': [
+            'genie-parse-bulk = genie.libs.parser.utils.bulk_parse:main',
+        ],
     },
 
     # package dependencies
@@ -22,6 +22,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import ArpRecord
+from genie.libs.parser.utils.interning import Interner
 
 
 # =============================================
@@ -73,62 +76,90 @@ class ShowArp(ShowArpSchema):
     cli_command = ['show arp','show arp vrf {vrf}','show arp vrf {vrf} {intf_or_ip}','show arp {intf_or_ip}']
     exclude = ['age']
 
+    patterns = Patterns(
+        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
+        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
+        p1=r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
+           '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$',
+    )
+
+    def _command(self, vrf='', intf_or_ip=''):
+        cmd = self.cli_command[0]
+        if vrf and not intf_or_ip:
+            cmd = self.cli_command[1].format(vrf=vrf)
+        if vrf and intf_or_ip:
+            cmd = self.cli_command[2].format(vrf=vrf,intf_or_ip=intf_or_ip)
+        if not vrf and intf_or_ip:
+            cmd = self.cli_command[3].format(intf_or_ip=intf_or_ip)
+        return cmd
+
     def cli(self, vrf='', intf_or_ip='', cmd=None, output=None):
         if output is None:
             if not cmd:
-                cmd = self.cli_command[0]
-                if vrf and not intf_or_ip:
-                    cmd = self.cli_command[1].format(vrf=vrf)
-                if vrf and intf_or_ip:
-                    cmd = self.cli_command[2].format(vrf=vrf,intf_or_ip=intf_or_ip)
-                if not vrf and intf_or_ip:
-                    cmd = self.cli_command[3].format(intf_or_ip=intf_or_ip)
+                cmd = self._command(vrf=vrf, intf_or_ip=intf_or_ip)
 
             out = self.device.execute(cmd)
         else:
             out = output
 
-        # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
-        # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-        p1 = re.compile(r'^(?P<protocol>\w+) +(?P<address>[\d\.\:]+) +(?P<age>[\d\-]+) +'
-                         '(?P<mac>[\w\.]+) +(?P<type>\w+)( +(?P<interface>[\w\.\/\-]+))?$')
         # initial variables
         ret_dict = {}
 
-        for line in out.splitlines():
+        for record in self.parse_records(output=out):
+            address = record.ip
+            interface = record.interface
+            if interface:
+                final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
+                    interface, {}).setdefault('ipv4', {}).setdefault(
+                    'neighbors', {}).setdefault(address, {})
+
+                final_dict['ip'] = address
+                final_dict['link_layer_address'] = record.mac_address
+                final_dict['type'] = record.encap_type
+                final_dict['origin'] = record.origin
+            else:
+                final_dict = ret_dict.setdefault(
+                    'global_static_table', {}).setdefault(address, {})
+                final_dict['ip_address'] = address
+                final_dict['mac_address'] = record.mac_address
+                final_dict['encap_type'] = record.encap_type
+
+            final_dict['age'] = record.age
+            final_dict['protocol'] = record.protocol
+
+        return ret_dict
+
+    def parse_records(self, vrf='', intf_or_ip='', cmd=None, output=None):
+        """ Yield an ArpRecord per entry of the output, as it is read. The
+            parsed dict of cli is built from them.
+
+            Entries without interface are those of the global static table,
+            without origin. The type of the interface entries is encap_type.
+        """
+        if output is None:
+            if not cmd:
+                cmd = self._command(vrf=vrf, intf_or_ip=intf_or_ip)
+            output = self.device.execute(cmd)
+
+        p = self.patterns
+        # The types, ages and protocols repeat over the entries
+        intern = Interner()
+
+        for line in Common.iter_lines(output):
             line = line.strip()
 
             # Internet  192.168.234.1           -   58bf.eaff.e508  ARPA   Vlan100
             # Internet  10.169.197.93          -   fa16.3eff.b7ad  ARPA
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                group = m.groupdict()
-                address = group['address']
-                interface = group['interface']
-                if interface:
-                    final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
-                        interface, {}).setdefault('ipv4', {}).setdefault(
-                        'neighbors', {}).setdefault(address, {})
-                    
-                    final_dict['ip'] = address
-                    final_dict['link_layer_address'] = group['mac']
-                    final_dict['type'] = group['type']
-                    if group['age'] == '-':
-                        final_dict['origin'] = 'static'
-                    else:
-                        final_dict['origin'] = 'dynamic'
-                else:
-                    final_dict = ret_dict.setdefault(
-                        'global_static_table', {}).setdefault(address, {})
-                    final_dict['ip_address'] = address
-                    final_dict['mac_address'] = group['mac']
-                    final_dict['encap_type'] = group['type']
-
-                final_dict['age'] = group['age']
-                final_dict['protocol'] = group['protocol']
-                continue
-
-        return ret_dict
+                group = intern.groups(m.groupdict(), 'type', 'age', 'protocol')
+                origin = None
+                if group['interface']:
+                    origin = 'static' if group['age'] == '-' else 'dynamic'
+                yield ArpRecord(
+                    interface=group['interface'], ip=group['address'],
+                    mac_address=group['mac'], origin=origin, age=group['age'],
+                    encap_type=group['type'], protocol=group['protocol'])
 
 # =====================================
 # Parser for 'show ip arp, show ip arp vrf <vrf>'
@@ -137,16 +168,20 @@ class ShowIpArp(ShowArp):
     """Parser for 'show ip arp,  show ip arp vrf <vrf>"""
     cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 
+    def _command(self, vrf='', intf_or_ip=''):
+        if vrf:
+            return self.cli_command[1].format(vrf=vrf)
+        return self.cli_command[0]
+
     def cli(self, vrf='', output=None):
         if output is None:
-            if vrf:
-                cmd = self.cli_command[1].format(vrf=vrf)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._command(vrf=vrf))
         else:
             out = output
         return super().cli(output=out)
+
+    def parse_records(self, vrf='', output=None):
+        return super().parse_records(vrf=vrf, output=output)
 # =====================================
 # Schema for 'show ip arp summary'
 # =====================================
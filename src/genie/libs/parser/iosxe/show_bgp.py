@@ -115,6 +115,8 @@ from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
 # Parser
 from genie.libs.parser.iosxe.show_vrf import ShowVrf
+from genie.libs.parser.utils.interning import Interner
+from genie.libs.parser.utils.session import nested_parse
 
 
 # ============================================
@@ -223,6 +225,8 @@ class ShowBgpSuperParser(ShowBgpSchema):
         status_codes = ''
         prefix = ""
         origin_codes_info = origin_codes_data = ""
+        # The next hops, paths and codes repeat over the routes
+        intern = Interner()
 
         # For address family: IPv4 Unicast
         p1 = re.compile(r'^\s*For +address +family:'
@@ -312,9 +316,9 @@ class ShowBgpSuperParser(ShowBgpSchema):
                 if m.groupdict()['path_type']:
                     path_type = str(m.groupdict()['path_type'])
                 if path_type:
-                    status_codes = status_codes + path_type
+                    status_codes = intern(status_codes + path_type)
                 else:
-                    status_codes = status_codes.rstrip()
+                    status_codes = intern(status_codes.rstrip())
 
                 if m.groupdict()['prefix']:
                     prefix = str(m.groupdict()['prefix'])
@@ -337,21 +341,21 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     path_type = m.groupdict()['path_type']
 
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern(m.groupdict()['next_hop'])
 
                 if path_type:
-                    status_codes = status_codes + path_type
+                    status_codes = intern(status_codes + path_type)
                 else:
-                    status_codes = status_codes.rstrip()
+                    status_codes = intern(status_codes.rstrip())
 
                 if m.groupdict()['termination']:
                     termination = m.groupdict()['termination']
                     m3 = re.compile(r'(?: *(?P<path>[0-9\{\}\s]+))?'
                                     ' +(?P<origin_codes>(i|e|\?|\|))$').match(termination)
                     if m3 and m3.groupdict()['path']:
-                        path_info = m3.groupdict()['path']
+                        path_info = intern(m3.groupdict()['path'])
                     if m3 and m3.groupdict()['origin_codes']:
-                        origin_codes_info = m3.groupdict()['origin_codes']
+                        origin_codes_info = intern(m3.groupdict()['origin_codes'])
 
                 if m.groupdict()['metric']:
                     metric = int(m.groupdict()['metric'])
@@ -427,19 +431,19 @@ class ShowBgpSuperParser(ShowBgpSchema):
                     path_type = m.groupdict()['path_type']
 
                 if path_type:
-                    status_codes = status_codes + path_type
+                    status_codes = intern(status_codes + path_type)
                 else:
-                    status_codes = status_codes.rstrip()
+                    status_codes = intern(status_codes.rstrip())
 
                 if m.groupdict()['path']:
                     path_1 = m.groupdict()['path']
                     m3 = re.compile(r'(?: *(?P<path_inner>[0-9\{\}\s\,]+))?'
                                     ' +(?P<origin_codes_inner>(i|e|\?|\|))$').match(path_1)
                     if m3:
-                        path_data = m3.groupdict()['path_inner']
-                        origin_codes_data = m3.groupdict()['origin_codes_inner']
+                        path_data = intern(m3.groupdict()['path_inner'])
+                        origin_codes_data = intern(m3.groupdict()['origin_codes_inner'])
                 if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
+                    next_hop = intern(m.groupdict()['next_hop'])
 
                 if m.groupdict()['metric']:
                     metric = int(m.groupdict()['metric'])
@@ -1843,6 +1847,34 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         * 'show ip bgp {address_family} all summary'
     '''
 
+    def _config_commands(self, address_family=''):
+        '''Commands reading the neighbors of the vrfs from the configuration'''
+        if 'vpnv4' in address_family:
+            return ['show run | sec address-family ipv4 vrf']
+        elif 'vpnv6' in address_family:
+            return ['show run | sec address-family ipv6 vrf']
+        return ['show run | sec address-family ipv4 vrf',
+                'show run | sec address-family ipv6 vrf']
+
+    def prerequisites(self, address_family='', **kwargs):
+        ''' Commands executed besides the command of the parser.
+
+            Args:
+                address_family (`str`): the address family
+                kwargs (`dict`): the other arguments of the parser
+
+            Returns:
+                list: show vrf for a rd, the configuration for all the vrfs
+        '''
+        cmd = self._command(address_family=address_family, **kwargs)
+        commands = []
+        if 'rd' in cmd and 'summary' in cmd:
+            commands.append(ShowVrf.cli_command[0])
+        if address_family.lower() not in ['ipv4 unicast', 'ipv6 unicast'] \
+                and 'all summary' in cmd:
+            commands.extend(self._config_commands(address_family))
+        return commands
+
     def cli(self, address_family='', vrf='', rd='',  cmd='', output=None):
 
         # Init vars
@@ -1858,8 +1890,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
         show_vrf_output = None
         if ('rd' in cmd and 'summary' in cmd and
             output != '% RD does not match the default RD of any VRF'):
-            obj = ShowVrf(device=self.device)
-            show_vrf_output = obj.parse()
+            show_vrf_output = nested_parse(ShowVrf, self.device)
             # try:
             #     show_vrf_output = obj.parse()
             # except Exception:
@@ -1870,15 +1901,7 @@ class ShowBgpSummarySuperParser(ShowBgpSummarySchema):
             if ('all summary' in cmd and 
                 output != '% RD does not match the default RD of any VRF'):
 
-                if 'vpnv4' in address_family:
-                    commands_list = ['show run | sec address-family ipv4 vrf']
-                elif 'vpnv6' in address_family:
-                    commands_list = ['show run | sec address-family ipv6 vrf']
-                else:
-                    commands_list = ['show run | sec address-family ipv4 vrf',
-                                     'show run | sec address-family ipv6 vrf']
-                
-                for command in commands_list:
+                for command in self._config_commands(address_family):
                     out_vrf = self.device.execute(command)
 
                     rc1 = re.compile(r'address\-family\s+(?P<address_family>'
@@ -2295,24 +2318,29 @@ class ShowBgpSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
 
+    def _command(self, address_family='', vrf='', rd=''):
+        cmd = ''
+        if vrf:
+            if address_family:
+                cmd = self.cli_command[0].format(address_family=address_family,
+                                             vrf=vrf)
+        elif rd:
+            if address_family:
+                cmd = self.cli_command[1].format(address_family=address_family,
+                                             rd=rd)
+        elif address_family:
+            cmd = self.cli_command[2].format(address_family=address_family)
+
+        else:
+            cmd = self.cli_command[3]
+        return cmd
+
     def cli(self, address_family='', vrf='', rd='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if vrf:
-                if address_family:
-                    cmd = self.cli_command[0].format(address_family=address_family,
-                                                 vrf=vrf)
-            elif rd:
-                if address_family:
-                    cmd = self.cli_command[1].format(address_family=address_family,
-                                                 rd=rd)
-            elif address_family:
-                cmd = self.cli_command[2].format(address_family=address_family)
-
-            else:
-                cmd = self.cli_command[3]
+            cmd = self._command(address_family=address_family, vrf=vrf, rd=rd)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -2345,6 +2373,10 @@ class ShowBgpAllSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
         'bgp_table_version', 'routing_table_version', 'tbl_ver', 'up_down',
         'attribute_entries', 'dropped', 'established']
 
+    def prerequisites(self, **kwargs):
+        # The command is not given to ShowBgpSummarySuperParser, which does
+        # not execute any other command then
+        return []
 
     def cli(self, address_family='', vrf='',output=None):
 
@@ -2388,22 +2420,26 @@ class ShowIpBgpSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
 
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
-    
+
+    def _command(self, address_family='', vrf='', rd=''):
+        if address_family and rd:
+            cmd = self.cli_command[0].format(address_family=address_family,
+                                             rd=rd)
+        elif address_family and vrf:
+            cmd = self.cli_command[1].format(address_family=address_family,
+                                             vrf=vrf)
+        elif address_family:
+            cmd = self.cli_command[2].format(address_family=address_family)
+        else:
+            cmd = self.cli_command[3]
+        return cmd
+
     def cli(self, address_family='', vrf='', rd='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if address_family and rd:
-                cmd = self.cli_command[0].format(address_family=address_family,
-                                                 rd=rd)
-            elif address_family and vrf:
-                cmd = self.cli_command[1].format(address_family=address_family,
-                                                 vrf=vrf)
-            elif address_family:
-                cmd = self.cli_command[2].format(address_family=address_family)
-            else:   
-                cmd = self.cli_command[3]
+            cmd = self._command(address_family=address_family, vrf=vrf, rd=rd)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
@@ -2431,15 +2467,20 @@ class ShowIpBgpAllSummary(ShowBgpSummarySuperParser, ShowBgpSummarySchema):
                    ]
 
     exclude = ['msg_rcvd', 'msg_sent', 'up_down']
+
+    def _command(self, address_family=''):
+        if address_family:
+            cmd = self.cli_command[0].format(address_family=address_family)
+        else:
+            cmd = self.cli_command[1]
+        return cmd
+
     def cli(self, address_family='', output=None):
 
         cmd = ''
         if output is None:
             # Build command
-            if address_family:
-                cmd = self.cli_command[0].format(address_family=address_family)
-            else:
-                cmd = self.cli_command[1]
+            cmd = self._command(address_family=address_family)
             # Execute command
             show_output = self.device.execute(cmd)
         else:
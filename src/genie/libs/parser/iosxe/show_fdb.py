@@ -20,6 +20,9 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import MacRecord
+from genie.libs.parser.utils.interning import Interner
 
 
 class ShowMacAddressTableSchema(MetaParser):
@@ -59,202 +62,198 @@ class ShowMacAddressTable(ShowMacAddressTableSchema):
 
     cli_command = ['show mac address-table',
                    'show mac address-table vlan {vlan}']
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
 
-    def cli(self, vlan='', output=None):
-        if output is None:
-            # get output from device
-            if vlan:
-                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
-            else:
-                out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-
-        # initial return dictionary
-        ret_dict = mac_dict = {}
-        entry_type = entry = learn = age = ''
-
+    patterns = Patterns(
         # Total Mac Addresses for this criterion: 93
-        p1 = re.compile(r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$')
+        p1=r'^Total +Mac +Addresses +for +this +criterion: +(?P<val>\d+)$',
 
         # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
         # 20    aaaa.bbff.8888    STATIC      Drop
         # All    0100.0cff.999a    STATIC      CPU
-        p2 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
+        p2=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
 
         # Gi1/9,Gi1/10,Gi1/11,Gi1/12
         #               Router,Switch
-        p3 = re.compile(r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$')
+        p3=r'^(?P<intfs>(vPC Peer-Link)?[\w\/\,\(\)]+)$',
 
         # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
         # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
         # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
         # *  ---  0000.0000.0000    static  No           -   Router
-        p4 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
-                        r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
-                        r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$')
+        p4=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) +(?P<mac>[\w.]+)'
+           r' +(?P<entry_type>\w+) +(?P<learn>\w+) +(?P<age>[\d\-\~]+) '
+           r'+(?P<intfs>(vPC )?[\w\/\,\-\(\)\s]+)$',
 
         # 964    0000.0000.0000   dynamic ip,ipx                Router
-        p5 = re.compile(r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
-                        r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
-                        r'+(?P<protocols>[\w\,]+) '
-                        r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$')
-        
-        for line in out.splitlines():
+        p5=r'^(?P<entry>[\w\*] )?\s*(?P<vlan>All|[\d\-]+) '
+           r'+(?P<mac>[\w.]+) +(?P<entry_type>\w+) '
+           r'+(?P<protocols>[\w\,]+) '
+           r'+(?P<intfs>\S+|[^\s]+\s[^\s]+)$',
+    )
+
+    def _iter_events(self, output):
+        """ Read the output one line at a time, the state machine of both cli
+            and parse_records.
+
+            Yields:
+                tuple: the name of the pattern matching a line, such as
+                       'p2', its groups, and a MacRecord per interface or
+                       drop of the MAC address of the line, or None for the
+                       total of 'p1'
+        """
+        p = self.patterns
+        # The interfaces and types repeat over the MAC addresses
+        intern = Interner()
+
+        # Carried over from the entry to the lines of interfaces following it
+        vlan = mac = None
+        entry_type = entry = learn = age = ''
+
+        for line in Common.iter_lines(output):
             line = line.strip()
 
             # Total Mac Addresses for this criterion: 93
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                ret_dict.update({'total_mac_addresses': int(m.groupdict()['val'])})
+                yield 'p1', m.groupdict(), None
                 continue
 
             # 10    aaaa.bbff.8888    STATIC      Gi1/0/8 Gi1/0/9
             # 20    aaaa.bbff.8888    STATIC      Drop
             # All    0100.0cff.999a    STATIC      CPU
-            m = p2.match(line)
+            # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
+            # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
+            # 964    0000.0000.0000   dynamic ip,ipx                Router
+            protocols = None
+            for name in ('p2', 'p4', 'p5'):
+                m = getattr(p, name).match(line)
+                if m:
+                    break
             if m:
                 group = m.groupdict()
                 mac = group['mac']
                 vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
                                           else group['vlan'].lower()
                 intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
+                    yield name, group, MacRecord(
+                        vlan=vlan, mac_address=mac, drop=True,
+                        mac_type=intern(group['entry_type'].lower()))
                     continue
 
-                for intf in intfs.replace(' ',',').split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
-                continue
+                if name == 'p4':
+                    intfs = intfs.split(',')
+                else:
+                    intfs = intfs.replace(' ', ',').split(',')
+                    if name == 'p5' and group['protocols']:
+                        protocols = tuple(intern(protocol) for protocol
+                                          in group['protocols'].split(','))
+
+                entry_type = intern(group['entry_type'].lower())
+                record_entry = record_learn = record_age = None
+                if group['entry']:
+                    entry = record_entry = intern(group['entry'].strip())
+                if name == 'p4':
+                    learn = record_learn = intern(group['learn'])
+                    age = record_age = int(group['age']) \
+                        if group['age'].isdigit() else None
 
             # Gi1/9,Gi1/10,Gi1/11,Gi1/12
             #               Router,Switch
-            m = p3.match(line)
-            if m:
+            else:
+                name = 'p3'
+                m = p.p3.match(line)
+                if not m or mac is None:
+                    continue
                 group = m.groupdict()
                 intfs = group['intfs'].strip()
 
                 if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': entry_type})
+                    yield name, group, MacRecord(
+                        vlan=vlan, mac_address=mac, drop=True,
+                        mac_type=entry_type)
                     continue
 
-                for intf in intfs.split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    intf_dict.update({'entry_type': entry_type})
-                    if entry:
-                        intf_dict.update({'entry': entry})
-                    if learn:
-                        intf_dict.update({'learn': learn})
-                    if age:
-                        intf_dict.update({'age': age})
-                continue
-
-            # *  101  44dd.eeff.55bb   dynamic  Yes         10   Gi1/40
-            # *  102  aa11.bbff.ee55    static  Yes          -   Gi1/2,Gi1/4,Gi1/5,Gi1/6
-            # *  400  0000.0000.0000    static  No           -   vPC Peer-Link
-            # *  ---  0000.0000.0000    static  No           -   Router
-            m = p4.match(line)
-            if m:
-                group = m.groupdict()
-                mac = group['mac']
-                vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
-                                          else group['vlan'].lower()
-                intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
+                intfs = intfs.split(',')
+                record_entry = entry or None
+                record_learn = learn or None
+                record_age = age or None
 
-                if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
-                    continue
+            for intf in intfs:
+                yield name, group, MacRecord(
+                    vlan=vlan, mac_address=mac,
+                    interface=intern(Common.convert_intf_name(intf)),
+                    mac_type=entry_type, entry=record_entry,
+                    learn=record_learn, age=record_age, protocols=protocols)
 
-                for intf in intfs.split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
-                    if group['learn']:
-                        learn = group['learn']
-                        intf_dict.update({'learn': learn})
-                    if group['age']:
-                        if group['age'].isdigit():
-                            age = int(group['age'])
-                            intf_dict.update({'age': age})
-                        else:
-                            age = None
-                continue
+    def cli(self, vlan='', output=None):
+        if output is None:
+            # get output from device
+            if vlan:
+                out = self.device.execute(self.cli_command[1].format(vlan=vlan))
+            else:
+                out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
 
-            # 964    0000.0000.0000   dynamic ip,ipx                Router
-            m = p5.match(line)
-            if m:
-                group = m.groupdict()
-                mac = group['mac']
-                vlan = int(group['vlan']) if re.search('\d+', group['vlan']) \
-                                          else group['vlan'].lower()
-                intfs = group['intfs'].strip()
-                vlan_dict = ret_dict.setdefault('mac_table', {}) \
-                .setdefault('vlans', {}).setdefault(str(vlan), {})
-                vlan_dict['vlan'] = vlan
-                mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
-                                    .setdefault(mac, {})
-                mac_dict.update({'mac_address': mac})
+        # initial return dictionary
+        ret_dict = {}
 
-                if 'drop' in intfs.lower():
-                    drop_dict = mac_dict.setdefault('drop', {})
-                    drop_dict.update({'drop': True})
-                    drop_dict.update({'entry_type': group['entry_type'].lower()})
-                    continue
+        for name, group, record in self._iter_events(out):
+            # Total Mac Addresses for this criterion: 93
+            if name == 'p1':
+                ret_dict.update({'total_mac_addresses': int(group['val'])})
+                continue
 
-                for intf in intfs.replace(' ',',').split(','):
-                    intf = Common.convert_intf_name(intf)
-                    intf_dict = mac_dict.setdefault('interfaces', {}) \
-                                        .setdefault(intf, {})
-                    intf_dict.update({'interface': intf})
-                    entry_type = group['entry_type'].lower()
-                    intf_dict.update({'entry_type': entry_type})
-                    if group['entry']:
-                        entry = group['entry'].strip()
-                        intf_dict.update({'entry': entry})
-
-                    if group['protocols']:
-                        intf_dict.update({'protocols': group['protocols'].split(',')})
+            vlan = record.vlan
+            mac = record.mac_address
+            vlan_dict = ret_dict.setdefault('mac_table', {}) \
+            .setdefault('vlans', {}).setdefault(str(vlan), {})
+            vlan_dict['vlan'] = vlan
+            mac_dict = vlan_dict.setdefault('mac_addresses', {}) \
+                                .setdefault(mac, {})
+            mac_dict.update({'mac_address': mac})
+
+            if record.drop:
+                drop_dict = mac_dict.setdefault('drop', {})
+                drop_dict.update({'drop': True})
+                drop_dict.update({'entry_type': record.mac_type})
                 continue
 
+            intf = record.interface
+            intf_dict = mac_dict.setdefault('interfaces', {}) \
+                                .setdefault(intf, {})
+            intf_dict.update({'interface': intf})
+            intf_dict.update({'entry_type': record.mac_type})
+            if record.entry:
+                intf_dict.update({'entry': record.entry})
+            if record.learn:
+                intf_dict.update({'learn': record.learn})
+            if record.age is not None:
+                intf_dict.update({'age': record.age})
+            if record.protocols:
+                intf_dict.update({'protocols': list(record.protocols)})
+
         return ret_dict
 
+    def parse_records(self, vlan='', output=None):
+        """ Yield a MacRecord per interface or drop of a MAC address of the
+            output, as it is read. The entry_type of the entries is mac_type.
+        """
+        if output is None:
+            if vlan:
+                output = self.device.execute(self.cli_command[1].format(vlan=vlan))
+            else:
+                output = self.device.execute(self.cli_command[0])
+
+        for name, group, record in self._iter_events(output):
+            if record is not None:
+                yield record
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
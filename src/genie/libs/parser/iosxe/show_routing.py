@@ -8,6 +8,11 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Any, \
                                          Optional
 
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import RouteRecord
+from genie.libs.parser.utils.interning import Interner
+
 
 # ====================================================
 #  distributor class for show ip route
@@ -185,108 +190,182 @@ class ShowIpRoute(ShowIpRouteSchema):
                    'show ip route', 'show ip route {protocol}']
     exclude = ['updated']
     IP_VER='ipv4'
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
+
+    source_protocol_dict = {}
+    source_protocol_dict['ospf'] = ['O','IA','N1','N2','E1','E2']
+    source_protocol_dict['odr'] = ['o']
+    source_protocol_dict['isis'] = ['i','su','L1','L2','ia', 'I1', 'I2']
+    source_protocol_dict['eigrp'] = ['D','EX']
+    source_protocol_dict['static'] = ['S']
+    source_protocol_dict['mobile'] = ['M']
+    source_protocol_dict['rip'] = ['R']
+    source_protocol_dict['lisp'] = ['I', 'Ir','Ia','Id']
+    source_protocol_dict['nhrp'] = ['H']
+    source_protocol_dict['local'] = ['L']
+    source_protocol_dict['connected'] = ['C']
+    source_protocol_dict['local_connected'] = ['LC']
+    source_protocol_dict['bgp'] = ['B']
+
+    patterns = Patterns(
+        # Routing Table: VRF1
+        # Routing Table: VRF-infra
+        p1=r'^Routing Table: +(?P<vrf>[\w?-]+)$',
+
+        # 10.1.0.0/32 is subnetted, 1 subnets
+        # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
+        p2=r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
+           r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$',
+
+        # C        10.4.1.1 is directly connected, Loopback0
+        # S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # S*       10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1
+        # O        10.2.3.0/24 [110/2] via 10.186.2.2, 06:46:59, GigabitEthernet0/1
+        # i L1     10.151.22.22 [115/20] via 10.186.2.2, 06:47:04, GigabitEthernet0/1
+        # D        192.168.205.1
+        # S*       0.0.0.0/0 [1/0] via 10.50.15.1
+        p3=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
+           r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+           r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        # L        FF00::/8 [0/0]
+        p3_ipv6=r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
+                r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
+                r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$',
+
+        #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
+        p4=r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
+           r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$',
+
+        #       is directly connected, GigabitEthernet0/2
+        p5=r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
+           r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
+           r'( +(?P<interface>[\S]+))?$',
+
+        #      via 2001:DB8:1:1::2
+        #      via 10.4.1.1%default, indirectly connected
+        #      via 2001:DB8:4:6::6
+        #      via 2001:DB8:20:4:6::6%VRF2
+        #      via Null0, receive
+        p6=r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
+           r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
+           r'( +directly connected)?( +indirectly connected)?$',
 
-    def cli(self, vrf=None, protocol=None, output=None):
-
-        if output is None:
-            if vrf and protocol:
-                cmd = self.command[1].format(vrf=vrf, protocol=protocol)
-            elif vrf:
-                cmd = self.command[0].format(vrf=vrf)
-            elif protocol:
-                cmd = self.command[3].format(protocol=protocol)
-            else:
-                cmd = self.command[2]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        af = self.IP_VER
-        route = ""
-        if not vrf:
-            vrf = 'default'
+        # Routing entry for 10.151.0.0/24, 1 known subnets
+        # Routing entry for 0.0.0.0/0, supernet
+        # Routing entry for 192.168.154.0/24
+        p100=r'^Routing +entry +for +'
+             r'(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
+             r'(, +(?P<net>[\w\s]+))?$',
 
-        source_protocol_dict = {}
-        source_protocol_dict['ospf'] = ['O','IA','N1','N2','E1','E2']
-        source_protocol_dict['odr'] = ['o']
-        source_protocol_dict['isis'] = ['i','su','L1','L2','ia', 'I1', 'I2']
-        source_protocol_dict['eigrp'] = ['D','EX']
-        source_protocol_dict['static'] = ['S']
-        source_protocol_dict['mobile'] = ['M']
-        source_protocol_dict['rip'] = ['R']
-        source_protocol_dict['lisp'] = ['I', 'Ir','Ia','Id']
-        source_protocol_dict['nhrp'] = ['H']
-        source_protocol_dict['local'] = ['L']
-        source_protocol_dict['connected'] = ['C']
-        source_protocol_dict['local_connected'] = ['LC']
-        source_protocol_dict['bgp'] = ['B']
+        # Known via "eigrp 1", distance 130, metric 10880, type internal
+        # Known via "rip", distance 120, metric 2
+        p200=r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
+             r'distance +(?P<distance>\d+), +'
+             r'metric +(?P<metric>\d+)'
+             r'(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$',
 
-        result_dict = {}
+        # Redistributing via rip
+        # Redistributing via eigrp 1
+        p300=r'^Redistributing +via +(?P<redist_via>\w+) *'
+             r'(?P<redist_via_tag>\d+)?$',
 
-        # initial regexp pattern
-        p100 = re.compile(r'^Routing +entry +for +'
-                        '(?P<entry>(?P<ip>[\w\:\.]+)\/(?P<mask>\d+))'
-                        '(, +(?P<net>[\w\s]+))?$')
-        p200 = re.compile(r'^Known +via +\"(?P<known_via>[\w\s]+)\", +'
-                        'distance +(?P<distance>\d+), +'
-                        'metric +(?P<metric>\d+)'
-                        '(, +type +(?P<type>[\w\-\s]+)(?P<connected>, connected)?)?$')
-        p300 = re.compile(r'^Redistributing +via +(?P<redist_via>\w+) *'
-                        '(?P<redist_via_tag>\d+)?$')
-        p400 = re.compile(r'^Last +update +from +(?P<from>[\w\.]+) +'
-                        'on +(?P<interface>[\w\.\/\-]+), +'
-                        '(?P<age>[\w\.\:]+) +ago$')
-        p500 = re.compile(r'^\*? *(?P<nexthop>[\w\.]+)(, +'
-                        'from +(?P<from>[\w\.]+), +'
-                        '(?P<age>[\w\.\:]+) +ago, +'
-                        'via +(?P<interface>[\w\.\/\-]+))?$')
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                        'traffic +share +count +is +(?P<share_count>\d+)$')
-
-        p600 = re.compile(r'^Route +metric +is +(?P<metric>\d+), +'
-                          'traffic +share +count +is +(?P<share_count>\d+)$')
-        p700 = re.compile(r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
-                          '+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$')
-        p800 = re.compile(r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$')
-        p900 = re.compile(r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$')
+        # Last update from 192.168.151.2 on Vlan101, 2w3d ago
+        p400=r'^Last +update +from +(?P<from>[\w\.]+) +'
+             r'on +(?P<interface>[\w\.\/\-]+), +'
+             r'(?P<age>[\w\.\:]+) +ago$',
 
-        # initial variables
-        ret_dict = {}
-        index = 0
+        # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
+        # * 10.69.1.2
+        p500=r'^\*? *(?P<nexthop>[\w\.]+)(, +'
+             r'from +(?P<from>[\w\.]+), +'
+             r'(?P<age>[\w\.\:]+) +ago, +'
+             r'via +(?P<interface>[\w\.\/\-]+))?$',
 
-        for line in out.splitlines():
-            if line:
-                line = line.strip()
-            else:
+        # Route metric is 10880, traffic share count is 1
+        p600=r'^Route +metric +is +(?P<metric>\d+), +'
+             r'traffic +share +count +is +(?P<share_count>\d+)$',
+
+        # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
+        p700=r'^Total +delay +is +(?P<total_delay>\d+) +microseconds, '
+             r'+minimum +bandwidth +is +(?P<minimum_bandwidth>\d+) +Kbit$',
+
+        # Reliability 255/255, minimum MTU 1500 bytes
+        p800=r'^Reliability +(?P<reliability>[\d\/]+), +minimum +MTU +(?P<minimum_mtu>\d+) +bytes$',
+
+        # Loading 1/255, Hops 1
+        p900=r'^Loading +(?P<loading>[\d\/]+), Hops +(?P<hops>\d+)$',
+    )
+
+    def _command(self, vrf=None, protocol=None):
+        if vrf and protocol:
+            cmd = self.command[1].format(vrf=vrf, protocol=protocol)
+        elif vrf:
+            cmd = self.command[0].format(vrf=vrf)
+        elif protocol:
+            cmd = self.command[3].format(protocol=protocol)
+        else:
+            cmd = self.command[2]
+        return cmd
+
+    def _iter_events(self, output, vrf):
+        """ Read the output one line at a time, the state machine of both cli
+            and parse_records.
+
+            Yields:
+                tuple: the name of the pattern matching a line, such as
+                       'p3', its groups, and the state of the route of the
+                       line: a dict, updated in place, of the vrf, route,
+                       source_protocol, source_protocol_codes,
+                       route_preference and metric of the route, and of the
+                       index, next_hop, next_hop_vrf, outgoing_interface and
+                       updated of the line
+        """
+        p = self.patterns
+        if self.IP_VER == 'ipv4':
+            p3 = p.p3
+        else:
+            p3 = p.p3_ipv6
+
+        # The next hops, interfaces and codes repeat over the routes
+        intern = Interner()
+        netmask = ""
+        state = {'vrf': vrf, 'route': "", 'source_protocol': None,
+                 'source_protocol_codes': None, 'route_preference': None,
+                 'metric': None, 'index': 0}
+
+        def path(preference, next_hop, interface, updated=None,
+                 next_hop_vrf=None):
+            # [110/2] of the line, kept for the next lines of the route
+            if preference and '/' in preference:
+                state['route_preference'], state['metric'] = map(
+                    int, preference.split('/')[:2])
+            state.update(next_hop=intern(next_hop),
+                         next_hop_vrf=intern(next_hop_vrf),
+                         outgoing_interface=intern(interface),
+                         updated=intern(updated))
+
+        for line in Common.iter_lines(output):
+            line = line.strip()
+            if not line:
                 continue
 
-            next_hop = interface = updated = metrics = route_preference = ""
             # Routing Table: VRF1
             # Routing Table: VRF-infra
-            p1 = re.compile(r'^Routing Table: +(?P<vrf>[\w?-]+)$')
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                vrf = m.groupdict()['vrf']
+                state['vrf'] = m.groupdict()['vrf']
                 continue
 
             # 10.1.0.0/32 is subnetted, 1 subnets
             # 10.0.0.0/8 is variably subnetted, 5 subnets, 2 masks
-            p2 = re.compile(r'^(?P<subnetted_ip>[\d\/\.]+) +is +(variably )?subnetted, '
-                            r'+(?P<number_of_subnets>[\d]+) +subnets(, +(?P<number_of_masks>[\d]+) +masks)?$')
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
-                # if you see the issue by "show ip route", it means that active is True.
-                # it means all routes in the output should be active=True
-                active = True
-                netmask = number_of_masks= ""
-                number_of_subnets = m.groupdict()['number_of_subnets']
-                if m.groupdict()['number_of_masks']:
-                    number_of_masks = m.groupdict()['number_of_masks']
-
-                if m.groupdict()['subnetted_ip']:
-                    subnetted_ip = m.groupdict()['subnetted_ip']
-                    if '/' in subnetted_ip:
-                        netmask = subnetted_ip.split('/')[1]
+                netmask = ""
+                subnetted_ip = m.groupdict()['subnetted_ip']
+                if '/' in subnetted_ip:
+                    netmask = subnetted_ip.split('/')[1]
                 continue
 
             # C        10.4.1.1 is directly connected, Loopback0
@@ -297,190 +376,43 @@ class ShowIpRoute(ShowIpRouteSchema):
             # D        192.168.205.1
             # S*       0.0.0.0/0 [1/0] via 10.50.15.1
             # L        FF00::/8 [0/0]
-            if self.IP_VER == 'ipv4':
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[0-9\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-            else:
-                p3 = re.compile(
-                    r'^(?P<code>[\w\*]+) +(?P<code1>[\w]+)? +(?P<network>[\w\.\:\/]+)?( '
-                    r'+is +directly +connected,)? *\[?(?P<route_preference>[\d\/]+)?\]?( *('
-                    r'via +)?(?P<next_hop>[\d\.]+))?,?( +(?P<date>[0-9][\w\:]+))?,?( +(?P<interface>[\S]+))?$')
-
             m = p3.match(line)
             if m:
-                active = True
-                if m.groupdict()['code']:
-                    source_protocol_codes = m.groupdict()['code'].strip()
-                    for key,val in source_protocol_dict.items():
-                        source_protocol_replaced = source_protocol_codes.split('*')[0]
-                        if source_protocol_replaced in val:
-                            source_protocol = key
-
-                if m.groupdict()['code1']:
-                    source_protocol_codes = '{} {}'.format(source_protocol_codes, m.groupdict()['code1'])
-
-                if m.groupdict()['network']:
-                    network = m.groupdict()['network']
+                group = m.groupdict()
+                codes = group['code'].strip()
+                for key, val in self.source_protocol_dict.items():
+                    if codes.split('*')[0] in val:
+                        state['source_protocol'] = key
+                if group['code1']:
+                    codes = '{} {}'.format(codes, group['code1'])
+                state['source_protocol_codes'] = intern(codes)
+
+                network = group['network']
+                if network:
                     if '/' in network:
-                        route = network
+                        state['route'] = network
                     else:
-                        route = '{}/{}'.format(network,netmask)
-
-                if not m.groupdict()['network']:
-                    route = route
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
-
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                    index = 1
-                else:
-                    index = 0
-
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-                route_dict['active'] = active
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
+                        state['route'] = '{}/{}'.format(network, netmask)
 
+                state['route_preference'] = state['metric'] = None
+                state['index'] = 1 if group['next_hop'] else 0
+                path(group['route_preference'], group['next_hop'],
+                     group['interface'], group['date'])
+                yield 'p3', group, state
                 continue
 
             #    [110/2] via 10.1.2.2, 06:46:59, GigabitEthernet0/0
-            p4 = re.compile(r'^\[(?P<route_preference>[\d\/]+)\] +via +(?P<next_hop>[\d\.]+)?,?'
-                            r'( +(?P<date>[0-9][\w\:]+),?)?( +(?P<interface>[\S]+))?$')
-            m = p4.match(line)
-            if m:
-                routepreference = m.groupdict()['route_preference']
-                if routepreference and '/' in routepreference:
-                    route_preference = routepreference.split('/')[0]
-                    metrics = routepreference.split('/')[1]
-
-                next_hop = m.groupdict()['next_hop']
-                index +=1
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-                route_dict['active'] = active
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-                if source_protocol_codes:
-                    route_dict['source_protocol_codes'] = source_protocol_codes
-                    route_dict['source_protocol'] = source_protocol
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-
-                continue
-
             #       is directly connected, GigabitEthernet0/2
-            p5 = re.compile(r'^is +directly +connected,( +\[(?P<route_preference>[\d\/]+)\] '
-                            r'+via +(?P<next_hop>[\d\.]+)?,)?( +(?P<date>[0-9][\w\:]+),)?'
-                            r'( +(?P<interface>[\S]+))?$')
-            m = p5.match(line)
+            for name in ('p4', 'p5'):
+                m = getattr(p, name).match(line)
+                if m:
+                    break
             if m:
-
-                if m.groupdict()['route_preference']:
-                    routepreference = m.groupdict()['route_preference']
-                    if '/' in routepreference:
-                        route_preference = routepreference.split('/')[0]
-                        metrics = routepreference.split('/')[1]
-
-                index += 1
-                if m.groupdict()['next_hop']:
-                    next_hop = m.groupdict()['next_hop']
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
-                if m.groupdict()['date']:
-                    updated = m.groupdict()['date']
-
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
-                                        .setdefault('address_family', {}).setdefault(af, {})\
-                                        .setdefault('routes', {}).setdefault(route, {})
-
-                route_dict['route'] = route
-
-                if metrics:
-                    route_dict['metric'] = int(metrics)
-                if route_preference:
-                    route_dict['route_preference'] = int(route_preference)
-
-                next_hop_dict = route_dict.setdefault('next_hop', {})
-
-                if not next_hop and interface:
-                    intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
-                    intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
-
-                elif next_hop:
-                    idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
-                    idx_dict['index'] = index
-                    idx_dict['next_hop'] = next_hop
-
-                    if updated:
-                        idx_dict['updated'] = updated
-                    if interface:
-                        idx_dict['outgoing_interface'] = interface
-
+                group = m.groupdict()
+                state['index'] += 1
+                path(group['route_preference'], group['next_hop'],
+                     group['interface'], group['date'])
+                yield name, group, state
                 continue
 
             #      via 2001:DB8:1:1::2
@@ -488,136 +420,166 @@ class ShowIpRoute(ShowIpRouteSchema):
             #      via 2001:DB8:4:6::6
             #      via 2001:DB8:20:4:6::6%VRF2
             #      via Null0, receive
-            p6 = re.compile(r'^via( +(?P<next_hop>[\w]+[.:][\w\:\.\%]+),?)?'
-                            r'( +(?P<interface>[\w\.\/\-\_]+))?,?( +receive)?'
-                            r'( +directly connected)?( +indirectly connected)?$')
-            m = p6.match(line)
+            m = p.p6.match(line)
             if m:
-                vrf_val = ''
-                tmp_next_hop = m.groupdict()['next_hop']
-                if tmp_next_hop:
-                    if '%' in  tmp_next_hop:
-                        next_hop = tmp_next_hop.split('%')[0]
-                        vrf_val = tmp_next_hop.split('%')[1]
-                    else:
-                        next_hop = tmp_next_hop
+                group = m.groupdict()
+                next_hop, next_hop_vrf = group['next_hop'], None
+                if next_hop and '%' in next_hop:
+                    next_hop, next_hop_vrf = next_hop.split('%')[:2]
+                state['index'] += 1
+                path(None, next_hop, group['interface'],
+                     next_hop_vrf=next_hop_vrf)
+                yield 'p6', group, state
+                continue
+
+            # The details of 'Routing entry for', and of its paths
+            for name in ('p100', 'p200', 'p300', 'p400', 'p500', 'p600',
+                         'p700', 'p800', 'p900'):
+                m = getattr(p, name).match(line)
+                if m:
+                    if name == 'p500':
+                        state['index'] += 1
+                    yield name, m.groupdict(), state
+                    break
 
-                if m.groupdict()['interface']:
-                    interface = m.groupdict()['interface']
+    def cli(self, vrf=None, protocol=None, output=None):
 
-                index += 1
-                route_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {})\
+        if output is None:
+            out = self.device.execute(self._command(vrf=vrf,
+                                                    protocol=protocol))
+        else:
+            out = output
+
+        af = self.IP_VER
+        if not vrf:
+            vrf = 'default'
+
+        result_dict = {}
+
+        for name, group, state in self._iter_events(out, vrf):
+            if name in ('p3', 'p4', 'p5', 'p6'):
+                route = state['route']
+                route_dict = result_dict.setdefault('vrf', {}).setdefault(state['vrf'], {})\
                                         .setdefault('address_family', {}).setdefault(af, {})\
                                         .setdefault('routes', {}).setdefault(route, {})
 
                 route_dict['route'] = route
-                route_dict['active'] = active
+                # The next lines of a route do not give its codes
+                if name != 'p5':
+                    route_dict['active'] = True
+                if name != 'p6':
+                    if state['metric'] is not None:
+                        route_dict['metric'] = state['metric']
+                    if state['route_preference'] is not None:
+                        route_dict['route_preference'] = \
+                            state['route_preference']
+                if name in ('p3', 'p4') and state['source_protocol_codes']:
+                    route_dict['source_protocol_codes'] = \
+                        state['source_protocol_codes']
+                    route_dict['source_protocol'] = state['source_protocol']
 
                 next_hop_dict = route_dict.setdefault('next_hop', {})
+                next_hop = state['next_hop']
+                interface = state['outgoing_interface']
 
                 if not next_hop and interface:
                     intf_dict = next_hop_dict.setdefault('outgoing_interface', {})
                     intf_dict.setdefault(interface, {}).update({'outgoing_interface': interface})
 
                 elif next_hop:
+                    index = state['index']
                     idx_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
                     idx_dict['index'] = index
                     idx_dict['next_hop'] = next_hop
 
-                    if updated:
-                        idx_dict['updated'] = updated
+                    if state['updated']:
+                        idx_dict['updated'] = state['updated']
                     if interface:
                         idx_dict['outgoing_interface'] = interface
-                    if vrf_val:
-                        idx_dict['vrf'] = vrf_val
-
-                continue
+                    if state['next_hop_vrf']:
+                        idx_dict['vrf'] = state['next_hop_vrf']
 
             # Routing entry for 10.151.0.0/24, 1 known subnets
-            # Routing entry for 0.0.0.0/0, supernet
-            # Routing entry for 192.168.154.0/24
-            m = p100.match(line)
-            if m:
-                group = m.groupdict()
-                entry_dict = result_dict.setdefault('vrf', {}).setdefault(vrf, {}).setdefault('address_family',
-                                                                                              {}).setdefault(af, {})
-                route_dict = entry_dict.setdefault('routes', {}).setdefault(route, {})
+            elif name == 'p100':
+                entry_dict = result_dict.setdefault('vrf', {}).setdefault(state['vrf'], {}).setdefault('address_family',
+                                                                                                       {}).setdefault(af, {})
+                route_dict = entry_dict.setdefault('routes', {}).setdefault(state['route'], {})
                 route_dict.update({'route': group['ip']})
                 route_dict.update({'mask': group['mask']})
                 route_dict.update({'active': True})
-                continue
 
             # Known via "eigrp 1", distance 130, metric 10880, type internal
-            # Known via "rip", distance 120, metric 2
-            m = p200.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p200':
                 route_dict.update({'distance': int(group['distance'])})
                 route_dict.update({'metric': int(group['metric'])})
                 if group['type']:
                     route_dict.update({'type': group['type']})
-                continue
 
-            # Redistributing via rip
             # Redistributing via eigrp 1
-            m = p300.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p300':
                 route_dict.update({k: v for k, v in group.items() if v})
-                continue
 
             # Last update from 192.168.151.2 on Vlan101, 2w3d ago
-            # Last update from 192.168.246.2 on Vlan103, 00:00:12 ago
-            m = p400.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p400':
                 update_dict = route_dict.setdefault('update', {})
                 update_dict.update({k: v for k, v in group.items() if v})
-                continue
 
             # * 192.168.151.2, from 192.168.151.2, 2w3d ago, via Vlan101
-            # * 10.69.1.2
-            m = p500.match(line)
-            if m:
-                group = m.groupdict()
-                index += 1
+            elif name == 'p500':
+                index = state['index']
                 path_dict = route_dict.setdefault('next_hop',{}).setdefault('next_hop_list', {}).setdefault(index, {})
                 path_dict.update({'index': index})
                 path_dict.update({'next_hop': group['nexthop']})
                 path_dict.update({'age': group['age']})
                 path_dict.update({'from': group['from']})
                 path_dict.update({'outgoing_interface': group['interface']})
-                continue
 
             # Route metric is 10880, traffic share count is 1
-            m = p600.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-
             # Total delay is 20 microseconds, minimum bandwidth is 1000000 Kbit
-            m = p700.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
-
             # Reliability 255/255, minimum MTU 1500 bytes
-            m = p800.match(line)
-            if m:
-                group = m.groupdict()
-                path_dict.update({k: v for k, v in group.items() if v})
-                continue
-
             # Loading 1/255, Hops 1
-            m = p900.match(line)
-            if m:
-                group = m.groupdict()
+            else:
                 path_dict.update({k: v for k, v in group.items() if v})
-                continue
 
         return result_dict
 
+    def parse_records(self, vrf=None, protocol=None, output=None):
+        """ Yield a RouteRecord per next hop of the routes of the output, or
+            per outgoing interface of the routes without next hop, as it is
+            read. The lines of 'Routing entry for' details are left out.
+        """
+        if output is None:
+            output = self.device.execute(self._command(vrf=vrf,
+                                                       protocol=protocol))
+
+        af = self.IP_VER
+        if not vrf:
+            vrf = 'default'
+
+        for name, group, state in self._iter_events(output, vrf):
+            if name not in ('p3', 'p4', 'p5', 'p6'):
+                continue
+            if state['next_hop']:
+                yield RouteRecord(
+                    vrf=state['vrf'], address_family=af, route=state['route'],
+                    active=True, source_protocol=state['source_protocol'],
+                    source_protocol_codes=state['source_protocol_codes'],
+                    route_preference=state['route_preference'],
+                    metric=state['metric'], index=state['index'],
+                    next_hop=state['next_hop'],
+                    next_hop_vrf=state['next_hop_vrf'],
+                    outgoing_interface=state['outgoing_interface'],
+                    updated=state['updated'])
+            elif state['outgoing_interface']:
+                yield RouteRecord(
+                    vrf=state['vrf'], address_family=af, route=state['route'],
+                    active=True, source_protocol=state['source_protocol'],
+                    source_protocol_codes=state['source_protocol_codes'],
+                    route_preference=state['route_preference'],
+                    metric=state['metric'],
+                    outgoing_interface=state['outgoing_interface'],
+                    updated=state['updated'])
+
 class ShowIpv6Route(ShowIpRoute):
     """Parser for:
         show ipv6 route
@@ -630,26 +592,38 @@ class ShowIpv6Route(ShowIpRoute):
     exclude = ['uptime']
 
     IP_VER = 'ipv6'
+
+    def _command(self, vrf=None, protocol=None, interface=None):
+        if vrf and protocol:
+            cmd = self.command[1].format(vrf=vrf, protocol=protocol)
+        elif vrf:
+            cmd = self.command[0].format(vrf=vrf)
+        elif protocol:
+            cmd = self.command[3].format(protocol=protocol)
+        elif interface:
+            cmd = self.command[4].format(interface=interface)
+        else:
+            cmd = self.command[2]
+        return cmd
+
     def cli(self, vrf=None, protocol=None, interface=None, output=None):
         
         if output is None:
-            if vrf and protocol:
-                cmd = self.command[1].format(vrf=vrf, protocol=protocol)
-            elif vrf:
-                cmd = self.command[0].format(vrf=vrf)
-            elif protocol:
-                cmd = self.command[3].format(protocol=protocol)
-            elif interface:
-                cmd = self.command[4].format(interface=interface)
-            else:
-                cmd = self.command[2]
-            out = self.device.execute(cmd)
+            out = self.device.execute(self._command(
+                vrf=vrf, protocol=protocol, interface=interface))
         else:
             out = output
         if not vrf:
             vrf = 'default'
         return super().cli(vrf=vrf, protocol=protocol, output=out)
 
+    def parse_records(self, vrf=None, protocol=None, interface=None,
+                      output=None):
+        if output is None:
+            output = self.device.execute(self._command(
+                vrf=vrf, protocol=protocol, interface=interface))
+        return super().parse_records(vrf=vrf, output=output)
+
 # ====================================================
 #  schema for show ipv6 route updated
 # ====================================================
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.interning import Interner
 
 # =======================================
 # Schema for 'show arp detail'
@@ -73,6 +74,8 @@ class ShowArpDetail(ShowArpDetailSchema):
 
         # initial variables
         ret_dict = {}
+        # The ages and types repeat over the entries
+        intern = Interner()
 
         for line in out.splitlines():
             line = line.strip()
@@ -81,7 +84,7 @@ class ShowArpDetail(ShowArpDetailSchema):
 
             m = p1.match(line)
             if m:
-                group = m.groupdict()
+                group = intern.groups(m.groupdict(), 'age', 'type')
                 address = group['ip_address']
                 interface = group['interface']
                 final_dict = ret_dict.setdefault('interfaces', {}).setdefault(
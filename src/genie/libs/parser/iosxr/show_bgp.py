@@ -58,6 +58,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 
 # Parser
 from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
+from genie.libs.parser.utils.interning import Interner
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -4950,6 +4951,8 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
         # Init
         parsed_dict = {}
         last_prefix = None
+        # The next hops, paths and numbers repeat over the prefixes
+        intern = Interner()
 
         # Determind VRF and AF
         if vrf_type == 'all':
@@ -5211,7 +5214,7 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i[2][0][48][0014.01ff.0001][32][10.249.249.10]/136
             m = p16_1.match(line)
             if m:
-                group = m.groupdict()
+                group = intern.groups(m.groupdict(), 'next_hop')
                 prefix = group['prefix']
                 if prefix:
                     last_prefix = prefix
@@ -5222,7 +5225,8 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 pfx_dict = af_dict.setdefault('prefix', {}).setdefault(last_prefix, {}).\
                                    setdefault('index', {}).setdefault(index, {})
                 # Set keys
-                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                pfx_dict['status_codes'] = intern(
+                    group['status_codes'].strip().replace(" ", ""))
                 if group['next_hop']:
                     pfx_dict['next_hop'] = group['next_hop']
                 continue
@@ -5230,7 +5234,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # 2219             0 200 33299 51178 47751 {27016} e
             m = p16_2.match(line)
             if m:
-                group = m.groupdict()
+                group = intern.groups(m.groupdict(), 'next_hop', 'metric',
+                                      'locprf', 'weight', 'path',
+                                      'origin_codes')
                 pfx_dict['metric'] = group['metric']
                 pfx_dict['weight'] = group['weight']
                 pfx_dict['path'] = group['path']
@@ -5242,7 +5248,9 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # 172.16.2.88                             100      0 i
             m = p16_3.match(line)
             if m:
-                group = m.groupdict()
+                group = intern.groups(m.groupdict(), 'next_hop', 'metric',
+                                      'locprf', 'weight', 'path',
+                                      'origin_codes')
                 pfx_dict['next_hop'] = group['next_hop']
                 if group['metric']:
                     pfx_dict['metric'] = group['metric']
@@ -5259,7 +5267,8 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             # *>i192.168.111.0/24       10.189.99.98                                                    0       0 i
             m = p16.match(line)
             if m:
-                group = m.groupdict()
+                group = intern.groups(m.groupdict(), 'next_hop',
+                                      'origin_codes')
                 prefix = group['prefix']
                 if prefix:
                     last_prefix = prefix
@@ -5271,7 +5280,8 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                                    setdefault('index', {}).setdefault(index, {})
                 # Set keys
                 pfx_dict['next_hop'] = group['next_hop']
-                pfx_dict['status_codes'] = group['status_codes'].strip().replace(" ", "")
+                pfx_dict['status_codes'] = intern(
+                    group['status_codes'].strip().replace(" ", ""))
                 if group['origin_codes']:
                     pfx_dict['origin_codes'] = group['origin_codes']
                 
@@ -5282,24 +5292,28 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
                 m3 = re.compile(r'^(?P<weight>[0-9]+) (?P<path>((\d+\s)|(\{\d+\}\s))+)$').match(group_num)
                 m4 = re.compile(r'^(?P<locprf>(\d+)) +(?P<weight>(\d+))$').match(group_num.strip())
                 if m1:
-                    pfx_dict['metric'] = m1.groupdict()['metric']
-                    pfx_dict['locprf'] = m1.groupdict()['locprf']
-                    pfx_dict['weight'] = m1.groupdict()['weight']
-                    pfx_dict['path'] = m1.groupdict()['path'].strip()
+                    numbers = intern.groups(m1.groupdict(), 'metric',
+                                            'locprf', 'weight')
+                    pfx_dict['metric'] = numbers['metric']
+                    pfx_dict['locprf'] = numbers['locprf']
+                    pfx_dict['weight'] = numbers['weight']
+                    pfx_dict['path'] = intern(numbers['path'].strip())
                 elif m2:
-                    if len(m2.groupdict()['space']) > 8:
-                        pfx_dict['metric'] = m2.groupdict()['value']
+                    numbers = intern.groups(m2.groupdict(), 'value', 'weight')
+                    if len(numbers['space']) > 8:
+                        pfx_dict['metric'] = numbers['value']
                     else:
-                        pfx_dict['locprf'] = m2.groupdict()['value']
+                        pfx_dict['locprf'] = numbers['value']
 
-                    pfx_dict['weight'] = m2.groupdict()['weight']
-                    pfx_dict['path'] = m2.groupdict()['path'].strip()
+                    pfx_dict['weight'] = numbers['weight']
+                    pfx_dict['path'] = intern(numbers['path'].strip())
                 elif m3:
-                    pfx_dict['weight'] = m3.groupdict()['weight']
-                    pfx_dict['path'] = m3.groupdict()['path'].strip()
+                    pfx_dict['weight'] = intern(m3.groupdict()['weight'])
+                    pfx_dict['path'] = intern(m3.groupdict()['path'].strip())
                 elif m4:
-                    pfx_dict['locprf'] = m4.groupdict()['locprf']
-                    pfx_dict['weight'] = m4.groupdict()['weight']
+                    numbers = intern.groups(m4.groupdict(), 'locprf', 'weight')
+                    pfx_dict['locprf'] = numbers['locprf']
+                    pfx_dict['weight'] = numbers['weight']
                 continue
 
             # 
@@ -5307,9 +5321,10 @@ class ShowBgpInstanceAllAll(ShowBgpInstanceAllAllSchema):
             if m:
                 group = m.groupdict()
                 if 'path' in pfx_dict:
-                    pfx_dict['path'] += ' ' + group['path'].strip()
+                    pfx_dict['path'] = intern(
+                        pfx_dict['path'] + ' ' + group['path'].strip())
                 if m.groupdict()['origin_codes']:
-                    pfx_dict['origin_codes'] = group['origin_codes']
+                    pfx_dict['origin_codes'] = intern(group['origin_codes'])
                 continue
 
             # Processed 40 prefixes, 50 paths
@@ -33,6 +33,7 @@ from genie.metaparser.util.schemaengine import Schema, \
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 
 logger = logging.getLogger(__name__)
 
@@ -2376,194 +2377,199 @@ class ShowInterfaces(ShowInterfacesSchema):
     exclude = []
 
 
-    def cli(self, interface="", output=None):
-        if output is None:
-            if interface:
-                cmd = self.cli_command[1].format(interface=interface)
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        result_dict = {}
-
-        # GigabitEthernet1 is up, line protocol is up 
+    patterns = Patterns(
+        # GigabitEthernet1 is up, line protocol is up
         # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-        p1 = re.compile(r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
-                         '+line +protocol +is +(?P<line_protocol>[\w\s]+)$')
+        p1=r'^(?P<interface>\S+) +is +(?P<enabled>[\w\s]+), '
+           '+line +protocol +is +(?P<line_protocol>[\w\s]+)$',
 
-        # Interface state transitions: 9 
-        p2 = re.compile(r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$')
+        # Interface state transitions: 9
+        p2=r'^Interface +state +transitions: +(?P<interface_state_transitions>[\d]+)$',
 
         # Hardware is Loopback
         # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-        p3 = re.compile(r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
-                         '(, *address +is +(?P<mac_address>[\w\.]+))?'
-                         '( *\(bia *(?P<phys_address>[\w\.]+)\))?$')
+        p3=r'^Hardware +is +(?P<type>[\w\-\/\s\+\(\)]+)'
+           '(, *address +is +(?P<mac_address>[\w\.]+))?'
+           '( *\(bia *(?P<phys_address>[\w\.]+)\))?$',
 
         # Layer 2 Transport Mode
-        p4 = re.compile(r'^Layer +2 +Transport +Mode$')
+        p4=r'^Layer +2 +Transport +Mode$',
 
         # Description: to-ML26-BE1
-        p5 = re.compile(r'^Description: *(?P<description>.*)$')
+        p5=r'^Description: *(?P<description>.*)$',
 
         # Internet address is 10.4.4.4/24
         # Internet address is Unknown
-        p6 = re.compile(r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
-                         '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$')
+        p6=r'^Internet +[A|a]ddress +is +(?P<ipv4>(?P<ip>[\d\.]+)'
+           '\/(?P<prefix_length>[\d]+))?(?P<unknown>Unknown)?$',
 
         # MTU 1500 bytes, BW 10000 Kbit
         # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-        p7 = re.compile(r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
-                         '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$')
+        p7=r'^MTU +(?P<mtu>[\d]+) +bytes, +BW +(?P<bandwidth>[\d]+) +Kbit'
+           '(.*Max: +(?P<bandwidth_max>[\d]+).*)?$',
 
         # reliability 255/255, txload 1/255, rxload 1/255
         # reliability Unknown, txload Unknown, rxload Unknown
-        p8 = re.compile(r'^reliability +(?P<reliability>[\w\/]+), '
-                         '+txload +(?P<txload>[\w\/]+), +rxload '
-                         '+(?P<rxload>[\w\/]+)$')
+        p8=r'^reliability +(?P<reliability>[\w\/]+), '
+           '+txload +(?P<txload>[\w\/]+), +rxload '
+           '+(?P<rxload>[\w\/]+)$',
 
         # Encapsulation ARPA,
         # Encapsulation 802.1Q Virtual LAN,
         # Encapsulation ARPA,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10,  loopback not set,
         # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-        p9 = re.compile(r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
-                         '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
-                         '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
-                         '( +loopback +(?P<loopback>[\w\s]+),)?$')
+        p9=r'^Encapsulation +(?P<encapsulation>[\w\.\s]+),'
+           '( +VLAN +Id +(?P<first_dot1q>\d+),)?'
+           '( +2nd +VLAN +Id +(?P<second_dot1q>\d+),)?'
+           '( +loopback +(?P<loopback>[\w\s]+),)?$',
 
         # Outer Match: Dot1Q VLAN 300
-        p10 = re.compile(r'^Outer +Match: +(?P<outer_match>[\w\s]+)$')
+        p10=r'^Outer +Match: +(?P<outer_match>[\w\s]+)$',
 
         # Ethertype Any, MAC Match src any, dest any
-        p11 = re.compile(r'^Ethertype +(?P<ethertype>\w+), '
-                           '+MAC +Match +(?P<mac_match>[\w\s]+), '
-                           '+dest +(?P<dest>\w+)$')
+        p11=r'^Ethertype +(?P<ethertype>\w+), '
+            '+MAC +Match +(?P<mac_match>[\w\s]+), '
+            '+dest +(?P<dest>\w+)$',
 
         # Full-duplex, 0Kb/s
         # Full-duplex, 1000Mb/s, link type is force-up
         # Full-duplex, Auto Speed, SR, link type is force-up
         # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-        p12 = re.compile(r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
-                          '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
-                          '(, +link +type +is +(?P<link_type>\S+))?$')
+        p12=r'^(?P<duplex_mode>[\w\s\-]+([d|D]uplex|unknown)), '
+            '+(?P<port_speed>[\w\s\/]+)(, +(?P<media_type>\S+))?'
+            '(, +link +type +is +(?P<link_type>\S+))?$',
 
         # output flow control is off, input flow control is off
         # output flow control is off, input flow control is unsupported
-        p13 = re.compile(r'^output +flow +control +is +(?P<send>\w+), +'
-                          'input +flow +control +is +(?P<receive>\w+)$')
+        p13=r'^output +flow +control +is +(?P<send>\w+), +'
+            'input +flow +control +is +(?P<receive>\w+)$',
 
         # Carrier delay (up) is 10 msec
         # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-        p14 = re.compile(r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
-                '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$')
+        p14=r'^Carrier +delay +\(up\) +is +(?P<carrier_delay_up>\d+) +msec'
+            '(, +Carrier +delay +\(down\) +is +(?P<carrier_delay_down>\d+) +msec)?$',
 
         # loopback not set,
-        p15 = re.compile(r'^loopback +(?P<loopback>[\w\s]+),$')
+        p15=r'^loopback +(?P<loopback>[\w\s]+),$',
 
         # Last link flapped 5w6d
-        p16 = re.compile(r'^Last +link +flapped +(?P<last_link_flapped>\S+)$')
+        p16=r'^Last +link +flapped +(?P<last_link_flapped>\S+)$',
 
         # ARP type ARPA, ARP timeout 04:00:00
-        p17 = re.compile(r'^ARP +type +(?P<arp_type>\w+), +'
-                          'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$')
+        p17=r'^ARP +type +(?P<arp_type>\w+), +'
+            'ARP +timeout +(?P<arp_timeout>[\w\:\.]+)$',
 
         # Last input never, output 00:01:05
-        p18 = re.compile(r'^Last +input +(?P<last_input>[\w\.\:]+), +'
-                          'output +(?P<last_output>[\w\.\:]+)$')
+        p18=r'^Last +input +(?P<last_input>[\w\.\:]+), +'
+            'output +(?P<last_output>[\w\.\:]+)$',
 
         # No. of members in this bundle: 1
-        p19 = re.compile(r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$')
+        p19=r'^No\. +of +members +in +this +bundle: +(?P<member_count>\d+)$',
 
         # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-        p20 = re.compile(r'^(?P<interface>[\w\/\.]+) '
-                          '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
-                          '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$')
+        p20=r'^(?P<interface>[\w\/\.]+) '
+            '+(?P<duplex_mode>[\w\-\s]+([d|D]uplex|unknown)) '
+            '+(?P<speed>[\w\/\s]+?) +(?P<state>\w+)$',
 
         # Last clearing of "show interface" counters 1d02h
-        p21 = re.compile(r'^Last +clearing +of +"show +interface" +counters +'
-                          '(?P<last_clear>[\w\:\.]+)$')
+        p21=r'^Last +clearing +of +"show +interface" +counters +'
+            '(?P<last_clear>[\w\:\.]+)$',
 
         # Input/output data rate is disabled.
-        p22 = re.compile(r'^Input\/output +data +rate +is +disabled\.$')
+        p22=r'^Input\/output +data +rate +is +disabled\.$',
 
         # 5 minute input rate 0 bits/sec, 0 packets/sec
-        p23 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
-                          ' +(?P<in_rate>[\d]+) +bits/sec,'
-                          ' +(?P<in_rate_pkts>[\d]+) +packets/sec$')
+        p23=r'^(?P<load_interval>[\d\#]+)'
+            ' *(?P<unit>(minute|second|minutes|seconds)) +input +rate'
+            ' +(?P<in_rate>[\d]+) +bits/sec,'
+            ' +(?P<in_rate_pkts>[\d]+) +packets/sec$',
 
         # 5 minute output rate 0 bits/sec, 0 packets/sec
-        p24 = re.compile(r'^(?P<load_interval>[\d\#]+)'
-                          ' *(minute|second|minutes|seconds) +output +rate'
-                          ' +(?P<out_rate>[\d]+) +bits/sec,'
-                          ' +(?P<out_rate_pkts>[\d]+) +packets/sec$')
+        p24=r'^(?P<load_interval>[\d\#]+)'
+            ' *(minute|second|minutes|seconds) +output +rate'
+            ' +(?P<out_rate>[\d]+) +bits/sec,'
+            ' +(?P<out_rate_pkts>[\d]+) +packets/sec$',
 
         # 0 packets input, 0 bytes
         # 0 packets input, 0 bytes, 0 total input drops
-        p25 = re.compile(r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
-                          '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$')
+        p25=r'^(?P<in_pkts>[\d]+) +packets +input, +(?P<in_octets>[\d]+) +bytes'
+            '(, +(?P<in_total_drops>[\d]+) +total +input +drops)?$',
 
         # 1258859 drops for unrecognized upper-level protocol
-        p26 = re.compile(r'(?P<in_unknown_protos>[\d]+) +drops +for '
-                          '+unrecognized +upper-level +protocol$')
+        p26=r'(?P<in_unknown_protos>[\d]+) +drops +for '
+            '+unrecognized +upper-level +protocol$',
 
         # 0 input drops, 0 queue drops, 0 input errors
-        p27 = re.compile(r'(?P<in_drops>[\d]+) +input +drops, '
-                          '+(?P<in_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<in_errors>[\d]+) +input +errors$')
+        p27=r'(?P<in_drops>[\d]+) +input +drops, '
+            '+(?P<in_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<in_errors>[\d]+) +input +errors$',
 
         # Received 0 broadcast packets, 0 multicast packets
-        p28 = re.compile(r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<in_multicast_pkts>\d+) +multicast +packets$')
+        p28=r'^Received +(?P<in_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<in_multicast_pkts>\d+) +multicast +packets$',
 
         # 0 runts, 0 giants, 0 throttles, 0 parity
-        p29 = re.compile(r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
-                          '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$')
+        p29=r'^(?P<in_runts>[\d]+) +runts, +(?P<in_giants>[\d]+) +giants, '
+            '+(?P<in_throttles>[\d]+) +throttles, +(?P<in_parity>[\d]+) +parity$',
 
         # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-        p30 = re.compile(r'^(?P<in_errors>[\d]+) +input +errors, +'
-                          '(?P<in_crc_errors>[\d]+) +CRC, +'
-                          '(?P<in_frame>[\d]+) +frame, +'
-                          '(?P<in_overrun>[\d]+) +overrun, +'
-                          '(?P<in_ignored>[\d]+) +ignored, +'
-                          '(?P<in_abort>[\d]+) +abort$')
+        p30=r'^(?P<in_errors>[\d]+) +input +errors, +'
+            '(?P<in_crc_errors>[\d]+) +CRC, +'
+            '(?P<in_frame>[\d]+) +frame, +'
+            '(?P<in_overrun>[\d]+) +overrun, +'
+            '(?P<in_ignored>[\d]+) +ignored, +'
+            '(?P<in_abort>[\d]+) +abort$',
 
         # 0 packets output, 0 bytes
         # 0 packets output, 0 bytes, 0 total output drops
-        p31 = re.compile(r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
-                          '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$')
+        p31=r'^(?P<out_pkts>[\d]+) +packets +output, +(?P<out_octets>[\d]+) +bytes'
+            '(, +(?P<out_total_drops>[\d]+) +total +output +drops)?$',
 
         # Output 0 broadcast packets, 178045 multicast packets
-        p32 = re.compile(r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
-                          '+(?P<out_multicast_pkts>\d+) +multicast +packets$')
-        
+        p32=r'^Output +(?P<out_broadcast_pkts>\d+) +broadcast +packets, '
+            '+(?P<out_multicast_pkts>\d+) +multicast +packets$',
+
         # 0 output errors, 0 underruns, 0 applique, 0 resets
-        p33 = re.compile(r'^(?P<out_errors>[\d]+) +output +errors, '
-                          '+(?P<out_underruns>[\d]+) +underruns, '
-                          '+(?P<out_applique>[\d]+) +applique, '
-                          '+(?P<out_resets>[\d]+) +resets$')
+        p33=r'^(?P<out_errors>[\d]+) +output +errors, '
+            '+(?P<out_underruns>[\d]+) +underruns, '
+            '+(?P<out_applique>[\d]+) +applique, '
+            '+(?P<out_resets>[\d]+) +resets$',
 
         # 0 output drops, 0 queue drops, 0 output errors
-        p34 = re.compile(r'(?P<out_drops>[\d]+) +output +drops, '
-                          '+(?P<out_queue_drops>[\d]+) +queue +drops, '
-                          '+(?P<out_errors>[\d]+) +output +errors$')
+        p34=r'(?P<out_drops>[\d]+) +output +drops, '
+            '+(?P<out_queue_drops>[\d]+) +queue +drops, '
+            '+(?P<out_errors>[\d]+) +output +errors$',
 
         # 0 output buffer failures, 0 output buffers swapped out
-        p35 = re.compile(r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
-                          '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$')
+        p35=r'^(?P<out_buffer_failure>[\d]+) +output +buffer +failures, '
+            '+(?P<out_buffers_swapped>[\d]+) +output +buffers +swapped +out$',
 
         # 0 carrier transitions
-        p36 = re.compile(r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$')
+        p36=r'^(?P<carrier_transitions>[\d]+) +carrier +transitions$',
+    )
+
+    def cli(self, interface="", output=None):
+        if output is None:
+            if interface:
+                cmd = self.cli_command[1].format(interface=interface)
+            else:
+                cmd = self.cli_command[0]
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        result_dict = {}
+
+        p = self.patterns
 
         for line in out.splitlines():
             line = line.strip()
+            lp = p.dispatch(line)
 
             # GigabitEthernet1 is up, line protocol is up
             # TenGigE0/0/0/4 is administratively down, line protocol is administratively down
-            m = p1.match(line)
+            m = lp.p1.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2582,7 +2588,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface state transitions: 9
-            m = p2.match(line)
+            m = lp.p2.match(line)
             if m:
                 interface_state_transitions = int(m.groupdict()['interface_state_transitions'])
                 intf_dict['interface_state_transitions'] = interface_state_transitions
@@ -2590,7 +2596,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Hardware is Loopback
             # Hardware is Gigabit Ethernet, address is 0057.d2ff.428c (bia 0057.d2ff.428c)
-            m = p3.match(line)
+            m = lp.p3.match(line)
             if m:
                 types = m.groupdict()['type']
                 mac_address = m.groupdict()['mac_address']
@@ -2603,13 +2609,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Layer 2 Transport Mode
-            m = p4.match(line)
+            m = lp.p4.match(line)
             if m:
                 intf_dict['layer2'] = True
                 continue
 
             # Description: desc
-            m = p5.match(line)
+            m = lp.p5.match(line)
             if m:
                 description = m.groupdict()['description']
                 intf_dict['description'] = description
@@ -2617,7 +2623,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Internet Address is 10.4.4.4/24
             # Internet address is Unknown
-            m = p6.match(line)
+            m = lp.p6.match(line)
             if m:
                 ipv4 = m.groupdict()['ipv4']
                 ip = m.groupdict()['ip']
@@ -2632,7 +2638,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # MTU 1500 bytes, BW 10000 Kbit
             # MTU 1518 bytes, BW 10000000 Kbit (Max: 10000000 Kbit)
-            m = p7.match(line)
+            m = lp.p7.match(line)
             if m:
                 mtu = m.groupdict()['mtu']
                 bandwidth = m.groupdict()['bandwidth']
@@ -2645,7 +2651,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # reliability 255/255, txload 1/255, rxload 1/255
-            m = p8.match(line)
+            m = lp.p8.match(line)
             if m:
                 reliability = m.groupdict()['reliability']
                 txload = m.groupdict()['txload']
@@ -2659,7 +2665,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Encapsulation ARPA,
             # Encapsulation 802.1Q Virtual LAN, Vlan ID 1, loopback not set
             # Encapsulation 802.1Q Virtual LAN, VLAN Id 10, 2nd VLAN Id 10,
-            m = p9.match(line)
+            m = lp.p9.match(line)
             if m:
                 group = m.groupdict()
                 encapsulation = group['encapsulation'].lower()
@@ -2682,14 +2688,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Outer Match: Dot1Q VLAN 300
-            m = p10.match(line)
+            m = lp.p10.match(line)
             if m:
                 outer_match = m.groupdict()['outer_match']
                 encap_dict['outer_match'] = outer_match
                 continue
 
             # Ethertype Any, MAC Match src any, dest any
-            m = p11.match(line)
+            m = lp.p11.match(line)
             if m:
                 group = m.groupdict()
                 ethertype = group['ethertype']
@@ -2705,7 +2711,7 @@ class ShowInterfaces(ShowInterfacesSchema):
             # Full-duplex, 1000Mb/s, link type is force-up
             # Full-duplex, Auto Speed, SR, link type is force-up
             # Duplex unknown, 0Kb/s, THD, link type is autonegotiation
-            m = p12.match(line)
+            m = lp.p12.match(line)
             if m:
                 group = m.groupdict()
                 duplex_mode = group['duplex_mode'].lower()
@@ -2727,7 +2733,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # output flow control is off, input flow control is off
-            m = p13.match(line)
+            m = lp.p13.match(line)
             if m:
                 receive = m.groupdict()['receive'].lower()
                 send = m.groupdict()['send'].lower()
@@ -2746,7 +2752,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Carrier delay (up) is 10 msec
             # Carrier delay (up) is 10 msec, Carrier delay (down) is 60 msec
-            m = p14.match(line)
+            m = lp.p14.match(line)
             if m:
                 group = m.groupdict()
                 carrier_delay_up = group['carrier_delay_up']
@@ -2759,14 +2765,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # loopback not set,
-            m = p15.match(line)
+            m = lp.p15.match(line)
             if m:
                 loopback = m.groupdict()['loopback']
                 intf_dict['loopback'] = loopback
                 continue
 
             # Last link flapped 5w6d
-            m = p16.match(line)
+            m = lp.p16.match(line)
             if m:
                 last_link_flapped = m.groupdict()['last_link_flapped']
                 intf_dict['last_link_flapped'] = last_link_flapped
@@ -2774,7 +2780,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
 
             # ARP type ARPA, ARP timeout 04:00:00
-            m = p17.match(line)
+            m = lp.p17.match(line)
             if m:
                 arp_type = m.groupdict()['arp_type'].lower()
                 arp_timeout = m.groupdict()['arp_timeout']
@@ -2783,7 +2789,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last input never, output 00:01:05
-            m = p18.match(line)
+            m = lp.p18.match(line)
             if m:
                 last_input = m.groupdict()['last_input']
                 last_output = m.groupdict()['last_output']
@@ -2792,14 +2798,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # No. of members in this bundle: 1
-            m = p19.match(line)
+            m = lp.p19.match(line)
             if m:
                 port_dict = intf_dict.setdefault('port_channel', {})
                 port_dict['member_count'] = int(m.groupdict()['member_count'])
                 continue
 
             # TenGigE0/0/0/1               Full-duplex  10000Mb/s    Active
-            m = p20.match(line)
+            m = lp.p20.match(line)
             if m:
                 group = m.groupdict()
                 interface = group['interface']
@@ -2815,7 +2821,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last clearing of "show interface" counters 1d02h
-            m = p21.match(line)
+            m = lp.p21.match(line)
             if m:
                 last_clear = m.groupdict()['last_clear']
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2823,7 +2829,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute input rate 0 bits/sec, 0 packets/sec
-            m = p23.match(line)
+            m = lp.p23.match(line)
             if m:
                 group = m.groupdict()
                 load_interval = int(group['load_interval'])
@@ -2842,7 +2848,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 5 minute output rate 0 bits/sec, 0 packets/sec
-            m = p24.match(line)
+            m = lp.p24.match(line)
             if m:
                 group = m.groupdict()
                 out_rate = int(group['out_rate'])
@@ -2855,7 +2861,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets input, 0 bytes
             # 0 packets input, 0 bytes, 0 total input drops
-            m = p25.match(line)
+            m = lp.p25.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict = intf_dict.setdefault('counters', {})
@@ -2865,34 +2871,34 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 1258859 drops for unrecognized upper-level protocol
-            m = p26.match(line)
+            m = lp.p26.match(line)
             if m:
                 counter_dict['in_unknown_protos'] = int(m.groupdict()['in_unknown_protos'])
                 continue
 
             # 0 input drops, 0 queue drops, 0 input errors
-            m = p27.match(line)
+            m = lp.p27.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # Received 0 broadcast packets, 0 multicast packets
-            m = p28.match(line)
+            m = lp.p28.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 runts, 0 giants, 0 throttles, 0 parity
-            m = p29.match(line)
+            m = lp.p29.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 input errors, 0 CRC, 0 frame, 0 overrun, 0 ignored, 0 abort
-            m = p30.match(line)
+            m = lp.p30.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -2900,7 +2906,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # 0 packets output, 0 bytes
             # 0 packets output, 0 bytes, 0 total output drops
-            m = p31.match(line)
+            m = lp.p31.match(line)
             if m:
                 group = m.groupdict()
                 for k, v in group.items():
@@ -2909,7 +2915,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output 0 broadcast packets, 178045 multicast packets
-            m = p32.match(line)
+            m = lp.p32.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -2917,28 +2923,28 @@ class ShowInterfaces(ShowInterfacesSchema):
 
 
             # 0 output errors, 0 underruns, 0 applique, 0 resets
-            m = p33.match(line)
+            m = lp.p33.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output drops, 0 queue drops, 0 output errors
-            m = p34.match(line)
+            m = lp.p34.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 output buffer failures, 0 output buffers swapped out
-            m = p35.match(line)
+            m = lp.p35.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
                 continue
 
             # 0 carrier transitions
-            m = p36.match(line)
+            m = lp.p36.match(line)
             if m:
                 group = m.groupdict()
                 counter_dict.update({k: int(v) for k, v in group.items()})
@@ -22,6 +22,9 @@ from netaddr import IPAddress, IPNetwork
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Or, Optional
 
+# Parser utils
+from genie.libs.parser.utils.session import nested_parse
+
 
 # ==================================================
 # Schema for 'show ospf vrf all-inclusive interface'
@@ -270,6 +273,11 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
         "high_water_mark",
     ]
 
+    def prerequisites(self, **kwargs):
+        """Commands executed besides the command of the parser"""
+        # The transit area of the virtual links
+        return [ShowOspfVrfAllInclusiveVirtualLinks.cli_command[0]]
+
     def cli(self, vrf="", interface="", output=None):
         if output is None:
             if interface:
@@ -499,8 +507,8 @@ class ShowOspfVrfAllInclusiveInterface(ShowOspfVrfAllInclusiveInterfaceSchema):
                     vl_transit_area_id = None
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = nested_parse(ShowOspfVrfAllInclusiveVirtualLinks,
+                                          self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
@@ -1011,6 +1019,11 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
 
     exclude = ["dead_timer", "neighbor_uptime", "hello_timer", "total_dbd_retrans"]
 
+    def prerequisites(self, **kwargs):
+        """Commands executed besides the command of the parser"""
+        # The transit area of the virtual links
+        return [ShowOspfVrfAllInclusiveVirtualLinks.cli_command[0]]
+
     def cli(self, vrf="", neighbor="", interface="", output=None):
         if output is None:
             if vrf:
@@ -1159,8 +1172,8 @@ class ShowOspfVrfAllInclusiveNeighborDetail(
                         name = "VL" + str(n.groupdict()["num"])
 
                     # Execute 'show ospf vrf all-inclusive virtual-links' to get the vl_transit_area_id
-                    obj = ShowOspfVrfAllInclusiveVirtualLinks(device=self.device)
-                    vl_out = obj.parse()
+                    vl_out = nested_parse(ShowOspfVrfAllInclusiveVirtualLinks,
+                                          self.device)
 
                     for vl_vrf in vl_out["vrf"]:
                         for vl_af in vl_out["vrf"][vl_vrf]["address_family"]:
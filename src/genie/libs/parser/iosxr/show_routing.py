@@ -8,6 +8,11 @@ from genie.metaparser.util.schemaengine import Schema, \
     Any, \
     Optional
 
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import RouteRecord
+from genie.libs.parser.utils.interning import Interner
+
 
 # ====================================================
 #  schema for show route ipv4
@@ -127,45 +132,13 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
     protocol_set = {'ospf', 'odr', 'isis', 'eigrp', 'static', 'mobile',
                     'rip', 'lisp', 'nhrp', 'local', 'connected', 'bgp'}
 
-    def cli(self, vrf=None, route=None, protocol=None, output=None):
-        
-        # Check if argument from device.parse is protocol or route
-        if protocol and protocol not in self.protocol_set:
-            route = protocol
-            protocol = None
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
 
-        if output is None:
-            if vrf and route:
-                cmd = self.cli_command[5].format(
-                    vrf=vrf,
-                    route=route
-                )
-            elif vrf and protocol:
-                cmd = self.cli_command[3].format(
-                    vrf=vrf,
-                    protocol=protocol
-                )
-            elif vrf:
-                cmd = self.cli_command[1].format(
-                    vrf=vrf
-                )
-            elif protocol:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol
-                )
-            elif route:
-                cmd = self.cli_command[4].format(
-                    route=route
-                )
-            else:
-                cmd = self.cli_command[0]
-            out = self.device.execute(cmd)
-        else:
-            out = output
-        
+    patterns = Patterns(
         # VRF: VRF501
         # VRF: L:123
-        p1 = re.compile(r'^\s*VRF: +(?P<vrf>\S+)$')
+        p1=r'^\s*VRF: +(?P<vrf>\S+)$',
 
         # R    10.1.0.0/8 [120/1] via 10.12.120.1, 1w0d, GigabitEthernet0/0/0/0.120
         # B    10.21.33.33/32 [200/0] via 10.166.13.13, 00:52:31
@@ -176,194 +149,282 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         # S*   192.168.4.4/10 [111/10] via 172.16.84.11, 1w0d
         # R    10.145.110.10/4 [10/10] via 192.168.10.12, 12:03:42, GigabitEthernet0/0/1/1.1
         # B    10.100.3.160/31 [200/0] via 172.23.6.198 (nexthop in vrf default), 5d13h
-        p2 = re.compile(r'^(?P<code1>[\w](\*)*)\s*(?P<code2>\S+)? +(?P<network>\S+) +'
-                        r'\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
-                        r'(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
-                        r'( +(?P<date>[\w:]+),?)?( +(?P<interface>[\w\/\.\-]+))?'
-                        r'( +(?P<code3>[\w\*\(\>\)\!]+))?$')
+        p2=r'^(?P<code1>[\w](\*)*)\s*(?P<code2>\S+)? +(?P<network>\S+) +'
+           r'\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
+           r'(?P<next_hop>\S+)( +\(nexthop +in +vrf +\w+\))?,'
+           r'( +(?P<date>[\w:]+),?)?( +(?P<interface>[\w\/\.\-]+))?'
+           r'( +(?P<code3>[\w\*\(\>\)\!]+))?$',
 
         # [90/15360] via 10.23.90.3, 1w0d, GigabitEthernet0/0/0/1.90
         # [110/2] via 10.1.2.1, 01:50:49, GigabitEthernet0/0/0/3
-        p3 = re.compile(r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
-                        r'(?P<next_hop>\S+),( +(?P<date>[\w:]+))?,? +'
-                        r'(?P<interface>[\w\/\.\-]+)$')
+        p3=r'^\[(?P<route_preference>\d+)\/(?P<metric>\d+)\] +via +'
+           r'(?P<next_hop>\S+),( +(?P<date>[\w:]+))?,? +'
+           r'(?P<interface>[\w\/\.\-]+)$',
 
         # L    10.16.2.2/32 is directly connected, 3w5d, Loopback0
         # is directly connected, 01:51:13, GigabitEthernet0/0/0/3
         # S    10.4.1.1/32 is directly connected, 01:51:13, GigabitEthernet0/0/0/0
         # S 10.2.2.2/32 is directly connected, 00:06:36, Null0
-        p4 = re.compile(r'^((?P<code1>[\w])\s*(?P<code2>\S+)?(\s+'
-                        r'(?P<network>\S+)\s+))?(is\s+directly\s+connected,\s+'
-                        r'(?P<date>[\w:]+))?,?\s+(?P<interface>[\w\/\.\-]+)?$')
+        p4=r'^((?P<code1>[\w])\s*(?P<code2>\S+)?(\s+'
+           r'(?P<network>\S+)\s+))?(is\s+directly\s+connected,\s+'
+           r'(?P<date>[\w:]+))?,?\s+(?P<interface>[\w\/\.\-]+)?$',
 
         # Routing entry for 10.151.0.0/24, 1 known subnets
         # Routing entry for 0.0.0.0/0, supernet
         # Routing entry for 192.168.154.0/24
-        p5 = re.compile(r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
-                        r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$')
-        
+        p5=r'^Routing +entry +for +(?P<network>(?P<ip>[\w\:\.]+)'
+           r'\/(?P<mask>\d+))(?:, +(?P<net>[\w\s]+))?$',
+
         # Known via "connected", distance 0, metric 0 (connected)
         # Known via "eigrp 1", distance 130, metric 10880, type internal
         # Known via "bgp 65161", distance 20, metric 0, candidate default path
-        p6 = re.compile(r'^Known +via +\"(?P<known_via>[\w ]+)\", +distance +'
-                r'(?P<distance>\d+), +metric +(?P<metric>\d+)( \(connected\))?'
-                r'(, +type +(?P<type>\S+))?(, +candidate +default +path)?$')
+        p6=r'^Known +via +\"(?P<known_via>[\w ]+)\", +distance +'
+           r'(?P<distance>\d+), +metric +(?P<metric>\d+)( \(connected\))?'
+           r'(, +type +(?P<type>\S+))?(, +candidate +default +path)?$',
 
         # * directly connected, via GigabitEthernet1.120
-        p7 = re.compile(r'^(\* +)?directly +connected, via +(?P<interface>\S+)$')
-        
+        p7=r'^(\* +)?directly +connected, via +(?P<interface>\S+)$',
+
         # Route metric is 10880, traffic share count is 1
-        p8 = re.compile(r'^Route +metric +is +(?P<metric>\d+)(, +'
-                        r'traffic +share +count +is +(?P<share_count>\d+))?$')
+        p8=r'^Route +metric +is +(?P<metric>\d+)(, +'
+           r'traffic +share +count +is +(?P<share_count>\d+))?$',
 
         # eigrp/100 (protoid=5, clientid=22)
-        p9 = re.compile(r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
-                        r', +clientid=(?P<clientid>\d+)\)$')
-        
+        p9=r'^(?P<redist_advertiser>\S+) +\(protoid=(?P<protoid>\d+)'
+           r', +clientid=(?P<clientid>\d+)\)$',
+
         # Installed Oct 23 22:09:38.380 for 5d21h
-        p10 = re.compile(r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$')
+        p10=r'^Installed +(?P<date>[\S\s]+) +for +(?P<for>\S+)$',
 
         # 10.12.90.1, from 10.12.90.1, via GigabitEthernet0/0/0/0.90
         # 172.23.6.96, from 172.23.15.196
         # 172.25.253.121, from 172.25.253.121, BGP external
-        p11 = re.compile(r'^(?P<nexthop>\S+),\s+from\s+(?P<from>\S+)(, '
-                         r'+via\s+(?P<interface>\S+))?'
-                         r'(, +BGP external)?$')
-        
+        p11=r'^(?P<nexthop>\S+),\s+from\s+(?P<from>\S+)(, '
+            r'+via\s+(?P<interface>\S+))?'
+            r'(, +BGP external)?$',
+
         # R2_xrv#show route ipv4
         # Routing Descriptor Blocks
         # No advertising protos.
-        p12 = re.compile(r'^((\S+#)?(show +route))|(Routing +Descriptor +'
-                r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)')
-        
+        p12=r'^((\S+#)?(show +route))|(Routing +Descriptor +'
+            r'Blocks)|(No +advertising +protos\.)|(Redist +Advertisers:)',
+
         # Tag 10584, type internal
-        p13 = re.compile(r'^Tag\s+(?P<tag>\d+)\,\s+type\s+(?P<type>\w+)$')
+        p13=r'^Tag\s+(?P<tag>\d+)\,\s+type\s+(?P<type>\w+)$',
 
         # Nexthop in Vrf: "default", Table: "default", IPv4 Unicast, Table Id: 0xe0000000
-        p14 = re.compile(r'^Nexthop\s+in\s+[V|v]rf\:\s+\"(?P<interface>\w+)\"\, '
-                         r'+[T|t]able\:\s+\"(?P<table>\w+)\"\, '
-                         r'+(?P<address_family>[\w\s]+)\,\s+[T|t]able '
-                         r'+[I|i]d\:\s+(?P<table_id>\S+)$')
+        p14=r'^Nexthop\s+in\s+[V|v]rf\:\s+\"(?P<interface>\w+)\"\, '
+            r'+[T|t]able\:\s+\"(?P<table>\w+)\"\, '
+            r'+(?P<address_family>[\w\s]+)\,\s+[T|t]able '
+            r'+[I|i]d\:\s+(?P<table_id>\S+)$',
 
         # Gateway of last resort is 172.16.0.88 to network 0.0.0.0
-        p15 = re.compile(r'^Gateway +of +last +resort +is '
-                         r'+(?P<gateway>(not +set)|\S+)( +to +network '
-                         r'+(?P<to_network>\S+))?$')
-
-        # initial variables
-        ret_dict = {}
-        index = 0
-        address_family = 'ipv4'
-        if not vrf:
-            vrf = 'default'
-
-        for line in out.splitlines():
+        p15=r'^Gateway +of +last +resort +is '
+            r'+(?P<gateway>(not +set)|\S+)( +to +network '
+            r'+(?P<to_network>\S+))?$',
+    )
+
+    def _command(self, vrf=None, route=None, protocol=None):
+        if vrf and route:
+            cmd = self.cli_command[5].format(
+                vrf=vrf,
+                route=route
+            )
+        elif vrf and protocol:
+            cmd = self.cli_command[3].format(
+                vrf=vrf,
+                protocol=protocol
+            )
+        elif vrf:
+            cmd = self.cli_command[1].format(
+                vrf=vrf
+            )
+        elif protocol:
+            cmd = self.cli_command[2].format(
+                protocol=protocol
+            )
+        elif route:
+            cmd = self.cli_command[4].format(
+                route=route
+            )
+        else:
+            cmd = self.cli_command[0]
+        return cmd
+
+    def _iter_events(self, output, vrf):
+        """ Read the output one line at a time, the state machine of both cli
+            and parse_records.
+
+            Yields:
+                tuple: the name of the pattern matching a line, such as
+                       'p2', its groups, and the state of the route of the
+                       line: a dict, updated in place, of the vrf, route,
+                       source_protocol and source_protocol_codes of the
+                       route, of its route_preference and metric given by
+                       the line or the ones before it, and of the index,
+                       next_hop, outgoing_interface and updated of the line
+        """
+        p = self.patterns
+        # The next hops, interfaces and codes repeat over the routes
+        intern = Interner()
+        # Protocol of the codes of the last line giving them
+        source_protocol = None
+        state = {'vrf': vrf, 'route': None, 'source_protocol': None,
+                 'source_protocol_codes': None, 'route_preference': None,
+                 'metric': None, 'index': 0}
+
+        for line in Common.iter_lines(output):
             line = line.strip()
-            
+
             # R2_xrv#show route ipv4
             # Routing Descriptor Blocks
             # No advertising protos.
-            m = p12.match(line)
+            m = p.p12.match(line)
             if m or not line:
                 continue
 
             # VRF: VRF501
             # VRF: L:123
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                vrf = m.groupdict()['vrf']
+                state['vrf'] = m.groupdict()['vrf']
                 continue
-            
+
             # R    10.1.0.0/8 [120/1] via 10.12.120.1, 1w0d, GigabitEthernet0/0/0/0.120
-            m = p2.match(line)
+            # [90/15360] via 10.23.90.3, 1w0d, GigabitEthernet0/0/0/1.90
+            for name in ('p2', 'p3'):
+                m = getattr(p, name).match(line)
+                if m:
+                    break
+            if m:
+                group = m.groupdict()
+                if name == 'p2':
+                    code1 = group['code1']
+                    code = re.split('\*|\(\!\)|\(\>\)', code1)[0].strip()
+                    for key, val in self.source_protocol_dict.items():
+                        if code in val:
+                            source_protocol = key
+                    if group['code2']:
+                        code1 = '{} {}'.format(code1, group['code2'])
+                    if group['code3']:
+                        code1 = '{} {}'.format(code1, group['code3'])
+
+                    state.update(route=group['network'],
+                                 source_protocol=source_protocol,
+                                 source_protocol_codes=intern(code1), index=1)
+                else:
+                    state['index'] += 1
+
+                state.update(route_preference=int(group['route_preference']),
+                             metric=int(group['metric']),
+                             next_hop=intern(group['next_hop']),
+                             outgoing_interface=intern(group['interface']),
+                             updated=intern(group['date']))
+                yield name, group, state
+                continue
+
+            # L    10.16.2.2/32 is directly connected, 3w5d, Loopback0
+            #                 is directly connected, 01:51:13, GigabitEthernet0/0/0/3
+            # S 10.2.2.2/32 is directly connected, 00:06:36, Null0
+            m = p.p4.match(line)
             if m:
                 group = m.groupdict()
+                if group['network']:
+                    state.update(route=group['network'], source_protocol=None,
+                                 source_protocol_codes=None,
+                                 route_preference=None, metric=None)
+
+                source_protocol = None
                 code1 = group['code1']
-                source_protocol_code = re.split('\*|\(\!\)|\(\>\)', code1)[0].strip()
-                for key,val in self.source_protocol_dict.items():
-                    if source_protocol_code in val:
-                        source_protocol = key
-                
-                code2 = group['code2']
-                if code2:
-                    code1 = '{} {}'.format(code1, code2)
+                if code1:
+                    code = re.split('\*|\(\!\)|\(\>\)', code1)[0].strip()
+                    for key, val in self.source_protocol_dict.items():
+                        if code in val:
+                            source_protocol = key
+                    if group['code2']:
+                        code1 = '{} {}'.format(code1, group['code2'])
+                    if source_protocol:
+                        state['source_protocol'] = source_protocol
+                    state['source_protocol_codes'] = intern(code1)
+
+                state.update(next_hop=None,
+                             outgoing_interface=intern(group['interface']),
+                             updated=intern(group['date']))
+                yield 'p4', group, state
+                continue
 
-                code3 = group['code3']
-                if code3:
-                    code1 = '{} {}'.format(code1, code3)
-                
-                network = group['network']
-                route_preference = int(group['route_preference'])
-                metric = int(group['metric'])
-                next_hop = group['next_hop']
-                updated = group['date']
-                interface = group['interface']
+            # The details of 'Routing entry for', and of its paths
+            for name in ('p5', 'p6', 'p7', 'p8', 'p9', 'p10', 'p11', 'p13',
+                         'p14', 'p15'):
+                m = getattr(p, name).match(line)
+                if m:
+                    # 10.12.90.1, from 10.12.90.1, via GigabitEthernet0/0/0/0.90
+                    if name == 'p11':
+                        state['index'] += 1
+                    yield name, m.groupdict(), state
+                    break
 
-                route_dict = ret_dict.setdefault('vrf', {}). \
-                    setdefault(vrf, {}). \
-                    setdefault('address_family', {}). \
-                    setdefault(address_family, {}). \
-                    setdefault('routes', {}). \
-                    setdefault(network, {})
+    def cli(self, vrf=None, route=None, protocol=None, output=None):
+        
+        # Check if argument from device.parse is protocol or route
+        if protocol and protocol not in self.protocol_set:
+            route = protocol
+            protocol = None
 
-                route_dict.update({'route': network})
-                route_dict.update({'active': True})
-                route_dict.update({'route_preference': route_preference})
-                route_dict.update({'metric': metric})
-                route_dict.update({'source_protocol': source_protocol})
-                route_dict.update({'source_protocol_codes': code1})
+        if output is None:
+            cmd = self._command(vrf=vrf, route=route, protocol=protocol)
+            out = self.device.execute(cmd)
+        else:
+            out = output
 
-                index = 1
+        # initial variables
+        ret_dict = {}
+        address_family = 'ipv4'
+        if not vrf:
+            vrf = 'default'
 
-                next_hop_list_dict = route_dict.setdefault('next_hop', {}). \
-                    setdefault('next_hop_list', {}). \
-                    setdefault(index, {})
-                
-                next_hop_list_dict.update({'index': index})
-                next_hop_list_dict.update({'next_hop': next_hop})
-                if interface:
-                    next_hop_list_dict.update({'outgoing_interface': interface})
-                if updated:
-                    next_hop_list_dict.update({'updated': updated})
-                continue
-            
+        for name, group, state in self._iter_events(out, vrf):
+            vrf = state['vrf']
+            index = state['index']
+
+            # R    10.1.0.0/8 [120/1] via 10.12.120.1, 1w0d, GigabitEthernet0/0/0/0.120
             # [90/15360] via 10.23.90.3, 1w0d, GigabitEthernet0/0/0/1.90
-            m = p3.match(line)
-            if m:
-                group = m.groupdict()
-                route_preference = int(group['route_preference'])
-                metric = int(group['metric'])
-                next_hop = group['next_hop']
-                updated = group['date']
-                interface = group['interface']
-                route_dict.update({'route_preference': route_preference})
-                route_dict.update({'metric': metric})
-                index += 1
+            if name in ('p2', 'p3'):
+                if name == 'p2':
+                    network = state['route']
+                    route_dict = ret_dict.setdefault('vrf', {}). \
+                        setdefault(vrf, {}). \
+                        setdefault('address_family', {}). \
+                        setdefault(address_family, {}). \
+                        setdefault('routes', {}). \
+                        setdefault(network, {})
+
+                    route_dict.update({'route': network})
+                    route_dict.update({'active': True})
+                route_dict.update({'route_preference': state['route_preference']})
+                route_dict.update({'metric': state['metric']})
+                if name == 'p2':
+                    route_dict.update({'source_protocol': state['source_protocol']})
+                    route_dict.update({'source_protocol_codes': state['source_protocol_codes']})
 
                 next_hop_list_dict = route_dict.setdefault('next_hop', {}). \
                     setdefault('next_hop_list', {}). \
                     setdefault(index, {})
                 
                 next_hop_list_dict.update({'index': index})
-                next_hop_list_dict.update({'next_hop': next_hop})
-                if interface:
-                    next_hop_list_dict.update({'outgoing_interface': interface})
-                if updated:
-                    next_hop_list_dict.update({'updated': updated})
-                continue
+                next_hop_list_dict.update({'next_hop': state['next_hop']})
+                if state['outgoing_interface']:
+                    next_hop_list_dict.update({'outgoing_interface': state['outgoing_interface']})
+                if state['updated']:
+                    next_hop_list_dict.update({'updated': state['updated']})
 
             # L    10.16.2.2/32 is directly connected, 3w5d, Loopback0
             #                 is directly connected, 01:51:13, GigabitEthernet0/0/0/3
-            # S 10.2.2.2/32 is directly connected, 00:06:36, Null0
-            m = p4.match(line)
-            if m:
+            elif name == 'p4':
                 try:
-                    group = m.groupdict()
-                    code1 = group.get('code1', None)
-                    source_protocol = None
-                    network = group.get('network', None)
-                    updated = group.get('date', None)
-                    interface = group.get('interface', None)
+                    network = group['network']
+                    interface = state['outgoing_interface']
+                    updated = state['updated']
 
                     if network:
                         route_dict = ret_dict.setdefault('vrf', {}). \
@@ -376,19 +437,10 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                         route_dict.update({'route': network})
                         route_dict.update({'active': True})
                     
-                    if code1:
-                        source_protocol_code = re.split('\*|\(\!\)|\(\>\)', code1)[0].strip()
-                        for key,val in self.source_protocol_dict.items():
-                            if source_protocol_code in val:
-                                source_protocol = key
-                        
-                        code2 = group.get('code2', None)
-                        if code2:
-                            code1 = '{} {}'.format(code1, code2)
-
-                        if source_protocol:
-                            route_dict.update({'source_protocol': source_protocol})
-                        route_dict.update({'source_protocol_codes': code1})
+                    if group['code1']:
+                        if state['source_protocol']:
+                            route_dict.update({'source_protocol': state['source_protocol']})
+                        route_dict.update({'source_protocol_codes': state['source_protocol_codes']})
                     
                     outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
                         setdefault('outgoing_interface', {}). \
@@ -400,18 +452,13 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     if updated:
                         outgoing_interface_dict.update({'updated': updated})
                 except Exception:
-                    print('--->'+line)
-                continue
-            
+                    print('--->{}'.format(group))
+
             # Routing entry for 10.151.0.0/24, 1 known subnets
             # Routing entry for 0.0.0.0/0, supernet
             # Routing entry for 192.168.154.0/24
-            m = p5.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p5':
                 network = group['network']
-                ip = group['ip']
-                mask = group['mask']
                 route_dict = ret_dict.setdefault('vrf', {}). \
                     setdefault(vrf, {}). \
                     setdefault('address_family', {}). \
@@ -419,146 +466,71 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                     setdefault('routes', {}). \
                     setdefault(network, {})
                 route_dict.update({'route': network})
-                route_dict.update({'ip': ip})
-                route_dict.update({'mask': mask})
+                route_dict.update({'ip': group['ip']})
+                route_dict.update({'mask': group['mask']})
                 route_dict.update({'active': True})
-                continue
 
             # Known via "static", distance 1, metric 0, candidate default path
             # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "rip", distance 120, metric 2
             # Known via "connected", distance 0, metric 0 (connected)
-            # Known via "eigrp 1", distance 130, metric 10880, type internal
             # Known via "bgp 65161", distance 20, metric 0, candidate default path
-            m = p6.match(line)
-            if m:
-                group = m.groupdict()
-                known_via = group['known_via']
-                metric = int(group['metric'])
-                distance = int(group['distance'])
-                _type = group['type']
-                route_dict.update({'known_via': known_via})
-                route_dict.update({'metric': metric})
-                route_dict.update({'distance': distance})
-                if _type:
-                    route_dict.update({'type': _type})
-                continue
+            elif name == 'p6':
+                route_dict.update({'known_via': group['known_via']})
+                route_dict.update({'metric': int(group['metric'])})
+                route_dict.update({'distance': int(group['distance'])})
+                if group['type']:
+                    route_dict.update({'type': group['type']})
 
             # * directly connected, via GigabitEthernet1.120
-            m = p7.match(line)
-            if m:
-                group = m.groupdict()
-                code1 = group.get('code1', None)
-                source_protocol = None
-                network = group.get('network', None)
-                updated = group.get('date', None)
-                interface = group.get('interface', None)
-
-                if network:
-                    route_dict = ret_dict.setdefault('vrf', {}). \
-                        setdefault(vrf, {}). \
-                        setdefault('address_family', {}). \
-                        setdefault(address_family, {}). \
-                        setdefault('routes', {}). \
-                        setdefault(network, {})
-
-                    route_dict.update({'route': network})
-                    route_dict.update({'active': True})
-                
-                if code1:
-                    source_protocol_code = re.split('\*|\(\!\)|\(\>\)', code1)[0].strip()
-                    for key,val in self.source_protocol_dict.items():
-                        if source_protocol_code in val:
-                            source_protocol = key
-                    
-                    code2 = group.get('code2', None)
-                    if code2:
-                        code1 = '{} {}'.format(code1, code2)
-                    route_dict.update({'source_protocol': source_protocol})
-                    route_dict.update({'source_protocol_codes': code1})
-                
-                if interface:
-                    outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
-                        setdefault('outgoing_interface', {}). \
-                        setdefault(interface, {})
-                    outgoing_interface_dict.update({'outgoing_interface': interface})
-                
-                if updated:
-                    outgoing_interface_dict.update({'updated': updated})
+            elif name == 'p7':
+                interface = group['interface']
+                outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
+                    setdefault('outgoing_interface', {}). \
+                    setdefault(interface, {})
+                outgoing_interface_dict.update({'outgoing_interface': interface})
 
             # Route metric is 10880, traffic share count is 1
-            m = p8.match(line)
-            if m:
-                group = m.groupdict()
-                metric = int(group['metric'])
-                outgoing_interface_dict.update({'metric': metric})
+            elif name == 'p8':
+                outgoing_interface_dict.update({'metric': int(group['metric'])})
                 if group.get('share_count', None):
                     share_count = int(group['share_count'])
                     outgoing_interface_dict.update({'share_count': share_count})
-                # outgoing_interface_dict.update({k:v for k,v in group.items() if v})
-                continue
-            
+
             # eigrp/100 (protoid=5, clientid=22)
-            m = p9.match(line)
-            if m:
-                group = m.groupdict()
-                redist_advertiser = group['redist_advertiser']
-                protoid = int(group['protoid'])
-                clientid = int(group['clientid'])
+            elif name == 'p9':
                 redist_advertiser_dict = route_dict.setdefault('redist_advertisers', {}). \
-                                setdefault(redist_advertiser, {})
-                redist_advertiser_dict.update({'protoid': protoid})
-                redist_advertiser_dict.update({'clientid': clientid})
-                continue
-            
+                                setdefault(group['redist_advertiser'], {})
+                redist_advertiser_dict.update({'protoid': int(group['protoid'])})
+                redist_advertiser_dict.update({'clientid': int(group['clientid'])})
+
             # Installed Oct 23 22:09:38.380 for 5d21h
-            m = p10.match(line)
-            if m:
-                group = m.groupdict()
+            elif name == 'p10':
                 installed_dict = route_dict.setdefault('installed', {})
                 installed_dict.update({k:v for k,v in group.items() if v})
-                continue
 
             # 10.12.90.1, from 10.12.90.1, via GigabitEthernet0/0/0/0.90
             # 172.23.6.96, from 172.23.15.196
-            m = p11.match(line)
-            if m:
-                group = m.groupdict()
-                nexthop = group['nexthop']
-                _from = group['from']
-                interface = group['interface']
-
-                index += 1
+            elif name == 'p11':
                 outgoing_interface_dict = route_dict.setdefault('next_hop', {}). \
                     setdefault('next_hop_list', {}). \
                     setdefault(index, {})
                 outgoing_interface_dict.update({'index': index})
-                if interface:
-                    outgoing_interface_dict.update({'outgoing_interface': interface})
+                if group['interface']:
+                    outgoing_interface_dict.update({'outgoing_interface': group['interface']})
 
-                outgoing_interface_dict.update({'from': _from})
-                outgoing_interface_dict.update({'next_hop': nexthop})
-                continue
+                outgoing_interface_dict.update({'from': group['from']})
+                outgoing_interface_dict.update({'next_hop': group['nexthop']})
 
             # Tag 10584, type internal
-            m13 = p13.match(line)
-            if m13:
-                group = m13.groupdict()
-
+            elif name == 'p13':
                 route_dict.update({'tag': group['tag']})
                 route_dict.update({'type': group['type']})
 
-                continue
-
             # Nexthop in Vrf: "default", Table: "default", IPv4 Unicast, Table Id: 0xe0000000
-            m14 = p14.match(line)
-            if m14:
-                group = m14.groupdict()
-                
+            elif name == 'p14':
                 interface = group['interface']
-                table = group['table']
                 address_family = group['address_family']
-                table_id = group['table_id']
 
                 if interface:
                     nexthop_intf_dict = route_dict.setdefault('next_hop', {}).\
@@ -569,16 +541,12 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
                 if interface:
                     nexthop_intf_dict.update({'nexthop_in_vrf': interface})
                 
-                nexthop_intf_dict.update({'table': table})
+                nexthop_intf_dict.update({'table': group['table']})
                 nexthop_intf_dict.update({'address_family': address_family})
-                nexthop_intf_dict.update({'table_id': table_id})
+                nexthop_intf_dict.update({'table_id': group['table_id']})
 
-                continue
-            
             # Gateway of last resort is 172.16.0.88 to network 0.0.0.0
-            m15 = p15.match(line)
-            if m15:
-                group = m15.groupdict()
+            elif name == 'p15':
                 gw_dict = ret_dict.setdefault('vrf', {}).\
                     setdefault(vrf, {}).\
                     setdefault('last_resort', {})
@@ -589,6 +557,37 @@ class ShowRouteIpv4(ShowRouteIpv4Schema):
         
         return ret_dict
 
+    def parse_records(self, vrf=None, route=None, protocol=None, output=None):
+        """ Yield a RouteRecord per next hop of the routes of the output, or
+            per outgoing interface of the directly connected routes, as it is
+            read. The lines of 'Routing entry for' details are left out.
+        """
+        # Check if argument from device.parse is protocol or route
+        if protocol and protocol not in self.protocol_set:
+            route = protocol
+            protocol = None
+
+        if output is None:
+            output = self.device.execute(self._command(
+                vrf=vrf, route=route, protocol=protocol))
+
+        if not vrf:
+            vrf = 'default'
+
+        for name, group, state in self._iter_events(output, vrf):
+            if name in ('p2', 'p3', 'p4'):
+                yield RouteRecord(
+                    vrf=state['vrf'], address_family='ipv4',
+                    route=state['route'], active=True,
+                    source_protocol=state['source_protocol'],
+                    source_protocol_codes=state['source_protocol_codes'],
+                    route_preference=state['route_preference'],
+                    metric=state['metric'],
+                    index=state['index'] if state['next_hop'] else None,
+                    next_hop=state['next_hop'],
+                    outgoing_interface=state['outgoing_interface'],
+                    updated=state['updated'])
+
 
 # ====================================================
 #  parser for show route ipv6
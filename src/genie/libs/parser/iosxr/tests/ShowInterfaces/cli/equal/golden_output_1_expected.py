@@ -0,0 +1,1322 @@
+expected_output = {
+    "BVI51": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0000.59ff.60b1",
+        "description": "NPON_Mcast_VLAN",
+        "ipv4": {
+            "192.168.166.9/30": {
+                "ip": "192.168.166.9",
+                "prefix_length": "30",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI100": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.01ff.0001",
+        "description": "au-hikari-mansion-100",
+        "ipv4": {
+            "192.168.36.254/24": {
+                "ip": "192.168.36.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI301": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.03ff.0102",
+        "ipv4": {
+            "192.168.1.254/24": {
+                "ip": "192.168.1.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI1401": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.14ff.0001",
+        "description": "au-hikari-home",
+        "ipv4": {
+            "192.168.1.254/24": {
+                "ip": "192.168.1.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+        },
+    },
+    "BVI1403": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.14ff.0304",
+        "description": "UQ-BS",
+        "ipv4": {
+            "192.168.169.254/24": {
+                "ip": "192.168.169.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI1405": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.14ff.0506",
+        "description": "au-hikari-mansion-giga",
+        "ipv4": {
+            "192.168.36.254/24": {
+                "ip": "192.168.36.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI1407": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.14ff.0708",
+        "description": "au-hikari-business",
+        "ipv4": {
+            "192.168.166.254/24": {
+                "ip": "192.168.166.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "00:03:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "BVI1410": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Bridge-Group Virtual Interface",
+        "mac_address": "0059.14ff.1011",
+        "description": "JCOM",
+        "ipv4": {
+            "192.168.121.254/24": {
+                "ip": "192.168.121.254",
+                "prefix_length": "24",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "loopback": "not set",
+        "arp_type": "arpa",
+        "arp_timeout": "00:03:00",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "Bundle-Ether1": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 9,
+        "type": "Aggregated Ethernet interface(s)",
+        "mac_address": "00bc.60ff.1119",
+        "description": "to-ML26-BE1",
+        "ipv4": {
+            "192.168.0.25/30": {
+                "ip": "192.168.0.25",
+                "prefix_length": "30",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 100000000,
+        "bandwidth_max": 100000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "100000Mb/s",
+        "loopback": "not set",
+        "last_link_flapped": "3w3d",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "port_channel": {
+            "member_count": 1,
+            "members": {
+                "HundredGigE0/0/1/2/0": {
+                    "interface": "HundredGigE0/0/1/2/0",
+                    "duplex_mode": "Full-duplex",
+                    "speed": "100000Mb/s",
+                    "state": "Active",
+                },
+            },
+        },
+        "last_input": "00:00:00",
+        "last_output": "00:00:00",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 30,
+                "in_rate": 1000,
+                "in_rate_pkts": 0,
+                "out_rate": 2000,
+                "out_rate_pkts": 1,
+            },
+            "in_pkts": 1716386544,
+            "in_octets": 751342403591,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 6,
+            "in_multicast_pkts": 642898,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 1714349214,
+            "out_octets": 754526715390,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 12,
+            "out_multicast_pkts": 642896,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 0,
+        },
+    },
+    "Bundle-Ether100": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "Aggregated Ethernet interface(s)",
+        "mac_address": "00bc.60ff.1118",
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "10000Mb/s",
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "port_channel": {
+            "member_count": 1,
+            "members": {
+                "TenGigE0/0/0/1": {
+                    "interface": "TenGigE0/0/0/1",
+                    "duplex_mode": "Full-duplex",
+                    "speed": "10000Mb/s",
+                    "state": "Active",
+                },
+            },
+        },
+        "last_input": "00:00:00",
+        "last_output": "00:00:00",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 313163,
+            "in_octets": 54531145,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 313163,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 178045,
+            "out_octets": 22136962,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 178045,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 0,
+        },
+    },
+    "Bundle-Ether100.12": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1118",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 12",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_drops": 0,
+            "in_queue_drops": 0,
+            "in_errors": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_drops": 0,
+            "out_queue_drops": 0,
+            "out_errors": 0,
+        },
+    },
+    "Bundle-Ether100.22": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1118",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 22",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_drops": 0,
+            "in_queue_drops": 0,
+            "in_errors": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_drops": 0,
+            "out_queue_drops": 0,
+            "out_errors": 0,
+        },
+    },
+    "Bundle-Ether1001": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Aggregated Ethernet interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "mtu": 1514,
+        "bandwidth": 0,
+        "reliability": "255/255",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "0Kb/s",
+        "loopback": "not set",
+        "port_channel": {
+            "member_count": 0,
+        },
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+        },
+    },
+    "Bundle-Ether1001.100": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "Down Mansion-100",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 300",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether1001.1400": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "Home Downlink",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 3400",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether1001.1402": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "UQ_BS Downlink",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 3402",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether1001.1404": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "au-hikari-mansion-giga Downlink",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 3404",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether1001.1406": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "au Hikari Business Downlink",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 3406",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether1001.1410": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "VLAN sub-interface(s)",
+        "mac_address": "00bc.60ff.1117",
+        "description": "JCOM Downlink",
+        "layer2": True,
+        "mtu": 1518,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "dot1q",
+            "outer_match": "Dot1Q VLAN 3410",
+            "ethertype": "Any",
+            "mac_match": "src any",
+            "dest": "any",
+        },
+        "loopback": "not set",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Bundle-Ether3333": {
+        "enabled": True,
+        "line_protocol": "down",
+        "oper_status": "down",
+        "interface_state_transitions": 0,
+        "type": "Aggregated Ethernet interface(s)",
+        "mac_address": "00bc.60ff.1116",
+        "mtu": 1514,
+        "bandwidth": 0,
+        "reliability": "255/255",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "0Kb/s",
+        "loopback": "not set",
+        "port_channel": {
+            "member_count": 1,
+            "members": {
+                "TenGigE0/0/0/25": {
+                    "interface": "TenGigE0/0/0/25",
+                    "duplex_mode": "Full-duplex",
+                    "speed": "10000Mb/s",
+                    "state": "Configured",
+                },
+            },
+        },
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 0,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 0,
+        },
+    },
+    "Loopback0": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "Loopback interface(s)",
+        "ipv4": {
+            "192.168.99.25/32": {
+                "ip": "192.168.99.25",
+                "prefix_length": "32",
+            },
+        },
+        "mtu": 1500,
+        "bandwidth": 0,
+        "reliability": "Unknown",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "loopback",
+        },
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "last_input": "Unknown",
+        "last_output": "Unknown",
+        "counters": {
+            "last_clear": "Unknown",
+        },
+    },
+    "Null0": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "Null interface",
+        "mtu": 1500,
+        "bandwidth": 0,
+        "reliability": "255/255",
+        "txload": "Unknown",
+        "rxload": "Unknown",
+        "encapsulations": {
+            "encapsulation": "null",
+        },
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+        },
+    },
+    "GigabitEthernet0/0/0/21": {
+        "enabled": False,
+        "line_protocol": "administratively down",
+        "oper_status": "administratively down",
+        "interface_state_transitions": 0,
+        "type": "GigabitEthernet",
+        "mac_address": "00bc.60ff.1151",
+        "phys_address": "00bc.60ff.1151",
+        "mtu": 1514,
+        "bandwidth": 1000000,
+        "bandwidth_max": 1000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "1000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 0,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 0,
+        },
+    },
+    "GigabitEthernet0/0/0/23": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 13,
+        "type": "GigabitEthernet",
+        "mac_address": "00bc.60ff.1153",
+        "phys_address": "00bc.60ff.1153",
+        "mtu": 1514,
+        "bandwidth": 1000000,
+        "bandwidth_max": 1000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "1000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "media_type": "TFD",
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_link_flapped": "3w3d",
+        "last_input": "00:03:58",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 209145,
+            "in_octets": 40356542,
+            "in_total_drops": 0,
+            "in_unknown_protos": 209145,
+            "in_broadcast_pkts": 85731,
+            "in_multicast_pkts": 123414,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 11,
+        },
+    },
+    "GigabitEthernet0/0/0/27": {
+        "enabled": False,
+        "line_protocol": "administratively down",
+        "oper_status": "administratively down",
+        "interface_state_transitions": 0,
+        "type": "GigabitEthernet",
+        "mac_address": "00bc.60ff.1157",
+        "phys_address": "00bc.60ff.1157",
+        "mtu": 1514,
+        "bandwidth": 1000000,
+        "bandwidth_max": 1000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "1000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_input": "never",
+        "last_output": "never",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 0,
+            "in_octets": 0,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 0,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 0,
+            "out_octets": 0,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 0,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 0,
+        },
+    },
+    "TenGigE0/0/0/0": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "TenGigE",
+        "mac_address": "00bc.60ff.113c",
+        "phys_address": "00bc.60ff.113c",
+        "description": "to-ML24",
+        "ipv4": {
+            "192.168.0.22/30": {
+                "ip": "192.168.0.22",
+                "prefix_length": "30",
+            },
+        },
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "10000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "media_type": "SR",
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "arp_type": "arpa",
+        "arp_timeout": "04:00:00",
+        "last_input": "00:00:00",
+        "last_output": "00:00:00",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 2000,
+                "in_rate_pkts": 1,
+                "out_rate": 1000,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 858438357,
+            "in_octets": 377844978719,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 6,
+            "in_multicast_pkts": 761392,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 860493206,
+            "out_octets": 374682459456,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 6,
+            "out_multicast_pkts": 524312,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 1,
+        },
+    },
+    "TenGigE0/0/0/1": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 1,
+        "type": "TenGigE",
+        "mac_address": "00bc.60ff.113d",
+        "phys_address": "00bc.60ff.113d",
+        "description": "L2SW Po12",
+        "mtu": 1518,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "10000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "media_type": "SR",
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_link_flapped": "5w6d",
+        "last_input": "00:00:00",
+        "last_output": "00:00:00",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 30,
+                "in_rate": 0,
+                "in_rate_pkts": 0,
+                "out_rate": 0,
+                "out_rate_pkts": 0,
+            },
+            "in_pkts": 313163,
+            "in_octets": 54531145,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 313163,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 178045,
+            "out_octets": 22136962,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 178045,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 1,
+        },
+    },
+    "TenGigE0/0/0/2": {
+        "enabled": True,
+        "line_protocol": "up",
+        "oper_status": "up",
+        "interface_state_transitions": 3,
+        "type": "TenGigE",
+        "mac_address": "00bc.60ff.113e",
+        "phys_address": "00bc.60ff.113e",
+        "layer2": True,
+        "mtu": 1514,
+        "bandwidth": 10000000,
+        "bandwidth_max": 10000000,
+        "reliability": "255/255",
+        "txload": "0/255",
+        "rxload": "0/255",
+        "encapsulations": {
+            "encapsulation": "arpa",
+        },
+        "duplex_mode": "full",
+        "port_speed": "10000Mb/s",
+        "link_type": "force-up",
+        "auto_negotiate": False,
+        "media_type": "SR",
+        "flow_control": {
+            "receive": False,
+            "send": False,
+        },
+        "carrier_delay_up": 10,
+        "loopback": "not set",
+        "last_link_flapped": "1w3d",
+        "last_input": "00:00:00",
+        "last_output": "00:00:00",
+        "counters": {
+            "last_clear": "never",
+            "rate": {
+                "load_interval": 300,
+                "in_rate": 0,
+                "in_rate_pkts": 1,
+                "out_rate": 0,
+                "out_rate_pkts": 1,
+            },
+            "in_pkts": 3800143,
+            "in_octets": 231571320,
+            "in_total_drops": 0,
+            "in_unknown_protos": 0,
+            "in_broadcast_pkts": 0,
+            "in_multicast_pkts": 3800143,
+            "in_runts": 0,
+            "in_giants": 0,
+            "in_throttles": 0,
+            "in_parity": 0,
+            "in_errors": 0,
+            "in_crc_errors": 0,
+            "in_frame": 0,
+            "in_overrun": 0,
+            "in_ignored": 0,
+            "in_abort": 0,
+            "out_pkts": 3562789,
+            "out_octets": 213767340,
+            "out_total_drops": 0,
+            "out_broadcast_pkts": 0,
+            "out_multicast_pkts": 3562789,
+            "out_errors": 0,
+            "out_underruns": 0,
+            "out_applique": 0,
+            "out_resets": 0,
+            "out_buffer_failure": 0,
+            "out_buffers_swapped": 0,
+            "carrier_transitions": 3,
+        },
+    },
+}
@@ -20,6 +20,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Use, Or
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
 
 
 # =======================================================
@@ -767,335 +768,342 @@ class ShowInterfacesSchema(MetaParser):
 class ShowInterfaces(ShowInterfacesSchema):
     cli_command = ['show interfaces']
 
-    def cli(self, output=None):
-
-        if not output:
-            out = self.device.execute(self.cli_command[0])
-        else:
-            out = output
-        
-        ret_dict = {}
-        
-        statistics_type = None
-
+    patterns = Patterns(
         # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-        p1 = re.compile(r'^Physical +interface: +(?P<name>\S+), +'
-            r'(?P<admin_status>\S+), +Physical +link +is +(?P<oper_status>\S+)$')
+        p1=r'^Physical +interface: +(?P<name>\S+), +'
+           r'(?P<admin_status>\S+), +Physical +link +is +(?P<oper_status>\S+)$',
 
         # Interface index: 148, SNMP ifIndex: 526
-        p2 = re.compile(r'^Interface +index: +(?P<local_index>\d+), +'
-            r'SNMP +ifIndex: +(?P<snmp_index>\d+)'
-            r'(, +Generation: +\S+)$')
+        p2=r'^Interface +index: +(?P<local_index>\d+), +'
+           r'SNMP +ifIndex: +(?P<snmp_index>\d+)'
+           r'(, +Generation: +\S+)$',
 
         # Description: none/100G/in/hktGCS002_ge-0/0/0
-        p3 = re.compile(r'^Description: +(?P<description>\S+)$')
+        p3=r'^Description: +(?P<description>\S+)$',
 
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
         # Link-level type: Ethernet, MTU: 1514, Link-mode: Full-duplex, Speed: 1000mbps,
-        p4 = re.compile(r'^(Type: +\S+, )?Link-level +type: +'
-            r'(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
-            r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-            r'(, +Link-mode: +(?P<link_mode>\S+))?'
-            r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +'
-            r'(?P<bpdu_error>\S+),)?$')
-        
+        p4=r'^(Type: +\S+, )?Link-level +type: +'
+           r'(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
+           r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+           r'(, +Link-mode: +(?P<link_mode>\S+))?'
+           r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +'
+           r'(?P<bpdu_error>\S+),)?$',
+
         # Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
-        p4_1 = re.compile(r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
-                          r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
-                          r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?')
+        p4_1=r'^(Speed: +(?P<speed>[^\s,]+))(, +)?'
+             r'(BPDU +Error: +(?P<bpdu_error>[^\s,]+))?(, +)?'
+             r'(Loop +Detect +PDU +Error: +(?P<ld_pdu_error>[^\s,]+))?(, +)?',
 
         # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
-        p4_2 = re.compile(r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
-                          r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
-                          r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
-                          r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
-                          r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
-                          r'( +MAC-REWRITE +Error: +\S+)?$')
-
+        p4_2=r'^Link-level +type: +(?P<link_level_type>\S+), +MTU: +(?P<mtu>\S+)'
+             r'(, +MRU: +(?P<mru>\d+))?(, +(?P<sonet_mode>\S+) +mode)?'
+             r'(, +Speed: +(?P<speed>\S+))?(, +BPDU +Error: +(?P<bpdu_error>\S+),)?'
+             r'( +Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+),)?'
+             r'( +Ethernet-Switching +Error: +(?P<eth_switch_error>\S+),)?'
+             r'( +MAC-REWRITE +Error: +\S+)?$',
 
         # Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        p5 = re.compile(r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
-            r'Ethernet-Switching +Error: +(?P<eth_switch_error>\S+), +MAC-REWRITE +'
-            r'Error: +\S+, +Loopback: +(?P<loopback>\S+),$')
+        p5=r'^Loop +Detect +PDU +Error: +(?P<ld_pdu_error>\S+), +'
+           r'Ethernet-Switching +Error: +(?P<eth_switch_error>\S+), +MAC-REWRITE +'
+           r'Error: +\S+, +Loopback: +(?P<loopback>\S+),$',
 
         # Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-        p5_1 = re.compile(r'^(Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))'
-                          r'(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?'
-                          r'(Loopback: +(?P<loopback>[^\s,]+))(, +)?')
+        p5_1=r'^(Ethernet-Switching +Error: +(?P<eth_switch_error>[^\s,]+))'
+             r'(, +)?(MAC-REWRITE +Error: +[^\s,]+)?(, +)?'
+             r'(Loopback: +(?P<loopback>[^\s,]+))(, +)?',
 
         # Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-        p5_2 = re.compile(r'^(Loopback: +(?P<loopback>\S+),)?'
-                          r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
-                          r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
-                          r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
-                          r'( +Remote +fault: +(?P<if_remote_fault>\S+))$')
+        p5_2=r'^(Loopback: +(?P<loopback>\S+),)?'
+             r'( +Source +filtering: +(?P<source_filtering>\S+),)?'
+             r'( +Flow +control: +(?P<if_flow_control>\S+),)?'
+             r'( +Auto-negotiation: +(?P<if_auto_negotiation>\S+),)?'
+             r'( +Remote +fault: +(?P<if_remote_fault>\S+))$',
 
         # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-        p6 = re.compile(r'^Source +filtering: +(?P<source_filtering>\S+), +'
-            r'Flow +control: +(?P<if_flow_control>\S+), +'
-            r'Auto-negotiation: +(?P<if_auto_negotiation>\S+), +'
-            r'Remote +fault: +(?P<if_remote_fault>\S+)$')
+        p6=r'^Source +filtering: +(?P<source_filtering>\S+), +'
+           r'Flow +control: +(?P<if_flow_control>\S+), +'
+           r'Auto-negotiation: +(?P<if_auto_negotiation>\S+), +'
+           r'Remote +fault: +(?P<if_remote_fault>\S+)$',
 
         # Pad to minimum frame size: Disabled
-        p7 = re.compile(r'^Pad +to +minimum +frame +size: +'
-            r'(?P<pad_to_minimum_frame_size>\S+)$')
+        p7=r'^Pad +to +minimum +frame +size: +'
+           r'(?P<pad_to_minimum_frame_size>\S+)$',
 
         # Device flags   : Present Running
-        p8 = re.compile(r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$')
+        p8=r'^Device +flags +: +(?P<if_device_flags>[\S\s]+)$',
 
         # Interface flags: SNMP-Traps Internal: 0x4000
-        p9 = re.compile(r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
-                r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$')
+        p9=r'^Interface +flags:( +(?P<hardware_down>Hardware-Down))? +'
+           r'(?P<iff_snmp_traps>\S+)( +Internal: +(?P<internal_flags>\S+))?$',
 
         # Link flags     : None
-        p10 = re.compile(r'^Link +flags +: +(?P<if_media_flags>\S+)$')
+        p10=r'^Link +flags +: +(?P<if_media_flags>\S+)$',
 
         # Link type      : Full-Duplex
-        p10_1 = re.compile(r'^Link +type +: +(?P<link_type>\S+)$')
+        p10_1=r'^Link +type +: +(?P<link_type>\S+)$',
 
         # CoS queues     : 8 supported, 8 maximum usable queues
-        p11 = re.compile(r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
+        p11=r'^CoS +queues +: +(?P<physical_interface_cos_hw_max_queues>\d+) +'
             r'supported, +(?P<physical_interface_cos_use_max_queues>\d+) maximum +'
-            r'usable +queues$')
+            r'usable +queues$',
 
         # Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
-        p12 = re.compile(r'^Current +address: +(?P<current_physical_address>\S+), +'
-            r'Hardware +address: +(?P<hardware_physical_address>\S+)$')
+        p12=r'^Current +address: +(?P<current_physical_address>\S+), +'
+            r'Hardware +address: +(?P<hardware_physical_address>\S+)$',
 
         # Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
-        p13 = re.compile(r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$')
+        p13=r'^Last +flapped +: +(?P<interface_flapped>[\S\s]+)$',
 
         # Input rate     : 2952 bps (5 pps)
-        p14 = re.compile(r'^Input +rate +: +(?P<input_bps>\d+) +'
-            r'bps +\((?P<input_pps>\d+) +pps\)$')
-        
+        p14=r'^Input +rate +: +(?P<input_bps>\d+) +'
+            r'bps +\((?P<input_pps>\d+) +pps\)$',
+
         # Input  bytes  :          19732539397                 3152 bps
-        p14_1 = re.compile(r'^Input +bytes *: +(?P<input_bytes>\S+)'
-            r'( +(?P<input_bps>\S+) +bps)?$')
+        p14_1=r'^Input +bytes *: +(?P<input_bytes>\S+)'
+              r'( +(?P<input_bps>\S+) +bps)?$',
+
         # Output bytes  :          16367814635                 3160 bps
-        p14_2 = re.compile(r'^Output +bytes *: +(?P<output_bytes>\S+)'
-            r'( +(?P<output_bps>\S+) +bps)?$')
+        p14_2=r'^Output +bytes *: +(?P<output_bytes>\S+)'
+              r'( +(?P<output_bps>\S+) +bps)?$',
+
         # Input  packets:            133726363                    5 pps
-        p14_3 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)'
-            r'( +(?P<input_pps>\S+) +pps)?$')
+        p14_3=r'^Input +packets *: +(?P<input_packets>\S+)'
+              r'( +(?P<input_pps>\S+) +pps)?$',
+
         # Output packets:            129306863                    4 pps
-        p14_4 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)'
-            r'( +(?P<output_pps>\S+) +pps)?$')
-        
+        p14_4=r'^Output +packets *: +(?P<output_packets>\S+)'
+              r'( +(?P<output_pps>\S+) +pps)?$',
+
         # Output rate    : 3080 bps (3 pps)
-        p15 = re.compile(r'^Output +rate +: +(?P<output_bps>\d+) +'
-            r'bps +\((?P<output_pps>\d+) +pps\)$')
-        
+        p15=r'^Output +rate +: +(?P<output_bps>\d+) +'
+            r'bps +\((?P<output_pps>\d+) +pps\)$',
+
         # Active alarms  : None
-        p16 = re.compile(r'^Active +alarms *: +(?P<active_alarms>\S+)$')
+        p16=r'^Active +alarms *: +(?P<active_alarms>\S+)$',
 
         # Active defects : None
-        p17 = re.compile(r'^Active +defects *: +(?P<active_defects>\S+)$')
-        
+        p17=r'^Active +defects *: +(?P<active_defects>\S+)$',
+
         # PCS statistics                      Seconds
-        p18 = re.compile(r'^PCS +statistics +Seconds$')
+        p18=r'^PCS +statistics +Seconds$',
 
         # Bit errors                             0
-        p19 = re.compile(r'^Bit +errors +(?P<bit_error_seconds>\d+)$')
+        p19=r'^Bit +errors +(?P<bit_error_seconds>\d+)$',
 
         # Errored blocks                         0
-        p20 = re.compile(r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$')
-        
+        p20=r'^Errored +blocks +(?P<errored_blocks_seconds>\d+)$',
+
         # Ethernet FEC statistics              Errors
-        p21 = re.compile(r'^Ethernet +FEC +statistics +Errors$')
+        p21=r'^Ethernet +FEC +statistics +Errors$',
 
         # FEC Corrected Errors                    0
         # FEC Uncorrected Errors                  0
         # FEC Corrected Errors Rate               0
         # FEC Uncorrected Errors Rate             0
-        p22 = re.compile(r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$')
-        p22_1 = re.compile(r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$')
-        p22_2 = re.compile(r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$')
-        p22_3 = re.compile(r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$')
+        p22=r'^FEC +Corrected +Errors +(?P<fec_ccw_count>\d+)$',
+        p22_1=r'^FEC +Uncorrected +Errors +(?P<fec_nccw_count>\d+)$',
+        p22_2=r'^FEC +Corrected +Errors +Rate +(?P<fec_ccw_error_rate>\d+)$',
+        p22_3=r'^FEC +Uncorrected +Errors +Rate +(?P<fec_nccw_error_rate>\d+)$',
 
         # Interface transmit statistics: Disabled
-        p23 = re.compile(r'^Interface +transmit +statistics: +'
-            r'(?P<interface_transmit_statistics>\S+)$')
+        p23=r'^Interface +transmit +statistics: +'
+            r'(?P<interface_transmit_statistics>\S+)$',
 
         # Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
-        p24 = re.compile(r'^Logical +interface +(?P<name>\S+) +'
+        p24=r'^Logical +interface +(?P<name>\S+) +'
             r'\(Index +(?P<local_index>\d+)\) +\(SNMP +ifIndex +'
-            r'(?P<snmp_index>\d+)\)( +\(Generation +\S+\))?$')
+            r'(?P<snmp_index>\d+)\)( +\(Generation +\S+\))?$',
 
         # Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
         # Flags: Up SNMP-Traps 0x4000 VLAN-Tag [ 0x8100.1 ]  Encapsulation: ENET2
-        p25 = re.compile(r'^Flags: +(?P<iff_up>\S+)( +SNMP-Traps)?'
+        p25=r'^Flags: +(?P<iff_up>\S+)( +SNMP-Traps)?'
             r'( +(?P<internal_flags>\S+))?( +VLAN-Tag +\[[\S\s]+\])? +'
-            r'Encapsulation: +(?P<encapsulation>\S+)$')
+            r'Encapsulation: +(?P<encapsulation>\S+)$',
 
         # Input packets : 133657033
-        p26 = re.compile(r'^Input +packets *: +(?P<input_packets>\S+)$')
+        p26=r'^Input +packets *: +(?P<input_packets>\S+)$',
 
         # Output packets: 129243982
-        p27 = re.compile(r'^Output +packets *: +(?P<output_packets>\S+)$')
+        p27=r'^Output +packets *: +(?P<output_packets>\S+)$',
 
         # Protocol inet, MTU: 1500, Maximum labels: 2
         # Protocol inet, MTU: 1500, Generation: 150, Route table: 0
-        p28 = re.compile(r'^Protocol +(?P<address_family_name>\S+), +'
+        p28=r'^Protocol +(?P<address_family_name>\S+), +'
             r'MTU: +(?P<mtu>\S+)(, +Maximum labels: +'
             r'(?P<maximum_labels>\S+))?(, +Generation: +'
             r'(?P<generation>\S+))?(, +Route table: +'
-            r'(?P<route_table>\S+))?$')
+            r'(?P<route_table>\S+))?$',
 
         # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
-        p30 = re.compile(r'^Max +nh +cache: +(?P<max_local_cache>\d+), +'
+        p30=r'^Max +nh +cache: +(?P<max_local_cache>\d+), +'
             r'New +hold +nh +limit: +(?P<new_hold_limit>\d+)'
             r', Curr +nh +cnt: +(?P<intf_curr_cnt>\d+), +'
             r'Curr +new +hold +cnt: +(?P<intf_unresolved_cnt>\d+)'
-            r', +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$')
+            r', +NH +drop +cnt: +(?P<intf_dropcnt>\d+)$',
 
         # Flags: No-Redirects, Sendbcast-pkt-to-re
-        p31 = re.compile(r'^Flags: +(?P<flags>[\S\s]+)')
+        p31=r'^Flags: +(?P<flags>[\S\s]+)',
 
         # Addresses, Flags: Is-Preferred Is-Primary
-        p32 = re.compile(r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$')
+        p32=r'^Addresses, +Flags: +(?P<flags>[\S\s]+)$',
 
         # Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
-        p33 = re.compile(r'^Destination: +(?P<ifa_destination>\S+)'
+        p33=r'^Destination: +(?P<ifa_destination>\S+)'
             r', +Local: +(?P<ifa_local>\S+)'
-            r'(, +Broadcast: +(?P<ifa_broadcast>\S+))?$')
+            r'(, +Broadcast: +(?P<ifa_broadcast>\S+))?$',
 
         # Bandwidth: 0
-        p34 = re.compile(r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$')
+        p34=r'^Bandwidth: +(?P<logical_interface_bandwidth>\S+)$',
 
         # Local: fe80::250:560f:fc8d:7c08
-        p35 = re.compile(r'^Local: +(?P<ifa_local>\S+)$')
+        p35=r'^Local: +(?P<ifa_local>\S+)$',
 
         # IPv6 transit statistics:
-        p36 = re.compile(r'^IPv6 +transit +statistics:$')
+        p36=r'^IPv6 +transit +statistics:$',
 
         # Dropped traffic statistics due to STP State:
-        p37 = re.compile(r'^Dropped +traffic +statistics +due +to +'
-            r'STP +State:$')
+        p37=r'^Dropped +traffic +statistics +due +to +'
+            r'STP +State:$',
 
         # Transit statistics:
-        p38 = re.compile(r'^Transit +statistics:$')
+        p38=r'^Transit +statistics:$',
 
         # Hold-times     : Up 2000 ms, Down 0 ms
-        p39 = re.compile(r'^Hold-times +: +Up +\d+ +ms, +Down +\d+ +ms$')
+        p39=r'^Hold-times +: +Up +\d+ +ms, +Down +\d+ +ms$',
 
         # Damping        : half-life: 0 sec, max-suppress: 0 sec, reuse: 0, suppress: 0, state: unsuppressed
-        p40 = re.compile(r'^Damping +: +half-life: +\d+ +sec, +max-suppress: +'
-            r'\d+ +sec, +reuse: +\d+, +suppress: +\d+, +state: +\S+$')
+        p40=r'^Damping +: +half-life: +\d+ +sec, +max-suppress: +'
+            r'\d+ +sec, +reuse: +\d+, +suppress: +\d+, +state: +\S+$',
 
         # Input errors:
-        p41 = re.compile(r'^Input +errors:$')
+        p41=r'^Input +errors:$',
 
         # Output errors:
-        p42 = re.compile(r'^Output +errors:$')
+        p42=r'^Output +errors:$',
 
         # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0,
         # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0, L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
-        p43_1 = re.compile(r'^Errors: +(?P<input_errors>\d+), +'
-            r'Drops: +(?P<input_drops>\d+), +Framing +errors: +(?P<framing_errors>\d+), +'
-            r'Runts: +(?P<input_runts>\d+), Policed +discards: +(?P<input_discards>\d+),'
-            r'( +L3 +incompletes: +(?P<input_l3_incompletes>\d+), +'
-            r'L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
-            r'( +L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
-            r'( +FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
-            r'( +Resource +errors: +(?P<input_resource_errors>\d+))?$')
-        
+        p43_1=r'^Errors: +(?P<input_errors>\d+), +'
+              r'Drops: +(?P<input_drops>\d+), +Framing +errors: +(?P<framing_errors>\d+), +'
+              r'Runts: +(?P<input_runts>\d+), Policed +discards: +(?P<input_discards>\d+),'
+              r'( +L3 +incompletes: +(?P<input_l3_incompletes>\d+), +'
+              r'L2 +channel +errors: +(?P<input_l2_channel_errors>\d+),)?'
+              r'( +L2 +mismatch +timeouts: +(?P<input_l2_mismatch_timeouts>\d+),?)?'
+              r'( +FIFO +errors: +(?P<input_fifo_errors>\d+),?)?'
+              r'( +Resource +errors: +(?P<input_resource_errors>\d+))?$',
+
         # L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
-        p43_2 = re.compile(r'^L2 +mismatch +timeouts: +'
-            r'(?P<input_l2_mismatch_timeouts>\d+), +FIFO +errors: +'
-            r'(?P<input_fifo_errors>\d+), +Resource +errors: +'
-            r'(?P<input_resource_errors>\d+)')
+        p43_2=r'^L2 +mismatch +timeouts: +'
+              r'(?P<input_l2_mismatch_timeouts>\d+), +FIFO +errors: +'
+              r'(?P<input_fifo_errors>\d+), +Resource +errors: +'
+              r'(?P<input_resource_errors>\d+)',
 
         # Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
         # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0,
         # Carrier transitions: 0, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0, MTU errors: 0, Resource errors: 0
-        p44_1 = re.compile(r'^Carrier +transitions: +(?P<carrier_transitions>\d+), +'
-            r'Errors: +(?P<output_errors>\d+), +Drops: +(?P<output_drops>\d+), +'
-            r'Collisions: +(?P<output_collisions>\d+), +Aged+ packets: +'
-            r'(?P<aged_packets>\d+),( +FIFO +errors: +(?P<output_fifo_errors>\d+), +'
-            r'HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
-            r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
-            r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$')
+        p44_1=r'^Carrier +transitions: +(?P<carrier_transitions>\d+), +'
+              r'Errors: +(?P<output_errors>\d+), +Drops: +(?P<output_drops>\d+), +'
+              r'Collisions: +(?P<output_collisions>\d+), +Aged+ packets: +'
+              r'(?P<aged_packets>\d+),( +FIFO +errors: +(?P<output_fifo_errors>\d+), +'
+              r'HS +link +CRC +errors: +(?P<hs_link_crc_errors>\d+),)?'
+              r'( +MTU +errors: +(?P<mtu_errors>\d+),?)?'
+              r'( +Resource +errors: +(?P<output_resource_errors>\d+))?$',
 
         # MTU errors: 0, Resource errors: 0
-        p44_2 = re.compile(r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
-            r'errors: +(?P<output_resource_errors>\d+)$')
-        
+        p44_2=r'^MTU +errors: +(?P<mtu_errors>\d+), +Resource +'
+              r'errors: +(?P<output_resource_errors>\d+)$',
+
         # Total octets                   21604601324      16828244544
-        p45 = re.compile(r'^Total +octets +(?P<input_bytes>\d+) +'
-            r'(?P<output_bytes>\d+)$')
+        p45=r'^Total +octets +(?P<input_bytes>\d+) +'
+            r'(?P<output_bytes>\d+)$',
 
         # MAC statistics:                      Receive         Transmit
-        p45_1 = re.compile(r'^MAC +statistics: +Receive +Transmit$')
+        p45_1=r'^MAC +statistics: +Receive +Transmit$',
 
         # Total packets                    133726919        129183374
-        p46 = re.compile(r'^Total +packets +(?P<input_packets>\d+) +'
-            r'(?P<output_packets>\d+)')
+        p46=r'^Total +packets +(?P<input_packets>\d+) +'
+            r'(?P<output_packets>\d+)',
 
         # Unicast packets                  133726908        129183361
-        p47 = re.compile(r'^Unicast +packets +(?P<input_unicasts>\d+) +'
-            r'(?P<output_unicasts>\d+)$')
+        p47=r'^Unicast +packets +(?P<input_unicasts>\d+) +'
+            r'(?P<output_unicasts>\d+)$',
 
         # Broadcast packets                        0                0
-        p48 = re.compile(r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
-            r'(?P<output_broadcasts>\d+)$')
+        p48=r'^Broadcast +packets +(?P<input_broadcasts>\d+) +'
+            r'(?P<output_broadcasts>\d+)$',
 
         # Multicast packets                        0                0
-        p49 = re.compile(r'^Multicast +packets +(?P<input_multicasts>\d+) +'
-            r'(?P<output_multicasts>\d+)$')
+        p49=r'^Multicast +packets +(?P<input_multicasts>\d+) +'
+            r'(?P<output_multicasts>\d+)$',
 
         # CRC/Align errors                         0                0
-        p50 = re.compile(r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
-            r'(?P<output_crc_errors>\d+)$')
+        p50=r'^CRC\/Align +errors +(?P<input_crc_errors>\d+) +'
+            r'(?P<output_crc_errors>\d+)$',
 
         # FIFO errors                              0                0
-        p51 = re.compile(r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
-            r'(?P<output_fifo_errors>\d+)$')
+        p51=r'^FIFO +errors +(?P<input_fifo_errors>\d+) +'
+            r'(?P<output_fifo_errors>\d+)$',
 
         # MAC control frames                       0                0
-        p52 = re.compile(r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
-            r'(?P<output_mac_control_frames>\d+)$')
+        p52=r'^MAC +control +frames +(?P<input_mac_control_frames>\d+) +'
+            r'(?P<output_mac_control_frames>\d+)$',
 
         # MAC pause frames                         0                0
-        p53 = re.compile(r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
-            r'(?P<output_mac_pause_frames>\d+)$')
+        p53=r'^MAC +pause +frames +(?P<input_mac_pause_frames>\d+) +'
+            r'(?P<output_mac_pause_frames>\d+)$',
 
         # Oversized frames                         0
-        p54 = re.compile(r'^Oversized +frames +(?P<input_oversized_frames>\d+)$')
+        p54=r'^Oversized +frames +(?P<input_oversized_frames>\d+)$',
 
         # Jabber frames                            0
-        p56 = re.compile(r'^Jabber +frames +(?P<input_jabber_frames>\d+)$')
+        p56=r'^Jabber +frames +(?P<input_jabber_frames>\d+)$',
 
         # Fragment frames                          0
-        p57 = re.compile(r'^Fragment +frames +(?P<input_fragment_frames>\d+)$')
+        p57=r'^Fragment +frames +(?P<input_fragment_frames>\d+)$',
 
         # VLAN tagged frames                       0
-        p58 = re.compile(r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$')
+        p58=r'^VLAN +tagged +frames +(?P<input_vlan_tagged_frames>\d+)$',
 
         # Code violations                          0
-        p59 = re.compile(r'^Code +violations +(?P<input_code_violations>\d+)$')
+        p59=r'^Code +violations +(?P<input_code_violations>\d+)$',
 
         # Total errors                             0                0
-        p60 = re.compile(r'^Total +errors +(?P<input_total_errors>\d+)$')
+        p60=r'^Total +errors +(?P<input_total_errors>\d+)$',
 
         # Label-switched interface (LSI) traffic statistics:
-        p61 = re.compile(r'^Label-switched +interface +\(LSI\) +traffic +statistics:$')
+        p61=r'^Label-switched +interface +\(LSI\) +traffic +statistics:$',
 
         # Egress queues: 8 supported, 4 in use
-        p62 = re.compile(r'^Egress +queues: +(?P<intf_cos_num_queues_supported>\d+) +'
-            r'supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$')
+        p62=r'^Egress +queues: +(?P<intf_cos_num_queues_supported>\d+) +'
+            r'supported, +(?P<intf_cos_num_queues_in_use>\d+) +in +use$',
 
         # 0                                0                    0                    0
-        p63 = re.compile(r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
-            r'(?P<queue_counters_trans_packets>\d+) +(?P<drop_packets>\d+)$')
+        p63=r'^(?P<queue_number>\d+) +(?P<queue_counters_queued_packets>\d+) +'
+            r'(?P<queue_counters_trans_packets>\d+) +(?P<drop_packets>\d+)$',
+    )
+
+    def cli(self, output=None):
+
+        if not output:
+            out = self.device.execute(self.cli_command[0])
+        else:
+            out = output
+        
+        ret_dict = {}
+        
+        statistics_type = None
+
+        p = self.patterns
 
         cnt = 0
         for line in out.splitlines():
             line = line.strip()
+            lp = p.dispatch(line)
             cnt += 1
 
             # Physical interface: ge-0/0/0, Enabled, Physical link is Up
-            m = p1.match(line)
+            m = lp.p1.match(line)
             if m:
                 group = m.groupdict()
                 statistics_type = 'physical'
@@ -1110,7 +1118,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface index: 148, SNMP ifIndex: 526
-            m = p2.match(line)
+            m = lp.p2.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1118,7 +1126,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Description: none/100G/in/hktGCS002_ge-0/0/0
-            m = p3.match(line)
+            m = lp.p3.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1126,7 +1134,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None,
-            m = p4.match(line)
+            m = lp.p4.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1134,7 +1142,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None,
-            m = p4_1.match(line)
+            m = lp.p4_1.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1142,7 +1150,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Link-level type: Ethernet, MTU: 1514, MRU: 1522, LAN-PHY mode, Speed: 1000mbps, BPDU Error: None, Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None,
-            m = p4_2.match(line)
+            m = lp.p4_2.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1150,7 +1158,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Loop Detect PDU Error: None, Ethernet-Switching Error: None, MAC-REWRITE Error: None, Loopback: Disabled,
-            m = p5.match(line)
+            m = lp.p5.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1158,7 +1166,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Loopback: Disabled, Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-            m = p5_2.match(line)
+            m = lp.p5_2.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1166,7 +1174,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Source filtering: Disabled, Flow control: Enabled, Auto-negotiation: Enabled, Remote fault: Online
-            m = p6.match(line)
+            m = lp.p6.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1174,7 +1182,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Pad to minimum frame size: Disabled
-            m = p7.match(line)
+            m = lp.p7.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1182,7 +1190,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Device flags   : Present Running
-            m = p8.match(line)
+            m = lp.p8.match(line)
             if m:
                 group = m.groupdict()
                 if_device_flags = group['if_device_flags']
@@ -1193,7 +1201,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface flags: SNMP-Traps Internal: 0x4000
-            m = p9.match(line)
+            m = lp.p9.match(line)
             if m:
                 group = m.groupdict()
                 if_config_flags_dict = physical_interface_dict.setdefault('if-config-flags', {})
@@ -1205,7 +1213,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Link flags     : None
-            m = p10.match(line)
+            m = lp.p10.match(line)
             if m:
                 group = m.groupdict()
                 if_media_flags = group['if_media_flags']
@@ -1216,7 +1224,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Link type      : Full-Duplex
-            m = p10_1.match(line)
+            m = lp.p10_1.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1224,7 +1232,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # CoS queues     : 8 supported, 8 maximum usable queues
-            m = p11.match(line)
+            m = lp.p11.match(line)
             if m:
                 group = m.groupdict()
                 cos_dict = physical_interface_dict.setdefault('physical-interface-cos-information', {})
@@ -1233,7 +1241,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Current address: 00:50:56:ff:56:b6, Hardware address: 00:50:56:ff:56:b6
-            m = p12.match(line)
+            m = lp.p12.match(line)
             if m:
                 group = m.groupdict()
                 physical_interface_dict.update({k.replace('_','-'):
@@ -1241,7 +1249,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Last flapped   : 2019-08-29 09:09:19 UTC (29w6d 18:56 ago)
-            m = p13.match(line)
+            m = lp.p13.match(line)
             if m:
                 group = m.groupdict()
                 intf_flapped_dict = physical_interface_dict.setdefault('interface-flapped', {})
@@ -1249,7 +1257,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # IPv6 transit statistics:
-            m = p36.match(line)
+            m = lp.p36.match(line)
             if m:
                 group = m.groupdict()
                 traffic_statistics_dict = traffic_statistics_dict.setdefault('ipv6-transit-statistics', {})
@@ -1257,7 +1265,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Dropped traffic statistics due to STP State:
-            m = p37.match(line)
+            m = lp.p37.match(line)
             if m:
                 statistics_type = 'dropped_stp_state'
                 group = m.groupdict()
@@ -1265,7 +1273,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Transit statistics:
-            m = p38.match(line)
+            m = lp.p38.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1276,7 +1284,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input rate     : 2952 bps (5 pps)
-            m = p14.match(line)
+            m = lp.p14.match(line)
             if m:
                 if statistics_type == 'physical':
                     traffic_statistics_dict = physical_interface_dict.setdefault('traffic-statistics', {})
@@ -1288,7 +1296,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input  bytes  :          19732539397                 3152 bps
-            m = p14_1.match(line)
+            m = lp.p14_1.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1303,7 +1311,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Output bytes  :          16367814635                 3160 bps
-            m = p14_2.match(line)
+            m = lp.p14_2.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1318,7 +1326,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Input  packets:            133726363                    5 pps
-            m = p14_3.match(line)
+            m = lp.p14_3.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1333,7 +1341,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                         v for k, v in group.items() if v is not None})
                 continue
             # Output packets:            129306863                    4 pps
-            m = p14_4.match(line)
+            m = lp.p14_4.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1349,7 +1357,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Output rate    : 3080 bps (3 pps)
-            m = p15.match(line)
+            m = lp.p15.match(line)
             if m:
                 group = m.groupdict()
                 if statistics_type == 'physical':
@@ -1361,7 +1369,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Active alarms  : None
-            m = p16.match(line)
+            m = lp.p16.match(line)
             if m:
                 group = m.groupdict()
                 active_alarms = group['active_alarms']
@@ -1375,7 +1383,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Active defects : None
-            m = p17.match(line)
+            m = lp.p17.match(line)
             if m:
                 group = m.groupdict()
                 active_defects = group['active_defects']
@@ -1389,14 +1397,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # PCS statistics                      Seconds
-            m = p18.match(line)
+            m = lp.p18.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict = physical_interface_dict.setdefault('ethernet-pcs-statistics', {})
                 continue
 
             # Bit errors                             0
-            m = p19.match(line)
+            m = lp.p19.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k.replace('_','-'):
@@ -1404,7 +1412,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Errored blocks                         0
-            m = p20.match(line)
+            m = lp.p20.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k.replace('_','-'):
@@ -1412,13 +1420,13 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Ethernet FEC statistics              Errors
-            m = p21.match(line)
+            m = lp.p21.match(line)
             if m:
                 statistics_dict = physical_interface_dict.setdefault('ethernet-fec-statistics', {})
                 continue
 
             # FEC Corrected Errors                    0
-            m = p22.match(line)
+            m = lp.p22.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k:
@@ -1426,7 +1434,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # FEC Uncorrected Errors                  0
-            m = p22_1.match(line)
+            m = lp.p22_1.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k:
@@ -1434,7 +1442,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # FEC Corrected Errors Rate               0
-            m = p22_2.match(line)
+            m = lp.p22_2.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k:
@@ -1442,7 +1450,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # FEC Uncorrected Errors Rate             0
-            m = p22_3.match(line)
+            m = lp.p22_3.match(line)
             if m:
                 group = m.groupdict()
                 statistics_dict.update({k:
@@ -1450,7 +1458,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Interface transmit statistics: Disabled
-            m = p23.match(line)
+            m = lp.p23.match(line)
             if m:
                 group = m.groupdict()
                 inft_transmit = group['interface_transmit_statistics']
@@ -1458,7 +1466,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Logical interface ge-0/0/0.0 (Index 333) (SNMP ifIndex 606)
-            m = p24.match(line)
+            m = lp.p24.match(line)
             if m:
                 statistics_type = 'logical'
                 group = m.groupdict()
@@ -1470,7 +1478,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Flags: Up SNMP-Traps 0x4004000 Encapsulation: ENET2
-            m = p25.match(line)
+            m = lp.p25.match(line)
             if m:
                 group = m.groupdict()
                 if_config_flags_dict = logical_interface_dict.setdefault('if-config-flags', {})
@@ -1482,7 +1490,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Input packets : 133657033
-            m = p26.match(line)
+            m = lp.p26.match(line)
             if m:
                 group = m.groupdict()
                 traffic_statistics_dict.update({k.replace('_','-'):
@@ -1490,7 +1498,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Output packets: 129243982
-            m = p27.match(line)
+            m = lp.p27.match(line)
             if m:
                 group = m.groupdict()
                 traffic_statistics_dict.update({k.replace('_','-'):
@@ -1499,7 +1507,7 @@ class ShowInterfaces(ShowInterfacesSchema):
 
             # Protocol inet, MTU: 1500
             # Protocol mpls, MTU: 1488, Maximum labels: 3
-            m = p28.match(line)
+            m = lp.p28.match(line)
             if m:
                 group = m.groupdict()
                 address_family_list = logical_interface_dict.setdefault('address-family', [])
@@ -1509,7 +1517,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Max nh cache: 75000, New hold nh limit: 75000, Curr nh cnt: 1, Curr new hold cnt: 0, NH drop cnt: 0
-            m = p30.match(line)
+            m = lp.p30.match(line)
             if m:
                 group = m.groupdict()
                 address_family_dict.update({k.replace('_','-'):
@@ -1517,7 +1525,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Flags: No-Redirects, Sendbcast-pkt-to-re
-            m = p31.match(line)
+            m = lp.p31.match(line)
             if m:
                 group = m.groupdict()
                 address_family_flags_dict = address_family_dict.setdefault('address-family-flags', {})
@@ -1531,7 +1539,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Addresses, Flags: Is-Preferred Is-Primary
-            m = p32.match(line)
+            m = lp.p32.match(line)
             if m:
                 group = m.groupdict()
                 af_check = address_family_dict.get('interface-address', None)
@@ -1555,7 +1563,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Destination: 10.189.5.92/30, Local: 10.189.5.93, Broadcast: 10.189.5.95
-            m = p33.match(line)
+            m = lp.p33.match(line)
             if m:
                 group = m.groupdict()
                 interface_address_dict.update({k.replace('_','-'):
@@ -1563,7 +1571,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Bandwidth: 0
-            m = p34.match(line)
+            m = lp.p34.match(line)
             if m:
                 group = m.groupdict()
                 logical_interface_dict.update({k.replace('_','-'):
@@ -1571,7 +1579,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Local: fe80::250:560f:fc8d:7c08
-            m = p35.match(line)
+            m = lp.p35.match(line)
             if m:
                 group = m.groupdict()
                 interface_address_dict.update({k.replace('_','-'):
@@ -1579,19 +1587,19 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
             
             # Input errors:
-            m = p41.match(line)
+            m = lp.p41.match(line)
             if m:
                 input_error_list_dict = physical_interface_dict.setdefault('input-error-list', {})
                 continue
 
             # Output errors:
-            m = p42.match(line)
+            m = lp.p42.match(line)
             if m:
                 output_error_list_dict = physical_interface_dict.setdefault('output-error-list', {})
                 continue
 
             # Errors: 0, Drops: 0, Framing errors: 0, Runts: 0, Policed discards: 0, L3 incompletes: 0, L2 channel errors: 0,
-            m = p43_1.match(line)
+            m = lp.p43_1.match(line)
             if m:
                 group = m.groupdict()
                 input_error_list_dict.update({k.replace('_','-'):
@@ -1599,7 +1607,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # L2 mismatch timeouts: 0, FIFO errors: 0, Resource errors: 0
-            m = p43_2.match(line)
+            m = lp.p43_2.match(line)
             if m:
                 group = m.groupdict()
                 input_error_list_dict.update({k.replace('_','-'):
@@ -1607,7 +1615,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Carrier transitions: 1, Errors: 0, Drops: 0, Collisions: 0, Aged packets: 0, FIFO errors: 0, HS link CRC errors: 0,
-            m = p44_1.match(line)
+            m = lp.p44_1.match(line)
             if m:
                 group = m.groupdict()
                 output_error_list_dict.update({k.replace('_','-'):
@@ -1615,7 +1623,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # MTU errors: 0, Resource errors: 0
-            m = p44_2.match(line)
+            m = lp.p44_2.match(line)
             if m:
                 group = m.groupdict()
                 output_error_list_dict.update({k.replace('_','-'):
@@ -1623,20 +1631,20 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Total octets                   21604601324      16828244544
-            m = p45.match(line)
+            m = lp.p45.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
                     v for k, v in group.items() if v is not None})
                 continue
 
-            m = p45_1.match(line)
+            m = lp.p45_1.match(line)
             if m:
                 ethernet_mac_statistics = physical_interface_dict.setdefault('ethernet-mac-statistics', {})
                 continue
 
             # Total packets                    133726919        129183374
-            m = p46.match(line)
+            m = lp.p46.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1644,7 +1652,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Unicast packets                  133726908        129183361
-            m = p47.match(line)
+            m = lp.p47.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1652,7 +1660,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Broadcast packets                        0                0
-            m = p48.match(line)
+            m = lp.p48.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1660,7 +1668,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Multicast packets                        0                0
-            m = p49.match(line)
+            m = lp.p49.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1668,7 +1676,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # CRC/Align errors                         0                0
-            m = p50.match(line)
+            m = lp.p50.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1676,7 +1684,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # FIFO errors                              0                0
-            m = p51.match(line)
+            m = lp.p51.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1684,7 +1692,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # MAC control frames                       0                0
-            m = p52.match(line)
+            m = lp.p52.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1692,7 +1700,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # MAC pause frames                         0                0
-            m = p53.match(line)
+            m = lp.p53.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1700,7 +1708,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Oversized frames                         0
-            m = p54.match(line)
+            m = lp.p54.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1708,7 +1716,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Jabber frames                            0
-            m = p56.match(line)
+            m = lp.p56.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1716,7 +1724,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Fragment frames                          0
-            m = p57.match(line)
+            m = lp.p57.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1724,7 +1732,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # VLAN tagged frames                       0
-            m = p58.match(line)
+            m = lp.p58.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1732,7 +1740,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Code violations                          0
-            m = p59.match(line)
+            m = lp.p59.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1740,7 +1748,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Total errors                             0                0
-            m = p60.match(line)
+            m = lp.p60.match(line)
             if m:
                 group = m.groupdict()
                 ethernet_mac_statistics.update({k.replace('_','-'):
@@ -1748,14 +1756,14 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # Label-switched interface (LSI) traffic statistics:
-            m = p61.match(line)
+            m = lp.p61.match(line)
             if m:
                 statistics_type = 'lsi_traffic_statistics'
                 traffic_statistics_dict = physical_interface_dict.setdefault('lsi-traffic-statistics', {})
                 continue
 
             # Egress queues: 8 supported, 4 in use
-            m = p62.match(line)
+            m = lp.p62.match(line)
             if m:
                 group = m.groupdict()
                 cos_short_summary_dict = physical_interface_dict.setdefault('queue-counters', {}). \
@@ -1765,7 +1773,7 @@ class ShowInterfaces(ShowInterfacesSchema):
                 continue
 
             # 0                                0                    0                    0
-            m = p63.match(line)
+            m = lp.p63.match(line)
             if m:
                 group = m.groupdict()
                 queue_list = physical_interface_dict.setdefault('queue-counters', {}). \
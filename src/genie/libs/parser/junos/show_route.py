@@ -29,6 +29,10 @@ import re
 from genie.metaparser import MetaParser
 from pyats.utils.exceptions import SchemaError
 from genie.metaparser.util.schemaengine import Any, Optional, Use, Schema
+
+# Parser Utils
+from genie.libs.parser.utils.common import Common
+
 '''
 Schema for:
     * show route table {table}
@@ -341,6 +345,9 @@ class ShowRoute(ShowRouteSchema):
                     'show route protocol {protocol} {ip_address}',
                     'show route protocol {protocol} table {table}']
 
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
+
     def cli(self, protocol=None, ip_address=None, table=None, output=None):
         if not output:
             if protocol and table:
@@ -414,7 +421,7 @@ class ShowRoute(ShowRouteSchema):
         # 2001:db8:eb18:ca45::1/128
         pIP = re.compile(r'^(?P<rt_destination>[\w:\/]+)$')
 
-        for line in out.splitlines():
+        for line in Common.iter_lines(out):
             line = line.strip()
 
             # inet.0: 932 destinations, 1618 routes (932 active, 0 holddown, 0 hidden)
@@ -14,6 +14,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
 										Default, Use
 from genie import parsergen
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import ArpRecord
+from genie.libs.parser.utils.interning import Interner
 
 
 # =====================================
@@ -61,36 +64,40 @@ class ShowIpArp(ShowIpArpSchema):
 	cli_command = ['show ip arp', 'show ip arp vrf {vrf}']
 	exclude = ['age']
 
-	def cli(self, vrf='', output=None):
-		if vrf:
-			cmd = self.cli_command[1].format(vrf=vrf)
-		else:
-			cmd = self.cli_command[0]
-			vrf = 'default'
-
-		if output is None:
-			out = self.device.execute(cmd)
-		else:
-			out = output
-
-		res_dict = {}
-
+	patterns = Patterns(
 		# IP ARP Table for all contexts
 		# IP ARP Table for context vni_10100
 		# IP ARP Table for context default
-		p1 = re.compile(r'^IP +ARP +Table +for +(context +)?(?P<vrf>[\S]+)( +contexts)?$')
+		p1=r'^IP +ARP +Table +for +(context +)?(?P<vrf>[\S]+)( +contexts)?$',
 
 		# Total number of entries: 11
-		p2 = re.compile(r'^Total +number +of +entries:\s+(?P<num_entries>\d+)$')
+		p2=r'^Total +number +of +entries:\s+(?P<num_entries>\d+)$',
 
 		# 192.168.16.226 0 0006.d6ff.632b ARPA GigabitEthernet1/1
 		# 10.111.1.3     00:09:20  fa16.3eff.0987  Vlan101         +
 		# 10.111.1.4     00:01:53  fa16.3eff.c271  Vlan101
-        # 10.23.90.2      00:01:05  fa16.3eff.f80e  Ethernet1/1.390
-		p3 = re.compile(r'^(?P<ip_address>[\d\.]+)\s+(?P<age>[\d:-]+)\s+(?P<mac_address>[\w\.]+)\s+'
-						r'((?P<encap_type>ARPA)\s+)?(?P<interface>\S+)(\s+(?P<flags>\S))?$')
-
-		for line in out.splitlines():
+		# 10.23.90.2      00:01:05  fa16.3eff.f80e  Ethernet1/1.390
+		p3=r'^(?P<ip_address>[\d\.]+)\s+(?P<age>[\d:-]+)\s+(?P<mac_address>[\w\.]+)\s+'
+		   r'((?P<encap_type>ARPA)\s+)?(?P<interface>\S+)(\s+(?P<flags>\S))?$',
+	)
+
+	def _iter_events(self, output):
+		"""Read the output one line at a time, the state machine of both cli
+		and parse_records.
+
+		Yields:
+			tuple: the name of the pattern matching a line, such as 'p3',
+				   its groups, and the ArpRecord of the entry of the line,
+				   or None for the lines of 'p1' and 'p2'
+		"""
+		# The interfaces, ages and types repeat over the entries
+		intern = Interner()
+
+		p1 = self.patterns.p1
+		p2 = self.patterns.p2
+		p3 = self.patterns.p3
+
+		for line in Common.iter_lines(output):
 			line = line.strip()
 
 			# IP ARP Table for all contexts
@@ -98,18 +105,13 @@ class ShowIpArp(ShowIpArpSchema):
 			# IP ARP Table for context default
 			m = p1.match(line)
 			if m:
-				if 'interfaces' not in res_dict:
-					interfaces_dict = res_dict.setdefault('interfaces', {})
+				yield 'p1', m.groupdict(), None
 				continue
 
 			# Total number of entries: 11
 			m = p2.match(line)
 			if m:
-				if 'statistics' not in res_dict:
-					statistics_dict = res_dict.setdefault('statistics', {})
-
-				groups = m.groupdict()
-				statistics_dict.update({'entries_total': int(groups['num_entries'])})
+				yield 'p2', m.groupdict(), None
 				continue
 
 			# 192.168.16.226 0 0006.d6ff.632b ARPA GigabitEthernet1/1
@@ -117,40 +119,85 @@ class ShowIpArp(ShowIpArpSchema):
 			# 10.111.1.4     00:01:53  fa16.3eff.c271  Vlan101
 			m = p3.match(line)
 			if m:
-				# Rare case (but found through run_parsers) - Only used to 
-				# setup data structure when output lines never match p1
-				if 'interfaces' not in res_dict:
-					interfaces_dict = res_dict.setdefault('interfaces', {})
-
-				groups = m.groupdict()
-				interface = groups['interface']
-				ip_address = groups['ip_address']
-				mac_address = groups['mac_address']
+				groups = intern.groups(m.groupdict(), 'interface', 'age',
+									   'encap_type', 'flags')
 				age = groups['age']
+				yield 'p3', groups, ArpRecord(
+					interface=groups['interface'], ip=groups['ip_address'],
+					mac_address=groups['mac_address'],
+					origin='static' if '-' in age else 'dynamic', age=age,
+					encap_type=groups['encap_type'], flags=groups['flags'])
+
+	def cli(self, vrf='', output=None):
+		if vrf:
+			cmd = self.cli_command[1].format(vrf=vrf)
+		else:
+			cmd = self.cli_command[0]
+			vrf = 'default'
+
+		if output is None:
+			out = self.device.execute(cmd)
+		else:
+			out = output
 
-				interface_dict = interfaces_dict.setdefault(interface, {})
-				neighbors_dict = interface_dict.setdefault('ipv4', {}).setdefault('neighbors', {})
-				ip_dict = neighbors_dict.setdefault(ip_address, {})
-				ip_dict.update({'ip': ip_address})
-				ip_dict.update({'link_layer_address': mac_address})
-				ip_dict.update({'physical_interface': interface})
+		res_dict = {}
 
-				if '-' in age:
-					origin = 'static'
-				else:
-					origin = 'dynamic'
+		for name, groups, record in self._iter_events(out):
+			# IP ARP Table for all contexts
+			if name == 'p1':
+				if 'interfaces' not in res_dict:
+					interfaces_dict = res_dict.setdefault('interfaces', {})
+				continue
 
-				ip_dict.update({'origin': origin})
-				ip_dict.update({'age': age})
+			# Total number of entries: 11
+			if name == 'p2':
+				if 'statistics' not in res_dict:
+					statistics_dict = res_dict.setdefault('statistics', {})
 
-				if groups['encap_type']:
-					ip_dict.update({'encap_type': groups['encap_type']})
+				statistics_dict.update({'entries_total': int(groups['num_entries'])})
+				continue
 
-				if groups['flags']:
-					ip_dict.update({'flags': groups['flags']})
+			# 192.168.16.226 0 0006.d6ff.632b ARPA GigabitEthernet1/1
+			# Rare case (but found through run_parsers) - Only used to 
+			# setup data structure when output lines never match p1
+			if 'interfaces' not in res_dict:
+				interfaces_dict = res_dict.setdefault('interfaces', {})
+
+			interface = record.interface
+			ip_address = record.ip
+
+			interface_dict = interfaces_dict.setdefault(interface, {})
+			neighbors_dict = interface_dict.setdefault('ipv4', {}).setdefault('neighbors', {})
+			ip_dict = neighbors_dict.setdefault(ip_address, {})
+			ip_dict.update({'ip': ip_address})
+			ip_dict.update({'link_layer_address': record.mac_address})
+			ip_dict.update({'physical_interface': interface})
+			ip_dict.update({'origin': record.origin})
+			ip_dict.update({'age': record.age})
+
+			if record.encap_type:
+				ip_dict.update({'encap_type': record.encap_type})
+
+			if record.flags:
+				ip_dict.update({'flags': record.flags})
 		
 		return res_dict
 
+	def parse_records(self, vrf='', output=None):
+		"""Yield an ArpRecord per entry of the output, as it is read. The
+		parsed dict of cli is built from them.
+		"""
+		if output is None:
+			if vrf:
+				cmd = self.cli_command[1].format(vrf=vrf)
+			else:
+				cmd = self.cli_command[0]
+			output = self.device.execute(cmd)
+
+		for name, groups, record in self._iter_events(output):
+			if record is not None:
+				yield record
+
 
 # =======================================
 # Schema for 'show ip arp detail vrf all'
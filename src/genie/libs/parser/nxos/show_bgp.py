@@ -63,6 +63,9 @@ from genie.libs.parser.yang.bgp_openconfig_yang import BgpOpenconfigYang
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import BgpRecord
+from genie.libs.parser.utils.interning import Interner
 
 
 # =====================================
@@ -1733,427 +1736,335 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
       'path_type',
       'weight']
 
-    def cli(self, vrf='all', address_family='all', output=None):
-        if output is None:
-            out = self.device.execute(self.cli_command.format(vrf=vrf,
-                                                              address_family=address_family))
-        else:
-            out = output
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
 
-        # Init dictionary
-        parsed_dict = {}
-        af_dict = {}
-        prefix_dict = {}
+    patterns = Patterns(
+        # Network            Next Hop            Metric     LocPrf     Weight Path
+        p0=r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$',
 
-        # Init vars
-        index = 1
-        data_on_nextline = False
-        bgp_table_version = local_router_id = ''
+        # BGP routing table information for VRF VRF1, address family IPv4 Unicast
+        p1=r'^\s*BGP +routing +table +information +for +VRF'
+           ' +(?P<vrf_name>\S+), +address +family'
+           ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$',
 
-        p = re.compile(r'^\s*Network +Next Hop +Metric +LocPrf +Weight Path$')
-        p1 = re.compile(r'^\s*BGP +routing +table +information +for +VRF'
-                            ' +(?P<vrf_name>\S+), +address +family'
-                            ' +(?P<address_family>[a-zA-Z0-9\s\-\_]+)$')
-        p2 = re.compile(r'^\s*BGP +table +version +is'
-                            ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
-                            ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$')
-        p3_4 = re.compile(r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$')
-        p3_1 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$')
-        p3_1_2 = re.compile(r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
-            '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
-            '(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
-            '(?P<origin_codes>(i|e|\?|\||&))$')
-        p3_3 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
-                            '(?P<path_type>(i|e|c|l|a|r|I))?'
-                            ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
-                            ' +(?P<origin_codes>(i|e|\?|\|))$')
-        p3_3_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
-        p4 = re.compile(r'^\s*Route +Distinguisher *:'
-                            ' +(?P<route_distinguisher>(\S+))'
-                            '(?: +\(((VRF +(?P<default_vrf>\S+))|'
-                            '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$')
-        p3_2 = re.compile(r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
-                            '(?P<path_type>(i|e|c|l|a|r|I))'
-                            '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                            ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                            ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
-                            ' +(?P<origin_codes>(i|e|\?|\&|\|))$')
-        p3_2_1 = re.compile(r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
-                                '(?P<path_type>(i|e|c|l|a|r|I))?'
-                                '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
-                                '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
-                                ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
-                                ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$')
+        # BGP table version is 35, local router ID is 10.229.11.11
+        # BGP table version is 381, Local Router ID is 10.4.1.2
+        p2=r'^\s*BGP +table +version +is'
+           ' +(?P<bgp_table_version>[0-9]+), +(L|l)ocal'
+           ' +(R|r)outer +ID +is +(?P<local_router_id>[0-9\.]+)$',
 
-        for line in out.splitlines():
+        #                     2001:db8:400:13b1:21a:1ff:fe00:161/128
+        p3_4=r'^\s*(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+)$',
+
+        # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
+        # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
+        p3_1=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             '(?: *(?P<next_hop>[a-zA-Z0-9\.\:\/\[\]\,]+))?$',
+
+        # *>i10.111.8.3/32     10.84.66.66           2000        100          0 200 i
+        p3_1_2=r'^(?P<status_codes>(s|x|S|d|h|\*|\>)+)(?P<path_type>'
+               '(i|e|c|l|a|r|I))(?P<prefix>[\w\.\/]+) +(?P<next_hop>[\w\.\/]+) +'
+               '(?P<metric>\d+) +(?P<localprf>\d+) +(?P<weight>\d+) +(?P<path>[\d ]+) +'
+               '(?P<origin_codes>(i|e|\?|\||&))$',
+
+        #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
+        p3_3=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)?'
+             '(?P<path_type>(i|e|c|l|a|r|I))?'
+             ' *(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             '(?: +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+))?'
+             ' +(?P<origin_codes>(i|e|\?|\|))$',
+
+        # *>e                   10.70.1.2                                      0 100 300 ?
+        p3_3_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+
+        # Route Distinguisher: 100:100     (VRF VRF1)
+        # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
+        p4=r'^\s*Route +Distinguisher *:'
+           ' +(?P<route_distinguisher>(\S+))'
+           '(?: +\(((VRF +(?P<default_vrf>\S+))|'
+           '((?P<default_vrf1>\S+)VNI +(?P<vni>\d+)))\))?$',
+
+        # *>i10.21.33.33/32   10.36.3.3         0        100          0 ?
+        p3_2=r'^\s*(?P<status_codes>(s|x|S|d|h|\*|\>|\s)+)'
+             '(?P<path_type>(i|e|c|l|a|r|I))'
+             '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+             ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+             ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}]+)'
+             ' +(?P<origin_codes>(i|e|\?|\&|\|))$',
+
+        # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
+        p3_2_1=r'^\s*(?P<status_codes>(\*\>|s|x|S|d|h|\*|\>|\s)+)'
+               '(?P<path_type>(i|e|c|l|a|r|I))?'
+               '( *(?P<origin_codes>(i|e|\?|\&|\|)+))'
+               '(?P<prefix>[a-zA-Z0-9\.\:\/\[\]\,]+)'
+               ' +(?P<next_hop>[a-zA-Z0-9\.\:]+)'
+               ' +(?P<numbers>[a-zA-Z0-9\s\(\)\{\}\?]+)$',
+
+        # Metric     LocPrf     Weight Path
+        #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
+        p5=r'^(?P<metric>[0-9]+)'
+           '(?P<space1>\s{5,10})'
+           '(?P<localprf>[0-9]+)'
+           '(?P<space2>\s{5,10})'
+           '(?P<weight>[0-9]+)'
+           '(?: *(?P<path>[0-9\{\}\s]+))?$',
+
+        #    100        ---          0 10 20 30 40 50 60 70 80 90
+        #    ---        100      32788 ---
+        p5_1=r'^(?P<value>[0-9]+)'
+             '(?P<space>\s{2,21})'
+             '(?P<weight>[0-9]+)'
+             '(?: *(?P<path>[0-9\{\}\s]+))?$',
+
+        #    ---        ---      32788 200 33299 51178 47751 {27016}
+        p5_2=r'^(?P<weight>[0-9]+)'
+             ' +(?P<path>[0-9\{\}\s]+)$',
+    )
+
+    def _iter_events(self, output):
+        """ Read the output one line at a time, the state machine of both cli
+            and parse_records.
+
+            Yields:
+                tuple: the name of the pattern matching a line, such as
+                       'p3_2', its groups, and the state of the line: a dict,
+                       updated in place, of the vrf_name, address_family,
+                       bgp_table_version and local_router_id of the table,
+                       of the prefix, index, status_codes and path_type of
+                       the path, and of the fields of the path given by the
+                       line
+        """
+        p = self.patterns
+        # The next hops, paths and codes repeat over the prefixes
+        intern = Interner()
+
+        # Each line is parsed by the first of these patterns which matches it
+        rows = p.alternation('p0', 'p1', 'p2', 'p3_4', 'p3_1', 'p3_1_2',
+                             'p3_3', 'p3_3_1', 'p4', 'p3_2', 'p3_2_1')
+
+        def numbers(fields, numbers):
+            # Metric     LocPrf     Weight Path
+            #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
+            m1 = p.p5.match(numbers)
+
+            #    100        ---          0 10 20 30 40 50 60 70 80 90
+            #    ---        100          0 10 20 30 40 50 60 70 80 90
+            #    100        ---      32788 ---
+            #    ---        100      32788 --- 
+            m2 = p.p5_1.match(numbers)
+
+            #    ---        ---      32788 200 33299 51178 47751 {27016}
+            m3 = p.p5_2.match(numbers)
+
+            if m1:
+                fields['metric'] = int(m1.groupdict()['metric'])
+                fields['localprf'] = int(m1.groupdict()['localprf'])
+                fields['weight'] = int(m1.groupdict()['weight'])
+                # Set path
+                if m1.groupdict()['path']:
+                    fields['path'] = intern(m1.groupdict()['path'].strip())
+            elif m2:
+                fields['weight'] = int(m2.groupdict()['weight'])
+                # Set metric or localprf
+                if len(m2.groupdict()['space']) > 10:
+                    fields['metric'] = int(m2.groupdict()['value'])
+                else:
+                    fields['localprf'] = int(m2.groupdict()['value'])
+                # Set path
+                if m2.groupdict()['path']:
+                    fields['path'] = intern(m2.groupdict()['path'].strip())
+            elif m3:
+                fields['weight'] = int(m3.groupdict()['weight'])
+                fields['path'] = intern(m3.groupdict()['path'].strip())
+
+        original_address_family = None
+        data_on_nextline = False
+        state = {'vrf_name': None, 'address_family': None,
+                 'bgp_table_version': '', 'local_router_id': '',
+                 'prefix': None, 'index': 1, 'status_codes': None,
+                 'path_type': None, 'fields': {}}
+
+        for line in Common.iter_lines(output):
             line = line.rstrip()
+            m = rows.match(line)
+            if not m:
+                continue
+            row = m.name
+            group = m.groupdict()
+            fields = state['fields'] = {}
+
             # Network            Next Hop            Metric     LocPrf     Weight Path
-            m = p.match(line)
-            if m:
+            if row == 'p0':
                 continue
 
             # BGP routing table information for VRF VRF1, address family IPv4 Unicast
-            m = p1.match(line)
-            if m:
-                # Get values
-                vrf_name = str(m.groupdict()['vrf_name'])
-                address_family = str(m.groupdict()['address_family']).lower()
-                original_address_family = address_family
-                if 'vrf' not in parsed_dict:
-                    parsed_dict['vrf'] = {}
-                if vrf_name not in parsed_dict['vrf']:
-                    parsed_dict['vrf'][vrf_name] = {}
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if address_family not in parsed_dict['vrf'][vrf_name]\
-                    ['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][address_family] = {}
-
-                # Set af_dict
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
-                continue
+            elif row == 'p1':
+                state['vrf_name'] = str(group['vrf_name'])
+                original_address_family = str(group['address_family']).lower()
+                state['address_family'] = original_address_family
 
             # BGP table version is 35, local router ID is 10.229.11.11
             # BGP table version is 381, Local Router ID is 10.4.1.2
-            m = p2.match(line)
-            if m:
-                bgp_table_version = int(m.groupdict()['bgp_table_version'])
-                local_router_id = str(m.groupdict()['local_router_id'])
-                af_dict['bgp_table_version'] = bgp_table_version
-                af_dict['local_router_id'] = local_router_id
-                continue
+            elif row == 'p2':
+                state['bgp_table_version'] = int(group['bgp_table_version'])
+                state['local_router_id'] = str(group['local_router_id'])
 
-            #                     2001:db8:400:13b1:21a:1ff:fe00:161/128
-            m = p3_4.match(line)
-            if m:
-                # Get keys
-                if 'njected' not in line and 'next_hop' in m.groupdict():
-                    next_hop = str(m.groupdict()['next_hop'])
-
-                    if data_on_nextline:
-                        data_on_nextline =  False
-                    else:
-                        index += 1
-
-                    # Init dict
-                    index_dict = af_dict.setdefault('prefixes', {}).setdefault(prefix, {})\
-                      .setdefault('index', {}).setdefault(index, {})
+            # Route Distinguisher: 100:100     (VRF VRF1)
+            # Route Distinguisher: 2:100    (VRF vpn2)
+            # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
+            elif row == 'p4':
+                state['address_family'] = original_address_family + \
+                    ' RD ' + str(group['route_distinguisher'])
 
-                    # Set keys
-                    index_dict['next_hop'] = next_hop
-                continue
+            #                     2001:db8:400:13b1:21a:1ff:fe00:161/128
+            elif row == 'p3_4':
+                if 'njected' in line:
+                    continue
+                if data_on_nextline:
+                    data_on_nextline = False
+                else:
+                    state['index'] += 1
+                fields['next_hop'] = intern(str(group['next_hop']))
 
-            # Status: s-suppressed, x-deleted, S-stale, d-dampened, h-history, *-valid, >-best
-            # Path type: i-internal, e-external, c-confed, l-local, a-aggregate, r-redist
-            # Origin codes: i - IGP, e - EGP, ? - incomplete, | - multipath
-            # Network            Next Hop         Metric   LocPrf   Weight Path
-            
             # *>i[2]:[77][7,0][10.69.9.9,1,151587081][10.135.1.1,22][10.106.101.1,10.76.1.30]/616
             # *>i2001:db8:aaaa:1::/113       ::ffff:10.106.101.1
-            m = p3_1.match(line)
             # *>i10.111.8.3/32     10.84.66.66           2000        100          0 200 i
-            # *>i10.111.8.4/32     10.84.66.66           2000        100          0 200 i
-            m1 = p3_1_2.match(line)
-
-            m = m if m else m1
-            if m:
+            elif row in ('p3_1', 'p3_1_2'):
                 # New prefix, reset index count
-                index = 1
                 data_on_nextline = True
-
-                # Get keys
-                status_codes = str(m.groupdict()['status_codes'])
-                path_type = str(m.groupdict()['path_type'])
-                prefix = str(m.groupdict()['prefix'])
-                if status_codes == 'None' or path_type == 'None' or prefix == 'None':
+                state.update(index=1,
+                             status_codes=intern(str(group['status_codes'])),
+                             path_type=intern(str(group['path_type'])),
+                             prefix=str(group['prefix']))
+                if state['status_codes'] == 'None' or \
+                        state['path_type'] == 'None':
                     continue
-                # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
-
-                # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
-                if 'next_hop' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['next_hop'] = str(m.groupdict()['next_hop'])
-                if 'metric' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m.groupdict()['metric'])
-                if 'localprf' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m.groupdict()['localprf'])
-                if 'weight' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m.groupdict()['weight'])
-                if 'path' in m.groupdict():
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m.groupdict()['path'].strip()
-                if 'origin_codes' in m.groupdict():                
-                    af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = str(m.groupdict()['origin_codes'])
-                
-                # Check if aggregate_address_ipv4_address
-                if 'a' in path_type:
-                    address, mask = prefix.split("/")
-                    if ':' in prefix:
-                        af_dict['v6_aggregate_address_ipv6_address'] = prefix
-                        af_dict['v6_aggregate_address_as_set'] = True
-                        af_dict['v6_aggregate_address_summary_only'] = True
-                        continue
-                    else:
-                        af_dict['aggregate_address_ipv4_address'] = address
-                        af_dict['aggregate_address_ipv4_mask'] = mask
-                        af_dict['aggregate_address_as_set'] = True
-                        af_dict['aggregate_address_summary_only'] = True
-                        continue
-                continue
-
+                fields['status_codes'] = state['status_codes']
+                fields['path_type'] = state['path_type']
+                fields['next_hop'] = intern(str(group['next_hop']))
+                if row == 'p3_1_2':
+                    fields['metric'] = int(group['metric'])
+                    fields['localprf'] = int(group['localprf'])
+                    fields['weight'] = int(group['weight'])
+                    fields['path'] = intern(group['path'].strip())
+                    fields['origin_codes'] = intern(str(group['origin_codes']))
 
             #                     0.0.0.0               100      32768 i
             #                     10.106.101.1            4444       100 0 3 10 20 30 40 50 60 70 80 90 i
             # *>i                 10.106.102.4                        100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_3.match(line)
-
             # * e                   10.70.2.2                                      0 100 300 ?
             # *>e                   10.70.1.2                                      0 100 300 ?
-            m1 = p3_3_1.match(line)
-            m = m if m else m1
-            if m:
-                # Get keys
-                if m.groupdict()['status_codes']:
-                    status_codes = str(m.groupdict()['status_codes'])
-                if m.groupdict()['path_type']:
-                    path_type = str(m.groupdict()['path_type'])
-                next_hop = str(m.groupdict()['next_hop'])
-                origin_codes = str(m.groupdict()['origin_codes'])
-
+            elif row in ('p3_3', 'p3_3_1'):
+                if group['status_codes']:
+                    state['status_codes'] = intern(str(group['status_codes']))
+                if group['path_type']:
+                    state['path_type'] = intern(str(group['path_type']))
                 if data_on_nextline:
-                    data_on_nextline =  False
+                    data_on_nextline = False
                 else:
-                    index += 1
-
-                # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+                    state['index'] += 1
+                fields['next_hop'] = intern(str(group['next_hop']))
+                fields['origin_codes'] = intern(str(group['origin_codes']))
+                # Values of status_codes and path_type from prefix line
+                if state['status_codes'] is not None:
+                    fields['status_codes'] = state['status_codes']
+                    fields['path_type'] = state['path_type']
+                numbers(fields, group['numbers'])
 
-                # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+            # *>a10.121.0.0/8       0.0.0.0                  100      32768 i
+            # *>i10.21.33.33/32   10.36.3.3         0        100          0 ?
+            # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
+            elif row in ('p3_2', 'p3_2_1'):
+                # New prefix, reset index count
+                state.update(index=1,
+                             status_codes=intern(str(group['status_codes'])),
+                             path_type=intern(str(group['path_type'])),
+                             prefix=str(group['prefix']))
+                fields['status_codes'] = state['status_codes']
+                fields['path_type'] = state['path_type']
+                fields['next_hop'] = intern(str(group['next_hop']))
+                fields['origin_codes'] = intern(str(group['origin_codes']))
+                numbers(fields, group['numbers'])
+
+            yield row, group, state
 
-                try:
-                    # Set values of status_codes and path_type from prefix line
-                    af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                    af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
-                except Exception:
-                    pass
+    def cli(self, vrf='all', address_family='all', output=None):
+        if output is None:
+            out = self.device.execute(self.cli_command.format(vrf=vrf,
+                                                              address_family=address_family))
+        else:
+            out = output
 
-                # Parse numbers
-                numbers = m.groupdict()['numbers']
-                
-                # Metric     LocPrf     Weight Path
-                #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+        # Init dictionary
+        parsed_dict = {}
+        af_dict = {}
 
-                #    100        ---          0 10 20 30 40 50 60 70 80 90
-                #    ---        100          0 10 20 30 40 50 60 70 80 90
-                #    100        ---      32788 ---
-                #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+        for row, group, state in self._iter_events(out):
+            vrf_name = state['vrf_name']
+            address_family = state['address_family']
 
-                #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
+            # BGP routing table information for VRF VRF1, address family IPv4 Unicast
+            if row == 'p1':
+                # Set af_dict
+                af_dict = parsed_dict.setdefault('vrf', {}).\
+                    setdefault(vrf_name, {}).\
+                    setdefault('address_family', {}).\
+                    setdefault(address_family, {})
 
-                if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
-                    # Set path
-                    if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
-                        continue
-                elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
-                    # Set metric or localprf
-                    if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
-                    else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
-                    # Set path
-                    if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
-                        continue
-                elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
-                    continue
-                continue
+            # BGP table version is 35, local router ID is 10.229.11.11
+            elif row == 'p2':
+                af_dict['bgp_table_version'] = state['bgp_table_version']
+                af_dict['local_router_id'] = state['local_router_id']
 
-            # Network            Next Hop            Metric     LocPrf     Weight Path
             # Route Distinguisher: 100:100     (VRF VRF1)
-            # Route Distinguisher: 2:100    (VRF vpn2)
             # Route Distinguisher: 10.49.1.0:3    (L3VNI 9100)
-            m = p4.match(line)
-            if m:
-                route_distinguisher = str(m.groupdict()['route_distinguisher'])
-                new_address_family = original_address_family + ' RD ' + route_distinguisher
-                
-                # Init dict
-                if 'address_family' not in parsed_dict['vrf'][vrf_name]:
-                    parsed_dict['vrf'][vrf_name]['address_family'] = {}
-                if new_address_family not in parsed_dict['vrf'][vrf_name]['address_family']:
-                    parsed_dict['vrf'][vrf_name]['address_family'][new_address_family] = {}
-                
-                # Set keys
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['bgp_table_version'] = bgp_table_version
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['local_router_id'] = local_router_id
-                parsed_dict['vrf'][vrf_name]['address_family'][new_address_family]['route_distinguisher'] = route_distinguisher
-
-
-                if m.groupdict()['default_vrf']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf'])
-                elif m.groupdict()['default_vrf1']:
-                    parsed_dict['vrf'][vrf_name]['address_family']\
-                        [new_address_family]['default_vrf'] = \
-                            str(m.groupdict()['default_vrf1'])
-
-                # Reset address_family key and af_dict for use in other regex
-                address_family = new_address_family
-                af_dict = parsed_dict['vrf'][vrf_name]['address_family'][address_family]
-                continue
-
-            # Network            Next Hop            Metric     LocPrf     Weight Path
-            # *>a10.121.0.0/8       0.0.0.0                  100      32768 i
-            # *>i10.21.33.33/32   10.36.3.3         0        100          0 ?
-            # l10.34.34.0/24      0.0.0.0                  100      32768 i
-            # *>i2001::33/128     ::ffff:10.36.3.3  0        100          0 ?
-            # *>l[2]:[0]:[0]:[48]:[0000.19ff.f320]:[0]:[0.0.0.0]/216
-            # *>i                 10.186.0.2        0        100          0 ?
-            # *>l10.4.1.0/24        0.0.0.0                            100      32768 i
-            # *>r10.16.1.0/24        0.0.0.0                4444        100      32768 ?
-            # *>r10.16.2.0/24        0.0.0.0                4444        100      32768 ?
-            # *>i10.49.0.0/16     10.106.101.1                            100          0 10 20 30 40 50 60 70 80 90 i
-            # *>i10.4.2.0/24     10.106.102.4                            100          0 {62112 33492 4872 41787 13166 50081 21461 58376 29755 1135} i
-            m = p3_2.match(line)
-
-            # *&i10.145.1.0/24        192.168.151.2                0        100          0 ?
-            m1 = p3_2_1.match(line)
-            m = m if m else m1
-            if m:
-                # New prefix, reset index count
-                index = 1
-                
-                # Get keys
-                status_codes = str(m.groupdict()['status_codes'])
-                path_type = str(m.groupdict()['path_type'])
-                prefix = str(m.groupdict()['prefix'])
-                next_hop = str(m.groupdict()['next_hop'])
-                origin_codes = str(m.groupdict()['origin_codes'])
-
-                # Init dict
-                if 'prefixes' not in af_dict:
-                    af_dict['prefixes'] = {}
-                if prefix not in af_dict['prefixes']:
-                    af_dict['prefixes'][prefix] = {}
-                if 'index' not in af_dict['prefixes'][prefix]:
-                    af_dict['prefixes'][prefix]['index'] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
-                if index not in af_dict['prefixes'][prefix]['index']:
-                    af_dict['prefixes'][prefix]['index'][index] = {}
+            elif row == 'p4':
+                # Reset af_dict for use in other regex
+                af_dict = parsed_dict['vrf'][vrf_name].\
+                    setdefault('address_family', {}).\
+                    setdefault(address_family, {})
 
                 # Set keys
-                af_dict['prefixes'][prefix]['index'][index]['status_codes'] = status_codes
-                af_dict['prefixes'][prefix]['index'][index]['path_type'] = path_type
-                af_dict['prefixes'][prefix]['index'][index]['next_hop'] = next_hop
-                af_dict['prefixes'][prefix]['index'][index]['origin_codes'] = origin_codes
+                af_dict['bgp_table_version'] = state['bgp_table_version']
+                af_dict['local_router_id'] = state['local_router_id']
+                af_dict['route_distinguisher'] = \
+                    str(group['route_distinguisher'])
 
-                # Parse numbers
-                numbers = m.groupdict()['numbers']
-                
-                # Metric     LocPrf     Weight Path
-                #    4444       100          0  10 3 10 20 30 40 50 60 70 80 90
-                m1 = re.compile(r'^(?P<metric>[0-9]+)'
-                                 '(?P<space1>\s{5,10})'
-                                 '(?P<localprf>[0-9]+)'
-                                 '(?P<space2>\s{5,10})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
+                if group['default_vrf']:
+                    af_dict['default_vrf'] = str(group['default_vrf'])
+                elif group['default_vrf1']:
+                    af_dict['default_vrf'] = str(group['default_vrf1'])
 
-                #    100        ---          0 10 20 30 40 50 60 70 80 90
-                #    ---        100          0 10 20 30 40 50 60 70 80 90
-                #    100        ---      32788 ---
-                #    ---        100      32788 --- 
-                m2 = re.compile(r'^(?P<value>[0-9]+)'
-                                 '(?P<space>\s{2,21})'
-                                 '(?P<weight>[0-9]+)'
-                                 '(?: *(?P<path>[0-9\{\}\s]+))?$').match(numbers)
-
-                #    ---        ---      32788 200 33299 51178 47751 {27016}
-                m3 = re.compile(r'^(?P<weight>[0-9]+)'
-                                 ' +(?P<path>[0-9\{\}\s]+)$').match(numbers)
-
-                if m1:
-                    af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m1.groupdict()['metric'])
-                    af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m1.groupdict()['localprf'])
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m1.groupdict()['weight'])
-                    # Set path
-                    if m1.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m1.groupdict()['path'].strip()
-                elif m2:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m2.groupdict()['weight'])
-                    # Set metric or localprf
-                    if len(m2.groupdict()['space']) > 10:
-                        af_dict['prefixes'][prefix]['index'][index]['metric'] = int(m2.groupdict()['value'])
-                    else:
-                        af_dict['prefixes'][prefix]['index'][index]['localprf'] = int(m2.groupdict()['value'])
-                    # Set path
-                    if m2.groupdict()['path']:
-                        af_dict['prefixes'][prefix]['index'][index]['path'] = m2.groupdict()['path'].strip()
-                elif m3:
-                    af_dict['prefixes'][prefix]['index'][index]['weight'] = int(m3.groupdict()['weight'])
-                    af_dict['prefixes'][prefix]['index'][index]['path'] = m3.groupdict()['path'].strip()
+            # A path of a prefix, or its next hop
+            else:
+                prefix = state['prefix']
+                if prefix is None:
+                    raise ValueError('path before any prefix: {}'.format(
+                        state['fields']))
+                af_dict.setdefault('prefixes', {}).setdefault(prefix, {}).\
+                    setdefault('index', {}).\
+                    setdefault(state['index'], {}).update(state['fields'])
 
                 # Check if aggregate_address_ipv4_address
-                if 'a' in path_type:
+                if row in ('p3_1', 'p3_1_2', 'p3_2', 'p3_2_1') and \
+                        'a' in state['path_type']:
                     address, mask = prefix.split("/")
                     if ':' in prefix:
                         af_dict['v6_aggregate_address_ipv6_address'] = prefix
                         af_dict['v6_aggregate_address_as_set'] = True
                         af_dict['v6_aggregate_address_summary_only'] = True
-                        continue
                     else:
                         af_dict['aggregate_address_ipv4_address'] = address
                         af_dict['aggregate_address_ipv4_mask'] = mask
                         af_dict['aggregate_address_as_set'] = True
                         af_dict['aggregate_address_summary_only'] = True
-                        continue
-                continue
 
         # order the af prefixes index
         # return dict when parsed dictionary is empty
@@ -2180,6 +2091,47 @@ class ShowBgpVrfAllAll(ShowBgpVrfAllAllSchema):
 
         return parsed_dict
 
+    def parse_records(self, vrf='all', address_family='all', output=None):
+        """ Yield a BgpRecord per path of the prefixes of the output, as it is
+            read. The paths of a prefix are yielded once all its lines are
+            read, ordered by next hop as in the parsed dict.
+        """
+        if output is None:
+            output = self.device.execute(self.cli_command.format(
+                vrf=vrf, address_family=address_family))
+
+        # Paths of the prefix being read, by index, and its vrf, af, prefix
+        paths = {}
+        key = None
+
+        def records(key, paths):
+            items = list(paths.items())
+            if len(items) > 1:
+                # Numbered in the order of their next hops, as in the dict
+                items = enumerate(sorted([fields for _, fields in items],
+                                         key=lambda x: x['next_hop']), 1)
+            for index, fields in items:
+                yield BgpRecord(key[0], key[1], key[2], index, **fields)
+
+        for row, group, state in self._iter_events(output):
+            if not state['fields'] or state['prefix'] is None:
+                continue
+            # The paths of the previous prefix are complete
+            if (state['vrf_name'], state['address_family'],
+                    state['prefix']) != key:
+                if paths:
+                    for record in records(key, paths):
+                        yield record
+                key = (state['vrf_name'], state['address_family'],
+                       state['prefix'])
+                paths = {}
+
+            paths.setdefault(state['index'], {}).update(state['fields'])
+
+        if paths:
+            for record in records(key, paths):
+                yield record
+
 
 # ==============================================
 # Schema for 'show bgp vrf <vrf> all neighbors'
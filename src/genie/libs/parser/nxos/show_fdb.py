@@ -28,6 +28,9 @@ from genie.metaparser.util.schemaengine import Schema, \
                                          Default, \
                                          Use
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import MacRecord
+from genie.libs.parser.utils.interning import Interner
 
 class ShowMacAddressTableBaseSchema(MetaParser):
     """Schema for:
@@ -73,59 +76,86 @@ class ShowMacAddressTableBase(ShowMacAddressTableBaseSchema):
         'show mac address-table'
         'show system internal l2fwder mac'"""
 
-    def cli(self, out):
-
-        # initial return dictionary
-        ret_dict = {}
+    # Reads its output one line at a time, see Common.iter_lines
+    streaming = True
 
+    patterns = Patterns(
         # C 1001     0000.04ff.b1b1   dynamic  0     F      F nve1(10.9.0.101)
         # * 1001     0000.01ff.9191   dynamic  0     F      F    Eth1/11
         # G 2000     7e00.c0ff.0007    static       -       F    F  vPC Peer-Link(R)
         # 4000     5e00.c0ff.0007   static   ~~~         F      F    sup-eth1(R)
         # +  390     000f.53ff.1f1d   dynamic  0         F      F    Po125
-        p1 = re.compile(r'^(?P<entry>[\w\*\+] )?\s*(?P<vlan>All|[\d\-]+) '
-            '+(?P<mac_address>[0-9a-z\.\:]+) +(?P<mac_type>[a-z]+) '
-            '+(?P<age>[0-9\-\~]+) '
-            '+(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
-            '+(?P<drop>(drop|Drop))?'
-            '(?P<ports>[a-zA-Z0-9\/\.\(\)\-\s]+)?$')
+        p1=r'^(?P<entry>[\w\*\+] )?\s*(?P<vlan>All|[\d\-]+) '
+           '+(?P<mac_address>[0-9a-z\.\:]+) +(?P<mac_type>[a-z]+) '
+           '+(?P<age>[0-9\-\~]+) '
+           '+(?P<secure>[A-Z]+) +(?P<ntfy>[A-Z]+) '
+           '+(?P<drop>(drop|Drop))?'
+           '(?P<ports>[a-zA-Z0-9\/\.\(\)\-\s]+)?$',
+    )
 
-        for line in out.splitlines():
+    def cli(self, out):
+
+        # initial return dictionary
+        ret_dict = {}
+
+        # parse_records of this class, the parsers below override it to
+        # take their command arguments
+        for record in ShowMacAddressTableBase.parse_records(self, out):
+            vlan = str(record.vlan)
+            vlan_dict = ret_dict.setdefault('mac_table', {})\
+            .setdefault('vlans', {}).setdefault(vlan, {})
+            vlan_dict.update({'vlan': str(vlan)})
+            mac_address = str(record.mac_address)
+            mac_dict = vlan_dict.setdefault('mac_addresses', {})\
+            .setdefault(mac_address,{})
+            mac_dict.update({'mac_address': mac_address})
+            if record.entry:
+                mac_dict.update({'entry': record.entry})
+            if record.drop:
+                intf_dict = mac_dict.setdefault('drop',{})
+                intf_dict.update({'drop': True})
+            if record.interface is not None:
+                intf_dict = mac_dict.setdefault('interfaces',{})\
+                .setdefault(record.interface,{})
+                intf_dict.update({'interface': record.interface})
+            intf_dict.update({'mac_type': record.mac_type})
+            intf_dict.update({'age': record.age})
+            mac_dict.update({'secure': record.secure})
+            mac_dict.update({'ntfy': record.ntfy})
+                
+        return ret_dict
+
+    def parse_records(self, out):
+        """Yield a MacRecord per entry of the output, as it is read. The
+        parsed dict of cli is built from them.
+        """
+        # The interfaces and types repeat over the MAC addresses
+        intern = Interner()
+
+        p1 = self.patterns.p1
+
+        for line in Common.iter_lines(out):
             line = line.strip()
 
+            # C 1001     0000.04ff.b1b1   dynamic  0     F      F nve1(10.9.0.101)
+            # * 1001     0000.01ff.9191   dynamic  0     F      F    Eth1/11
             m = p1.match(line)
             if m:
-                group = m.groupdict()
-                vlan = str(group['vlan'])
-                vlan_dict = ret_dict.setdefault('mac_table', {})\
-                .setdefault('vlans', {}).setdefault(vlan, {})
-                vlan_dict.update({'vlan': str(vlan)})
-                mac_address = str(group['mac_address'])
-                mac_dict = vlan_dict.setdefault('mac_addresses', {})\
-                .setdefault(mac_address,{})
-                mac_dict.update({'mac_address': mac_address})
-                if group['entry']:
-                    mac_dict.update({'entry': str(group['entry']).strip()})
-                if not str(group['drop']) == 'None':
-                    intf_dict = mac_dict.setdefault('drop',{})
-                    intf_dict.update({'drop': True})
-                port = str(group['ports'])
-                if not port == 'None':
-                    converted_port = Common.convert_intf_name(group['ports'])
-                    intf_dict = mac_dict.setdefault('interfaces',{})\
-                    .setdefault(converted_port,{})
-                    intf_dict.update({'interface': converted_port})
-                mac_type = str(group['mac_type'])
-                age = str(group['age'])
-                secure = str(group['secure'])
-                ntfy = str(group['ntfy'])
-                intf_dict.update({'mac_type': str(group['mac_type'])})
-                intf_dict.update({'age': str(group['age'])})                
-                mac_dict.update({'secure': str(group['secure'])})
-                mac_dict.update({'ntfy': str(group['ntfy'])})
-                continue
-                
-        return ret_dict
+                group = intern.groups(m.groupdict(), 'mac_type', 'age',
+                                      'secure', 'ntfy')
+                interface = None
+                if group['ports'] is not None:
+                    interface = intern(
+                        Common.convert_intf_name(group['ports']))
+                entry = group['entry']
+                yield MacRecord(
+                    vlan=group['vlan'], mac_address=group['mac_address'],
+                    interface=interface,
+                    drop=True if group['drop'] is not None else None,
+                    mac_type=group['mac_type'],
+                    entry=intern(entry.strip()) if entry else None,
+                    age=group['age'], secure=group['secure'],
+                    ntfy=group['ntfy'])
 
 
 class ShowMacAddressTableVni(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema):
@@ -171,26 +201,30 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
         'show mac address-table address {address} interface {interface} vlan {vlan}'
     ]
 
+    def _command(self, address=None, interface=None, vlan=None):
+        if address and interface and vlan:
+            cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
+        elif address and interface:
+            cmd = self.cli_command[6].format(address=address, interface=interface)
+        elif address and vlan:
+            cmd = self.cli_command[5].format(address=address, vlan=vlan)
+        elif address:
+            cmd = self.cli_command[4].format(address=address)
+        elif interface and vlan:
+            cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
+        elif interface:
+            cmd = self.cli_command[2].format(interface=interface)
+        elif vlan:
+            cmd = self.cli_command[1].format(vlan=vlan)
+        else:
+            cmd = self.cli_command[0]
+        return cmd
+
     def cli(self, address=None, interface=None, vlan=None, output=None):
 
         if output is None:
-            if address and interface and vlan:
-                cmd = self.cli_command[7].format(address=address, interface=interface, vlan=vlan)
-            elif address and interface:
-                cmd = self.cli_command[6].format(address=address, interface=interface)
-            elif address and vlan:
-                cmd = self.cli_command[5].format(address=address, vlan=vlan)
-            elif address:
-                cmd = self.cli_command[4].format(address=address)
-            elif interface and vlan:
-                cmd = self.cli_command[3].format(interface=interface, vlan=vlan)
-            elif interface:
-                cmd = self.cli_command[2].format(interface=interface)
-            elif vlan:
-                cmd = self.cli_command[1].format(vlan=vlan)
-            else:
-                cmd = self.cli_command[0]
-
+            cmd = self._command(address=address, interface=interface,
+                                vlan=vlan)
             out = self.device.execute(cmd)
         else:
             out = output
@@ -205,6 +239,13 @@ class ShowMacAddressTable(ShowMacAddressTableBase, ShowMacAddressTableBaseSchema
 
         return ret_dict
 
+    def parse_records(self, address=None, interface=None, vlan=None,
+                      output=None):
+        if output is None:
+            output = self.device.execute(self._command(
+                address=address, interface=interface, vlan=vlan))
+        return super().parse_records(output)
+
 
 class ShowMacAddressTableAgingTimeSchema(MetaParser):
     """Schema for show mac address-table aging-time"""
@@ -16,6 +16,7 @@ import re
 from genie.metaparser import MetaParser
 from genie.metaparser.util.schemaengine import Schema, Any, Optional
 from genie.libs.parser.nxos.show_vrf import  ShowVrf
+from genie.libs.parser.utils.session import nested_parse
 
 # ===================================
 # Parser for 'show ip mroute vrf all'
@@ -838,14 +839,18 @@ class ShowForwardingDistributionMulticastRoute(ShowForwardingDistributionMultica
         'num_of_oifs',
         'oifs']
 
+    def prerequisites(self, vrf='', **kwargs):
+        '''Commands executed besides the command of the parser'''
+        # The vrf ids are mapped to their names for all the vrfs
+        return [ShowVrf.cli_command[0]] if vrf == 'all' else []
+
     def cli(self, vrf="", output=None):
         # finding vrf names
         vrf_dict = {}
 
         if vrf:
             if vrf == 'all':
-                showparser = ShowVrf(device=self.device)
-                vrfs_list = showparser.parse()
+                vrfs_list = nested_parse(ShowVrf, self.device)
                 for vrf_name in vrfs_list['vrfs'].keys():
                     vrf_id = vrfs_list['vrfs'][vrf_name]['vrf_id']
                     vrf_dict.update({vrf_id: vrf_name})
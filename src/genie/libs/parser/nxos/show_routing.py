@@ -51,6 +51,9 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional, Or, And,\
                                          
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.patterns import Patterns
+from genie.libs.parser.utils.records import RouteRecord
+from genie.libs.parser.utils.interning import Interner
 
 # =================================
 # Parser for 'show routing vrf all'
@@ -588,104 +591,12 @@ class ShowIpRoute(ShowIpRouteSchema):
     exclude = [
         'updated']
 
-    def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
-
-        # execute command to get output
-        if output is None:
-            if protocol and route and interface and vrf:
-                cmd = self.cli_command[0].format(
-                        protocol=protocol,
-                        route=route,
-                        interface=interface,
-                        vrf=vrf,
-                        )
-            elif protocol and route and interface:
-                cmd = self.cli_command[1].format(
-                        protocol=protocol,
-                        route=route,
-                        interface=interface,
-                        )
-            elif protocol and route and vrf:
-                cmd = self.cli_command[2].format(
-                        protocol=protocol,
-                        route=route,
-                        vrf=vrf,
-                        )
-            elif protocol and interface and vrf:
-                cmd = self.cli_command[3].format(
-                        protocol=protocol,
-                        vrf=vrf,
-                        interface=interface,
-                        )
-            elif route and interface and vrf:
-                cmd = self.cli_command[4].format(
-                        vrf=vrf,
-                        route=route,
-                        interface=interface,
-                        )
-            elif protocol and route:
-                cmd = self.cli_command[5].format(
-                        protocol=protocol,
-                        route=route,
-                        )
-            elif protocol and interface:
-                cmd = self.cli_command[6].format(
-                        protocol=protocol,
-                        interface=interface,
-                        )
-            elif protocol and vrf:
-                cmd = self.cli_command[7].format(
-                        protocol=protocol,
-                        vrf=vrf,
-                        )
-            elif route and interface:
-                cmd = self.cli_command[8].format(
-                        route=route,
-                        interface=interface,
-                        )
-            elif route and vrf:
-                cmd = self.cli_command[9].format(
-                        route=route,
-                        vrf=vrf,
-                        )
-            elif interface and vrf:
-                cmd = self.cli_command[10].format(
-                        interface=interface,
-                        vrf=vrf,
-                        )
-            elif protocol:
-                cmd = self.cli_command[11].format(
-                        protocol=protocol,
-                        )
-            elif route:
-                cmd = self.cli_command[12].format(
-                        route=route,
-                        )
-            elif interface:
-                cmd = self.cli_command[13].format(
-                        interface=interface,
-                        )
-            elif vrf:
-                cmd = self.cli_command[14].format(
-                        vrf=vrf,
-                        )
-            else:
-                cmd = self.cli_command[15]
-
-            out = self.device.execute(cmd)
-        else:
-            out = output
-
-        if not cmd:
-            cmd = 'ipv4'
-        af = 'ipv6' if 'v6' in cmd else 'ipv4'
-        result_dict = {}
-
+    patterns = Patterns(
         # IP Route Table for VRF "default"
         # IP Route Table for Context "default"
         # IPv6 Routing Table for VRF "default"
         # IP Route Table for VRF "default"
-        p1 = re.compile(r'^\s*IP(?:v6)? +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$')
+        p1=r'^\s*IP(?:v6)? +Rout(?:e|ing) +Table +for (VRF|Context) +\"(?P<vrf>\S+)\"$',
 
         # 10.4.1.1/32, ubest/mbest: 2/0
         # 10.36.3.3/32, ubest/mbest: 2/0, attached
@@ -695,10 +606,10 @@ class ShowIpRoute(ShowIpRouteSchema):
         # 0.1.3.255/32, 1 ucast next-hops, 0 mcast next-hops, attached
         # 2001:db8:5f1:1::1/128, ubest/mbest: 1/0, attached
         # 192.168.1.1/32, ubest/mbest: 1/0, pending ufdm
-        p2 = re.compile(r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
-                        r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
-                        r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
-                        r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?$')
+        p2=r'^(?P<route>[\w\/\.\:]+), +(ubest/mbest: +'
+           r'(?P<ubest_mbest>[\d\/]+)( +time)?)?((?P<ubest>\d+) '
+           r'+ucast +next-hops, +(?P<mbest>\d+) +mcast +next-hops)?'
+           r'(, +(?P<attached>[\w]+))?( +(?P<attached2>[\w]+))?$',
 
         # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
         # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
@@ -712,32 +623,131 @@ class ShowIpRoute(ShowIpRouteSchema):
         # *via vrf default, Null0, [20/0], 18:11:28, bgp-333, external, tag 333
         # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
         # *via 2001:db8:626b:2101::3/128, [200/7], 01:51:32, bgp-10001, internal, tag 20001
-        p3 = re.compile(r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%]+),'
-                        r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
-                        r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
-                        r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
-                        r'( +\((?P<hidden>hidden)\))?'
-                        r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid: +(?P<segid>\d+))?,?'
-                        r'( +tunnelid: +(?P<tunnelid>[0-9x]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$')
+        p3=r'^\s*(?P<star>[*]+)?via +(?P<next_hop>[\s\w\:\.\/\%]+),'
+           r'( +(?P<interface>[\w\/\.]+))?,? +\[(?P<route_preference>[\d\/]+)\],'
+           r' +(?P<date>[0-9][\w\:]+)?,?( +(?P<source_protocol>[\w\-]+))?,?'
+           r'( +(?P<source_protocol_status>[\w-]+))?,?( +tag +(?P<tag>[\d]+))?,?'
+           r'( +\((?P<hidden>hidden)\))?'
+           r'\s*(?P<vpn>[a-zA-Z\(\)\-]+)?,?( +segid: +(?P<segid>\d+))?,?'
+           r'( +tunnelid: +(?P<tunnelid>[0-9x]+))?,?( +encap: +(?P<encap>[a-zA-Z0-9]+))?$',
 
         #    tag 100
-        p4 = re.compile(r'^tag +(?P<tag>\d+)$')
+        p4=r'^tag +(?P<tag>\d+)$',
+    )
 
-        for line in out.splitlines():
+    def _command(self, route=None, protocol=None, vrf=None, interface=None):
+        if protocol and route and interface and vrf:
+            cmd = self.cli_command[0].format(
+                    protocol=protocol,
+                    route=route,
+                    interface=interface,
+                    vrf=vrf,
+                    )
+        elif protocol and route and interface:
+            cmd = self.cli_command[1].format(
+                    protocol=protocol,
+                    route=route,
+                    interface=interface,
+                    )
+        elif protocol and route and vrf:
+            cmd = self.cli_command[2].format(
+                    protocol=protocol,
+                    route=route,
+                    vrf=vrf,
+                    )
+        elif protocol and interface and vrf:
+            cmd = self.cli_command[3].format(
+                    protocol=protocol,
+                    vrf=vrf,
+                    interface=interface,
+                    )
+        elif route and interface and vrf:
+            cmd = self.cli_command[4].format(
+                    vrf=vrf,
+                    route=route,
+                    interface=interface,
+                    )
+        elif protocol and route:
+            cmd = self.cli_command[5].format(
+                    protocol=protocol,
+                    route=route,
+                    )
+        elif protocol and interface:
+            cmd = self.cli_command[6].format(
+                    protocol=protocol,
+                    interface=interface,
+                    )
+        elif protocol and vrf:
+            cmd = self.cli_command[7].format(
+                    protocol=protocol,
+                    vrf=vrf,
+                    )
+        elif route and interface:
+            cmd = self.cli_command[8].format(
+                    route=route,
+                    interface=interface,
+                    )
+        elif route and vrf:
+            cmd = self.cli_command[9].format(
+                    route=route,
+                    vrf=vrf,
+                    )
+        elif interface and vrf:
+            cmd = self.cli_command[10].format(
+                    interface=interface,
+                    vrf=vrf,
+                    )
+        elif protocol:
+            cmd = self.cli_command[11].format(
+                    protocol=protocol,
+                    )
+        elif route:
+            cmd = self.cli_command[12].format(
+                    route=route,
+                    )
+        elif interface:
+            cmd = self.cli_command[13].format(
+                    interface=interface,
+                    )
+        elif vrf:
+            cmd = self.cli_command[14].format(
+                    vrf=vrf,
+                    )
+        else:
+            cmd = self.cli_command[15]
+        return cmd
+
+    def _iter_events(self, output):
+        """ Read the output one line at a time, the state machine of both cli
+            and parse_records.
+
+            Yields:
+                tuple: the name of the pattern matching a line, such as
+                       'p3', its groups, and the state of the route of the
+                       line: a dict, updated in place, of the vrf, route,
+                       index and tag of the route, of the updated and
+                       source_protocol of the line or of the ones before it,
+                       and of the next_hop, next_hop_vrf, next_hop_af,
+                       outgoing_interface, route_preference, metric,
+                       process_id and source_protocol_status of the line
+        """
+        p = self.patterns
+        # The next hops, interfaces and protocols repeat over the routes
+        intern = Interner()
+        state = {'vrf': 'default', 'route': None, 'index': 1, 'tag': None,
+                 'updated': None, 'source_protocol': None}
+
+        for line in Common.iter_lines(output):
             line = line.strip()
 
             # IP Route Table for VRF "default"
             # IP Route Table for Context "default"
             # IPv6 Routing Table for VRF "default"
-            m = p1.match(line)
+            m = p.p1.match(line)
             if m:
-                if 'vrf' not in result_dict:
-                    vrfs_dict = result_dict.setdefault('vrf', {})
-
-                group = m.groupdict()
-                vrf = group['vrf']
-                routes_dict = vrfs_dict.setdefault(vrf, {}).setdefault('address_family', {}). \
-                                        setdefault(af, {}).setdefault('routes', {})
+                groups = m.groupdict()
+                state['vrf'] = groups['vrf']
+                yield 'p1', groups, state
                 continue
 
             # 10.4.1.1/32, ubest/mbest: 2/0
@@ -748,12 +758,103 @@ class ShowIpRoute(ShowIpRouteSchema):
             # 0.1.3.255/32, 1 ucast next-hops, 0 mcast next-hops, attached
             # 2001:db8:5f1:1::1/128, ubest/mbest: 1/0, attached
             # 192.168.1.1/32, ubest/mbest: 1/0, pending ufdm
-            m = p2.match(line)
+            m = p.p2.match(line)
             if m:
                 groups = m.groupdict()
-                route = groups['route']
-                active = True
-                index = 1
+                state.update(route=groups['route'], index=1, tag=None)
+                yield 'p2', groups, state
+                continue
+
+            # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
+            # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
+            # *via 10.229.11.11, [200/0], 01:01:12, bgp-100, internal, tag 100
+            # *via 2001:db8:5f1:1::1, Eth1/27, [0/0], 05:56:03, local
+            # *via ::ffff:10.229.11.11%default:IPv4, [200/0], 01:01:43, bgp-100, internal,
+            # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra, tag 100,
+            # via 10.4.1.1, [200/0], 1w4d, bgp-65000, internal, tag 65000 (hidden)
+            # via 10.23.120.2, Eth1/1.120, [120/2], 1w4d, rip-1, rip
+            # **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
+            # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
+            m = p.p3.match(line)
+            if m:
+                groups = m.groupdict()
+
+                next_hop = groups['next_hop']
+                next_hop_vrf = next_hop_af = None
+                if '%' in next_hop:
+                    next_hop, next_hop_vrf = next_hop.split('%')[:2]
+                    if ':' in next_hop_vrf:
+                        next_hop_vrf, next_hop_af = next_hop_vrf.split(':')[:2]
+                        next_hop_af = next_hop_af.lower()
+
+                route_preference, metric = map(
+                    int, groups['route_preference'].split('/')[:2])
+
+                interface = None
+                if groups['interface']:
+                    interface = Common.convert_intf_name(groups['interface'])
+
+                if groups['date']:
+                    state['updated'] = intern(groups['date'])
+
+                process_id = None
+                if groups['source_protocol']:
+                    source_protocol = groups['source_protocol'].split('-')
+                    state['source_protocol'] = intern(source_protocol[0])
+                    if len(source_protocol) > 1:
+                        process_id = intern(source_protocol[1])
+
+                if groups['tag']:
+                    state['tag'] = int(groups['tag'])
+
+                state.update(
+                    next_hop=intern(next_hop),
+                    next_hop_vrf=intern(next_hop_vrf),
+                    next_hop_af=intern(next_hop_af),
+                    outgoing_interface=intern(interface),
+                    route_preference=route_preference, metric=metric,
+                    process_id=process_id,
+                    source_protocol_status=intern(
+                        groups['source_protocol_status']))
+                yield 'p3', groups, state
+                state['index'] += 1
+                continue
+
+            #    tag 100
+            m = p.p4.match(line)
+            if m:
+                groups = m.groupdict()
+                state['tag'] = int(groups['tag'])
+                yield 'p4', groups, state
+
+    def cli(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+
+        # execute command to get output
+        if output is None:
+            cmd = self._command(route=route, protocol=protocol, vrf=vrf,
+                                interface=interface)
+            out = self.device.execute(cmd)
+        else:
+            out = output
+
+        if not cmd:
+            cmd = 'ipv4'
+        af = 'ipv6' if 'v6' in cmd else 'ipv4'
+        result_dict = {}
+
+        for name, groups, state in self._iter_events(out):
+
+            # IP Route Table for VRF "default"
+            if name == 'p1':
+                if 'vrf' not in result_dict:
+                    vrfs_dict = result_dict.setdefault('vrf', {})
+
+                routes_dict = vrfs_dict.setdefault(state['vrf'], {}).setdefault('address_family', {}). \
+                                        setdefault(af, {}).setdefault('routes', {})
+
+            # 10.4.1.1/32, ubest/mbest: 2/0
+            elif name == 'p2':
+                route = state['route']
 
                 if groups['ubest_mbest']:
                     ubest_mbest = groups['ubest_mbest']
@@ -776,7 +877,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                         setdefault('routes', {})
                 route_dict = routes_dict.setdefault(route, {})
                 route_dict.update({'route': route})
-                route_dict.update({'active': active})
+                route_dict.update({'active': True})
 
                 if ubest:
                     route_dict.update({'ubest': int(ubest)})
@@ -787,69 +888,28 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if groups['attached']:
                     route_dict.update({'attached': attached})
 
-                continue
-
             # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
-            # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra
-            # *via 10.229.11.11, [200/0], 01:01:12, bgp-100, internal, tag 100
-            # *via 2001:db8:5f1:1::1, Eth1/27, [0/0], 05:56:03, local
-            # *via ::ffff:10.229.11.11%default:IPv4, [200/0], 01:01:43, bgp-100, internal,
-            # *via 10.1.3.1, Eth1/2, [110/41], 01:01:18, ospf-1, intra, tag 100,
-            # via 10.4.1.1, [200/0], 1w4d, bgp-65000, internal, tag 65000 (hidden)
-            # via 10.23.120.2, Eth1/1.120, [120/2], 1w4d, rip-1, rip
-            # **via 10.36.3.3%default, [33/0], 5w0d, bgp-100, internal, tag 100 (mpls-vpn)
-            # *via 10.55.130.3%default, [33/0], 3d10h, bgp-1, internal, tag 1 (evpn), segid: 50051 tunnelid: 0x64008203 encap: VXLAN
-            m = p3.match(line)
-            if m:
-                groups = m.groupdict()
-
-                tag = process_id = source_protocol_status = interface = next_hop_vrf = next_hop_af = ""
-                star = m.groupdict()['star']
+            elif name == 'p3':
+                next_hop = state['next_hop']
+                interface = state['outgoing_interface']
+                updated = state['updated']
+                source_protocol = state['source_protocol']
+                source_protocol_status = state['source_protocol_status']
+                rp, metrics = state['route_preference'], state['metric']
+
+                star = groups['star']
                 cast = None
-
                 star_rp, non_star_rp, star_metrics, non_star_metrics = None, None, None, None
-                if groups['route_preference']:
-                    rp_val = groups['route_preference'].split('/')
-                    rp = int(rp_val[0])
-                    metrics = int(rp_val[1])
-                    if star:
-                        if len(star) == 1:
-                            cast = 'best_ucast_nexthop'
-                        if len(star) == 2:
-                            cast = 'best_mcast_nexthop'
-                        star_rp = rp
-                        star_metrics = metrics
-                    else:
-                        non_star_rp = rp
-                        non_star_metrics = metrics
-
-                if groups['next_hop']:
-                    next_hop = groups['next_hop']
-                    if '%' in next_hop:
-                        next_hop_vrf = next_hop.split('%')[1]
-                        next_hop = next_hop.split('%')[0]
-                        if ':' in next_hop_vrf:
-                            next_hop_af = next_hop_vrf.split(':')[1].lower()
-                            next_hop_vrf = next_hop_vrf.split(':')[0]
-
-                if groups['interface']:
-                    interface = Common.convert_intf_name(groups['interface'])
-
-                if groups['date']:
-                    updated = groups['date']
-
-                if groups['source_protocol_status']:
-                    source_protocol_status = groups['source_protocol_status']
-
-                if groups['source_protocol']:
-                    if '-' in groups['source_protocol']:
-                        source_protocol = groups['source_protocol'].split('-')[0]
-                        process_id = groups['source_protocol'].split('-')[1]
-                    else:
-                        source_protocol = groups['source_protocol']
-
-                if groups['tag']:
-                    tag = groups['tag']
+                if star:
+                    if len(star) == 1:
+                        cast = 'best_ucast_nexthop'
+                    if len(star) == 2:
+                        cast = 'best_mcast_nexthop'
+                    star_rp = rp
+                    star_metrics = metrics
+                else:
+                    non_star_rp = rp
+                    non_star_metrics = metrics
 
                 hidden = True if groups.get('hidden') else False
 
@@ -862,16 +922,16 @@ class ShowIpRoute(ShowIpRouteSchema):
                 if star_rp is not None:
                     route_dict.update({'route_preference': int(star_rp)})
 
-                if process_id:
-                    route_dict.update({'process_id': process_id})
+                if state['process_id']:
+                    route_dict.update({'process_id': state['process_id']})
 
-                if tag:
-                    route_dict.update({'tag': int(tag)})
+                if groups['tag']:
+                    route_dict.update({'tag': int(groups['tag'])})
 
                 next_hop_dict = route_dict.setdefault('next_hop', {})
 
                 if not next_hop:
-                    interface_dict = next_hop_dict.setdefault('outgoing_interface', {}).setdefault(interface, {})
+                    interface_dict = next_hop_dict.setdefault('outgoing_interface', {}).setdefault(interface or "", {})
 
                     if interface:
                         interface_dict.update({'outgoing_interface': interface})
@@ -880,6 +940,7 @@ class ShowIpRoute(ShowIpRouteSchema):
                         interface_dict.update({'updated': updated})
 
                 else:
+                    index = state['index']
                     index_dict = next_hop_dict.setdefault('next_hop_list', {}).setdefault(index, {})
                     index_dict.update({'index': index})
                     index_dict.update({'next_hop': next_hop})
@@ -900,11 +961,11 @@ class ShowIpRoute(ShowIpRouteSchema):
                     if interface:
                         index_dict.update({'outgoing_interface': interface})
 
-                    if next_hop_vrf:
-                        index_dict.update({'next_hop_vrf': next_hop_vrf})
+                    if state['next_hop_vrf']:
+                        index_dict.update({'next_hop_vrf': state['next_hop_vrf']})
 
-                    if next_hop_af:
-                        index_dict.update({'next_hop_af': next_hop_af})
+                    if state['next_hop_af']:
+                        index_dict.update({'next_hop_af': state['next_hop_af']})
 
                     if star_metrics is not None:
                         index_dict['metric'] = star_metrics
@@ -940,18 +1001,54 @@ class ShowIpRoute(ShowIpRouteSchema):
                     elif vpn and 'stale' in vpn:
                         index_dict['stale'] = True
 
-                index += 1
-                continue
-
             #    tag 100
-            m = p4.match(line)
-            if m:
-                groups = m.groupdict()
-                if groups['tag']:
-                    route_dict.update({'tag': int(groups['tag'])})
-                    
+            elif name == 'p4':
+                route_dict.update({'tag': state['tag']})
+
         return result_dict
 
+    def parse_records(self, route=None, protocol=None, vrf=None, interface=None, output=None, cmd=None):
+        """ Yield a RouteRecord per next hop of the routes of the output, as
+            it is read. The records of a route are yielded once all its lines
+            are read, with the tag of the route.
+        """
+        if output is None:
+            cmd = self._command(route=route, protocol=protocol, vrf=vrf,
+                                interface=interface)
+            output = self.device.execute(cmd)
+
+        if not cmd:
+            cmd = 'ipv4'
+        af = 'ipv6' if 'v6' in cmd else 'ipv4'
+
+        # Records of the current route, and its tag
+        records = []
+        tag = None
+
+        for name, groups, state in self._iter_events(output):
+            # IP Route Table for VRF "default"
+            # 10.4.1.1/32, ubest/mbest: 2/0
+            if name in ('p1', 'p2'):
+                for record in records:
+                    yield record._replace(tag=tag)
+                records = []
+
+            # *via 10.2.3.2, Eth1/4, [1/0], 01:01:30, static
+            elif name == 'p3':
+                records.append(RouteRecord(
+                    vrf=state['vrf'], address_family=af, route=state['route'],
+                    active=True, source_protocol=state['source_protocol'],
+                    route_preference=state['route_preference'],
+                    metric=state['metric'], index=state['index'],
+                    next_hop=state['next_hop'],
+                    next_hop_vrf=state['next_hop_vrf'] or None,
+                    outgoing_interface=state['outgoing_interface'],
+                    updated=state['updated']))
+            tag = state['tag']
+
+        for record in records:
+            yield record._replace(tag=tag)
+
 
 # ====================================================
 #  parser for:
@@ -1022,85 +1119,8 @@ class ShowIpv6Route(ShowIpRoute):
     def cli(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
 
         if output is None:
-            if protocol and route and interface and vrf:
-                cmd = self.cli_command[0].format(
-                    protocol=protocol,
-                    route=route,
-                    interface=interface,
-                    vrf=vrf,
-                )
-            elif protocol and route and interface:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                    route=route,
-                    interface=interface,
-                )
-            elif protocol and route and vrf:
-                cmd = self.cli_command[2].format(
-                    protocol=protocol,
-                    route=route,
-                    vrf=vrf,
-                )
-            elif protocol and interface and vrf:
-                cmd = self.cli_command[3].format(
-                    protocol=protocol,
-                    vrf=vrf,
-                    interface=interface,
-                )
-            elif route and interface and vrf:
-                cmd = self.cli_command[4].format(
-                    vrf=vrf,
-                    route=route,
-                    interface=interface,
-                )
-            elif protocol and route:
-                cmd = self.cli_command[5].format(
-                    protocol=protocol,
-                    route=route,
-                )
-            elif protocol and interface:
-                cmd = self.cli_command[6].format(
-                    protocol=protocol,
-                    interface=interface,
-                )
-            elif protocol and vrf:
-                cmd = self.cli_command[7].format(
-                    protocol=protocol,
-                    vrf=vrf,
-                )
-            elif route and interface:
-                cmd = self.cli_command[8].format(
-                    route=route,
-                    interface=interface,
-                )
-            elif route and vrf:
-                cmd = self.cli_command[9].format(
-                    route=route,
-                    vrf=vrf,
-                )
-            elif interface and vrf:
-                cmd = self.cli_command[10].format(
-                    interface=interface,
-                    vrf=vrf,
-                )
-            elif protocol:
-                cmd = self.cli_command[11].format(
-                    protocol=protocol,
-                )
-            elif route:
-                cmd = self.cli_command[12].format(
-                    route=route,
-                )
-            elif interface:
-                cmd = self.cli_command[13].format(
-                    interface=interface,
-                )
-            elif vrf:
-                cmd = self.cli_command[14].format(
-                    vrf=vrf,
-                )
-            else:
-                cmd = self.cli_command[15]
+            cmd = self._command(route=route, protocol=protocol, vrf=vrf,
+                                interface=interface)
             out = self.device.execute(cmd)
         else:
             out = output
@@ -1114,15 +1134,19 @@ class ShowRouting(ShowIpRoute):
         show routing <ip>"""
     cli_command = ['show routing', 'show routing {protocol}']
 
+    def _command(self, route=None, protocol=None, vrf=None, interface=None):
+        if protocol:
+            cmd = self.cli_command[1].format(
+                protocol=protocol,
+            )
+        else:
+            cmd = self.cli_command[0]
+        return cmd
+
     def cli(self, protocol=None, route=None, vrf=None, interface=None, output=None, cmd=None):
 
         if output is None:
-            if protocol:
-                cmd = self.cli_command[1].format(
-                    protocol=protocol,
-                )
-            else:
-                cmd = self.cli_command[0]
+            cmd = self._command(protocol=protocol)
             out = self.device.execute(cmd)
         else:
             out = output
@@ -15,6 +15,7 @@ from genie.metaparser.util.schemaengine import Schema, Any, Optional
 
 # import parser utils
 from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.session import nested_parse
 
 # =====================
 # Parser for 'show vrf'
@@ -271,6 +272,12 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
     """Parser for show running-config vrf <vrf> | sec '^vrf' """
 
     cli_command = "show running-config vrf {vrf} | sec '^vrf'"
+
+    def prerequisites(self, vrf=None, **kwargs):
+        '''Commands executed besides the command of the parser'''
+        # The configuration of each vrf is then executed, once known
+        return [] if vrf else [ShowVrf.cli_command[0]]
+
     def cli(self, vrf=None):
         # Init vars
         vrf_list = []
@@ -298,8 +305,7 @@ class ShowRunningConfigVrf(ShowRunningConfigVrfSchema):
             vrf_list.append(vrf)
 
         else:
-            showVrf = ShowVrf(device=self.device)
-            vrfs = showVrf.parse()
+            vrfs = nested_parse(ShowVrf, self.device)
             for vrf in vrfs['vrfs'].keys():
                 vrf_list.append(vrf)
 
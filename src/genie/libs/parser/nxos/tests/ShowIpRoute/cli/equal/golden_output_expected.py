@@ -0,0 +1,202 @@
+expected_output = {
+    "vrf": {
+        "default": {
+            "address_family": {
+                "ipv4": {
+                    "routes": {
+                        "10.144.6.6/32": {
+                            "active": True,
+                            "mbest": 0,
+                            "metric": 81,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 81,
+                                        "next_hop": "10.2.4.4",
+                                        "outgoing_interface": "Ethernet1/1",
+                                        "route_preference": 110,
+                                        "source_protocol": "ospf",
+                                        "source_protocol_status": "intra",
+                                        "updated": "00:20:04",
+                                    },
+                                    2: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 2,
+                                        "metric": 81,
+                                        "next_hop": "10.2.5.5",
+                                        "outgoing_interface": "Ethernet1/2",
+                                        "route_preference": 110,
+                                        "source_protocol": "ospf",
+                                        "source_protocol_status": "intra",
+                                        "updated": "00:20:04",
+                                    },
+                                },
+                            },
+                            "process_id": "10",
+                            "route": "10.144.6.6/32",
+                            "route_preference": 110,
+                            "source_protocol": "ospf",
+                            "source_protocol_status": "intra",
+                            "ubest": 2,
+                        },
+                        "10.16.2.2/32": {
+                            "active": True,
+                            "attached": True,
+                            "mbest": 0,
+                            "metric": 0,
+                            "route_preference": 0,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.16.2.2",
+                                        "outgoing_interface": "Loopback1",
+                                        "source_protocol": "local",
+                                        "updated": "00:41:07",
+                                    },
+                                    2: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 2,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.16.2.2",
+                                        "outgoing_interface": "Loopback1",
+                                        "source_protocol": "direct",
+                                        "updated": "00:41:07",
+                                    },
+                                },
+                            },
+                            "route": "10.16.2.2/32",
+                            "source_protocol": "direct",
+                            "ubest": 2,
+                        },
+                        "10.166.7.0/24": {
+                            "active": True,
+                            "mbest": 0,
+                            "metric": 20,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 20,
+                                        "next_hop": "10.2.4.4",
+                                        "outgoing_interface": "Ethernet1/1",
+                                        "route_preference": 110,
+                                        "source_protocol": "ospf",
+                                        "source_protocol_status": "type-2",
+                                        "updated": "00:20:04",
+                                    },
+                                    2: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 2,
+                                        "metric": 20,
+                                        "next_hop": "10.2.5.5",
+                                        "outgoing_interface": "Ethernet1/2",
+                                        "route_preference": 110,
+                                        "source_protocol": "ospf",
+                                        "source_protocol_status": "type-2",
+                                        "updated": "00:20:04",
+                                    },
+                                },
+                            },
+                            "process_id": "10",
+                            "route": "10.166.7.0/24",
+                            "route_preference": 110,
+                            "source_protocol": "ospf",
+                            "source_protocol_status": "type-2",
+                            "ubest": 2,
+                        },
+                        "10.2.5.0/24": {
+                            "active": True,
+                            "attached": True,
+                            "mbest": 0,
+                            "metric": 0,
+                            "route_preference": 0,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.2.5.2",
+                                        "outgoing_interface": "Ethernet1/2",
+                                        "source_protocol": "direct",
+                                        "updated": "00:45:10",
+                                    },
+                                },
+                            },
+                            "route": "10.2.5.0/24",
+                            "source_protocol": "direct",
+                            "ubest": 1,
+                        },
+                        "10.2.5.2/32": {
+                            "active": True,
+                            "attached": True,
+                            "mbest": 0,
+                            "metric": 0,
+                            "route_preference": 0,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.2.5.2",
+                                        "outgoing_interface": "Ethernet1/2",
+                                        "source_protocol": "local",
+                                        "updated": "00:45:10",
+                                    },
+                                },
+                            },
+                            "route": "10.2.5.2/32",
+                            "source_protocol": "local",
+                            "ubest": 1,
+                        },
+                        "10.76.23.23/32": {
+                            "active": True,
+                            "attached": True,
+                            "mbest": 0,
+                            "metric": 0,
+                            "route_preference": 0,
+                            "next_hop": {
+                                "next_hop_list": {
+                                    1: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 1,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.76.23.23",
+                                        "outgoing_interface": "Loopback1",
+                                        "source_protocol": "local",
+                                        "updated": "00:41:07",
+                                    },
+                                    2: {
+                                        "best_ucast_nexthop": True,
+                                        "index": 2,
+                                        "metric": 0,
+                                        "route_preference": 0,
+                                        "next_hop": "10.76.23.23",
+                                        "outgoing_interface": "Loopback1",
+                                        "source_protocol": "direct",
+                                        "updated": "00:41:07",
+                                    },
+                                },
+                            },
+                            "route": "10.76.23.23/32",
+                            "source_protocol": "direct",
+                            "ubest": 2,
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
@@ -0,0 +1,503 @@
+expected_output = {
+    "mac_table": {
+        "vlans": {
+            "-": {
+                "mac_addresses": {
+                    "0000.deff.6c9d": {
+                        "entry": "G",
+                        "mac_address": "0000.deff.6c9d",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "(R)",
+                            },
+                            "Sup-eth1(R)(Lo0)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)(Lo0)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "-",
+            },
+            "10": {
+                "mac_addresses": {
+                    "aaaa.bbff.8888": {
+                        "entry": "*",
+                        "mac_address": "aaaa.bbff.8888",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Ethernet1/2": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Ethernet1/2",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "10",
+            },
+            "100": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "100",
+            },
+            "1000": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1000",
+            },
+            "1005": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1005",
+            },
+            "1006": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1006",
+            },
+            "1007": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1007",
+            },
+            "1008": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1008",
+            },
+            "1009": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "1009",
+            },
+            "101": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "101",
+            },
+            "102": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "102",
+            },
+            "103": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "103",
+            },
+            "105": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "105",
+            },
+            "106": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "106",
+            },
+            "107": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "107",
+            },
+            "108": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "108",
+            },
+            "109": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "109",
+            },
+            "110": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "110",
+            },
+            "111": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "111",
+            },
+            "112": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "112",
+            },
+            "113": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "113",
+            },
+            "114": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "entry": "G",
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "114",
+            },
+            "20": {
+                "mac_addresses": {
+                    "aaaa.bbff.8888": {
+                        "drop": {
+                            "age": "-",
+                            "drop": True,
+                            "mac_type": "static",
+                        },
+                        "entry": "*",
+                        "mac_address": "aaaa.bbff.8888",
+                        "ntfy": "F",
+                        "secure": "F",
+                    },
+                },
+                "vlan": "20",
+            },
+            "30": {
+                "mac_addresses": {
+                    "aaaa.bbff.8888": {
+                        "drop": {
+                            "age": "-",
+                            "drop": True,
+                            "mac_type": "static",
+                        },
+                        "entry": "*",
+                        "mac_address": "aaaa.bbff.8888",
+                        "ntfy": "F",
+                        "secure": "F",
+                    },
+                },
+                "vlan": "30",
+            },
+            "2000": {
+                "mac_addresses": {
+                    "7e00.c0ff.0007": {
+                        "mac_address": "7e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "vPC Peer-Link(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "vPC Peer-Link(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "2000",
+            },
+            "3000": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "-",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "3000",
+            },
+            "4000": {
+                "mac_addresses": {
+                    "5e00.c0ff.0007": {
+                        "mac_address": "5e00.c0ff.0007",
+                        "ntfy": "F",
+                        "interfaces": {
+                            "Sup-eth1(R)": {
+                                "age": "~~~",
+                                "mac_type": "static",
+                                "interface": "Sup-eth1(R)",
+                            },
+                        },
+                        "secure": "F",
+                    },
+                },
+                "vlan": "4000",
+            },
+        },
+    },
+}
@@ -1,3 +1,4 @@
-from .common import get_parser, get_parser_exclude, get_parser_commands
+from .common import get_parser, get_parsers, get_parser_exclude,\
+                    get_parser_commands
 from . import entry_points
 
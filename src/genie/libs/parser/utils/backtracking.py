@@ -0,0 +1,705 @@
+'''Catastrophic backtracking detector of the parser regular expressions
+
+Extracts every regular expression of the parsers out of their source, the
+ones declared through `Patterns` and the ones given to `re.compile`,
+`re.match`, ... as literals, and times each of them on adversarial long
+variants of lines: the golden `*_output.txt` lines of its parser which it
+matches, stretched (tail token repeated, columns widened, line repeated) and
+terminated so that the match fails late, along with runs of letters, digits
+and spaces.
+
+Each variant is timed at growing lengths. A pattern is flagged when its match
+time grows super-linearly with the length of the line and ends up above a
+minimum, or when it is still running after a timeout, as a device wrapping a
+line or a huge AS path would then stall the worker parsing it.
+
+The patterns run in worker processes, which are killed on timeout. The
+findings of the whole package are committed as a baseline, next to the
+unittests of the source checkout, along with the options of the scan which
+made it. A scan fails on any pattern flagged which is not in it, once timed
+again at a floor CONFIRM_FACTOR times higher and flagged again, as a busy
+machine can slow down a single timing. The patterns of the baseline are
+known to be slow and not timed again, unless the findings are saved to make
+a new baseline.
+
+Usage:
+
+    python -m genie.libs.parser.utils.backtracking
+    python -m genie.libs.parser.utils.backtracking --os nxos
+    python -m genie.libs.parser.utils.backtracking --baseline '' \\
+        --output tests/backtracking_baseline.json
+'''
+
+# python
+import os
+import re
+import ast
+import sys
+import json
+import math
+import time
+import glob
+import hashlib
+import warnings
+import argparse
+import multiprocessing
+from multiprocessing.connection import wait
+
+from .patterns import literal_prefixes
+
+# Methods of the re module taking the pattern as first argument, and the
+# position of their flags argument
+RE_FUNCTIONS = {'compile': 1, 'match': 2, 'search': 2, 'fullmatch': 2,
+                'findall': 2, 'finditer': 2, 'split': 3, 'sub': 4,
+                'subn': 4}
+
+# Method timed for each of them, the ones going through the whole line
+# timed as findall which does the same scan
+TIMED_METHODS = {'compile': 'match', 'match': 'match', 'search': 'search',
+                 'fullmatch': 'fullmatch', 'findall': 'findall',
+                 'finditer': 'findall', 'split': 'split', 'sub': 'findall',
+                 'subn': 'findall'}
+
+# Lengths of the variants each pattern is timed on
+LENGTHS = (256, 512, 1024, 2048)
+
+# Growth of the match time with the length beyond which it is super-linear,
+# 1 being linear and 2 quadratic
+DEFAULT_EXPONENT = 1.5
+
+# Match time, at the longest variant, below which a pattern is not flagged
+DEFAULT_MIN_SECONDS = 0.001
+
+# Match time after which a variant is not made any longer
+DEFAULT_BUDGET = 0.25
+
+# Time after which a worker stuck on a pattern is killed
+DEFAULT_TIMEOUT = 20
+
+# Golden lines of its parser a pattern is fuzzed from
+MAX_SEEDS = 3
+
+# Times the minimum match time a pattern flagged which is not in the
+# baseline is timed again with, before failing the scan
+CONFIRM_FACTOR = 10
+
+# Findings of the whole package the scans are compared with, in the tests
+# folder of the source checkout
+BASELINE = os.path.normpath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, os.pardir,
+    os.pardir, os.pardir, os.pardir, 'tests', 'backtracking_baseline.json'))
+
+# Character ending the variants, so that the match fails after going through
+# the whole line
+TERMINATOR = '!'
+
+
+class PatternSource(object):
+    '''Regular expression found in the source of a parser module'''
+
+    __slots__ = ('path', 'lineno', 'os', 'class_name', 'name', 'pattern',
+                 'flags', 'method')
+
+    def __init__(self, path, lineno, os, class_name, name, pattern, flags,
+                 method):
+        self.path = path
+        self.lineno = lineno
+        self.os = os
+        self.class_name = class_name
+        self.name = name
+        self.pattern = pattern
+        self.flags = flags
+        self.method = method
+
+    @property
+    def key(self):
+        '''Identifies the pattern across changes of the lines around it'''
+        digest = hashlib.sha1('{p}\0{f}'.format(p=self.pattern,
+                                                f=self.flags).encode())
+        return '{p}:{d}'.format(p=self.path, d=digest.hexdigest()[:12])
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _literal(node):
+    '''Value of a literal node, or None'''
+    # ast.Str and ast.Num before python 3.8
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+
+def _flags(node):
+    '''Value of a flags expression made of re.X constants, or None'''
+    if isinstance(node, ast.Attribute) and \
+            isinstance(node.value, ast.Name) and node.value.id == 're':
+        value = getattr(re, node.attr, None)
+        return int(value) if isinstance(value, int) else None
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr):
+        left, right = _flags(node.left), _flags(node.right)
+        if left is None or right is None:
+            return None
+        return left | right
+    value = _literal(node)
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    return None
+
+
+def _string(node):
+    value = _literal(node)
+    return value if isinstance(value, str) else None
+
+
+class _PatternVisitor(ast.NodeVisitor):
+    '''Collects the literal patterns of a module'''
+
+    def __init__(self, path, os_name):
+        self.path = path
+        self.os = os_name
+        self.sources = []
+        self._classes = []
+        self._names = {}
+
+    def visit_ClassDef(self, node):
+        self._classes.append(node.name)
+        self.generic_visit(node)
+        self._classes.pop()
+
+    def visit_Assign(self, node):
+        # Named after the variable they are assigned to
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            self._names[node.value] = node.targets[0].id
+        self.generic_visit(node)
+
+    def _add(self, node, name, pattern, flags, method):
+        self.sources.append(PatternSource(
+            self.path, node.lineno, self.os,
+            self._classes[0] if self._classes else None,
+            name or 'line {n}'.format(n=node.lineno), pattern, flags,
+            method))
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute) and func.attr in RE_FUNCTIONS \
+                and isinstance(func.value, ast.Name) \
+                and func.value.id == 're' and node.args:
+            pattern = _string(node.args[0])
+            position = RE_FUNCTIONS[func.attr]
+            flags = node.args[position] if len(node.args) > position else \
+                next((keyword.value for keyword in node.keywords
+                                        if keyword.arg == 'flags'), None)
+            flags = 0 if flags is None else _flags(flags)
+            if pattern is not None and flags is not None:
+                # Compiled patterns are mostly matched
+                method = 'match' if func.attr == 'compile' else func.attr
+                self._add(node, self._names.get(node), pattern, flags, method)
+
+        elif isinstance(func, ast.Name) and func.id == 'Patterns':
+            for keyword in node.keywords:
+                value = keyword.value
+                pattern, flags = _string(value), 0
+                if isinstance(value, ast.Tuple) and len(value.elts) == 2:
+                    pattern, flags = _string(value.elts[0]), \
+                                     _flags(value.elts[1])
+                if pattern is not None and flags is not None:
+                    self._add(value, keyword.arg, pattern, flags, 'match')
+
+        self.generic_visit(node)
+
+
+def extract_patterns(root=None, os_names=None, paths=None):
+    ''' Extract the literal regular expressions of the parser modules.
+
+        Args:
+            root (`str`): genie.libs.parser directory, default to this one
+            os_names (`list`): only extract the modules of these OS
+            paths (`list`): only extract these modules, relative to root
+
+        Returns:
+            list: the PatternSource of every pattern
+    '''
+    root = root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    if paths is None:
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            relative = os.path.relpath(dirpath, root)
+            dirnames[:] = sorted(name for name in dirnames
+                                        if name not in ('tests', 'utils',
+                                                        '__pycache__'))
+            if relative == '.':
+                continue
+            paths.extend(os.path.join(relative, name)
+                            for name in sorted(filenames)
+                                if name.endswith('.py'))
+
+    sources = []
+    for path in paths:
+        os_name = path.split(os.sep)[0]
+        if os_names and os_name not in os_names:
+            continue
+        with open(os.path.join(root, path), encoding='utf-8',
+                  errors='replace') as f:
+            try:
+                with warnings.catch_warnings():
+                    # Invalid escapes of the parsers' non raw strings
+                    warnings.simplefilter('ignore')
+                    tree = ast.parse(f.read(), path)
+            except SyntaxError:
+                continue
+        visitor = _PatternVisitor(path, os_name)
+        visitor.visit(tree)
+        sources.extend(visitor.sources)
+
+    return sources
+
+
+def golden_lines(root=None, os_names=None):
+    ''' Read the golden outputs of the parsers.
+
+        Args:
+            root (`str`): genie.libs.parser directory, default to this one
+            os_names (`list`): only read the outputs of these OS
+
+        Returns:
+            dict: (os, parser class) -> lines of its golden outputs
+    '''
+    root = root or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    lines = {}
+    for path in sorted(glob.glob(os.path.join(
+            root, '*', 'tests', '*', 'cli', 'equal', '*_output.txt'))):
+        parts = os.path.relpath(path, root).split(os.sep)
+        os_name, class_name = parts[0], parts[2]
+        if os_names and os_name not in os_names:
+            continue
+        with open(path, encoding='utf-8', errors='replace') as f:
+            lines.setdefault((os_name, class_name), []).extend(
+                f.read().splitlines())
+    return lines
+
+
+def seeds(compiled, method, lines, count=MAX_SEEDS):
+    '''Golden lines a pattern matches, the longest first'''
+    found = []
+    run = getattr(compiled, method)
+    for line in sorted(set(line.strip() for line in lines if line.strip()),
+                       key=lambda line: (-len(line), line)):
+        if run(line):
+            found.append(line)
+            if len(found) == count:
+                break
+    return found
+
+
+def _stretched(base, unit, length):
+    '''base followed by unit repeated up to length, then the terminator'''
+    count = max(1, int(math.ceil((length - len(base)) / float(len(unit)))))
+    return base + unit * count + TERMINATOR
+
+
+def variants(pattern, flags, seed_lines):
+    ''' Return the families of adversarial lines of a pattern.
+
+        Args:
+            pattern (`str`): the pattern
+            flags (`int`): its flags
+            seed_lines (`list`): lines it matches
+
+        Returns:
+            list: (family name, function returning the line of a length)
+    '''
+    families = []
+    for number, seed in enumerate(seed_lines):
+        tokens = seed.split()
+        families.extend([
+            ('seed{n} tail'.format(n=number),
+             lambda length, seed=seed, last=tokens[-1]:
+                _stretched(seed, ' ' + last, length)),
+            ('seed{n} repeat'.format(n=number),
+             lambda length, seed=seed:
+                _stretched('', seed + ' ', length)),
+        ])
+        if len(tokens) > 1:
+            families.append((
+                'seed{n} columns'.format(n=number),
+                lambda length, tokens=tokens:
+                    (' ' * max(1, length // (len(tokens) - 1))).join(tokens) +
+                    TERMINATOR))
+
+    # Past the literal the lines start with, if any
+    prefixes = literal_prefixes(pattern, flags)
+    prefix = prefixes[0] + ' ' if prefixes else ''
+    for name, unit in [('letters', 'a'), ('digits', '1'), ('spaces', ' '),
+                       ('words', 'a1 ')]:
+        families.append((name, lambda length, unit=unit:
+                                        _stretched(prefix, unit, length)))
+
+    return families
+
+
+def _timed_run(run, line, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(line)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    return best
+
+
+def measure(compiled, method, family, lengths=LENGTHS, budget=DEFAULT_BUDGET):
+    ''' Time a pattern on the lines of a family at growing lengths.
+
+        Args:
+            compiled (`re.Pattern`): the pattern
+            method (`str`): its method to time, such as 'match'
+            family (`function`): returns the line of a length
+            lengths (`list`): the lengths to time, growing
+            budget (`float`): time after which longer lines are not timed
+
+        Returns:
+            list: (length, seconds) of each line timed
+    '''
+    run = getattr(compiled, method)
+    timings = []
+    for length in lengths:
+        line = family(length)
+        seconds = _timed_run(run, line, repeat=1 if timings and
+                             timings[-1][1] > budget / 10 else 3)
+        timings.append((len(line), seconds))
+        if seconds > budget:
+            break
+    return timings
+
+
+def growth(timings):
+    '''Exponent of the match time with the line length, between the two
+       longest lines timed'''
+    if len(timings) < 2:
+        return None
+    (short, short_seconds), (long, long_seconds) = timings[-2:]
+    if short_seconds <= 0 or long <= short:
+        return None
+    return math.log(max(long_seconds, 1e-9) / short_seconds) / \
+        math.log(float(long) / short)
+
+
+def scan_pattern(source, lines=(), exponent=DEFAULT_EXPONENT,
+                 min_seconds=DEFAULT_MIN_SECONDS, lengths=LENGTHS,
+                 budget=DEFAULT_BUDGET):
+    ''' Fuzz one pattern.
+
+        Args:
+            source (`PatternSource`): the pattern
+            lines (`list`): golden lines of its parser
+            exponent (`float`): growth beyond which it is super-linear
+            min_seconds (`float`): time under which it is not flagged
+            lengths (`list`): lengths of the lines to time
+            budget (`float`): time after which longer lines are not timed
+
+        Returns:
+            dict: the finding of its slowest family, None when not flagged
+    '''
+    try:
+        compiled = re.compile(source.pattern, source.flags)
+    except (re.error, OverflowError, ValueError):
+        return None
+    method = TIMED_METHODS.get(source.method, 'match')
+
+    worst = None
+    for family, build in variants(source.pattern, source.flags,
+                                  seeds(compiled, method, lines)):
+        timings = measure(compiled, method, build, lengths, budget)
+        length, seconds = timings[-1]
+        rate = growth(timings)
+        slow = seconds > budget
+        if seconds < min_seconds or not (slow or
+                                         (rate is not None and
+                                          rate > exponent)):
+            continue
+        if worst is None or seconds > worst['seconds']:
+            worst = {'family': family, 'length': length, 'seconds': seconds,
+                     'exponent': rate, 'timings': timings,
+                     'line': build(lengths[0])[:200]}
+
+    return worst
+
+
+def _worker(connection, options):
+    '''Scan the patterns received until None'''
+    while True:
+        job = connection.recv()
+        if job is None:
+            return
+        number, source, lines = job
+        try:
+            result = scan_pattern(source, lines, **options)
+        except Exception:
+            # Not a pattern this scan can time
+            result = None
+        connection.send((number, result))
+
+
+def _finding(source, result):
+    finding = source.to_dict()
+    finding['key'] = source.key
+    finding.update(result)
+    return finding
+
+
+def scan(sources, lines=None, processes=None, timeout=DEFAULT_TIMEOUT,
+         progress=None, **options):
+    ''' Fuzz patterns, each one in a worker process killed on timeout.
+
+        Args:
+            sources (`list`): the PatternSource to fuzz
+            lines (`dict`): (os, parser class) -> golden lines of the parser
+            processes (`int`): number of workers, 0 to fuzz in this process
+                               without timeout
+            timeout (`float`): time after which a pattern is flagged and its
+                               worker killed
+            progress (`function`): called with the number of patterns done
+            options (`dict`): arguments of scan_pattern
+
+        Returns:
+            list: the findings, the slowest first
+    '''
+    lines = lines or {}
+    jobs = [(number, source, lines.get((source.os, source.class_name), []))
+                for number, source in enumerate(sources)]
+    findings = []
+
+    if processes == 0:
+        for number, source, source_lines in jobs:
+            result = scan_pattern(source, source_lines, **options)
+            if result:
+                findings.append(_finding(source, result))
+            if progress:
+                progress(number + 1)
+        return _sorted(findings)
+
+    processes = processes or multiprocessing.cpu_count()
+    jobs.reverse()
+    # Connection -> [process, job, start]
+    workers = {}
+    done = 0
+
+    def start_worker():
+        parent, child = multiprocessing.Pipe()
+        process = multiprocessing.Process(target=_worker,
+                                          args=(child, options), daemon=True)
+        process.start()
+        child.close()
+        workers[parent] = [process, None, None]
+
+    def assign(connection):
+        worker = workers[connection]
+        if jobs:
+            job = jobs.pop()
+            connection.send(job)
+            worker[1], worker[2] = job, time.monotonic()
+        else:
+            connection.send(None)
+            worker[0].join()
+            del workers[connection]
+
+    try:
+        for _ in range(min(processes, len(jobs))):
+            start_worker()
+        for connection in list(workers):
+            assign(connection)
+
+        while workers:
+            ready = wait(list(workers), timeout=1)
+            for connection in ready:
+                number, result = connection.recv()
+                if result:
+                    findings.append(_finding(sources[number], result))
+                done += 1
+                assign(connection)
+
+            # Stuck workers
+            now = time.monotonic()
+            for connection, (process, job, started) in list(workers.items()):
+                if job is None or now - started < timeout:
+                    continue
+                process.terminate()
+                process.join()
+                del workers[connection]
+                findings.append(_finding(job[1], {
+                    'family': None, 'length': None, 'seconds': timeout,
+                    'exponent': None, 'timings': [], 'line': None,
+                    'timeout': True}))
+                done += 1
+                if jobs:
+                    start_worker()
+                    assign(list(workers)[-1])
+
+            if progress:
+                progress(done)
+    finally:
+        for process, _, _ in workers.values():
+            process.terminate()
+
+    return _sorted(findings)
+
+
+def _sorted(findings):
+    return sorted(findings, key=lambda finding: (-finding['seconds'],
+                                                 finding['key']))
+
+
+def compare_baseline(findings, baseline):
+    ''' Return the findings which are not in a baseline.
+
+        Args:
+            findings (`list`): the findings of a scan
+            baseline (`dict`): the results of an earlier scan
+
+        Returns:
+            list: the findings whose key is not flagged in the baseline
+    '''
+    known = baseline_keys(baseline)
+    return [finding for finding in findings if finding['key'] not in known]
+
+
+def confirm(findings, sources, lines=None, processes=None,
+            timeout=DEFAULT_TIMEOUT, min_seconds=DEFAULT_MIN_SECONDS,
+            factor=CONFIRM_FACTOR, **options):
+    ''' Time again the patterns of findings, at a higher minimum.
+
+        Args:
+            findings (`list`): the findings to confirm
+            sources (`list`): the PatternSource scanned, among them the
+                              ones of the findings
+            lines (`dict`): (os, parser class) -> golden lines of the parser
+            processes (`int`): number of workers, as for scan
+            timeout (`float`): time after which a pattern is flagged
+            min_seconds (`float`): minimum match time of the findings
+            factor (`float`): times min_seconds a pattern is flagged above
+            options (`dict`): other arguments of scan_pattern
+
+        Returns:
+            list: the findings flagged again
+    '''
+    keys = set(finding['key'] for finding in findings)
+    return scan([source for source in sources if source.key in keys], lines,
+                processes=processes, timeout=timeout,
+                min_seconds=min_seconds * factor, **options)
+
+
+def baseline_keys(baseline):
+    '''Keys of the patterns flagged in a baseline'''
+    return set(finding['key'] for finding in baseline.get('findings', []))
+
+
+def load_baseline(path=BASELINE):
+    '''Read the findings of a baseline'''
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def report(findings, top=None):
+    '''Return the findings as a table, the slowest first'''
+    lines = ['{n} patterns flagged'.format(n=len(findings)),
+             '{:<45} {:<16} {:>7} {:>10} {:>8}  {}'.format(
+                 'pattern', 'variant', 'length', 'ms', 'growth', 'regex')]
+    for finding in findings[:top]:
+        where = '{p}:{l} {n}'.format(p=finding['path'], l=finding['lineno'],
+                                     n=finding['name'])
+        growth_text = 'timeout' if finding.get('timeout') else \
+            '-' if finding['exponent'] is None else \
+            '{:.2f}'.format(finding['exponent'])
+        lines.append('{w:<45} {f:<16} {l:>7} {ms:>10.1f} {g:>8}  {r}'.format(
+            w=where, f=finding['family'] or '-',
+            l=finding['length'] or '-', ms=finding['seconds'] * 1000,
+            g=growth_text, r=finding['pattern'][:60]))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Flag the parser regular expressions whose match time '
+                    'grows super-linearly on long lines')
+    parser.add_argument('--os', action='append', dest='os_names',
+                        help='OS to scan, can be repeated, default to all')
+    parser.add_argument('--module', action='append', dest='paths',
+                        help='module to scan, relative to genie.libs.parser, '
+                             'can be repeated')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes, default to the '
+                             'number of CPUs, 0 to scan without timeout')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help='seconds after which a pattern is flagged')
+    parser.add_argument('--exponent', type=float, default=DEFAULT_EXPONENT,
+                        help='growth of the match time with the line length '
+                             'beyond which a pattern is flagged')
+    parser.add_argument('--min-seconds', type=float,
+                        default=DEFAULT_MIN_SECONDS,
+                        help='match time under which a pattern is not flagged')
+    parser.add_argument('--top', type=int, default=None,
+                        help='number of findings to report')
+    parser.add_argument('--output', help='json file to save the findings to')
+    parser.add_argument('--baseline',
+                        default=BASELINE if os.path.exists(BASELINE) else '',
+                        help='json findings to compare with, exit with an '
+                             'error on any pattern flagged which is not in '
+                             'it, default to the committed baseline of the '
+                             'source checkout, empty for none')
+    parser.add_argument('--json', action='store_true',
+                        help='print the findings as json')
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    options = {'exponent': args.exponent, 'min_seconds': args.min_seconds,
+               'timeout': args.timeout, 'budget': DEFAULT_BUDGET,
+               'lengths': list(LENGTHS)}
+    if baseline is not None and baseline.get('options') != options:
+        print('The baseline was made with other options: {o}'.format(
+            o=baseline.get('options')), file=sys.stderr)
+
+    sources = extract_patterns(os_names=args.os_names, paths=args.paths)
+    if baseline is not None and not args.output:
+        # Known to be slow, only the others can regress
+        known = baseline_keys(baseline)
+        sources = [source for source in sources if source.key not in known]
+
+    lines = golden_lines(os_names=args.os_names)
+    findings = scan(sources, lines, processes=args.processes,
+                    timeout=args.timeout, exponent=args.exponent,
+                    min_seconds=args.min_seconds)
+    results = {'python': '.'.join(map(str, sys.version_info[:3])),
+               'options': options,
+               'patterns': len(sources),
+               'findings': findings}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(report(findings, args.top))
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if baseline is not None:
+        regressions = compare_baseline(findings, baseline)
+        confirmed = set(finding['key'] for finding in confirm(
+            regressions, sources, lines, processes=args.processes,
+            timeout=args.timeout, exponent=args.exponent,
+            min_seconds=args.min_seconds)) if regressions else set()
+        for finding in regressions:
+            print('{s}: {p}:{l} {n} {r!r}'.format(
+                s='Regression' if finding['key'] in confirmed else
+                  'Not flagged again',
+                p=finding['path'], l=finding['lineno'], n=finding['name'],
+                r=finding['pattern']), file=sys.stderr)
+        if confirmed:
+            return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
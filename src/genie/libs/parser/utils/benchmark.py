@@ -0,0 +1,1200 @@
+'''Benchmarks of the parser lookup
+
+The lookup benchmark goes through every command of every OS and times
+`get_parser`, `_fuzzy_search_command` with and without fuzzy and
+`get_parser_commands`, for exact commands, commands with their arguments
+filled and regex queries. It reports the p50/p99 latencies, can save them
+as a json baseline and fails when a later run regresses from it.
+
+The patterns benchmark parses captured outputs with the parsers declaring
+their regular expressions through `Patterns`, with the patterns compiled
+on every call (cold) and once per process (warm).
+
+The dispatch benchmark parses the output of 10k interfaces, made of the
+interfaces of a captured output renamed, with every pattern tried on every
+line and with the patterns dispatched on the first token of the lines.
+
+The streaming benchmark parses captured outputs repeated into files of a few
+MB, read into a string first and given as the open file, and reports the
+peak memory allocated while parsing each way.
+
+The incremental benchmark sends the same outputs in chunks at the rate of a
+device, and times parsing them once received and while receiving them.
+
+The columnar benchmark parses a synthetic routing table of distinct routes
+into the dict of `parse()` and into columns, and reports the memory each
+holds per route.
+
+The interning benchmark parses synthetic routing and BGP tables of a million
+routes with the repeated strings shared and not, and reports the memory held
+by each result.
+
+The result-cache benchmark parses captured outputs of mostly static commands
+and times parsing them against taking them from the result caches.
+
+The fleet benchmark collects and parses the captured outputs of a few
+commands from replayed devices through the asyncio pipeline, with pools of
+an increasing number of processes, and reports the devices per second.
+
+Usage:
+
+    python -m genie.libs.parser.utils.benchmark matches-fuzzy
+    python -m genie.libs.parser.utils.benchmark patterns
+    python -m genie.libs.parser.utils.benchmark dispatch --interfaces 10000
+    python -m genie.libs.parser.utils.benchmark streaming --size 8
+    python -m genie.libs.parser.utils.benchmark incremental --rate 1
+    python -m genie.libs.parser.utils.benchmark columnar --routes 100000
+    python -m genie.libs.parser.utils.benchmark interning --routes 1000000
+    python -m genie.libs.parser.utils.benchmark result-cache
+    python -m genie.libs.parser.utils.benchmark fleet --devices 2000
+    python -m genie.libs.parser.utils.benchmark lookup --output baseline.json
+    python -m genie.libs.parser.utils.benchmark lookup --baseline baseline.json
+'''
+
+# python
+import os
+import re
+import sys
+import json
+import math
+import time
+import argparse
+import platform
+import tempfile
+import importlib
+import tracemalloc
+
+from .common import (
+    parser_data,
+    command_index,
+    get_parser,
+    get_parser_cache,
+    get_parser_commands,
+    _matches_fuzzy,
+    _fuzzy_search_command
+)
+from . import patterns
+from . import interning
+from .incremental import IncrementalParser
+from .columnar import parse_columns
+from .result_cache import MemoryResultCache, SqliteResultCache
+from .fleet import ReplayDevice, parse_fleet
+
+# Allowed slowdown from the baseline before a latency is a regression
+DEFAULT_TOLERANCE = 1.5
+
+# Parsers declaring their patterns, with an output captured from a device,
+# relative to genie.libs.parser
+PATTERN_BENCHMARKS = [
+    ('iosxe', 'show_interface', 'ShowInterfaces',
+     'iosxe/tests/ShowInterfaces/cli/equal/golden_interface_output_1_output.txt'),
+    ('nxos', 'show_bgp', 'ShowBgpVrfAllAll',
+     'nxos/tests/ShowBgpVrfAllAll/cli/equal/golden_output_1_output.txt'),
+]
+
+# Parsers dispatching their patterns, with an output captured from a device
+# and the line starting each interface of it
+DISPATCH_BENCHMARKS = [
+    ('iosxe', 'show_interface', 'ShowInterfaces',
+     'iosxe/tests/ShowInterfaces/cli/equal/golden_output_output.txt',
+     r'^(?P<name>\S+) is '),
+    ('nxos', 'show_interface', 'ShowInterface',
+     'nxos/tests/ShowInterface/cli/equal/golden_output_1_output.txt',
+     r'^ {8}(?P<name>\S+) is '),
+    ('iosxr', 'show_interface', 'ShowInterfaces',
+     'iosxr/tests/ShowInterfaces/cli/equal/golden_output_1_output.txt',
+     r'^ {8}(?P<name>\S+) is '),
+    ('junos', 'show_interface', 'ShowInterfaces',
+     'junos/tests/ShowInterfaces/cli/equal/golden_output_1_output.txt',
+     r'^ *Physical interface: (?P<name>[^,]+),'),
+]
+
+# Parsers of the large tables, with an output captured from a device
+STREAMING_BENCHMARKS = [
+    ('iosxe', 'show_routing', 'ShowIpRoute',
+     'iosxe/tests/ShowIpRoute/cli/equal/golden_output_1_output.txt'),
+    ('nxos', 'show_bgp', 'ShowBgpVrfAllAll',
+     'nxos/tests/ShowBgpVrfAllAll/cli/equal/golden_output_1_output.txt'),
+    ('iosxr', 'show_routing', 'ShowRouteIpv4',
+     'iosxr/tests/ShowRouteIpv4/cli/equal/golden_output_1_output.txt'),
+    ('junos', 'show_route', 'ShowRoute',
+     'junos/tests/ShowRoute/cli/equal/golden_output_6_output.txt'),
+    ('iosxe', 'show_fdb', 'ShowMacAddressTable',
+     'iosxe/tests/ShowMacAddressTable/cli/equal/golden_output_2_output.txt'),
+    ('nxos', 'show_fdb', 'ShowMacAddressTable',
+     'nxos/tests/ShowMacAddressTable/cli/equal/golden_output_output.txt'),
+]
+
+# Parsers of mostly static commands, with an output captured from a device
+RESULT_CACHE_BENCHMARKS = [
+    ('iosxe', 'show_platform', 'ShowVersion',
+     'iosxe/tests/ShowVersion/cli/equal/golden_output_asr1k_output.txt'),
+    ('iosxe', 'show_platform', 'ShowInventory',
+     'iosxe/tests/ShowInventory/cli/equal/golden_output_asr1k_output.txt'),
+    ('iosxe', 'show_vrf', 'ShowVrf',
+     'iosxe/tests/ShowVrf/cli/equal/golden_output_output.txt'),
+]
+
+# Commands of the replayed iosxe devices, with an output captured from a
+# device
+FLEET_BENCHMARKS = [
+    ('show version',
+     'iosxe/tests/ShowVersion/cli/equal/golden_output_asr1k_output.txt'),
+    ('show inventory',
+     'iosxe/tests/ShowInventory/cli/equal/golden_output_asr1k_output.txt'),
+    ('show vrf', 'iosxe/tests/ShowVrf/cli/equal/golden_output_output.txt'),
+    ('show ip route',
+     'iosxe/tests/ShowIpRoute/cli/equal/golden_output_1_output.txt'),
+]
+
+# Searches which used to take the longest to compare with the commands
+WORST_CASE_SEARCHES = [
+    ('show bgp vrf X all neighbors Y advertised-routes', False),
+    ('show bgp vrf X all neighbors Y advertised-routes', True),
+    ('sh bgp vrf X al ne Y .*', True),
+]
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def synthetic_search(arguments, fuzzy=False):
+    ''' Build a command with a number of two token arguments, and a search
+        which spans them in every possible way but does not match.
+
+        Args:
+            arguments (`int`): number of arguments of the command
+            fuzzy (`bool`): whether the search ends with a regex
+
+        Returns:
+            tuple: the command and the search
+    '''
+    command = 'show {} end'.format(
+        ' '.join('{{argument{}}}'.format(k) for k in range(arguments)))
+
+    if fuzzy:
+        search = ['t'] * (2 * arguments) + ['.*', 'end']
+    else:
+        search = ['t'] * (2 * arguments - 1) + ['x']
+
+    return command, 'show ' + ' '.join(search)
+
+
+def bench_synthetic(sizes=(2, 4, 8, 16, 32), fuzzy=False):
+    ''' Compare synthetic searches with a growing number of arguments.
+
+        Args:
+            sizes (`list`): numbers of arguments to compare
+            fuzzy (`bool`): whether to use fuzzy searches
+
+        Returns:
+            list: dict of the number of arguments, search tokens, compared
+                  subproblems and seconds, per size
+    '''
+    results = []
+    for arguments in sizes:
+        command, search = synthetic_search(arguments, fuzzy)
+        tokens = search.split()
+        memo = {}
+        _, seconds = _timed(_matches_fuzzy, 0, 0, tokens.copy(), command, {},
+                            fuzzy, None, 0, memo)
+        results.append({'arguments': arguments,
+                        'tokens': len(tokens),
+                        'subproblems': len(memo),
+                        'seconds': seconds})
+    return results
+
+
+def bench_worst_cases(searches=WORST_CASE_SEARCHES):
+    ''' Compare worst case searches with all the candidate commands.
+
+        Args:
+            searches (`list`): (search, fuzzy) to compare
+
+        Returns:
+            list: dict of the search, fuzzy, candidate commands, compared
+                  subproblems and seconds, per search
+    '''
+    results = []
+    for search, fuzzy in searches:
+        tokens = search.split()
+        subproblems = 0
+        seconds = 0
+        candidates = command_index.search(tokens, fuzzy)
+        for command in candidates:
+            memo = {}
+            _, elapsed = _timed(_matches_fuzzy, 0, 0, tokens.copy(), command,
+                                {}, fuzzy, None, 0, memo)
+            subproblems += len(memo)
+            seconds += elapsed
+        results.append({'search': search,
+                        'fuzzy': fuzzy,
+                        'candidates': len(candidates),
+                        'subproblems': subproblems,
+                        'seconds': seconds})
+    return results
+
+
+class BenchmarkDevice(object):
+    '''Device with the attributes get_parser looks at'''
+
+    def __init__(self, os, platform=None, model=None):
+        self.os = os
+        self.platform = platform
+        self.model = model
+        self.custom = {}
+
+
+def percentile(timings, percent):
+    '''Nearest rank percentile of a list of timings'''
+    if not timings:
+        return None
+    timings = sorted(timings)
+    return timings[max(0, int(math.ceil(percent / 100.0 * len(timings))) - 1)]
+
+
+def lookup_queries(command):
+    ''' Build the queries benchmarked for a command.
+
+        Args:
+            command (`str`): the command
+
+        Returns:
+            list: (kind, search) of the exact, arguments and regex queries
+    '''
+    filled = re.sub('{.*?}', 'argument', command)
+    queries = [('arguments' if '{' in command else 'exact', filled)]
+
+    tokens = filled.split()
+    if len(tokens) > 1:
+        queries.append(('regex', ' '.join(tokens[:-1] + ['.*'])))
+
+    return queries
+
+
+class _Timings(object):
+    '''Timings and errors of the benchmarks, by name'''
+
+    def __init__(self):
+        self.timings = {}
+        self.errors = {}
+
+    def time(self, name, func, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            func(*args, **kwargs)
+        except Exception:
+            self.errors[name] = self.errors.get(name, 0) + 1
+        self.timings.setdefault(name, []).append(time.perf_counter() - start)
+
+    def results(self):
+        return {name: {'count': len(timings),
+                       'errors': self.errors.get(name, 0),
+                       'mean': sum(timings) / len(timings),
+                       'p50': percentile(timings, 50),
+                       'p99': percentile(timings, 99)}
+                for name, timings in sorted(self.timings.items())}
+
+
+def bench_lookup(os_names=None, step=1):
+    ''' Time the lookup of the commands of every OS.
+
+        Args:
+            os_names (`list`): OS to benchmark, default to all of them
+            step (`int`): only benchmark every step-th command of an OS
+
+        Returns:
+            dict: the environment and, per benchmark, the number of timed
+                  calls, errors, mean, p50 and p99 in seconds
+    '''
+    os_names = os_names or parser_data.os_names()
+    timings = _Timings()
+    commands = 0
+
+    for os_name in os_names:
+        device = BenchmarkDevice(os_name)
+        timings.time('get_parser_commands', get_parser_commands, device)
+
+        for command in parser_data.commands(os_name)[::step]:
+            commands += 1
+            for kind, search in lookup_queries(command):
+                fuzzy = kind == 'regex'
+                if not fuzzy:
+                    timings.time('fuzzy_search_command[{}]'.format(kind),
+                                 _fuzzy_search_command, search, False,
+                                 os_name)
+                timings.time('fuzzy_search_command_fuzzy[{}]'.format(kind),
+                             _fuzzy_search_command, search, True, os_name)
+
+                # Resolution without the get_parser cache, then from it
+                get_parser_cache.clear()
+                name = 'get_parser{}[{}]'.format('_fuzzy' if fuzzy else '',
+                                                 kind)
+                timings.time(name, get_parser, search, device, fuzzy)
+                timings.time('get_parser_cached', get_parser, search, device,
+                             fuzzy)
+
+    return {'python': platform.python_version(),
+            'os': os_names,
+            'commands': commands,
+            'step': step,
+            'results': timings.results()}
+
+
+def compare_baseline(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    ''' Compare lookup benchmark results with a baseline.
+
+        Args:
+            results (`dict`): results of `bench_lookup`
+            baseline (`dict`): earlier results of `bench_lookup`
+            tolerance (`float`): allowed slowdown factor
+
+        Returns:
+            list: (benchmark, percentile, baseline seconds, seconds) of the
+                  latencies slower than the baseline times the tolerance
+    '''
+    regressions = []
+    for name, result in sorted(results['results'].items()):
+        reference = baseline['results'].get(name)
+        if not reference:
+            continue
+        for metric in ('p50', 'p99'):
+            if result[metric] > reference[metric] * tolerance:
+                regressions.append((name, metric, reference[metric],
+                                    result[metric]))
+    return regressions
+
+
+def bench_patterns(benchmarks=PATTERN_BENCHMARKS, repeat=20):
+    ''' Time parsing outputs with the patterns compiled on every call (cold),
+        and compiled once (warm). The `re` module cache is purged before
+        every call in both cases, as it is when a process goes through more
+        than its 512 entries.
+
+        Args:
+            benchmarks (`list`): (os, module, class, output file) to parse
+            repeat (`int`): number of parses of each output
+
+        Returns:
+            list: dict of the parser, number of patterns, and the cold and
+                  warm p50 in seconds, per parser
+    '''
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+
+    for os_name, module, class_name, output_file in benchmarks:
+        parser_cls = getattr(importlib.import_module(
+            'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+            class_name)
+        with open(os.path.join(base, output_file)) as f:
+            output = f.read()
+
+        timings = {'cold': [], 'warm': []}
+        for kind in ('cold', 'warm'):
+            for _ in range(repeat):
+                if kind == 'cold':
+                    patterns.purge()
+                re.purge()
+                parser = parser_cls(device=BenchmarkDevice(os_name))
+                _, seconds = _timed(lambda: parser.parse(output=output))
+                timings[kind].append(seconds)
+
+        results.append({'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                                       c=class_name),
+                        'patterns': len(parser_cls.patterns),
+                        'cold': percentile(timings['cold'], 50),
+                        'warm': percentile(timings['warm'], 50)})
+
+    return results
+
+
+def replicate_interfaces(output, header, count):
+    ''' Build the output of many interfaces out of a captured output.
+
+        Args:
+            output (`str`): the captured output
+            header (`str`): pattern of the line starting an interface, with
+                            its name as the 'name' group
+            count (`int`): number of interfaces to build
+
+        Returns:
+            str: the interfaces of output, then renamed copies of them
+    '''
+    header = re.compile(header)
+    interfaces = []
+    for line in output.splitlines():
+        m = header.match(line)
+        if m:
+            interfaces.append((m.group('name'), [line]))
+        elif interfaces:
+            interfaces[-1][1].append(line)
+
+    # The interfaces are first kept as they are, as they can refer to each
+    # other (port-channel members, ...)
+    lines = []
+    for number in range(count):
+        name, interface = interfaces[number % len(interfaces)]
+        if number < len(interfaces):
+            lines.extend(interface)
+            continue
+        renamed = '{n}{k:05d}'.format(n=name, k=number)
+        lines.extend(line.replace(name, renamed) for line in interface)
+
+    return '\n'.join(lines) + '\n'
+
+
+def bench_dispatch(benchmarks=DISPATCH_BENCHMARKS, interfaces=10000,
+                   repeat=3):
+    ''' Time cli() on the output of many interfaces, without and with the
+        patterns dispatched on the first token of the lines.
+
+        Args:
+            benchmarks (`list`): (os, module, class, output, header) to time
+            interfaces (`int`): number of interfaces of the outputs
+            repeat (`int`): number of parses of each output
+
+        Returns:
+            list: the median time of each parser, without and with dispatch
+    '''
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    dispatch = patterns.DISPATCH
+    results = []
+
+    try:
+        for os_name, module, class_name, path, header in benchmarks:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            with open(os.path.join(base, path)) as f:
+                output = replicate_interfaces(f.read(), header, interfaces)
+
+            timings = {}
+            parsed = {}
+            for kind in ('all', 'dispatch'):
+                patterns.DISPATCH = kind == 'dispatch'
+                timings[kind] = []
+                for _ in range(repeat):
+                    # Only cli() tries the patterns, leave the schema out
+                    parser = parser_cls(device=BenchmarkDevice(os_name))
+                    parsed[kind], seconds = _timed(
+                        lambda: parser.cli(output=output))
+                    timings[kind].append(seconds)
+
+            results.append({
+                'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                               c=class_name),
+                'interfaces': interfaces,
+                'lines': output.count('\n'),
+                'all': percentile(timings['all'], 50),
+                'dispatch': percentile(timings['dispatch'], 50),
+                'identical': parsed['all'] == parsed['dispatch']})
+    finally:
+        patterns.DISPATCH = dispatch
+
+    return results
+
+
+def _traced(func):
+    '''Return the result of func and the peak memory it allocated, in bytes'''
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_streaming(benchmarks=STREAMING_BENCHMARKS, size=4):
+    ''' Measure the peak memory of parsing a large output read into a string,
+        and given as the open file the parser reads line by line.
+
+        The outputs are captured ones repeated, the repeated entries replace
+        each other in the result, which stays small: the peaks are mostly
+        what is held of the output while parsing.
+
+        Args:
+            benchmarks (`list`): (os, module, class, output file) to parse
+            size (`int`): size of the outputs to parse, in MB
+
+        Returns:
+            list: the output size and the peak memory and time of parsing it
+                  from a string and from a file, per parser
+    '''
+    results = []
+
+    for os_name, module, class_name, output_file in benchmarks:
+        parser_cls = getattr(importlib.import_module(
+            'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+            class_name)
+        output = _repeated(output_file, size)
+
+        with tempfile.NamedTemporaryFile('w', suffix='.txt',
+                                         delete=False) as f:
+            f.write(output)
+        del output
+
+        def from_string():
+            with open(f.name) as output:
+                output = output.read()
+            return parser_cls(device=BenchmarkDevice(os_name)).parse(
+                output=output)
+
+        def from_file():
+            with open(f.name) as output:
+                return parser_cls(device=BenchmarkDevice(os_name)).parse(
+                    output=output)
+
+        try:
+            result = {'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                                     c=class_name),
+                      'bytes': os.path.getsize(f.name)}
+            parsed = {}
+            for kind, func in (('string', from_string), ('file', from_file)):
+                parsed[kind], seconds = _timed(func)
+                _, peak = _traced(func)
+                result[kind] = {'peak': peak, 'seconds': seconds}
+            result['identical'] = parsed['string'] == parsed['file']
+            results.append(result)
+        finally:
+            os.remove(f.name)
+
+    return results
+
+
+def _repeated(output_file, size):
+    '''Captured output repeated up to size MB'''
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with open(os.path.join(base, output_file)) as f:
+        output = f.read()
+    output = output.rstrip('\n') + '\n'
+    return output * max(1, int(size * 1024 * 1024) // len(output))
+
+
+def bench_incremental(benchmarks=STREAMING_BENCHMARKS, size=2, rate=1,
+                      chunk=4096):
+    ''' Time parsing outputs sent in chunks at the rate of a device, parsed
+        once they are received and parsed as they are received.
+
+        Args:
+            benchmarks (`list`): (os, module, class, output file) to parse
+            size (`float`): size of the outputs to parse, in MB
+            rate (`float`): transfer rate of the device, in MB/s
+            chunk (`int`): size of the chunks the output is received in
+
+        Returns:
+            list: the transfer time and the time from the start of the
+                  transfer to the parsed output both ways, per parser
+    '''
+    results = []
+
+    for os_name, module, class_name, output_file in benchmarks:
+        parser_cls = getattr(importlib.import_module(
+            'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+            class_name)
+        output = _repeated(output_file, size)
+        chunks = [output[i:i + chunk] for i in range(0, len(output), chunk)]
+        interval = chunk / (rate * 1024 * 1024)
+
+        def receive(feed):
+            # Sleeping up to when each chunk is due, as a device would send it
+            start = time.perf_counter()
+            for number, data in enumerate(chunks):
+                delay = start + number * interval - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                feed(data)
+
+        def after():
+            received = []
+            receive(received.append)
+            return parser_cls(device=BenchmarkDevice(os_name)).parse(
+                output=''.join(received))
+
+        def incremental():
+            parser = IncrementalParser(
+                parser_cls(device=BenchmarkDevice(os_name)))
+            receive(parser.feed)
+            return parser.close()
+
+        parsed = {}
+        result = {'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                                 c=class_name),
+                  'bytes': len(output),
+                  'transfer': len(chunks) * interval}
+        for kind, func in (('after', after), ('incremental', incremental)):
+            parsed[kind], result[kind] = _timed(func)
+        result['identical'] = parsed['after'] == parsed['incremental']
+        results.append(result)
+
+    return results
+
+
+def synthetic_routes(count):
+    ''' Lines of an iosxe `show ip route` of count distinct OSPF routes, over
+        a few next hops, as a routing table of a device has them.'''
+    yield 'Codes: L - local, C - connected, S - static, O - OSPF\n'
+    yield '\n'
+    yield 'Gateway of last resort is not set\n'
+    yield '\n'
+    for number in range(count):
+        yield ('O        {a}.{b}.{c}.0/24 [110/{metric}] via 192.168.{hop}.1, '
+               '1d02h, GigabitEthernet0/{hop}\n'.format(
+                   a=10 + (number >> 16), b=(number >> 8) & 0xff,
+                   c=number & 0xff, metric=2 + number % 20, hop=number % 4))
+
+
+def synthetic_bgp(count):
+    ''' Lines of an nxos `show bgp vrf all all` of count distinct prefixes
+        learnt from a few peers, over a few thousand AS paths, as a full
+        table has them.'''
+    yield 'BGP routing table information for VRF default, address family ' \
+          'IPv4 Unicast\n'
+    yield 'BGP table version is 25, Local Router ID is 10.186.101.1\n'
+    yield '   Network            Next Hop            Metric     LocPrf     ' \
+          'Weight Path\n'
+    for number in range(count):
+        yield '*>e{prefix:<19}{hop:<20}{metric:>6}{localprf:>11}{weight:>11} ' \
+              '{path} i\n'.format(
+                  prefix='{a}.{b}.{c}.0/24'.format(a=10 + (number >> 16),
+                                                   b=(number >> 8) & 0xff,
+                                                   c=number & 0xff),
+                  hop='192.168.0.{}'.format(1 + number % 4),
+                  metric=0, localprf=100, weight=0,
+                  path='6500{} {} {}'.format(number % 4,
+                                             64512 + number % 50,
+                                             1000 + number % 2000))
+
+
+def _retained(func):
+    '''Return the result of func and the memory it holds, in bytes'''
+    tracemalloc.start()
+    try:
+        result = func()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_columnar(routes=100000):
+    ''' Measure the memory held by a routing table parsed into the dict of
+        `parse()` and into columns.
+
+        The output is read from a file line by line, the memory is the one
+        of the result only.
+
+        Args:
+            routes (`int`): number of routes of the table
+
+        Returns:
+            dict: the memory and time of each result
+    '''
+    from ..iosxe.show_routing import ShowIpRoute
+
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+        f.writelines(synthetic_routes(routes))
+
+    def parsed():
+        with open(f.name) as output:
+            return ShowIpRoute(device=BenchmarkDevice('iosxe')).parse(
+                output=output)
+
+    def columns():
+        with open(f.name) as output:
+            return parse_columns(ShowIpRoute(device=BenchmarkDevice('iosxe')),
+                                 output=output)
+
+    try:
+        result = {'parser': 'iosxe.show_routing.ShowIpRoute',
+                  'routes': routes, 'bytes': os.path.getsize(f.name)}
+        for kind, func in (('dict', parsed), ('columns', columns)):
+            _, seconds = _timed(func)
+            value, held = _retained(func)
+            result[kind] = {'held': held, 'seconds': seconds}
+            del value
+        result['columns']['arrays'] = columns().nbytes()
+        result['reduction'] = result['dict']['held'] / \
+            result['columns']['held']
+    finally:
+        os.remove(f.name)
+
+    return result
+
+
+def _parse_held(os_name, module, class_name, path, intern):
+    ''' Parse an output file sharing the repeated strings or not, and return
+        the memory held by the result and the time of the parse'''
+    parser_cls = getattr(importlib.import_module(
+        'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)), class_name)
+
+    def parsed():
+        with open(path) as output:
+            return parser_cls(device=BenchmarkDevice(os_name)).parse(
+                output=output)
+
+    previous = interning.INTERN
+    interning.INTERN = intern
+    try:
+        _, seconds = _timed(parsed)
+        value, held = _retained(parsed)
+        del value
+    finally:
+        interning.INTERN = previous
+    return held, seconds
+
+
+# Parsers of the large tables, with the synthetic output to parse
+INTERNING_BENCHMARKS = [
+    ('iosxe', 'show_routing', 'ShowIpRoute', synthetic_routes),
+    ('nxos', 'show_bgp', 'ShowBgpVrfAllAll', synthetic_bgp),
+]
+
+
+def bench_interning(benchmarks=INTERNING_BENCHMARKS, routes=1000000):
+    ''' Measure the memory held by a synthetic table parsed with the
+        repeated strings shared and not.
+
+        The output is read from a file line by line, the memory is the one
+        of the result only.
+
+        Args:
+            benchmarks (`list`): (os, module, class, lines of the output)
+            routes (`int`): number of routes of the tables
+
+        Returns:
+            list: the memory and time of the parse both ways, per parser
+    '''
+    results = []
+
+    for os_name, module, class_name, synthetic in benchmarks:
+        with tempfile.NamedTemporaryFile('w', suffix='.txt',
+                                         delete=False) as f:
+            f.writelines(synthetic(routes))
+        try:
+            result = {'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                                     c=class_name),
+                      'routes': routes, 'bytes': os.path.getsize(f.name)}
+            for kind, intern in (('plain', False), ('interned', True)):
+                held, seconds = _parse_held(os_name, module, class_name,
+                                            f.name, intern)
+                result[kind] = {'held': held, 'seconds': seconds}
+            result['saved'] = 1 - result['interned']['held'] / \
+                result['plain']['held'] if result['plain']['held'] else 0.0
+            results.append(result)
+        finally:
+            os.remove(f.name)
+
+    return results
+
+
+def bench_result_cache(benchmarks=RESULT_CACHE_BENCHMARKS, repeat=50):
+    ''' Time parsing captured outputs, and taking them from the in-memory
+        and SQLite result caches once parsed.
+
+        Args:
+            benchmarks (`list`): (os, module, class, output file) to parse
+            repeat (`int`): number of parses of each output
+
+        Returns:
+            list: dict of the parser and the parse, memory and SQLite hit
+                  p50 in seconds, per parser
+    '''
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        caches = (('memory', MemoryResultCache()),
+                  ('sqlite', SqliteResultCache(
+                      os.path.join(directory, 'results.db'))))
+
+        for os_name, module, class_name, output_file in benchmarks:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            with open(os.path.join(base, output_file)) as f:
+                output = f.read()
+            parser = parser_cls(device=BenchmarkDevice(os_name))
+
+            timings = {'parse': [_timed(lambda: parser.parse(
+                output=output))[1] for _ in range(repeat)]}
+            for kind, cache in caches:
+                # The first parse fills the cache, the others are hits
+                cache.parse(parser, output=output)
+                timings[kind] = [_timed(lambda: cache.parse(
+                    parser, output=output))[1] for _ in range(repeat)]
+
+            result = {'parser': '{o}.{m}.{c}'.format(o=os_name, m=module,
+                                                     c=class_name),
+                      'bytes': len(output)}
+            result.update((kind, percentile(values, 50))
+                          for kind, values in timings.items())
+            results.append(result)
+
+        caches[1][1].close()
+
+    return results
+
+
+def bench_fleet(benchmarks=FLEET_BENCHMARKS, devices=1000, delay=0.05,
+                processes=None, concurrency=256):
+    ''' Time collecting and parsing the commands of replayed devices
+        through the fleet pipeline, with pools of processes of increasing
+        sizes.
+
+        Args:
+            benchmarks (`list`): (command, output file) of the devices
+            devices (`int`): number of devices
+            delay (`float`): time taken by each command, in seconds
+            processes (`list`): sizes of the pools, 1 to the number of cores
+                                doubling if None
+            concurrency (`int`): number of devices in flight
+
+        Returns:
+            list: dict of the pool size, the seconds, the devices per second
+                  and the number of errors, per pool size
+    '''
+    base = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    outputs = {}
+    for command, output_file in benchmarks:
+        with open(os.path.join(base, output_file)) as f:
+            outputs[command] = f.read()
+
+    if processes is None:
+        processes = [1]
+        while processes[-1] * 2 <= (os.cpu_count() or 1):
+            processes.append(processes[-1] * 2)
+
+    results = []
+    for size in processes:
+        fleet = [ReplayDevice('R{}'.format(number), 'iosxe', outputs,
+                              delay=delay) for number in range(devices)]
+        parsed, seconds = _timed(lambda: parse_fleet(
+            fleet, list(outputs), processes=size, concurrency=concurrency))
+        results.append({'processes': size, 'devices': devices,
+                        'seconds': seconds, 'rate': devices / seconds,
+                        'errors': sum(len(result.errors)
+                                      for result in parsed)})
+
+    return results
+
+
+def _print_patterns(results):
+    print('{:<40} {:>9} {:>10} {:>10}'.format('parser', 'patterns',
+                                              'cold ms', 'warm ms'))
+    for result in results:
+        print('{parser:<40} {patterns:>9} {cold:>10.3f} {warm:>10.3f}'.format(
+            parser=result['parser'], patterns=result['patterns'],
+            cold=result['cold'] * 1000, warm=result['warm'] * 1000))
+
+
+def _print_dispatch(results):
+    print('{:<40} {:>8} {:>10} {:>10} {:>8} {:>10}'.format(
+        'parser', 'lines', 'all ms', 'dispatch ms', 'speedup', 'identical'))
+    for result in results:
+        print('{parser:<40} {lines:>8} {all:>10.1f} {dispatch:>11.1f} '
+              '{speedup:>7.2f}x {identical!s:>10}'.format(
+                  speedup=result['all'] / result['dispatch'],
+                  **dict(result, all=result['all'] * 1000,
+                         dispatch=result['dispatch'] * 1000)))
+
+
+def _print_streaming(results):
+    print('{:<40} {:>8} {:>11} {:>9} {:>10} {:>8} {:>10}'.format(
+        'parser', 'MB', 'string MB', 'file MB', 'string s', 'file s',
+        'identical'))
+    for result in results:
+        print('{parser:<40} {mb:>8.1f} {string:>11.1f} {file:>9.1f} '
+              '{string_s:>10.2f} {file_s:>8.2f} {identical!s:>10}'.format(
+                  parser=result['parser'], mb=result['bytes'] / 2 ** 20,
+                  string=result['string']['peak'] / 2 ** 20,
+                  file=result['file']['peak'] / 2 ** 20,
+                  string_s=result['string']['seconds'],
+                  file_s=result['file']['seconds'],
+                  identical=result['identical']))
+
+
+def _print_incremental(results):
+    print('{:<40} {:>6} {:>11} {:>9} {:>15}  {}'.format(
+        'parser', 'MB', 'transfer s', 'after s', 'incremental s',
+        'identical'))
+    for result in results:
+        print('{parser:<40} {mb:>6.1f} {transfer:>11.2f} {after:>9.2f} '
+              '{incremental:>15.2f}  {identical!s}'.format(
+                  mb=result['bytes'] / 2 ** 20, **result))
+
+
+def _print_columnar(result):
+    print('{parser}: {routes} routes, {mb:.1f} MB of output'.format(
+        mb=result['bytes'] / 2 ** 20, **result))
+    for kind in ('dict', 'columns'):
+        print('{kind:<8} {mb:>8.1f} MB held {per:>8.1f} B/route '
+              '{seconds:>8.2f} s'.format(
+                  kind=kind, mb=result[kind]['held'] / 2 ** 20,
+                  per=result[kind]['held'] / result['routes'],
+                  seconds=result[kind]['seconds']))
+    print('reduction {:.1f}x'.format(result['reduction']))
+
+
+def _print_interning(results):
+    print('{:<40} {:>8} {:>10} {:>12} {:>8} {:>10}'.format(
+        'parser', 'routes', 'plain MB', 'interned MB', 'saved',
+        'interned s'))
+    for result in results:
+        print('{parser:<40} {routes:>8} {plain:>10.1f} {interned:>12.1f} '
+              '{saved:>7.1%} {seconds:>10.2f}'.format(
+                  parser=result['parser'], routes=result['routes'],
+                  plain=result['plain']['held'] / 2 ** 20,
+                  interned=result['interned']['held'] / 2 ** 20,
+                  saved=result['saved'],
+                  seconds=result['interned']['seconds']))
+
+
+def _print_result_cache(results):
+    print('{:<40} {:>8} {:>10} {:>10} {:>10} {:>9}'.format(
+        'parser', 'KB', 'parse ms', 'memory ms', 'sqlite ms', 'speedup'))
+    for result in results:
+        print('{parser:<40} {kb:>8.1f} {parse:>10.3f} {memory:>10.3f} '
+              '{sqlite:>10.3f} {speedup:>8.0f}x'.format(
+                  parser=result['parser'], kb=result['bytes'] / 2 ** 10,
+                  parse=result['parse'] * 1000,
+                  memory=result['memory'] * 1000,
+                  sqlite=result['sqlite'] * 1000,
+                  speedup=result['parse'] / result['memory']))
+
+
+def _print_fleet(results):
+    print('{:>10} {:>8} {:>10} {:>10} {:>7}'.format(
+        'processes', 'devices', 'seconds', 'devices/s', 'errors'))
+    for result in results:
+        print('{processes:>10} {devices:>8} {seconds:>10.2f} {rate:>10.1f} '
+              '{errors:>7}'.format(**result))
+
+
+def _print_lookup(results):
+    print('{:<40} {:>7} {:>7} {:>10} {:>10}'.format('benchmark', 'count',
+                                                    'errors', 'p50 ms',
+                                                    'p99 ms'))
+    for name, result in results['results'].items():
+        print('{name:<40} {count:>7} {errors:>7} {p50:>10.3f} '
+              '{p99:>10.3f}'.format(name=name, count=result['count'],
+                                    errors=result['errors'],
+                                    p50=result['p50'] * 1000,
+                                    p99=result['p99'] * 1000))
+
+
+def _print_matches_fuzzy(results):
+    print('{:>10} {:>7} {:>12} {:>10}'.format('arguments', 'tokens',
+                                              'subproblems', 'ms'))
+    for result in results['synthetic']:
+        print('{arguments:>10} {tokens:>7} {subproblems:>12} '
+              '{ms:>10.3f}'.format(ms=result['seconds'] * 1000, **result))
+    print()
+    for result in results['worst_cases']:
+        print('{search!r} fuzzy={fuzzy}: {candidates} candidates, '
+              '{subproblems} subproblems, {ms:.3f} ms'.format(
+                  ms=result['seconds'] * 1000, **result))
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(
+        description='Benchmark the parser lookup')
+    benchmarks = args.add_subparsers(dest='benchmark')
+    benchmarks.required = True
+
+    matches_fuzzy = benchmarks.add_parser(
+        'matches-fuzzy', help='compare synthetic and worst case searches')
+    matches_fuzzy.add_argument('--json', action='store_true',
+                               help='print the results as json')
+
+    patterns_parser = benchmarks.add_parser(
+        'patterns', help='time parsing with the patterns compiled on every '
+                         'call and once')
+    patterns_parser.add_argument('--repeat', type=int, default=20,
+                                 help='number of parses of each output')
+    patterns_parser.add_argument('--json', action='store_true',
+                                 help='print the results as json')
+
+    dispatch = benchmarks.add_parser(
+        'dispatch', help='time parsing many interfaces without and with the '
+                         'patterns dispatched on the first token of the lines')
+    dispatch.add_argument('--interfaces', type=int, default=10000,
+                          help='number of interfaces of the outputs')
+    dispatch.add_argument('--repeat', type=int, default=3,
+                          help='number of parses of each output')
+    dispatch.add_argument('--json', action='store_true',
+                          help='print the results as json')
+
+    streaming = benchmarks.add_parser(
+        'streaming', help='measure the peak memory of parsing large outputs '
+                          'from a string and from a file')
+    streaming.add_argument('--size', type=int, default=4,
+                           help='size of the outputs to parse, in MB')
+    streaming.add_argument('--json', action='store_true',
+                           help='print the results as json')
+
+    incremental = benchmarks.add_parser(
+        'incremental', help='time parsing outputs once received and while '
+                            'they are received')
+    incremental.add_argument('--size', type=float, default=2,
+                             help='size of the outputs to parse, in MB')
+    incremental.add_argument('--rate', type=float, default=1,
+                             help='transfer rate of the device, in MB/s')
+    incremental.add_argument('--json', action='store_true',
+                             help='print the results as json')
+
+    columnar = benchmarks.add_parser(
+        'columnar', help='measure the memory held by a routing table parsed '
+                         'into a dict and into columns')
+    columnar.add_argument('--routes', type=int, default=100000,
+                          help='number of routes of the table')
+    columnar.add_argument('--json', action='store_true',
+                          help='print the results as json')
+
+    interning_parser = benchmarks.add_parser(
+        'interning', help='measure the memory held by large tables parsed '
+                          'with the repeated strings shared and not')
+    interning_parser.add_argument('--routes', type=int, default=1000000,
+                                  help='number of routes of the tables')
+    interning_parser.add_argument('--json', action='store_true',
+                                  help='print the results as json')
+
+    result_cache = benchmarks.add_parser(
+        'result-cache', help='time parsing outputs of static commands and '
+                             'taking them from the result caches')
+    result_cache.add_argument('--repeat', type=int, default=50,
+                              help='number of parses of each output')
+    result_cache.add_argument('--json', action='store_true',
+                              help='print the results as json')
+
+    fleet = benchmarks.add_parser(
+        'fleet', help='time collecting and parsing replayed devices with '
+                      'pools of processes of increasing sizes')
+    fleet.add_argument('--devices', type=int, default=1000,
+                       help='number of devices')
+    fleet.add_argument('--delay', type=float, default=0.05,
+                       help='time taken by each command, in seconds')
+    fleet.add_argument('--processes', type=int, action='append',
+                       help='size of a pool, can be repeated, default to 1 '
+                            'to the number of cores')
+    fleet.add_argument('--json', action='store_true',
+                       help='print the results as json')
+
+    lookup = benchmarks.add_parser(
+        'lookup', help='time the lookup of every command of every OS')
+    lookup.add_argument('--os', action='append', dest='os_names',
+                        help='OS to benchmark, can be repeated, default to '
+                             'all of them')
+    lookup.add_argument('--step', type=int, default=1,
+                        help='only benchmark every step-th command')
+    lookup.add_argument('--output', help='json file to save the results to')
+    lookup.add_argument('--baseline',
+                        help='json results to compare with, exit with an '
+                             'error on regression')
+    lookup.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='allowed slowdown from the baseline')
+    lookup.add_argument('--json', action='store_true',
+                        help='print the results as json')
+    args = args.parse_args(argv)
+
+    if args.benchmark == 'matches-fuzzy':
+        results = {'synthetic': bench_synthetic() +
+                                bench_synthetic(fuzzy=True),
+                   'worst_cases': bench_worst_cases()}
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_matches_fuzzy(results)
+        return
+
+    if args.benchmark == 'patterns':
+        results = bench_patterns(repeat=args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_patterns(results)
+        return
+
+    if args.benchmark == 'dispatch':
+        results = bench_dispatch(interfaces=args.interfaces,
+                                 repeat=args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_dispatch(results)
+        return
+
+    if args.benchmark == 'streaming':
+        results = bench_streaming(size=args.size)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_streaming(results)
+        return
+
+    if args.benchmark == 'incremental':
+        results = bench_incremental(size=args.size, rate=args.rate)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_incremental(results)
+        return
+
+    if args.benchmark == 'columnar':
+        result = bench_columnar(routes=args.routes)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            _print_columnar(result)
+        return
+
+    if args.benchmark == 'interning':
+        results = bench_interning(routes=args.routes)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_interning(results)
+        return
+
+    if args.benchmark == 'result-cache':
+        results = bench_result_cache(repeat=args.repeat)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_result_cache(results)
+        return
+
+    if args.benchmark == 'fleet':
+        results = bench_fleet(devices=args.devices, delay=args.delay,
+                              processes=args.processes)
+        if args.json:
+            print(json.dumps(results, indent=2))
+        else:
+            _print_fleet(results)
+        return
+
+    results = bench_lookup(args.os_names, args.step)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        _print_lookup(results)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_baseline(results, baseline, args.tolerance)
+        for name, metric, reference, value in regressions:
+            print('Regression: {n} {m} {v:.3f} ms, baseline {r:.3f} '
+                  'ms'.format(n=name, m=metric, v=value * 1000,
+                              r=reference * 1000), file=sys.stderr)
+        if regressions:
+            return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,346 @@
+'''Bulk parse of captured outputs
+
+Parses archives of captured outputs laid out as `<device>/<os>/<command>.txt`,
+in directories or tarballs, and writes one JSON line per file with the
+parsed output or the error, and the time it took:
+
+    {"file": "archive/R1/iosxe/show version.txt", "device": "R1",
+     "os": "iosxe", "command": "show version", "parsed": {...},
+     "error": null, "seconds": 0.0021}
+
+The name of a file is its command, with underscores read as spaces when it
+has no space, such as `show_ip_route.txt`. The parsers of the commands are
+resolved once per OS through `get_parsers`, and the files are parsed in
+shards by a pool of processes. The files of a directory are read by the
+processes, the members of a tarball are read in order from the archive and
+sent along with their shard.
+
+With --resume, the files already in the output are skipped, so an
+interrupted run carries on where it stopped.
+
+Usage:
+
+    genie-parse-bulk archive/ captures.tar.gz --output parsed.jsonl
+    genie-parse-bulk archive/ --output parsed.jsonl --resume
+    python -m genie.libs.parser.utils.bulk_parse archive/ -o parsed.jsonl
+'''
+
+# python
+import os
+import sys
+import json
+import time
+import tarfile
+import argparse
+import collections
+import concurrent.futures
+
+from .common import get_parsers
+
+# Files of a shard, parsed by one task of the pool
+DEFAULT_CHUNK = 64
+
+Capture = collections.namedtuple('Capture', ['file', 'device', 'os',
+                                             'command', 'path', 'output'])
+
+
+class _OfflineDevice(object):
+    '''Device of the captured outputs, with the attributes the parser lookup
+    looks at'''
+
+    def __init__(self, os, name=None):
+        self.name = name
+        self.os = os
+        self.platform = None
+        self.model = None
+        self.custom = {}
+
+    def execute(self, command):
+        raise Exception("'{c}' is not captured, only the outputs of the "
+                        "files are parsed".format(c=command))
+
+
+def command_of(filename):
+    '''Command of a captured output file name'''
+    command = os.path.splitext(filename)[0]
+    if ' ' not in command:
+        command = command.replace('_', ' ')
+    return ' '.join(command.split())
+
+
+def _capture(file, parts, path=None, output=None):
+    '''Capture of the last three parts of a path, None if it has less'''
+    if len(parts) < 3 or not parts[-1].endswith('.txt'):
+        return None
+    device, os_name, filename = parts[-3:]
+    return Capture(file, device, os_name, command_of(filename), path, output)
+
+
+def iter_captures(path):
+    ''' Yield the captured outputs of a directory or tarball.
+
+        Args:
+            path (`str`): the directory or tarball
+
+        Returns:
+            generator: Capture of each file, with the path of the files of a
+                       directory and the output of the members of a tarball
+    '''
+    if os.path.isdir(path):
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for filename in sorted(files):
+                file = os.path.join(root, filename)
+                capture = _capture(file,
+                                   os.path.relpath(file, path).split(os.sep),
+                                   path=file)
+                if capture:
+                    yield capture
+        return
+
+    # Read as a stream, a compressed archive is not gone through again
+    with tarfile.open(path, 'r|*') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            capture = _capture('{t}:{m}'.format(t=path, m=member.name),
+                               member.name.split('/'))
+            if capture:
+                output = tar.extractfile(member).read()
+                yield capture._replace(
+                    output=output.decode('utf-8', 'replace'))
+
+
+def _error(e):
+    return '{t}: {e}'.format(t=type(e).__name__, e=e)
+
+
+def _line(capture, parsed, error, seconds):
+    ''' JSON line of the result of a capture, and whether it failed'''
+    record = {'file': capture.file, 'device': capture.device,
+              'os': capture.os, 'command': capture.command,
+              'parsed': parsed, 'error': error, 'seconds': seconds}
+    try:
+        line = json.dumps(record, default=str)
+    except (TypeError, ValueError) as e:
+        record.update(parsed=None, error=_error(e))
+        line = json.dumps(record, default=str)
+    return bool(record['error']), line
+
+
+def _parse_shard(shard):
+    ''' Parse the captures of a shard, in a process of the pool.
+
+        Args:
+            shard (`list`): (capture, parser class, kwargs) to parse
+
+        Returns:
+            list: whether it failed and the JSON line, of each capture
+    '''
+    lines = []
+    devices = {}
+
+    for capture, parser_cls, kwargs in shard:
+        start = time.perf_counter()
+        parsed = error = None
+        try:
+            output = capture.output
+            if output is None:
+                with open(capture.path, errors='replace') as f:
+                    output = f.read()
+            device = devices.setdefault(capture.os,
+                                        _OfflineDevice(capture.os))
+            parsed = parser_cls(device=device).parse(output=output, **kwargs)
+        except Exception as e:
+            error = _error(e)
+
+        lines.append(_line(capture, parsed, error,
+                           time.perf_counter() - start))
+
+    return lines
+
+
+def done_files(output):
+    ''' Return the files already in an output, and drop a line left
+        incomplete by an interruption.
+
+        Args:
+            output (`str`): the JSON lines file
+
+        Returns:
+            set: the files of the complete lines
+    '''
+    files = set()
+    if not os.path.exists(output):
+        return files
+
+    with open(output, 'rb+') as f:
+        complete = 0
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                files.add(json.loads(line.decode('utf-8'))['file'])
+            except (ValueError, KeyError, TypeError):
+                break
+            complete += len(line)
+        f.truncate(complete)
+
+    return files
+
+
+class _Resolver(object):
+    '''Parsers of the commands, resolved in batches per OS'''
+
+    def __init__(self):
+        self._parsers = collections.defaultdict(dict)
+
+    def resolve(self, captures):
+        ''' Resolve the parsers of captures.
+
+            Returns:
+                dict: (parser class, kwargs), or the exception, of each
+                      (os, command)
+        '''
+        missing = collections.defaultdict(set)
+        for capture in captures:
+            if capture.command not in self._parsers[capture.os]:
+                missing[capture.os].add(capture.command)
+
+        for os_name, commands in missing.items():
+            parsers, errors = get_parsers(sorted(commands),
+                                          _OfflineDevice(os_name))
+            known = self._parsers[os_name]
+            known.update(errors)
+            for command, parser_cls, kwargs in parsers:
+                known[command] = (parser_cls, kwargs)
+
+        return {(capture.os, capture.command):
+                self._parsers[capture.os][capture.command]
+                for capture in captures}
+
+
+def _shards(captures, size):
+    shard = []
+    for capture in captures:
+        shard.append(capture)
+        if len(shard) >= size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def bulk_parse(paths, output, processes=None, chunk=DEFAULT_CHUNK,
+               resume=False, executor=None):
+    ''' Parse the captured outputs of directories and tarballs into a JSON
+        lines file.
+
+        Args:
+            paths (`list`): the directories and tarballs
+            output (`str`): the JSON lines file
+            processes (`int`): number of processes of the pool, the number of
+                               cores if None
+            chunk (`int`): number of files per shard
+            resume (`bool`): skip the files already in the output, which is
+                             overwritten otherwise
+            executor (`Executor`): pool to parse in, instead of a new pool
+                                   of processes
+
+        Returns:
+            dict: number of files parsed, failed and skipped, and the time
+    '''
+    start = time.perf_counter()
+    done = done_files(output) if resume else set()
+    summary = {'parsed': 0, 'errors': 0, 'skipped': 0}
+    resolver = _Resolver()
+
+    def captures():
+        for path in paths:
+            for capture in iter_captures(path):
+                if capture.file in done:
+                    summary['skipped'] += 1
+                    continue
+                yield capture
+
+    pool = executor or concurrent.futures.ProcessPoolExecutor(
+        max_workers=processes)
+    # Shards in flight, bounding the outputs read ahead of the pool
+    window = 2 * (processes or os.cpu_count() or 1)
+
+    def write(f, lines):
+        for failed, line in lines:
+            summary['errors' if failed else 'parsed'] += 1
+            f.write(line)
+            f.write('\n')
+        f.flush()
+
+    try:
+        with open(output, 'a' if resume else 'w') as f:
+            pending = set()
+            for shard in _shards(captures(), chunk):
+                tasks = []
+                unresolved = []
+                parsers = resolver.resolve(shard)
+                for capture in shard:
+                    parser = parsers[(capture.os, capture.command)]
+                    if isinstance(parser, Exception):
+                        unresolved.append(_line(capture, None,
+                                                _error(parser), 0.0))
+                    else:
+                        tasks.append((capture,) + parser)
+                write(f, unresolved)
+                if tasks:
+                    pending.add(pool.submit(_parse_shard, tasks))
+
+                while len(pending) >= window:
+                    finished, pending = concurrent.futures.wait(
+                        pending,
+                        return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in finished:
+                        write(f, future.result())
+
+            for future in concurrent.futures.as_completed(pending):
+                write(f, future.result())
+    finally:
+        if executor is None:
+            pool.shutdown()
+
+    summary['seconds'] = time.perf_counter() - start
+    return summary
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parse directories and tarballs of captured outputs, '
+                    'laid out as <device>/<os>/<command>.txt, into JSON '
+                    'lines')
+    parser.add_argument('paths', nargs='+',
+                        help='directories and tarballs of captured outputs')
+    parser.add_argument('-o', '--output', required=True,
+                        help='JSON lines file to write the results to')
+    parser.add_argument('--processes', type=int, default=None,
+                        help='number of worker processes, default to the '
+                             'number of CPUs')
+    parser.add_argument('--chunk', type=int, default=DEFAULT_CHUNK,
+                        help='number of files parsed per task')
+    parser.add_argument('--resume', action='store_true',
+                        help='skip the files already in the output')
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not os.path.isdir(path) and not (os.path.isfile(path) and
+                                            tarfile.is_tarfile(path)):
+            print('{p} is not a directory or a tarball'.format(p=path),
+                  file=sys.stderr)
+            return 2
+
+    summary = bulk_parse(args.paths, args.output, processes=args.processes,
+                         chunk=args.chunk, resume=args.resume)
+    print('{parsed} parsed, {errors} errors, {skipped} skipped in '
+          '{seconds:.1f}s'.format(**summary), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+'''Columnar results of the large table parsers
+
+The records yielded by `parse_records` (see records.py) are packed into one
+typed array per field, a few bytes per entry of the table instead of the
+dicts and strings of `parse()`:
+
+    columns = parse_columns(ShowIpRoute(device=device), vrf='VRF1')
+    len(columns)               # number of records
+    columns[0]                 # first record, a RouteRecord
+    columns.values('metric')   # [110, 0, ...]
+
+The fields are stored by kind:
+
+    * prefixes, such as the route of a RouteRecord, as four columns:
+      <field>_high and <field>_low, the high and low 64 bits of the IPv6
+      address, IPv4 addresses being mapped as ::ffff:a.b.c.d,
+      <field>_length, the prefix length, and <field>_family, 4 or 6, which
+      tells an IPv4 prefix from an IPv6 one in the mapped range. A value
+      which is not an IP prefix has the length NOT_PREFIX, the family 0,
+      and its index in `strings` as low.
+    * integers, such as the metric, as signed 64 bits, MISSING when None.
+    * booleans, such as active, as 1, 0 or MISSING.
+    * any other value, as the index of the value in `strings`, the table of
+      the distinct values of all the columns, 0 being None.
+
+The columns are `array.array`s, or numpy arrays viewing the same memory
+with `to_numpy()` when numpy is installed, which filters them at once:
+
+    arrays = columns.to_numpy()
+    ospf = columns.strings.index('ospf')
+    columns.take(numpy.flatnonzero(arrays['source_protocol'] == ospf))
+'''
+
+# python
+import array
+import socket
+
+# metaparser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from .records import RouteRecord, MacRecord, ArpRecord, BgpRecord
+
+# Kinds of the fields
+PREFIX = 'prefix'
+INT = 'int'
+BOOL = 'bool'
+VALUE = 'value'
+
+# Integer or boolean of a record which is None
+MISSING = -1
+
+# Length of a prefix column holding a value which is not an IP prefix
+NOT_PREFIX = 255
+
+# Record type -> kind of its fields which are not values
+KINDS = {
+    RouteRecord: {'route': PREFIX, 'active': BOOL, 'route_preference': INT,
+                  'metric': INT, 'tag': INT, 'index': INT},
+    MacRecord: {'drop': BOOL},
+    ArpRecord: {},
+    BgpRecord: {'prefix': PREFIX, 'index': INT, 'metric': INT,
+                'localprf': INT, 'weight': INT},
+}
+
+# Type code of the arrays of each kind
+_TYPECODES = {INT: 'q', BOOL: 'b', VALUE: 'I'}
+
+_IPV4_MAPPED = 0xffff << 32
+_LOW_BITS = (1 << 64) - 1
+
+
+class Columns(object):
+    '''Records of one type, stored as one array per field'''
+
+    def __init__(self, record_type, records=()):
+        ''' Args:
+                record_type (`type`): the type of the records, such as
+                                      RouteRecord
+                records (`iterable`): records to append
+        '''
+        self.record_type = record_type
+        self.kinds = [KINDS.get(record_type, {}).get(field, VALUE)
+                      for field in record_type._fields]
+        # Name -> array
+        self.columns = {}
+        for field, kind in zip(record_type._fields, self.kinds):
+            if kind == PREFIX:
+                self.columns[field + '_high'] = array.array('Q')
+                self.columns[field + '_low'] = array.array('Q')
+                self.columns[field + '_length'] = array.array('B')
+                self.columns[field + '_family'] = array.array('B')
+            else:
+                self.columns[field] = array.array(_TYPECODES[kind])
+        self.strings = [None]
+        # Value -> index in strings
+        self._index = {}
+        self.extend(records)
+
+    def __len__(self):
+        # Every column has a value per record
+        return len(next(iter(self.columns.values())))
+
+    def _intern(self, value):
+        if value is None:
+            return 0
+        # Values equal across types, such as 1 and '1', stay apart
+        key = value if type(value) is str else (type(value), value)
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def _pack_prefix(self, value):
+        address, slash, length = value.partition('/')
+        try:
+            if ':' in address:
+                packed = socket.inet_pton(socket.AF_INET6, address)
+                # Kept as text unless written the way it is read back
+                if socket.inet_ntop(socket.AF_INET6, packed) != address:
+                    raise ValueError(address)
+                number = int.from_bytes(packed, 'big')
+                family, limit = 6, 128
+            else:
+                number = _IPV4_MAPPED | int.from_bytes(
+                    socket.inet_pton(socket.AF_INET, address), 'big')
+                family, limit = 4, 32
+            if not slash or not length.isdigit() or int(length) > limit \
+                    or str(int(length)) != length:
+                raise ValueError(value)
+        except (OSError, ValueError):
+            return 0, self._intern(value), NOT_PREFIX, 0
+        return number >> 64, number & _LOW_BITS, int(length), family
+
+    def _unpack_prefix(self, high, low, length, family):
+        if length == NOT_PREFIX:
+            return self.strings[low]
+        if family == 4:
+            address = socket.inet_ntop(socket.AF_INET,
+                                       (low & 0xffffffff).to_bytes(4, 'big'))
+        else:
+            address = socket.inet_ntop(
+                socket.AF_INET6, ((high << 64) | low).to_bytes(16, 'big'))
+        return '{}/{}'.format(address, length)
+
+    def append(self, record):
+        ''' Add a record, of the record type of the columns'''
+        columns = self.columns
+        for field, kind, value in zip(record._fields, self.kinds, record):
+            if kind == VALUE:
+                columns[field].append(self._intern(value))
+            elif kind == PREFIX:
+                high, low, length, family = self._pack_prefix(value)
+                columns[field + '_high'].append(high)
+                columns[field + '_low'].append(low)
+                columns[field + '_length'].append(length)
+                columns[field + '_family'].append(family)
+            elif value is None:
+                columns[field].append(MISSING)
+            else:
+                columns[field].append(int(value))
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def value(self, field, index):
+        ''' Value of a field of a record, as it is in the record'''
+        kind = self.kinds[self.record_type._fields.index(field)]
+        if kind == PREFIX:
+            return self._unpack_prefix(self.columns[field + '_high'][index],
+                                       self.columns[field + '_low'][index],
+                                       self.columns[field + '_length'][index],
+                                       self.columns[field + '_family'][index])
+        value = self.columns[field][index]
+        if kind == VALUE:
+            return self.strings[value]
+        if value == MISSING:
+            return None
+        return bool(value) if kind == BOOL else value
+
+    def values(self, field):
+        ''' Values of a field of all the records'''
+        return [self.value(field, index) for index in range(len(self))]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('record index out of range')
+        return self.record_type(*[self.value(field, index)
+                                  for field in self.record_type._fields])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def take(self, indices):
+        ''' Columns of the records at the given indices, such as the indices
+            selected by a numpy filter
+
+            Args:
+                indices (`iterable`): indices of the records, in order
+
+            Returns:
+                Columns: new columns, with a copy of the strings of these
+                         ones
+        '''
+        taken = Columns(self.record_type)
+        # Copied, values appended to the new columns stay out of these ones
+        taken.strings = list(self.strings)
+        taken._index = dict(self._index)
+        indices = list(indices)
+        for name, column in self.columns.items():
+            taken.columns[name] = array.array(column.typecode,
+                                              [column[i] for i in indices])
+        return taken
+
+    def nbytes(self):
+        ''' Size of the arrays, the distinct values of the strings table
+            not included'''
+        return sum(column.itemsize * len(column)
+                   for column in self.columns.values())
+
+    def to_numpy(self):
+        ''' Numpy arrays viewing the columns, without copying them
+
+            Returns:
+                dict: column name -> numpy array
+
+            Raises:
+                ImportError: numpy is not installed
+        '''
+        import numpy
+        return {name: numpy.frombuffer(column, dtype=column.typecode)
+                for name, column in self.columns.items()}
+
+
+def parse_columns(parser, **kwargs):
+    ''' Parse into columns the records of a parser having `parse_records`
+
+        Args:
+            parser (`MetaParser`): the parser, such as
+                                   ShowIpRoute(device=device)
+            kwargs (`dict`): arguments of parse_records, such as vrf or
+                             output
+
+        Returns:
+            Columns: the records
+
+        Raises:
+            SchemaEmptyParserError: the output has no records
+    '''
+    columns = None
+    for record in parser.parse_records(**kwargs):
+        if columns is None:
+            columns = Columns(type(record))
+        columns.append(record)
+    if columns is None:
+        raise SchemaEmptyParserError({})
+    return columns
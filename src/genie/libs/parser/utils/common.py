@@ -9,38 +9,437 @@ import warnings
 import logging
 import importlib
 import math
+import bisect
+import threading
+import collections
 
 from genie.libs import parser
 from genie.abstract import Lookup
 
+from .index import (PARSER_JSON, ROUTING_JSON, METADATA_JSON, SHARD_DIR,
+                    SHARD_INDEX, ParserData, load_parser_shards)
+
 log = logging.getLogger(__name__)
 
-def _load_parser_json():
-    '''get all parser data in json file'''
+def _parser_json_file(name):
+    '''get the path of a json file within genie.libs.parser'''
     try:
         mod = importlib.import_module('genie.libs.parser')
-        parsers = os.path.join(mod.__path__[0], 'parsers.json')
+        return os.path.join(mod.__path__[0], name)
     except Exception:
-        parsers = ''
-    if not os.path.isfile(parsers):
+        return ''
+
+def _load_parser_json():
+    '''get all parser data in json file, per OS shards or the routing index
+       if the package has them'''
+    shards = _parser_json_file(SHARD_DIR)
+    if os.path.isfile(os.path.join(shards, SHARD_INDEX)):
+        # Shards are loaded when an OS is first looked up
+        return load_parser_shards(shards)
+
+    for name in (ROUTING_JSON, PARSER_JSON):
+        parsers = _parser_json_file(name)
+        if os.path.isfile(parsers):
+            break
+    else:
         log.warning('parsers.json does not exist, make sure you '
                     'are running with latest version of '
                     'genie.libs.parsers')
-        parser_data = {}
-    else:
-        # Open all the parsers in json file
-        with open(parsers) as f:
-            parser_data = json.load(f)
+        return ParserData()
+
+    # Open all the parsers in json file
+    with open(parsers) as f:
+        parser_data = ParserData(json.load(f))
     return parser_data
 
 # Parser within Genie
 parser_data = _load_parser_json()
 
+# Doc, schema and url of the parsers, only loaded when asked for
+_parser_metadata = None
+
+def get_parser_metadata(command=None, os_name=None):
+    ''' Return the doc, schema and url of the parsers.
+
+        The metadata file is only read on the first call.
+
+        Args:
+            command (`str`): the command to get the metadata of, all
+                             the commands if None
+            os_name (`str`): the os to get the metadata of, all the os if
+                             None
+
+        Returns:
+            dict: the metadata, keyed the same way as the parser data
+    '''
+    global _parser_metadata
+
+    if _parser_metadata is None:
+        _parser_metadata = {}
+        # Complete parser json file holds the metadata as well
+        for name in (METADATA_JSON, PARSER_JSON):
+            metadata = _parser_json_file(name)
+            if os.path.isfile(metadata):
+                with open(metadata) as f:
+                    _parser_metadata = json.load(f)
+                break
+
+    if command is None:
+        return _parser_metadata
+
+    metadata = _parser_metadata.get(command, {})
+    if os_name is None:
+        return metadata
+
+    return metadata.get(os_name, {})
+
+
+# Arguments which can only be made of one search token, others can be made
+# of up to two
+SINGLE_TOKEN_ARGUMENTS = ('vrf', 'rd', 'instance', 'vrf_type', 'feature',
+                          'fileA', 'fileB')
+
+
+class _TrieNode(object):
+    '''One command token position in the CommandTrie'''
+
+    __slots__ = ('keywords', 'children', 'arguments', 'commands')
+
+    def __init__(self):
+        # sorted literal command tokens, used to find prefix matches
+        self.keywords = []
+        # command token -> child node, for literal tokens
+        self.children = {}
+        # command token -> child node, for tokens holding an {argument}
+        self.arguments = {}
+        # (order, command) of every command which ends on this node
+        self.commands = []
+
+
+class CommandTrie(object):
+    '''Token trie over the commands of the parser data
+
+    Every command is split in tokens, literal tokens become regular edges and
+    tokens holding an `{argument}` become wildcard edges. A search only walks
+    the branches its tokens can match and returns the candidate commands,
+    which still have to go through `_matches_fuzzy` for kwargs and score.
+    The candidates are always a superset of the commands `_matches_fuzzy`
+    would accept.
+
+    Without fuzzy, `match` walks the trie as a token automaton matching all
+    the commands at once, and returns the kwargs and score of each command
+    the same way `_matches_fuzzy` would.
+
+    The trie is built on first use and built again whenever the commands of
+    the parser data change afterwards (for example through `add_parser`),
+    as told by its version.
+    '''
+
+    def __init__(self, data):
+        self.data = data
+        self.root = None
+        # Version of the data the trie was built from
+        self.version = None
+        # command token -> how it matches a search token, for arguments
+        self._arguments = {}
+        # command -> number of arguments
+        self._required = {}
+
+    def _insert(self, command, order):
+        node = self.root
+        for token in command.split():
+            if '{' in token:
+                edges = node.arguments
+            else:
+                edges = node.children
+            child = edges.get(token)
+            if child is None:
+                child = edges[token] = _TrieNode()
+                if edges is node.children:
+                    bisect.insort(node.keywords, token)
+            node = child
+        node.commands.append((order, command))
+
+    def _sync(self):
+        '''Build the trie, again if the commands changed since'''
+        # Commands replaced by others keep the same length, only the
+        # version of ParserData tells, plain containers go by their length
+        version = getattr(self.data, 'version', len(self.data))
+        if self.root is not None and version == self.version:
+            return
+
+        self.root = _TrieNode()
+        for order, command in enumerate(self.data):
+            self._insert(command, order)
+        self.version = version
+
+    def _collect(self, node, found):
+        '''Add every command of the node subtree into found'''
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            found.update(node.commands)
+            stack.extend(node.children.values())
+            stack.extend(node.arguments.values())
+
+    def search(self, tokens, fuzzy=False):
+        ''' Find the commands which can match the search tokens.
+
+            Args:
+                tokens (`list`): the search tokens
+                fuzzy (`bool`): whether or not fuzzy mode is used
+
+            Returns:
+                list: the candidate commands, in parser data order
+        '''
+        self._sync()
+
+        found = set()
+        seen = set()
+        stack = [(self.root, 0)]
+
+        while stack:
+            node, i = stack.pop()
+            if (id(node), i) in seen:
+                continue
+            seen.add((id(node), i))
+
+            if i == len(tokens):
+                found.update(node.commands)
+                continue
+
+            token = tokens[i]
+
+            if fuzzy:
+                if token != '*' and not _is_regular_token(token):
+                    # Regex token may span any number of command tokens
+                    self._collect(node, found)
+                    continue
+                token = token.replace(r'\|', '|')
+
+            # Literal tokens, search token can be a prefix of them
+            keywords = node.keywords
+            index = bisect.bisect_left(keywords, token)
+            while index < len(keywords) and \
+                                        keywords[index].startswith(token):
+                stack.append((node.children[keywords[index]], i + 1))
+                index += 1
+
+            # Arguments can be made of one or two search tokens, unless
+            # the argument is within the command token
+            for command_token, child in node.arguments.items():
+                stack.append((child, i + 1))
+                if command_token.startswith('{') and i + 2 <= len(tokens):
+                    stack.append((child, i + 2))
+
+        return [command for _, command in sorted(found)]
+
+    def _argument(self, command_token):
+        '''Return (name, start, end, pattern) of an argument token, start,
+           end and pattern are None when the whole token is the argument'''
+        argument = self._arguments.get(command_token)
+        if argument is None:
+            name = re.search('{(.*)}', command_token).groups()[0]
+            if command_token.startswith('{'):
+                argument = (name, None, None, None)
+            else:
+                start, end = re.match('(.*){.*?}(.*)', command_token).groups()
+                argument = (name, start, end, re.compile('{}(.*){}'.format(
+                                            re.escape(start), re.escape(end))))
+            self._arguments[command_token] = argument
+        return argument
+
+    def _is_complete(self, command, kwargs, standalone):
+        '''Whether the collected kwargs hold every argument of the command'''
+        if not standalone:
+            return True
+        required = self._required.get(command)
+        if required is None:
+            required = self._required[command] = \
+                                            len(re.findall('{.*?}', command))
+        return len(kwargs) == required
+
+    def match(self, tokens):
+        ''' Match the search tokens against all the commands at once, without
+            fuzzy.
+
+            Args:
+                tokens (`list`): the search tokens
+
+            Returns:
+                list: (command, kwargs, score) of the matching commands, in
+                      parser data order
+        '''
+        self._sync()
+
+        matches = {}
+        self._match(self.root, tokens, 0, {}, 0, False, matches)
+
+        return [(command, kwargs, score)
+                for (_, command), (kwargs, score) in sorted(matches.items())]
+
+    def _match(self, node, tokens, i, kwargs, score, standalone, matches):
+        if i == len(tokens):
+            for entry in node.commands:
+                # First path reaching a command is the one _matches_fuzzy
+                # returns, it tries shorter arguments first
+                if entry not in matches and \
+                        self._is_complete(entry[1], kwargs, standalone):
+                    matches[entry] = (kwargs, score)
+            return
+
+        token = tokens[i]
+
+        # Literal tokens, search token can be a prefix of them
+        keywords = node.keywords
+        index = bisect.bisect_left(keywords, token)
+        while index < len(keywords) and keywords[index].startswith(token):
+            keyword = keywords[index]
+            self._match(node.children[keyword], tokens, i + 1, kwargs,
+                        score + (102 if keyword == token else 100),
+                        standalone, matches)
+            index += 1
+
+        for command_token, child in node.arguments.items():
+            name, start, end, pattern = self._argument(command_token)
+
+            if start is None:
+                # Argument is made of one or two search tokens
+                span = 1 if name in SINGLE_TOKEN_ARGUMENTS else 2
+                for end_index in range(i + 1, min(i + span, len(tokens)) + 1):
+                    child_kwargs = kwargs.copy()
+                    child_kwargs.setdefault(name, ' '.join(
+                        tokens[i:end_index]).rstrip('"').replace('\\', ''))
+                    self._match(child, tokens, end_index, child_kwargs,
+                                score + 100, True, matches)
+            elif token.startswith(start) and token.endswith(end):
+                # Argument is within the command token
+                found = pattern.match(token)
+                if found:
+                    child_kwargs = kwargs.copy()
+                    child_kwargs[name] = found.groups()[0]
+                    self._match(child, tokens, i + 1, child_kwargs,
+                                score + 103, standalone, matches)
+
+
+# Token index over parser_data, used to narrow down the command search
+command_index = CommandTrie(parser_data)
+
+# os -> (parser data version, CommandTrie over the commands of that os)
+_os_command_index = {}
+
+def _get_command_index(os=None):
+    '''Return the CommandTrie over the commands of an os, built once per
+       parser data version'''
+    if os is None:
+        return command_index
+
+    version, index = _os_command_index.get(os, (None, None))
+    if version != parser_data.version:
+        version = parser_data.version
+        index = CommandTrie([command for command in parser_data
+                                    if parser_data.supports(command, os)])
+        _os_command_index[os] = (version, index)
+
+    return index
+
+# Device attributes which can be used as abstraction tokens
+DEFAULT_TOKEN_ATTRIBUTES = ('os', 'platform', 'model')
+
+ParserCacheInfo = collections.namedtuple('ParserCacheInfo',
+                        ['hits', 'misses', 'maxsize', 'currsize', 'version'])
+
+
+class ParserCache(object):
+    '''Bounded LRU cache of get_parser results
+
+    Entries are keyed on the command, the device abstraction tokens and the
+    fuzzy flag. Also used for the parser classes, keyed on their package,
+    module, class and the device abstraction tokens.
+
+    The cache is tied to a registry version which is bumped by `invalidate`
+    whenever the parser data changes (see `add_parser`), so a stale result
+    is never returned.
+    '''
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.version = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        '''Return the cached result of key, None if there is none'''
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key, result):
+        '''Cache the result of key, evicting the least recently used'''
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        '''Drop all the entries and move to a new registry version'''
+        with self._lock:
+            self._entries.clear()
+            self.version += 1
+
+    def clear(self):
+        '''Drop all the entries and reset the statistics'''
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        '''Return the cache statistics'''
+        with self._lock:
+            return ParserCacheInfo(self.hits, self.misses, self.maxsize,
+                                   len(self._entries), self.version)
+
+
+# Results of get_parser
+get_parser_cache = ParserCache()
+
+# Parser classes resolved through the abstraction
+parser_class_cache = ParserCache()
+
+# Imported on first use, entry_points imports this module
+_entry_points = None
+
+def _ensure_entry_points():
+    '''Discover the third party parsers, if not done yet'''
+    global _entry_points
+    if _entry_points is None:
+        from . import entry_points as _entry_points
+    return _entry_points.ensure_entry_points()
+
 def get_parser_commands(device, data=parser_data):
     '''Remove all commands which contain { as this requires
        extra kwargs which cannot be guessed dynamically
        Remove the ones that arent related to this os'''
 
+    # All the commands are needed, including the third party ones
+    _ensure_entry_points()
+
+    if isinstance(data, ParserData):
+        # Only needs the shard index, not the shard itself
+        return [command for command in data.commands(device.os)
+                                                        if '{' not in command]
+
     commands = []
     for command, values in data.items():
         if '{' in command or command == 'tokens' or device.os not in values:
@@ -69,15 +468,102 @@ def get_parser_exclude(command, device):
     except AttributeError:
         return []
 
+def _device_tokens(device):
+    '''Return the abstraction order and token values of a device, as a
+       hashable key'''
+
+    try:
+        order_list = device.custom.get('abstraction').get('order', [])
+    except AttributeError:
+        order_list = None
+
+    attributes = list(order_list or [])
+    attributes.extend(attr for attr in DEFAULT_TOKEN_ATTRIBUTES
+                                                    if attr not in attributes)
+
+    return (tuple(order_list or ()),
+            tuple(str(getattr(device, attr, None)) for attr in attributes))
+
 def get_parser(command, device, fuzzy=False):
     '''From a show command and device, return parser class and kwargs if any'''
 
+    result = _cached_get_parser(command, device, fuzzy)
+
+    # Never hand out the cached kwargs
+    if not fuzzy:
+        return result[0], dict(result[1])
+
+    return [(found_command, cls, dict(kwargs))
+                                    for found_command, cls, kwargs in result]
+
+def get_parsers(commands, device):
+    ''' Resolve the parsers of several show commands for a device at once.
+
+        The device abstraction tokens and lookup are computed once and shared
+        by all the commands, and a command failing to resolve does not stop
+        the others.
+
+        Args:
+            commands (`list`): the show commands
+            device (`Device`): the device instance
+
+        Returns:
+            tuple: list of (command, parser class, kwargs) for the commands
+                   which resolved, in the commands order, and dict of
+                   command to the exception raised for the others
+    '''
+    tokens = _device_tokens(device)
+    lookup = Lookup.from_device(device, packages={'parser': parser})
+    parsers = []
+    errors = {}
+
+    for command in commands:
+        if command in errors:
+            continue
+
+        try:
+            result = _cached_get_parser(command, device, lookup=lookup,
+                                        tokens=tokens)
+        except Exception as e:
+            errors[command] = e
+            continue
+
+        parsers.append((command, result[0], dict(result[1])))
+
+    return parsers, errors
+
+def _cached_get_parser(command, device, fuzzy=False, lookup=None,
+                                                                tokens=None):
+    '''Resolve the parser of a command for a device, through the cache'''
+
+    # Commands only differing in whitespaces resolve the same way
+    command = ' '.join(command.split())
+    if tokens is None:
+        tokens = _device_tokens(device)
+    key = (command, tokens, fuzzy)
+
+    # Third party parsers may override the commands of this package, they
+    # are discovered before the first lookup
+    _ensure_entry_points()
+
+    result = get_parser_cache.get(key)
+    if result is None:
+        result = _get_parser(command, device, fuzzy, lookup, tokens=tokens)
+        get_parser_cache.put(key, result)
+
+    return result
+
+def _get_parser(command, device, fuzzy=False, lookup=None, tokens=None):
+    '''Resolve the parser of a command for a device, without caching the
+       result'''
+
     try:
         order_list = device.custom.get('abstraction').get('order', [])
     except AttributeError:
         order_list = None
 
-    lookup = Lookup.from_device(device, packages={'parser': parser})
+    if lookup is None:
+        lookup = Lookup.from_device(device, packages={'parser': parser})
     results = _fuzzy_search_command(command, fuzzy, device.os, order_list)
     valid_results = []
     
@@ -94,12 +580,17 @@ def get_parser(command, device, fuzzy=False):
 
         try:
             valid_results.append((found_command, 
-                                        _find_parser_cls(device, data), kwargs))
+                                _find_parser_cls(device, data, tokens), kwargs))
         except KeyError:
             # Case when the show command is only found under one of
             # the child level tokens
             continue
 
+        # Without fuzzy only the first parser found is returned, no need
+        # to resolve the others
+        if not fuzzy:
+            break
+
     if not valid_results:
         raise Exception("Could not find parser for "
                         "'{c}' under {l}".format(c=command, l=lookup._tokens))
@@ -126,7 +617,7 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
 
     # Perfect match should return 
     if search in parser_data:
-        return [(search, parser_data[search], {})]
+        return [(search, parser_data.entry(search, os), {})]
 
     # Preprocess if fuzzy
     if fuzzy:
@@ -141,10 +632,20 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
     best_score = -math.inf
     result = []
 
-    for command, source in parser_data.items():
+    if fuzzy:
+        # Only the commands the token trie can reach need a full comparison
         # Tokens and kwargs parameter must be non reference
-        match_result = _matches_fuzzy(0, 0, tokens.copy(),
-                                                        command, {}, fuzzy)
+        matches = ((command, _matches_fuzzy(0, 0, tokens.copy(),
+                                                        command, {}, fuzzy))
+                   for command in _get_command_index(os).search(tokens, fuzzy))
+    else:
+        # The commands of the os are all matched in one walk of their trie
+        matches = ((command, (kwargs, score)) for command, kwargs, score
+                                        in _get_command_index(os).match(tokens))
+
+    for command, match_result in matches:
+        # Only the shard of the os is needed
+        source = parser_data.entry(command, os)
 
         if match_result: 
             kwargs, score = match_result
@@ -153,9 +654,6 @@ def _fuzzy_search_command(search, fuzzy, os=None, order_list=None,
                                 getattr(device, order_list[0]) not in source:
                 continue
 
-            if os and os not in source:
-                continue
-
             entry = (command, source, kwargs)
 
             if score > best_score:
@@ -222,7 +720,7 @@ def _is_regular_token(token):
     return token_is_regular
 
 def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy, 
-                                            required_arguments=None, score=0):
+                            required_arguments=None, score=0, memo=None):
     """ Compares between given tokens and command to see if they match.
 
         Args: 
@@ -234,17 +732,54 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
             fuzzy (`bool`): whether or not fuzzy should be used
             required_arguments (`int`): number of arguments command has
             score (`int`): the current similarity score between token and command
+            memo (`dict`): results of the subproblems already compared for
+                           this search and command
 
             Returns:
                 bool: whether or not search matches the command
 
     """
-    command_tokens = command.split()
-
     # Initialize by counting how many arguments this command needs
     if required_arguments is None:
         required_arguments = len(re.findall('{.*?}', command))
 
+    if memo is None:
+        memo = {}
+
+    # The outcome of a subproblem only depends on the tokens, the position in
+    # both and which arguments are already collected, so the different ways
+    # of spanning the arguments which lead to the same subproblem only
+    # compare it once. Scores are added up, only the difference is kept.
+    key = (i, j, tuple(tokens), frozenset(kwargs))
+
+    if key not in memo:
+        result = _match_tokens(i, j, tokens, command, kwargs.copy(), fuzzy,
+                                                    required_arguments, memo)
+        if result:
+            result_kwargs, result_score = result
+            result = ({name: value for name, value in result_kwargs.items()
+                                if name not in kwargs or kwargs[name] != value},
+                      result_score)
+        memo[key] = result
+
+    result = memo[key]
+    if not result:
+        return None
+
+    collected, added_score = result
+    result_kwargs = kwargs.copy()
+    result_kwargs.update(collected)
+
+    return result_kwargs, score + added_score
+
+
+def _match_tokens(i, j, tokens, command, kwargs, fuzzy, required_arguments,
+                                                            memo, score=0):
+    """ Compares the tokens from i with the command tokens from j, see
+        `_matches_fuzzy`. Modifies tokens and kwargs.
+    """
+    command_tokens = command.split()
+
     while i < len(tokens):
         # If command token index is greater than its length, stop
         if j >= len(command_tokens):
@@ -309,14 +844,7 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                     # If argument is any of these, argument can only be 1 token
                     # Else argument can be up to 2 tokens
                     endpoint = i + 1 \
-                        if argument_key == 'vrf' \
-                            or argument_key == 'rd' \
-                            or argument_key == 'instance' \
-                            or argument_key == 'vrf_type' \
-                            or argument_key == 'feature' \
-                            or argument_key == 'fileA' \
-                            or argument_key == 'fileB' \
-                        else i + 2
+                        if argument_key in SINGLE_TOKEN_ARGUMENTS else i + 2
 
                     # Try out ways we can assign search tokens into argument
                     for index in range(i, endpoint):
@@ -340,7 +868,8 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                         kwargs_copy.setdefault(argument_key, argument_value)
                         
                         result = _matches_fuzzy(i, j, tokens_copy, command,
-                                kwargs_copy, fuzzy, required_arguments, score)
+                                kwargs_copy, fuzzy, required_arguments, score,
+                                memo)
                             
                         if result:
                             result_kwargs, score = result
@@ -433,7 +962,7 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
                         # Make sure items are passed by copies, not by reference
                         submatch_result = _matches_fuzzy(i, subindex, 
                             tokens.copy(), command, kwargs.copy(),
-                                            fuzzy, required_arguments, score)
+                                        fuzzy, required_arguments, score, memo)
                         
                         # If any match is found, return true
                         if submatch_result:
@@ -459,10 +988,23 @@ def _matches_fuzzy(i, j, tokens, command, kwargs, fuzzy,
         return None
 
 
-def _find_parser_cls(device, data):
-    lookup = Lookup.from_device(device, packages={'parser':importlib.import_module(data['package'])})
+def _find_parser_cls(device, data, tokens=None):
+    '''Return the parser class of a command entry for a device, resolved once
+       per device abstraction tokens'''
 
-    return getattr(getattr(lookup.parser, data['module_name']), data['class'])
+    if tokens is None:
+        tokens = _device_tokens(device)
+    key = (data['package'], data['module_name'], data['class'], tokens)
+
+    cls = parser_class_cache.get(key)
+    if cls is None:
+        package = importlib.import_module(data['package'])
+        lookup = Lookup.from_device(device, packages={'parser': package})
+        cls = getattr(getattr(lookup.parser, data['module_name']),
+                      data['class'])
+        parser_class_cache.put(key, cls)
+
+    return cls
 
 
 class Common():
@@ -784,3 +1326,44 @@ class Common():
                                         final_seconds)
 
         return normal_time
+
+
+    @classmethod
+    def iter_lines(self, output):
+        '''yield the lines of an output, one at a time
+
+            Args:
+                output (`str`, `file` or iterable): the output, as a string,
+                    a file object or any iterable of lines (or of bytes)
+
+            Returns:
+                Generator of the lines, without their line break, as
+                str.splitlines() would return them
+
+            Raises:
+                None
+
+            example:
+
+                >>> with open('show_ip_route.txt') as f:
+                >>>     parsed = ShowIpRoute(device=device).parse(output=f)
+        '''
+        if isinstance(output, str):
+            # Line by line rather than a list of all of them
+            start = 0
+            end = output.find('\n')
+            while end != -1:
+                for line in output[start:end].splitlines() or ['']:
+                    yield line
+                start = end + 1
+                end = output.find('\n', start)
+            if start < len(output):
+                for line in output[start:].splitlines():
+                    yield line
+            return
+
+        for chunk in output:
+            if isinstance(chunk, bytes):
+                chunk = chunk.decode('utf-8', 'replace')
+            for line in chunk.splitlines() or ['']:
+                yield line
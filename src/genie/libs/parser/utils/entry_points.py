@@ -31,18 +31,48 @@ example 'nxos', and the value is a list of MetaParser class definitions.
             ]
         }
 
+Discovery of the entry points is deferred: it happens on the first
+`get_parser` lookup, on the first `get_parser_commands` call, or on an
+explicit `load_entry_points()` call. The entry points found are cached on
+disk (see `ENTRY_POINT_CACHE`) along with a fingerprint of `sys.path`, so the
+next processes don't scan the installed distributions again until a package
+is installed or removed.
+
 """
 
+import os
+import re
 import sys
-import pkg_resources
+import json
 import logging
+import importlib
+import threading
+
+try:
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    # python < 3.8
+    try:
+        import importlib_metadata
+    except ImportError:
+        importlib_metadata = None
 
-from .common import parser_data
+from .common import parser_data, get_parser_cache
 
 log = logging.getLogger(__name__)
 
 ENTRY_POINT_NAME = 'genie.libs.parser'
 
+# On-disk cache of the discovered entry points, set to None to disable
+ENTRY_POINT_CACHE = os.environ.get(
+    'GENIE_PARSER_ENTRY_POINT_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'genie',
+                 'parser_entry_points.json'))
+
+# Whether the entry points were loaded in this process
+_loaded = False
+_lock = threading.RLock()
+
 
 def add_parser(parser, os_name):
     """
@@ -70,28 +100,154 @@ def add_parser(parser, os_name):
         cli_commands = [cli_commands]
 
     for cmd in cli_commands:
-        if cmd not in parser_data:
-            parser_data[cmd] = {}
-
-        parser_data[cmd][os_name] = {
+        parser_data.register(cmd, os_name, {
             'module_name': mod.__name__.rsplit('.', 1)[-1],
             'package': package,
             'class': parser.__name__
-        }
+        })
 
+    # Results cached before this parser was added might be stale
+    get_parser_cache.invalidate()
 
-def load_entry_points():
-    for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME):
-        loader_function = ep.load()
-        if not callable(loader_function):
-            log.warning('unable to load parsers from entry point '
-                        '{name} as it is not callable.'.format(name=ep.name))
+
+def _sys_path_fingerprint():
+    """
+    Fingerprint of the installed distributions: the modification time of
+    every directory in `sys.path` changes when a package is installed into
+    or removed from it.
+    """
+    fingerprint = []
+    for path in sys.path:
+        try:
+            fingerprint.append([path, os.stat(path or '.').st_mtime])
+        except OSError:
             continue
+    return fingerprint
+
+
+def _scan_entry_points():
+    """
+    Scan the installed distributions for the parser entry points
 
-        parser_dict = loader_function()
-        for os_name, parser_list in parser_dict.items():
-            for parser in parser_list:
-                add_parser(parser=parser, os_name=os_name)
+    Returns
+    -------
+    list
+        (name, value) of each entry point
+    """
+    if importlib_metadata is None:
+        import pkg_resources
+        return [(ep.name, str(ep).split('=', 1)[1].strip())
+                for ep in pkg_resources.iter_entry_points(ENTRY_POINT_NAME)]
+
+    entry_points = importlib_metadata.entry_points()
+    if hasattr(entry_points, 'select'):
+        entry_points = entry_points.select(group=ENTRY_POINT_NAME)
+    else:
+        entry_points = entry_points.get(ENTRY_POINT_NAME, [])
+
+    return [(ep.name, ep.value) for ep in entry_points]
+
+
+def discover_entry_points(refresh=False):
+    """
+    Return the parser entry points of the installed distributions, from the
+    on-disk cache when `sys.path` did not change since it was written.
+
+    Parameters
+    ----------
+    refresh : bool
+        Ignore the on-disk cache and scan the distributions again
+
+    Returns
+    -------
+    list
+        (name, value) of each entry point
+    """
+    fingerprint = _sys_path_fingerprint()
 
+    if ENTRY_POINT_CACHE and not refresh:
+        try:
+            with open(ENTRY_POINT_CACHE) as f:
+                cache = json.load(f)
+            if cache['fingerprint'] == fingerprint:
+                return [tuple(ep) for ep in cache['entry_points']]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
 
-load_entry_points()
+    entry_points = _scan_entry_points()
+
+    if ENTRY_POINT_CACHE:
+        try:
+            os.makedirs(os.path.dirname(ENTRY_POINT_CACHE), exist_ok=True)
+            with open(ENTRY_POINT_CACHE, 'w') as f:
+                json.dump({'fingerprint': fingerprint,
+                           'entry_points': entry_points}, f)
+        except OSError as e:
+            log.debug('unable to write the entry point cache {f}: '
+                      '{e}'.format(f=ENTRY_POINT_CACHE, e=e))
+
+    return entry_points
+
+
+def _load_entry_point(value):
+    """
+    Import the object an entry point value ("module:attr [extras]") points to
+    """
+    value = re.sub(r'\[.*\]', '', value).strip()
+    module, _, attrs = value.partition(':')
+    obj = importlib.import_module(module.strip())
+    for attr in filter(None, attrs.strip().split('.')):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def load_entry_points(refresh=False):
+    """
+    Add the parsers of every entry point into the genie parser framework
+
+    Parameters
+    ----------
+    refresh : bool
+        Ignore the on-disk cache and scan the distributions again
+    """
+    global _loaded
+
+    with _lock:
+        _loaded = True
+
+        for name, value in discover_entry_points(refresh=refresh):
+            try:
+                loader_function = _load_entry_point(value)
+            except Exception as e:
+                log.warning('unable to load parsers from entry point '
+                            '{name}: {e}'.format(name=name, e=e))
+                continue
+
+            if not callable(loader_function):
+                log.warning('unable to load parsers from entry point '
+                            '{name} as it is not callable.'.format(name=name))
+                continue
+
+            parser_dict = loader_function()
+            for os_name, parser_list in parser_dict.items():
+                for parser in parser_list:
+                    add_parser(parser=parser, os_name=os_name)
+
+
+def ensure_entry_points():
+    """
+    Load the entry points if they were not loaded yet in this process
+
+    Returns
+    -------
+    bool
+        True if the entry points were loaded by this call
+    """
+    if _loaded:
+        return False
+
+    with _lock:
+        if _loaded:
+            return False
+        load_entry_points()
+        return True
@@ -0,0 +1,255 @@
+'''Collection and parsing of the outputs of a fleet of devices with asyncio
+
+One thread per device executing its commands and parsing them holds the
+GIL for every parse, so the parsing of a fleet does not go faster than one
+core. The pipeline fetches the outputs with coroutines, many devices at a
+time, and hands each output to a pool of processes to parse:
+
+    devices = [ReplayDevice('R1', 'iosxe', {'show version': output}), ...]
+    with FleetPipeline(['show version', 'show vrf']) as pipeline:
+        async for result in pipeline.results(devices):
+            print(result.device, result.parsed, result.errors)
+
+A device is any object with `name`, `os` and a coroutine `execute(command)`
+returning the output, such as an adapter of an async connection library,
+or `ReplayDevice` which replays captured outputs. The commands of a device
+are executed one after the other, each parsed while the next is fetched.
+
+At most `concurrency` devices are in flight, and a device is only started
+once the results before it are taken, so a slow consumer holds back the
+collection instead of piling up results. The results are given in the
+order of the devices, each with the outputs parsed and the errors of the
+others, a device not done within `timeout` seconds giving a TimeoutError
+for the commands left.
+'''
+
+# python
+import asyncio
+import functools
+import collections
+import concurrent.futures
+
+from .common import get_parser
+
+FleetResult = collections.namedtuple('FleetResult',
+                                     ['device', 'parsed', 'errors', 'seconds'])
+
+
+class ReplayDevice(object):
+    '''Async device replaying captured outputs'''
+
+    def __init__(self, name, os, outputs, delay=0, platform=None,
+                 model=None):
+        ''' Create a device.
+
+            Args:
+                name (`str`): name of the device
+                os (`str`): os of the device
+                outputs (`dict`): output of each command
+                delay (`float`): time taken by each command, in seconds
+                platform (`str`): platform of the device
+                model (`str`): model of the device
+        '''
+        self.name = name
+        self.os = os
+        self.platform = platform
+        self.model = model
+        self.custom = {}
+        self.outputs = outputs
+        self.delay = delay
+
+    async def execute(self, command):
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        try:
+            return self.outputs[command]
+        except KeyError:
+            raise Exception("Invalid command '{c}' on {d}".format(
+                c=command, d=self.name)) from None
+
+
+class _ParserDevice(object):
+    '''Device with the attributes the parser lookup looks at, sent to the
+    parsing processes'''
+
+    def __init__(self, device):
+        self.name = getattr(device, 'name', None)
+        self.os = device.os
+        self.platform = getattr(device, 'platform', None)
+        self.model = getattr(device, 'model', None)
+        custom = getattr(device, 'custom', None)
+        self.custom = dict(custom) if isinstance(custom, dict) else {}
+
+    def execute(self, command):
+        raise Exception("'{c}' is not collected, the parsers of {d} only "
+                        "parse the outputs given".format(c=command,
+                                                         d=self.name))
+
+
+def _parse(device, command, output):
+    '''Parse the output of a command, in a process of the pool'''
+    parser_cls, kwargs = get_parser(command, device)
+    return parser_cls(device=device).parse(output=output, **kwargs)
+
+
+class _OrderedResults(object):
+    '''Results of the devices in their order, with a bounded number of
+    devices in flight'''
+
+    def __init__(self, pipeline, devices):
+        self._pipeline = pipeline
+        self._devices = iter(devices)
+        self._pending = collections.deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        # Devices are only started as the results are taken
+        while len(self._pending) < self._pipeline.concurrency:
+            try:
+                device = next(self._devices)
+            except StopIteration:
+                break
+            self._pending.append(asyncio.ensure_future(
+                self._pipeline.collect(device)))
+
+        if not self._pending:
+            raise StopAsyncIteration
+        return await self._pending.popleft()
+
+    def cancel(self):
+        '''Stop the devices in flight'''
+        for task in self._pending:
+            task.cancel()
+        self._pending.clear()
+
+
+class FleetPipeline(object):
+    '''Collects the commands of devices and parses them in processes'''
+
+    def __init__(self, commands, executor=None, processes=None,
+                 concurrency=64, timeout=60.0):
+        ''' Create a pipeline.
+
+            Args:
+                commands (`list`): show commands to collect from each device
+                executor (`Executor`): pool to parse the outputs in, a pool
+                                       of processes owned by the pipeline if
+                                       None
+                processes (`int`): number of processes of the pool, the
+                                   number of cores if None
+                concurrency (`int`): number of devices in flight
+                timeout (`float`): time allowed per device, in seconds
+        '''
+        self.commands = list(commands)
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self._owned = executor is None
+        self._executor = executor or \
+            concurrent.futures.ProcessPoolExecutor(max_workers=processes)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        '''Shut the pool down, if owned by the pipeline'''
+        if self._owned:
+            self._executor.shutdown()
+
+    def results(self, devices):
+        ''' Collect and parse the commands of devices.
+
+            Args:
+                devices (`iterable`): the devices
+
+            Returns:
+                async iterator: FleetResult of each device, in order
+        '''
+        return _OrderedResults(self, devices)
+
+    async def collect(self, device):
+        ''' Collect and parse the commands of a device.
+
+            Returns:
+                FleetResult: the parsed outputs and errors per command
+        '''
+        loop = asyncio.get_event_loop()
+        start = loop.time()
+        parsed = {}
+        errors = {}
+        parses = []
+
+        try:
+            await asyncio.wait_for(
+                self._collect(device, parsed, errors, parses), self.timeout)
+        except asyncio.TimeoutError:
+            # Parses still queued are dropped, the ones done are kept
+            for parse in parses:
+                parse.cancel()
+            parsed = dict(parsed)
+            errors = dict(errors)
+            for command in self.commands:
+                if command not in parsed and command not in errors:
+                    errors[command] = asyncio.TimeoutError(
+                        'Timed out after {t}s'.format(t=self.timeout))
+
+        return FleetResult(getattr(device, 'name', None), parsed, errors,
+                           loop.time() - start)
+
+    async def _collect(self, device, parsed, errors, parses):
+        loop = asyncio.get_event_loop()
+        parser_device = _ParserDevice(device)
+
+        def done(command, parse):
+            if parse.cancelled():
+                return
+            if parse.exception() is None:
+                parsed[command] = parse.result()
+            else:
+                errors[command] = parse.exception()
+
+        for command in self.commands:
+            try:
+                output = await device.execute(command)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                errors[command] = e
+                continue
+            # Parsed while the next command is fetched
+            parse = loop.run_in_executor(self._executor, _parse,
+                                         parser_device, command, output)
+            parse.add_done_callback(functools.partial(done, command))
+            parses.append(parse)
+
+        if parses:
+            await asyncio.wait(parses)
+
+
+def parse_fleet(devices, commands, **kwargs):
+    ''' Collect and parse the commands of devices in a new event loop.
+
+        Args:
+            devices (`iterable`): the devices
+            commands (`list`): show commands to collect from each device
+            kwargs (`dict`): arguments of FleetPipeline
+
+        Returns:
+            list: FleetResult of each device, in order
+    '''
+    async def collect(pipeline):
+        results = []
+        async for result in pipeline.results(devices):
+            results.append(result)
+        return results
+
+    loop = asyncio.new_event_loop()
+    try:
+        with FleetPipeline(commands, **kwargs) as pipeline:
+            return loop.run_until_complete(collect(pipeline))
+    finally:
+        loop.close()
@@ -0,0 +1,157 @@
+'''Incremental parsing of an output while the device is still printing it
+
+    parser = IncrementalParser(ShowBgpVrfAllAll(device=device))
+    for chunk in chunks:
+        parser.feed(chunk)
+    parsed = parser.close()
+
+The chunks are split into lines as they arrive, a line split across chunks
+is only handed to the parser once complete. The parsers reading their output
+with `Common.iter_lines`, marked with `streaming = True`, parse these lines
+in a thread as they come, which overlaps the parsing with the transfer of the
+output. The other parsers get the whole output on close.
+'''
+
+# python
+import codecs
+import threading
+import collections
+
+# Marks the end of the output in the queue of chunks
+_CLOSED = object()
+
+
+class _ChunkQueue(object):
+    '''Complete lines of the chunks fed, for the parser thread to read'''
+
+    def __init__(self):
+        self._chunks = collections.deque()
+        self._ready = threading.Condition()
+
+    def put(self, chunk):
+        with self._ready:
+            self._chunks.append(chunk)
+            self._ready.notify()
+
+    def __iter__(self):
+        while True:
+            with self._ready:
+                while not self._chunks:
+                    self._ready.wait()
+                # Left in the queue, for any later reader to stop at too
+                if self._chunks[0] is _CLOSED:
+                    return
+                chunk = self._chunks.popleft()
+            yield chunk
+
+
+class IncrementalParser(object):
+    '''Parser fed with the chunks of an output as they are received'''
+
+    def __init__(self, parser, encoding='utf-8', **kwargs):
+        ''' Start parsing an output.
+
+            Args:
+                parser (`MetaParser`): the parser, such as
+                                       ShowIpRoute(device=device)
+                encoding (`str`): encoding of the chunks fed as bytes
+                kwargs (`dict`): arguments of the parser, such as vrf
+        '''
+        self.parser = parser
+        self.kwargs = kwargs
+        self.streaming = getattr(parser, 'streaming', False)
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        # Text received after the last line break
+        self._partial = ''
+        self._closed = False
+        self._result = None
+        self._error = None
+
+        if self.streaming:
+            self._queue = _ChunkQueue()
+            self._thread = threading.Thread(target=self._parse,
+                                            args=(self._queue,),
+                                            daemon=True)
+            self._thread.start()
+        else:
+            self._chunks = []
+
+    def _parse(self, output):
+        try:
+            self._result = self.parser.parse(output=output, **self.kwargs)
+        except Exception as e:
+            self._error = e
+            # Drop the rest of the output as it is fed
+            for _ in output:
+                pass
+
+    def feed(self, chunk):
+        ''' Add the next chunk of the output.
+
+            Args:
+                chunk (`str` or `bytes`): the chunk, lines may be split
+                                          across chunks
+        '''
+        if self._closed:
+            raise ValueError('IncrementalParser is closed')
+        if isinstance(chunk, bytes):
+            chunk = self._decoder.decode(chunk)
+        if not chunk:
+            return
+
+        if not self.streaming:
+            self._chunks.append(chunk)
+            return
+
+        # Hand over the complete lines only, a '\r' ending the chunk can be
+        # followed by the '\n' of the same line break
+        text = self._partial + chunk
+        end = text.rfind('\n') + 1
+        if end:
+            self._queue.put(text[:end])
+        self._partial = text[end:]
+
+    def close(self):
+        ''' Finish parsing the output.
+
+            Returns:
+                dict: the parsed output
+
+            Raises:
+                the exception raised by the parser, such as
+                SchemaEmptyParserError
+        '''
+        if not self._closed:
+            self._closed = True
+            rest = self._decoder.decode(b'', final=True)
+            if not self.streaming:
+                output = ''.join(self._chunks) + rest
+                self._chunks = None
+                try:
+                    self._result = self.parser.parse(output=output,
+                                                     **self.kwargs)
+                except Exception as e:
+                    self._error = e
+            else:
+                rest = self._partial + rest
+                if rest:
+                    self._queue.put(rest)
+                self._partial = ''
+                self._queue.put(_CLOSED)
+                self._thread.join()
+
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # Do not leave the parser thread waiting for more chunks
+        if not self._closed:
+            try:
+                self.close()
+            except Exception:
+                if exc_info[0] is None:
+                    raise
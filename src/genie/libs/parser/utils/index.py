@@ -0,0 +1,393 @@
+'''Build the parser index files out of the complete parser json file
+
+The complete parser json file (sdk_generator/outputs/github_parser.json,
+shipped as parsers.json) holds the doc, schema and url of every command/OS
+pair, while looking up a parser only needs the module name, package and
+class. This module splits it in:
+
+    * a routing index, loaded at import time by `get_parser`
+    * the same routing index sharded per OS, along with the list of OS
+      supporting each command, so a process only loads the OS it talks to
+    * a metadata file, only loaded when the docs or schemas are requested
+
+Usage:
+
+    python -m genie.libs.parser.utils.index sdk_generator/outputs/github_parser.json
+'''
+
+# python
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+import collections.abc
+
+log = logging.getLogger(__name__)
+
+# File names within genie.libs.parser
+PARSER_JSON = 'parsers.json'
+ROUTING_JSON = 'parsers_routing.json'
+METADATA_JSON = 'parsers_metadata.json'
+SHARD_DIR = 'parsers_routing'
+
+# File within the shard directory listing the OS of each command
+SHARD_INDEX = 'index.json'
+
+# Keys needed to find the parser class
+ROUTING_KEYS = ('module_name', 'package', 'class')
+
+
+def _split_entry(entry, tokens):
+    '''Split one command/OS entry and its nested token entries'''
+
+    routing = {}
+    metadata = {}
+    for key, value in entry.items():
+        if key in tokens and isinstance(value, dict):
+            routing[key], metadata[key] = _split_entry(value, tokens)
+        elif key in ROUTING_KEYS:
+            routing[key] = value
+        else:
+            metadata[key] = value
+
+    return routing, metadata
+
+
+def split_parser_data(data):
+    ''' Split the complete parser data in routing and metadata.
+
+        Args:
+            data (`dict`): the content of the complete parser json file
+
+        Returns:
+            tuple: the routing index and the metadata, both keyed the same
+                   way as the complete parser data
+    '''
+    tokens = set(data.get('tokens', []))
+    routing = {}
+    metadata = {}
+
+    for command, sources in data.items():
+        if command == 'tokens':
+            routing[command] = sources
+            continue
+
+        routing[command] = {}
+        metadata[command] = {}
+        for os_name, entry in sources.items():
+            routing[command][os_name], metadata[command][os_name] = \
+                                                _split_entry(entry, tokens)
+
+    return routing, metadata
+
+
+def shard_parser_data(routing):
+    ''' Shard the routing index per OS.
+
+        Args:
+            routing (`dict`): the routing index
+
+        Returns:
+            tuple: the shard index, with the same keys as the routing index
+                   and the list of OS of each command as values, and a dict
+                   of OS to its shard
+    '''
+    index = {}
+    shards = {}
+
+    for command, sources in routing.items():
+        if command == 'tokens':
+            index[command] = sources
+            continue
+
+        index[command] = list(sources)
+        for os_name, entry in sources.items():
+            shards.setdefault(os_name, {})[command] = entry
+
+    return index, shards
+
+
+def make_index(parser_json, routing_json=None, metadata_json=None,
+               shard_dir=None):
+    ''' Write the routing index, its per OS shards and the metadata files of
+        a parser json file.
+
+        Args:
+            parser_json (`str`): path to the complete parser json file
+            routing_json (`str`): path of the routing index to write, default
+                                  to <parser_json>_routing.json
+            metadata_json (`str`): path of the metadata to write, default to
+                                   <parser_json>_metadata.json
+            shard_dir (`str`): directory to write the per OS shards into,
+                               default to <parser_json>_routing
+    '''
+    base = os.path.splitext(parser_json)[0]
+    routing_json = routing_json or base + '_routing.json'
+    metadata_json = metadata_json or base + '_metadata.json'
+    shard_dir = shard_dir or base + '_routing'
+
+    with open(parser_json) as f:
+        data = json.load(f)
+
+    routing, metadata = split_parser_data(data)
+
+    # Routing index is read at every import, keep it compact
+    with open(routing_json, 'w') as f:
+        json.dump(routing, f, separators=(',', ':'))
+
+    with open(metadata_json, 'w') as f:
+        json.dump(metadata, f, separators=(',', ':'))
+
+    index, shards = shard_parser_data(routing)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    # Remove the shards of OS which are gone
+    for name in os.listdir(shard_dir):
+        if name.endswith('.json'):
+            os.remove(os.path.join(shard_dir, name))
+
+    with open(os.path.join(shard_dir, SHARD_INDEX), 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+    for os_name, shard in shards.items():
+        with open(os.path.join(shard_dir, os_name + '.json'), 'w') as f:
+            json.dump(shard, f, separators=(',', ':'))
+
+    log.info('Wrote {r}, {m} and {s}'.format(r=routing_json, m=metadata_json,
+                                             s=shard_dir))
+
+
+class ParserData(collections.abc.MutableMapping):
+    '''Parser data, with the entries of each OS loaded on demand
+
+    Behaves like the dict of the complete parser json file: every command is
+    always a key, and reading the entries loads the missing OS first. It
+    wraps its dict rather than being one, so that `dict(parser_data)` and
+    `{**parser_data}` go through the loading too. The lookups which know the
+    OS they are after use `entry`, `supports` and `commands` instead, which
+    only ever load the shard of that OS.
+
+    Built from a dict, every OS is loaded from the start.
+    '''
+
+    def __init__(self, data=None, index=None, loader=None):
+        self._data = {}
+        self._lock = threading.RLock()
+        self._loader = loader
+        # OS which have a shard left to load
+        self._pending = set()
+        # OS -> its commands, dict used as an ordered set
+        self._os_commands = {}
+        # Bumped whenever the commands of an OS change
+        self.version = 0
+
+        for command, sources in (data or {}).items():
+            self._data[command] = sources
+            self._index(command, sources)
+
+        for command, os_names in (index or {}).items():
+            if command == 'tokens':
+                self._data[command] = os_names
+                continue
+            self._data[command] = {}
+            self._index(command, os_names)
+            self._pending.update(os_names)
+
+    def _index(self, command, os_names):
+        if command == 'tokens':
+            return
+        for os_name in os_names:
+            self._os_commands.setdefault(os_name, {})[command] = None
+        self.version += 1
+
+    def _unindex(self, command):
+        for commands in self._os_commands.values():
+            commands.pop(command, None)
+        self.version += 1
+
+    def load(self, os_name):
+        '''Load the entries of an OS, if not loaded yet'''
+        if os_name not in self._pending:
+            return
+
+        with self._lock:
+            if os_name not in self._pending:
+                return
+
+            for command, entry in self._loader(os_name).items():
+                sources = self._data.get(command)
+                if sources is None:
+                    # Removed since
+                    continue
+                # Entries registered since take precedence over the shard
+                sources.setdefault(os_name, entry)
+
+            self._pending.discard(os_name)
+
+    def load_all(self):
+        '''Load the entries of every OS'''
+        for os_name in list(self._pending):
+            self.load(os_name)
+
+    def supports(self, command, os_name):
+        '''Whether a parser exists for a command and OS, without loading'''
+        if command == 'tokens':
+            return os_name in self._data.get('tokens', [])
+        return command in self._os_commands.get(os_name, ())
+
+    def commands(self, os_name):
+        '''The commands with a parser for an OS, without loading'''
+        return list(self._os_commands.get(os_name, ()))
+
+    def os_names(self):
+        '''The OS with at least one parser, without loading'''
+        return sorted(os_name for os_name, commands in self._os_commands.items()
+                                                                if commands)
+
+    def entry(self, command, os_name=None):
+        '''The entries of a command, with at least os_name loaded'''
+        if os_name is None:
+            self.load_all()
+        else:
+            self.load(os_name)
+        return self._data[command]
+
+    def register(self, command, os_name, entry):
+        '''Add or replace the entry of a command for an OS'''
+        with self._lock:
+            self._data.setdefault(command, {})[os_name] = entry
+            self._index(command, [os_name])
+
+    # Mapping methods, the keys without loading and the entries on the
+    # complete data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, command):
+        return command in self._data
+
+    def __getitem__(self, command):
+        self.load_all()
+        return self._data[command]
+
+    def __setitem__(self, command, sources):
+        self.load_all()
+        self._data[command] = sources
+        self._unindex(command)
+        self._index(command, sources)
+
+    def __delitem__(self, command):
+        self.load_all()
+        del self._data[command]
+        self._unindex(command)
+
+    def __eq__(self, other):
+        self.load_all()
+        if isinstance(other, ParserData):
+            other = dict(other)
+        return self._data == other
+
+    def __ne__(self, other):
+        self.load_all()
+        return not self == other
+
+    def __repr__(self):
+        self.load_all()
+        return repr(self._data)
+
+    def __reduce__(self):
+        self.load_all()
+        return (dict, (dict(self._data),))
+
+    def get(self, command, default=None):
+        self.load_all()
+        return self._data.get(command, default)
+
+    def items(self):
+        self.load_all()
+        return self._data.items()
+
+    def values(self):
+        self.load_all()
+        return self._data.values()
+
+    def copy(self):
+        self.load_all()
+        return dict(self._data)
+
+    def pop(self, command, *default):
+        self.load_all()
+        self._unindex(command)
+        return self._data.pop(command, *default)
+
+    def popitem(self):
+        self.load_all()
+        command, sources = self._data.popitem()
+        self._unindex(command)
+        return command, sources
+
+    def setdefault(self, command, default=None):
+        if command not in self:
+            self[command] = default
+        return self[command]
+
+    def update(self, *args, **kwargs):
+        for command, sources in dict(*args, **kwargs).items():
+            self[command] = sources
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._pending.clear()
+            self._os_commands.clear()
+            self.version += 1
+
+
+def load_parser_shards(shard_dir):
+    ''' Load the shard index of a shard directory, the shards themselves
+        are loaded on demand.
+
+        Args:
+            shard_dir (`str`): directory holding the per OS shards
+
+        Returns:
+            ParserData: the parser data
+    '''
+    with open(os.path.join(shard_dir, SHARD_INDEX)) as f:
+        index = json.load(f)
+
+    def loader(os_name):
+        shard = os.path.join(shard_dir, os_name + '.json')
+        if not os.path.isfile(shard):
+            log.warning('Parser shard {s} does not exist'.format(s=shard))
+            return {}
+        with open(shard) as f:
+            return json.load(f)
+
+    return ParserData(index=index, loader=loader)
+
+
+def main(argv=None):
+    args = argparse.ArgumentParser(
+        description='Split the parser json file in a routing index, its '
+                    'per OS shards and a metadata file')
+    args.add_argument('parser_json', help='complete parser json file')
+    args.add_argument('--routing', default=None,
+                      help='routing index file to write')
+    args.add_argument('--metadata', default=None,
+                      help='metadata file to write')
+    args.add_argument('--shards', default=None,
+                      help='directory to write the per OS shards into')
+    args = args.parse_args(argv)
+
+    make_index(args.parser_json, args.routing, args.metadata, args.shards)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
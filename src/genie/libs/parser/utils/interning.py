@@ -0,0 +1,62 @@
+'''Sharing the repeated strings of the large parse results
+
+Each match of a line gives new strings, so the next hop, interface, AS path
+or status codes repeated over the entries of a table of a million routes is
+held a million times in the parsed output. The parsers of the large tables
+pass the values which repeat through an `Interner`, local to the parse,
+which returns the first string equal to the value, so the entries share it:
+
+    intern = Interner()
+    for line in Common.iter_lines(out):
+        ...
+        next_hop = intern(group['next_hop'])
+
+The values which are unique to an entry, such as the prefix of a route, are
+better left alone: interning them only costs the table of the interner.
+The table is dropped with the Interner at the end of the parse, unlike the
+one of `sys.intern`, and takes any string, including the values of a dict
+the parser fills through `groups`.
+'''
+
+# Whether the parsers share their repeated strings, turned off to measure
+# what it saves
+INTERN = True
+
+
+class Interner(object):
+    '''Returns one object per distinct string given to it'''
+
+    def __init__(self):
+        self._strings = {}
+
+    def __call__(self, value):
+        ''' The first value equal to value given, value otherwise
+
+            Args:
+                value (`str`): the value, None is returned as is
+        '''
+        if value is None or not INTERN:
+            return value
+        return self._strings.setdefault(value, value)
+
+    def groups(self, group, *fields):
+        ''' Intern the values of the given keys of a dict, such as the
+            groupdict of a match
+
+            Args:
+                group (`dict`): the dict, updated
+                fields (`str`): its keys holding values which repeat
+
+            Returns:
+                dict: the dict
+        '''
+        if INTERN:
+            strings = self._strings
+            for field in fields:
+                value = group.get(field)
+                if value is not None:
+                    group[field] = strings.setdefault(value, value)
+        return group
+
+    def __len__(self):
+        return len(self._strings)
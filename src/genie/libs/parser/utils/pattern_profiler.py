@@ -0,0 +1,327 @@
+'''Profiler of the regular expressions of the parsers
+
+Records, for each regular expression of a parser, how many times it was
+tried, how many times it matched and the time spent in it:
+
+    profiler = PatternProfiler()
+    with profiler.profile(ShowBgpVrfAllAll):
+        parsed = ShowBgpVrfAllAll(device=device).parse(output=output)
+    print(profiler.report())
+
+The patterns declared through `Patterns` are reported by name (p3_1, ...),
+the ones compiled or used through the `re` module within the parser module
+by the line they are compiled at. Profiling replaces the `re` module of the
+parser modules for its duration, it is meant for troubleshooting and is not
+thread safe.
+
+Usage:
+
+    python -m genie.libs.parser.utils.pattern_profiler \\
+        --parser nxos.show_bgp.ShowBgpVrfAllAll output.txt
+    python -m genie.libs.parser.utils.pattern_profiler \\
+        --os iosxe --command 'show ip route' output.txt
+'''
+
+# python
+import re
+import sys
+import json
+import time
+import argparse
+import importlib
+import contextlib
+
+from .patterns import Patterns
+
+# Methods of the compiled patterns which are recorded
+PATTERN_METHODS = ('match', 'search', 'fullmatch', 'findall', 'finditer',
+                   'sub', 'subn', 'split')
+
+# Parser modules, only their use of the re module is recorded
+PARSER_PACKAGE = 'genie.libs.parser.'
+
+
+class PatternStats(object):
+    '''Use of one regular expression'''
+
+    __slots__ = ('owner', 'name', 'pattern', 'attempts', 'hits', 'seconds')
+
+    def __init__(self, owner, name, pattern):
+        self.owner = owner
+        self.name = name
+        self.pattern = pattern
+        self.attempts = 0
+        self.hits = 0
+        self.seconds = 0.0
+
+    def to_dict(self):
+        return {'owner': self.owner,
+                'name': self.name,
+                'pattern': self.pattern,
+                'attempts': self.attempts,
+                'hits': self.hits,
+                'seconds': self.seconds}
+
+
+class ProfiledPattern(object):
+    '''Compiled pattern recording its use in a PatternStats'''
+
+    def __init__(self, compiled, stats):
+        self._compiled = compiled
+        self._stats = stats
+        for method in PATTERN_METHODS:
+            setattr(self, method, self._recorded(getattr(compiled, method)))
+
+    def _recorded(self, method):
+        stats = self._stats
+        perf_counter = time.perf_counter
+
+        def recorded(*args, **kwargs):
+            start = perf_counter()
+            result = method(*args, **kwargs)
+            stats.seconds += perf_counter() - start
+            stats.attempts += 1
+            if result:
+                stats.hits += 1
+            return result
+
+        return recorded
+
+    def __getattr__(self, name):
+        return getattr(self._compiled, name)
+
+    def __repr__(self):
+        return '<ProfiledPattern {p!r}>'.format(p=self._compiled.pattern)
+
+
+class _ProfiledRe(object):
+    '''re module of a parser module, recording the patterns used through it'''
+
+    def __init__(self, profiler, owner):
+        self._profiler = profiler
+        self._owner = owner
+
+    def __getattr__(self, name):
+        return getattr(re, name)
+
+    def _wrap(self, pattern, flags):
+        # Named after the line of the parser using it
+        frame = sys._getframe(2)
+        name = 'line {n}'.format(n=frame.f_lineno)
+        if isinstance(pattern, ProfiledPattern):
+            return pattern
+        return self._profiler.wrap(self._owner, name,
+                                   re.compile(pattern, flags))
+
+    def compile(self, pattern, flags=0):
+        return self._wrap(pattern, flags)
+
+    def match(self, pattern, string, flags=0):
+        return self._wrap(pattern, flags).match(string)
+
+    def search(self, pattern, string, flags=0):
+        return self._wrap(pattern, flags).search(string)
+
+    def fullmatch(self, pattern, string, flags=0):
+        return self._wrap(pattern, flags).fullmatch(string)
+
+    def findall(self, pattern, string, flags=0):
+        return self._wrap(pattern, flags).findall(string)
+
+    def finditer(self, pattern, string, flags=0):
+        return self._wrap(pattern, flags).finditer(string)
+
+    def split(self, pattern, string, maxsplit=0, flags=0):
+        return self._wrap(pattern, flags).split(string, maxsplit)
+
+    def sub(self, pattern, repl, string, count=0, flags=0):
+        return self._wrap(pattern, flags).sub(repl, string, count)
+
+    def subn(self, pattern, repl, string, count=0, flags=0):
+        return self._wrap(pattern, flags).subn(repl, string, count)
+
+
+class PatternProfiler(object):
+    '''Records the use of the regular expressions of parsers'''
+
+    def __init__(self):
+        # (owner, name, pattern) -> its PatternStats
+        self._stats = {}
+        self.parses = 0
+        self.seconds = 0.0
+
+    def wrap(self, owner, name, compiled):
+        '''Return a compiled pattern recording its use'''
+        key = (owner, name, compiled.pattern)
+        try:
+            stats = self._stats[key]
+        except KeyError:
+            stats = self._stats[key] = PatternStats(owner, name,
+                                                    compiled.pattern)
+        return ProfiledPattern(compiled, stats)
+
+    @contextlib.contextmanager
+    def profile(self, parser_cls):
+        ''' Record the use of the regular expressions of a parser class, and
+            of the classes it inherits from, within the block.
+
+            Args:
+                parser_cls (`class`): the parser class
+        '''
+        classes = [cls for cls in parser_cls.__mro__
+                        if cls.__module__.startswith(PARSER_PACKAGE)]
+
+        patterns = []
+        for cls in classes:
+            declared = vars(cls).get('patterns')
+            if isinstance(declared, Patterns) and declared not in patterns:
+                patterns.append(declared)
+
+        modules = {}
+        for cls in classes:
+            module = sys.modules[cls.__module__]
+            if getattr(module, 're', None) is re:
+                modules[module] = _ProfiledRe(self, cls.__module__)
+
+        for declared in patterns:
+            declared.clear()
+            declared.profiler = self
+        for module, profiled in modules.items():
+            module.re = profiled
+
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.parses += 1
+            for module in modules:
+                module.re = re
+            for declared in patterns:
+                declared.profiler = None
+                declared.clear()
+
+    def stats(self):
+        '''The PatternStats of every pattern used, the slowest first'''
+        return sorted(self._stats.values(),
+                      key=lambda stats: (-stats.seconds, stats.owner,
+                                         stats.name))
+
+    def report(self, top=None):
+        ''' Return the use of the patterns as a table.
+
+            Args:
+                top (`int`): only report the slowest patterns
+
+            Returns:
+                str: the table, the slowest patterns first
+        '''
+        stats = self.stats()
+        regex_seconds = sum(stat.seconds for stat in stats)
+        lines = ['{n} patterns, {r:.3f} ms out of {t:.3f} ms in {p} '
+                 'parse(s)'.format(n=len(stats), r=regex_seconds * 1000,
+                                   t=self.seconds * 1000, p=self.parses),
+                 '{:<14} {:>9} {:>8} {:>10} {:>6}  {}'.format(
+                     'name', 'attempts', 'hits', 'ms', '%', 'pattern')]
+
+        for stat in stats[:top]:
+            share = stat.seconds / regex_seconds * 100 if regex_seconds else 0
+            lines.append('{name:<14} {attempts:>9} {hits:>8} {ms:>10.3f} '
+                         '{share:>6.1f}  {pattern}'.format(
+                             name=stat.name, attempts=stat.attempts,
+                             hits=stat.hits, ms=stat.seconds * 1000,
+                             share=share, pattern=_shorten(stat.pattern)))
+
+        return '\n'.join(lines)
+
+
+def _shorten(pattern, width=70):
+    if len(pattern) <= width:
+        return pattern
+    return pattern[:width - 3] + '...'
+
+
+def profile_parse(parser_cls, output, device=None, repeat=1, **kwargs):
+    ''' Parse an output with a parser, recording the use of its patterns.
+
+        Args:
+            parser_cls (`class`): the parser class
+            output (`str`): the output to parse
+            device (`Device`): the device given to the parser
+            repeat (`int`): number of times to parse the output
+            kwargs (`dict`): arguments of the parser
+
+        Returns:
+            tuple: the parsed output and the PatternProfiler
+    '''
+    profiler = PatternProfiler()
+    parsed = None
+    for _ in range(repeat):
+        with profiler.profile(parser_cls):
+            parsed = parser_cls(device=device).parse(output=output, **kwargs)
+
+    return parsed, profiler
+
+
+def _parser_class(path):
+    '''Parser class of '<os>.<module>.<class>', under genie.libs.parser'''
+    module, _, class_name = path.rpartition('.')
+    if not module.startswith(PARSER_PACKAGE):
+        module = PARSER_PACKAGE + module
+    return getattr(importlib.import_module(module), class_name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Parse a captured output and report the time spent in '
+                    'each regular expression of the parser')
+    parser.add_argument('output', help='file holding the output to parse')
+    parser_args = parser.add_mutually_exclusive_group(required=True)
+    parser_args.add_argument('--parser',
+                             help='parser class, as <os>.<module>.<class>')
+    parser_args.add_argument('--command',
+                             help='show command to find the parser of, '
+                                  'along with --os')
+    parser.add_argument('--os', help='OS of the device the output is from')
+    parser.add_argument('--platform', default=None,
+                        help='platform of the device the output is from')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='number of times to parse the output')
+    parser.add_argument('--top', type=int, default=20,
+                        help='number of patterns to report')
+    parser.add_argument('--json', action='store_true',
+                        help='print the statistics of every pattern as json')
+    args = parser.parse_args(argv)
+
+    from .benchmark import BenchmarkDevice
+    device = BenchmarkDevice(args.os, platform=args.platform)
+
+    kwargs = {}
+    if args.command:
+        if not args.os:
+            parser.error('--command needs --os')
+        from .common import get_parser
+        parser_cls, kwargs = get_parser(args.command, device)
+    else:
+        parser_cls = _parser_class(args.parser)
+
+    with open(args.output) as f:
+        output = f.read()
+
+    _, profiler = profile_parse(parser_cls, output, device=device,
+                                repeat=args.repeat, **kwargs)
+
+    if args.json:
+        print(json.dumps({'parser': '{m}.{c}'.format(
+                              m=parser_cls.__module__, c=parser_cls.__name__),
+                          'parses': profiler.parses,
+                          'seconds': profiler.seconds,
+                          'patterns': [stats.to_dict()
+                                          for stats in profiler.stats()]},
+                         indent=2))
+    else:
+        print(profiler.report(args.top))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,668 @@
+'''Compiled regular expression registry of the parsers
+
+Parsers declare their regular expressions once, at the class level, instead
+of compiling them in `cli()` on every call:
+
+    class ShowVersion(ShowVersionSchema):
+
+        patterns = Patterns(
+            # Cisco IOS XE Software, Version 16.9.1
+            p1=r'^Cisco +IOS +XE +Software, +Version +(?P<version>\\S+)$',
+        )
+
+        def cli(self, output=None):
+            p = self.patterns
+            ...
+            m = p.p1.match(line)
+
+Each pattern is compiled on first use and then stays an attribute of the
+`Patterns` object, so `cli()` gets it without any further cost. Identical
+patterns of different parsers share the same compiled object, and none of
+them go through the `re` module cache, which only holds 512 entries.
+
+Line oriented parsers trying their patterns one after the other on every
+line can also only try the patterns which can match it:
+
+        for line in out.splitlines():
+            line = line.strip()
+            lp = p.dispatch(line)
+
+            m = lp.p1.match(line)
+
+`dispatch` indexes the patterns anchored on a literal leading token
+('Hardware', 'MTU', ...) and returns, for the first token of the line, the
+compiled patterns which can match it, along with the patterns without a
+literal prefix which can match its first character. The others are replaced
+by a pattern which never matches, at the cost of a dict lookup. Only `match`,
+`search` and `fullmatch` of the whole line can be used through `dispatch`.
+
+Parsers trying several patterns in a row on each line, and keeping the first
+one which matches, can try them all in one regular expression instead:
+
+        rows = p.alternation('p3_1', 'p3_2', 'p3_3')
+        for line in out.splitlines():
+            m = rows.match(line)
+            if m and m.name == 'p3_1':
+                ...
+
+`alternation` joins the patterns in one alternation, in the given order, so
+the branch matching a line is the first of the patterns which matches it on
+its own. The match tells which pattern it is, and reads like the match of
+that pattern alone.
+'''
+
+# python
+import re
+import threading
+
+try:
+    from re import _parser as sre_parse
+    from re import _constants as sre_constants
+except ImportError:
+    import sre_parse
+    import sre_constants
+
+# Pattern and flags -> compiled pattern, shared by all the parsers
+_compiled = {}
+_lock = threading.Lock()
+
+# Owner class ("module.Class") -> its Patterns
+registry = {}
+
+# Whether Patterns.dispatch narrows down the patterns, or returns them all
+DISPATCH = True
+
+# Literal prefixes of a pattern beyond which it is tried on every line
+MAX_PREFIXES = 16
+
+# First tokens of the lines a LineDispatcher keeps the patterns of
+MAX_TOKENS = 1024
+
+
+def compile_pattern(pattern, flags=0):
+    '''Compile a pattern, at most once per process'''
+    key = (pattern, flags)
+    try:
+        return _compiled[key]
+    except KeyError:
+        pass
+
+    with _lock:
+        if key not in _compiled:
+            _compiled[key] = re.compile(pattern, flags)
+        return _compiled[key]
+
+
+def purge():
+    '''Drop all the compiled patterns, they are compiled again on next use'''
+    with _lock:
+        _compiled.clear()
+    for patterns in list(registry.values()):
+        patterns.clear()
+
+
+def _prefixes(items):
+    '''Return the literal prefixes of parsed regex items, and whether the
+       items are entirely literal'''
+    prefixes = ['']
+
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            char = chr(av)
+            if char.isspace():
+                return prefixes, False
+            prefixes = [prefix + char for prefix in prefixes]
+            continue
+
+        if op is sre_constants.IN:
+            # Character set of literals, such as [A|a]
+            chars = [chr(value) for kind, value in av
+                                    if kind is sre_constants.LITERAL]
+            if len(chars) != len(av) or any(c.isspace() for c in chars):
+                return prefixes, False
+            prefixes = [prefix + char for prefix in prefixes
+                                            for char in chars]
+        elif op is sre_constants.SUBPATTERN:
+            alternatives, complete = _prefixes(av[-1])
+            prefixes = [prefix + alternative for prefix in prefixes
+                                            for alternative in alternatives]
+            if not complete:
+                return prefixes, False
+        elif op is sre_constants.BRANCH:
+            alternatives = []
+            complete = True
+            for branch in av[1]:
+                branch_prefixes, branch_complete = _prefixes(branch)
+                alternatives.extend(branch_prefixes)
+                complete = complete and branch_complete
+            prefixes = [prefix + alternative for prefix in prefixes
+                                            for alternative in alternatives]
+            if not complete:
+                return prefixes, False
+        else:
+            return prefixes, False
+
+        if len(prefixes) > MAX_PREFIXES:
+            return [''], False
+
+    return prefixes, True
+
+
+def _is_space(item):
+    op, av = item
+    if op is sre_constants.LITERAL:
+        return chr(av).isspace()
+    if op is sre_constants.IN:
+        return av == [(sre_constants.CATEGORY, sre_constants.CATEGORY_SPACE)]
+    return False
+
+
+# Character categories of the character sets
+_CATEGORIES = {
+    sre_constants.CATEGORY_DIGIT: re.compile(r'\d').match,
+    sre_constants.CATEGORY_NOT_DIGIT: re.compile(r'\D').match,
+    sre_constants.CATEGORY_SPACE: re.compile(r'\s').match,
+    sre_constants.CATEGORY_NOT_SPACE: re.compile(r'\S').match,
+    sre_constants.CATEGORY_WORD: re.compile(r'\w').match,
+    sre_constants.CATEGORY_NOT_WORD: re.compile(r'\W').match,
+}
+
+
+def _in_set(items, char):
+    '''Whether a character is in a parsed character set'''
+    negate = False
+    found = False
+    for op, av in items:
+        if op is sre_constants.NEGATE:
+            negate = True
+        elif op is sre_constants.LITERAL:
+            found = found or char == chr(av)
+        elif op is sre_constants.RANGE:
+            found = found or av[0] <= ord(char) <= av[1]
+        elif op is sre_constants.CATEGORY:
+            found = found or bool(_CATEGORIES[av](char))
+    return found != negate
+
+
+def _first_set(items):
+    '''Return the character sets the first character matched by parsed
+       regex items is in, or None when it can be anything'''
+    if not items:
+        return None
+    op, av = items[0]
+
+    if op is sre_constants.LITERAL:
+        return [[(op, av)]]
+    if op is sre_constants.IN:
+        supported = (sre_constants.NEGATE, sre_constants.LITERAL,
+                     sre_constants.RANGE, sre_constants.CATEGORY)
+        if all(kind in supported and (kind is not sre_constants.CATEGORY
+                                      or value in _CATEGORIES)
+                                                    for kind, value in av):
+            return [av]
+        return None
+    if op in (sre_constants.MAX_REPEAT, sre_constants.MIN_REPEAT):
+        minimum, _, repeated = av
+        return _first_set(list(repeated)) if minimum else None
+    if op is sre_constants.SUBPATTERN:
+        return _first_set(list(av[-1]))
+    if op is sre_constants.BRANCH:
+        sets = []
+        for branch in av[1]:
+            branch_sets = _first_set(list(branch))
+            if branch_sets is None:
+                return None
+            sets.extend(branch_sets)
+        return sets
+    return None
+
+
+def _anchored_items(pattern, flags):
+    '''Parsed items of a pattern anchored with ^, after its leading
+       whitespaces, or None'''
+    if flags & (re.IGNORECASE | re.MULTILINE | re.VERBOSE):
+        return None
+
+    items = list(sre_parse.parse(pattern, flags))
+
+    if not items or items[0] != (sre_constants.AT,
+                                 sre_constants.AT_BEGINNING):
+        return None
+    items = items[1:]
+
+    # Leading whitespaces are not part of the first token
+    while items and items[0][0] in (sre_constants.MAX_REPEAT,
+                                    sre_constants.MIN_REPEAT):
+        _, _, repeated = items[0][1]
+        if len(repeated) != 1 or not _is_space(repeated[0]):
+            break
+        items = items[1:]
+
+    return items
+
+
+def first_characters(pattern, flags=0):
+    ''' Return a function telling whether the first token of a line can start
+        with a character for a pattern to match it.
+
+        Args:
+            pattern (`str`): the pattern, anchored with ^
+            flags (`int`): its flags
+
+        Returns:
+            function: called with a character, None when the pattern can
+                      match any line
+    '''
+    items = _anchored_items(pattern, flags)
+    if items is None:
+        return None
+
+    sets = _first_set(items)
+    if sets is None:
+        return None
+
+    def accepts(char):
+        return any(_in_set(items, char) for items in sets)
+
+    # The first token never starts with a whitespace
+    if any(accepts(space) for space in ' \t\r\n\x0b\x0c'):
+        return None
+
+    return accepts
+
+
+def literal_prefixes(pattern, flags=0):
+    ''' Return the literal prefixes the first token of a line must start
+        with for a pattern to match it.
+
+        Args:
+            pattern (`str`): the pattern, anchored with ^
+            flags (`int`): its flags
+
+        Returns:
+            list: the prefixes, empty when the pattern can match any line
+    '''
+    items = _anchored_items(pattern, flags)
+    if items is None:
+        return []
+
+    prefixes, _ = _prefixes(items)
+    if '' in prefixes:
+        return []
+
+    return sorted(set(prefixes))
+
+
+class _NoMatch(object):
+    '''Pattern which never matches, only called with the string'''
+
+    __slots__ = ()
+
+    match = search = fullmatch = {}.get
+
+
+_no_match = _NoMatch()
+
+
+class _LinePatterns(object):
+    '''Compiled patterns which can match a line, the others never match'''
+
+    def __init__(self, patterns):
+        self.__dict__.update(patterns)
+
+
+class LineDispatcher(object):
+    '''Index of patterns by the literal prefix of the first token of the
+    lines they can match
+
+    Args:
+        patterns (`dict`): name -> compiled pattern
+    '''
+
+    def __init__(self, patterns):
+        self._patterns = patterns
+        # Prefix -> names of the patterns with this prefix
+        self._index = {}
+        # Names of the patterns without literal prefix, which can match
+        # any line or the lines starting with some characters
+        self._fallback = frozenset()
+        self._first = []
+        # First character -> names of the patterns it can start
+        self._characters = {}
+        # Names of the patterns which can match a line -> its _LinePatterns
+        self._views = {}
+        # First token -> its _LinePatterns
+        self._lines = {}
+
+        fallback = set()
+        for name, compiled in patterns.items():
+            flags = compiled.flags & ~re.UNICODE
+            prefixes = literal_prefixes(compiled.pattern, flags)
+            for prefix in prefixes:
+                self._index.setdefault(prefix, set()).add(name)
+            if prefixes:
+                continue
+
+            accepts = first_characters(compiled.pattern, flags)
+            if accepts is None:
+                fallback.add(name)
+            else:
+                self._first.append((name, accepts))
+
+        self._fallback = frozenset(fallback)
+        self._longest = max((len(prefix) for prefix in self._index),
+                            default=0)
+
+    def candidates(self, token):
+        '''Names of the patterns which can match a line starting with token'''
+        if not token:
+            return self._fallback
+
+        char = token[0]
+        try:
+            names = self._characters[char]
+        except KeyError:
+            names = self._characters[char] = self._fallback.union(
+                name for name, accepts in self._first if accepts(char))
+
+        index = self._index
+        prefixed = [index[token[:end]]
+                        for end in range(1, min(len(token), self._longest) + 1)
+                            if token[:end] in index]
+        if prefixed:
+            names = names.union(*prefixed)
+        return names
+
+    def dispatch(self, line):
+        '''Return the patterns which can match a line'''
+        token = line.split(None, 1)
+        token = token[0] if token else ''
+
+        try:
+            return self._lines[token]
+        except KeyError:
+            pass
+
+        names = frozenset(self.candidates(token))
+        try:
+            line_patterns = self._views[names]
+        except KeyError:
+            line_patterns = self._views[names] = _LinePatterns(
+                {name: compiled if name in names else _no_match
+                    for name, compiled in self._patterns.items()})
+
+        if len(self._lines) >= MAX_TOKENS:
+            self._lines.clear()
+        self._lines[token] = line_patterns
+
+        return line_patterns
+
+
+# Group names and named back references of a pattern, not escaped
+_GROUP_NAME = re.compile(r'(?<!\\)((?:\\\\)*)\(\?P([<=])(\w+)')
+
+# Back references by number, which would not be the same in an alternation
+_GROUP_NUMBER = re.compile(r'(?<!\\)(?:\\\\)*\\[1-9]')
+
+# Flags set for the whole pattern, which would apply to every alternative
+_GLOBAL_FLAGS = re.compile(r'\^?\(\?[aiLmsux]+\)')
+
+
+class BranchMatch(object):
+    '''Match of an Alternation, read like the match of the pattern of the
+    branch which matched
+
+    Attributes:
+        name (`str`): name of the pattern which matched
+    '''
+
+    __slots__ = ('name', '_match', '_branch', '_groupdict')
+
+    def __init__(self, match, name, branch):
+        self.name = name
+        self._match = match
+        self._branch = branch
+        self._groupdict = None
+
+    def __bool__(self):
+        return True
+
+    def __repr__(self):
+        return '<BranchMatch {n}: {m!r}>'.format(n=self.name,
+                                                 m=self._match.group(0))
+
+    def _index(self, group):
+        if isinstance(group, int):
+            return self._branch.offset + group if group else group
+        return self._branch.names[group]
+
+    def group(self, *groups):
+        if not groups:
+            return self._match.group(0)
+        return self._match.group(*[self._index(group) for group in groups])
+
+    def __getitem__(self, group):
+        return self.group(group)
+
+    def groups(self, default=None):
+        return self._match.groups(default)[
+            self._branch.offset:self._branch.offset + self._branch.groups]
+
+    def groupdict(self, default=None):
+        if default is None and self._groupdict is not None:
+            return self._groupdict
+
+        group = self._match.group
+        groupdict = {}
+        for name, tagged in self._branch.names.items():
+            value = group(tagged)
+            groupdict[name] = default if value is None else value
+
+        if default is None:
+            self._groupdict = groupdict
+        return groupdict
+
+    def start(self, group=0):
+        return self._match.start(self._index(group))
+
+    def end(self, group=0):
+        return self._match.end(self._index(group))
+
+    def span(self, group=0):
+        return self._match.span(self._index(group))
+
+    @property
+    def string(self):
+        return self._match.string
+
+
+class _Branch(object):
+    '''Pattern of an Alternation, with its groups within the alternation'''
+
+    __slots__ = ('name', 'names', 'offset', 'groups')
+
+    def __init__(self, name, names, offset, groups):
+        self.name = name
+        # Group name -> its name in the alternation
+        self.names = names
+        # Group number of the branch itself in the alternation
+        self.offset = offset
+        self.groups = groups
+
+
+class Alternation(object):
+    '''Patterns tried in order in one regular expression
+
+    Args:
+        patterns (`list`): (name, pattern, flags) in priority order, all with
+                           the same flags
+    '''
+
+    def __init__(self, patterns):
+        patterns = list(patterns)
+        flags = set(flags for _, _, flags in patterns)
+        if len(flags) > 1:
+            raise ValueError('Patterns {p} do not have the same '
+                             'flags'.format(p=[name for name, _, _ in patterns]))
+        flags = flags.pop() if flags else 0
+
+        branches = []
+        self._branches = {}
+        offset = 0
+        for number, (name, pattern, _) in enumerate(patterns):
+            compiled = compile_pattern(pattern, flags)
+            if _GLOBAL_FLAGS.match(pattern):
+                raise ValueError('Pattern {n} sets global flags'.format(n=name))
+            if _GROUP_NUMBER.search(pattern):
+                raise ValueError('Pattern {n} refers to a group by '
+                                 'number'.format(n=name))
+
+            tag = '_{n}'.format(n=number)
+
+            def rename(m):
+                return '{e}(?P{k}{t}_{g}'.format(e=m.group(1), k=m.group(2),
+                                                 t=tag, g=m.group(3))
+
+            branches.append('(?P<{t}>{p})'.format(
+                t=tag, p=_GROUP_NAME.sub(rename, pattern)))
+
+            # The branch itself is a group, before the groups of the pattern
+            offset += 1
+            names = {group: '{t}_{g}'.format(t=tag, g=group)
+                        for group in compiled.groupindex}
+            self._branches[tag] = _Branch(name, names, offset,
+                                          compiled.groups)
+            offset += compiled.groups
+
+        self.names = [name for name, _, _ in patterns]
+        self.regex = compile_pattern('|'.join(branches), flags)
+
+    def __repr__(self):
+        return '<Alternation of {n}>'.format(n=', '.join(self.names))
+
+    def match(self, string):
+        '''Return the BranchMatch of the first pattern matching string, or
+           None'''
+        m = self.regex.match(string)
+        if m is None:
+            return None
+        branch = self._branches[m.lastgroup]
+        return BranchMatch(m, branch.name, branch)
+
+
+class _SequentialAlternation(object):
+    '''Alternation trying its patterns one after the other, used while the
+    patterns are profiled so that the time of each of them is recorded'''
+
+    def __init__(self, patterns, names):
+        self.names = list(names)
+        self._patterns = patterns
+        self._branches = {}
+        for name in names:
+            compiled = compile_pattern(*patterns.pattern(name))
+            self._branches[name] = _Branch(
+                name, {group: group for group in compiled.groupindex}, 0,
+                compiled.groups)
+
+    def match(self, string):
+        for name in self.names:
+            m = getattr(self._patterns, name).match(string)
+            if m:
+                return BranchMatch(m, name, self._branches[name])
+        return None
+
+
+class Patterns(object):
+    '''Regular expressions of a parser, compiled on first use
+
+    Patterns are given as keyword arguments, either as a string or as a
+    (string, flags) tuple, and read back compiled as attributes.
+    '''
+
+    def __init__(self, **patterns):
+        self._patterns = {}
+        for name, pattern in patterns.items():
+            if isinstance(pattern, tuple):
+                self._patterns[name] = pattern
+            else:
+                self._patterns[name] = (pattern, 0)
+        self.owner = None
+        # PatternProfiler recording the use of the patterns, if any
+        self.profiler = None
+        self._dispatcher = None
+        self._alternations = {}
+
+    def __set_name__(self, owner, name):
+        self.owner = '{m}.{c}'.format(m=owner.__module__, c=owner.__qualname__)
+        registry[self.owner] = self
+
+    def __getattr__(self, name):
+        # Only called for the patterns not compiled yet
+        try:
+            pattern, flags = self.__dict__['_patterns'][name]
+        except KeyError:
+            raise AttributeError(name)
+
+        compiled = compile_pattern(pattern, flags)
+        if self.profiler is not None:
+            compiled = self.profiler.wrap(self.owner, name, compiled)
+        setattr(self, name, compiled)
+        return compiled
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __repr__(self):
+        return '<Patterns of {o}: {n} patterns>'.format(o=self.owner,
+                                                        n=len(self))
+
+    def names(self):
+        '''The pattern names, in declaration order'''
+        return list(self._patterns)
+
+    def pattern(self, name):
+        '''The (pattern, flags) of a pattern name'''
+        return self._patterns[name]
+
+    def compile(self):
+        '''Compile all the patterns now'''
+        for name in self._patterns:
+            getattr(self, name)
+
+    def clear(self):
+        '''Drop the compiled patterns, they are compiled again on next use'''
+        for name in self._patterns:
+            self.__dict__.pop(name, None)
+        self._dispatcher = None
+        self._alternations = {}
+
+    def dispatch(self, line):
+        '''Return the compiled patterns which can match a line, see
+           LineDispatcher'''
+        if not DISPATCH:
+            return self
+
+        dispatcher = self._dispatcher
+        if dispatcher is None:
+            dispatcher = self._dispatcher = LineDispatcher(
+                {name: getattr(self, name) for name in self._patterns})
+
+        return dispatcher.dispatch(line)
+
+    def alternation(self, *names):
+        '''Return the Alternation of the given patterns, tried in this order'''
+        try:
+            return self._alternations[names]
+        except KeyError:
+            pass
+
+        if self.profiler is not None:
+            alternation = _SequentialAlternation(self, names)
+        else:
+            alternation = Alternation(
+                (name,) + self._patterns[name] for name in names)
+        self._alternations[names] = alternation
+        return alternation
@@ -0,0 +1,59 @@
+'''Flat records of the large table parsers
+
+The route, MAC address, ARP and BGP table parsers return a nested dict, such
+as vrf -> address_family -> routes -> route -> next_hop -> next_hop_list ->
+index, which for a table of a million entries is expensive to build and to
+walk. These parsers also have a `parse_records` mode, which yields one flat
+record per entry of the table as the lines of the output are read, without
+building the dict:
+
+    parser = ShowIpRoute(device=device)
+    for record in parser.parse_records(output=open('show_ip_route.txt')):
+        cursor.execute('INSERT INTO routes VALUES (?, ?, ?, ?, ...)', record)
+
+The records are named tuples, read as `record.next_hop`, inserted as is in a
+database or turned into a dict with `record._asdict()`. They hold the values
+of their entry in the dict returned by `parse()` along with the keys leading
+to it, the fields which the output does not give are None.
+
+The records are not validated against the schema of the parser, and lines
+of a single route detail, such as 'Routing entry for 10.4.1.0/24', are not
+part of a table and are left out.
+'''
+
+# python
+import collections
+
+
+def _record(name, fields):
+    '''Named tuple whose fields are None unless given'''
+    record = collections.namedtuple(name, fields)
+    record.__new__.__defaults__ = (None,) * len(record._fields)
+    return record
+
+
+# A next hop, or an outgoing interface when there is no next hop, of a route:
+# routes[route]['next_hop']['next_hop_list'][index] or
+# routes[route]['next_hop']['outgoing_interface'][outgoing_interface]
+RouteRecord = _record('RouteRecord', [
+    'vrf', 'address_family', 'route', 'active', 'source_protocol',
+    'source_protocol_codes', 'route_preference', 'metric', 'tag', 'index',
+    'next_hop', 'next_hop_vrf', 'outgoing_interface', 'updated'])
+
+# A MAC address of a vlan, on an interface or dropped; the entry_type of
+# IOSXE is given as mac_type and the protocols as a tuple
+MacRecord = _record('MacRecord', [
+    'vlan', 'mac_address', 'interface', 'drop', 'mac_type', 'entry', 'age',
+    'learn', 'secure', 'ntfy', 'protocols'])
+
+# An ARP entry, of an interface, or of the global static table when the
+# output does not give the interface
+ArpRecord = _record('ArpRecord', [
+    'interface', 'ip', 'mac_address', 'origin', 'age', 'encap_type',
+    'protocol', 'flags'])
+
+# A path of a BGP prefix:
+# address_family[address_family]['prefixes'][prefix]['index'][index]
+BgpRecord = _record('BgpRecord', [
+    'vrf', 'address_family', 'prefix', 'index', 'next_hop', 'status_codes',
+    'path_type', 'metric', 'localprf', 'weight', 'path', 'origin_codes'])
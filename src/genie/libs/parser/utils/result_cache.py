@@ -0,0 +1,245 @@
+'''Cache of parsed outputs keyed on the content of the output
+
+Pollers collect mostly static commands, such as `show version`, `show
+inventory` or `show vrf`, every cycle and most of the time get the same
+output back. A cache in front of `parse()` returns the result of the last
+parse of an identical output, for the cost of hashing it:
+
+    cache = MemoryResultCache(maxbytes=64 * 2 ** 20)
+    parsed = cache.parse(ShowVersion(device=device), output=output)
+
+The key is made of the device abstraction tokens, the parser class, its
+arguments and the sha256 of the output, so a parser resolved differently or
+given other arguments never shares a result. Results are held pickled,
+every hit returns a new copy of the result the caller is free to modify.
+
+`MemoryResultCache` keeps them in the process, `SqliteResultCache` in a
+SQLite file shared across processes and runs. Both evict the least recently
+used results once their pickled size goes over maxbytes.
+
+Only a string or bytes output is cached: without an output the parser
+executes the command on the device, and a file or iterable of lines can
+only be read once.
+'''
+
+# python
+import pickle
+import sqlite3
+import hashlib
+import threading
+import collections
+
+from genie.libs import parser
+
+from .common import _device_tokens
+
+ResultCacheInfo = collections.namedtuple('ResultCacheInfo',
+                        ['hits', 'misses', 'maxbytes', 'currbytes', 'currsize'])
+
+
+def result_key(parser_instance, output, kwargs):
+    ''' Return the key of the result of a parse.
+
+        Args:
+            parser_instance (`MetaParser`): the parser, bound to its device
+            output (`str`): the output parsed, str or bytes
+            kwargs (`dict`): the other arguments of parse()
+
+        Returns:
+            str: hex digest of the key
+    '''
+    if isinstance(output, str):
+        output = output.encode('utf-8', 'surrogatepass')
+    cls = type(parser_instance)
+    key = hashlib.sha256()
+    # A new version of the parsers may parse the same output differently
+    key.update(repr((parser.__version__,
+                     _device_tokens(parser_instance.device),
+                     cls.__module__, cls.__qualname__,
+                     sorted((name, repr(value))
+                            for name, value in kwargs.items()))).encode())
+    key.update(b'\0')
+    key.update(output)
+    return key.hexdigest()
+
+
+class ResultCache(object):
+    '''Parsed outputs keyed on the parser and the output, base of the
+    cache backends'''
+
+    def __init__(self, maxbytes=64 * 2 ** 20):
+        self.maxbytes = maxbytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def parse(self, parser_instance, output=None, **kwargs):
+        ''' Parse an output through the cache.
+
+            Args:
+                parser_instance (`MetaParser`): the parser, such as
+                                                ShowVersion(device=device)
+                output (`str`): the output, executed on the device if None
+                kwargs (`dict`): the other arguments of parse()
+
+            Returns:
+                dict: the parsed output, a copy when taken from the cache
+        '''
+        if not isinstance(output, (str, bytes)):
+            return parser_instance.parse(output=output, **kwargs)
+
+        key = result_key(parser_instance, output, kwargs)
+        data = self.get(key)
+        if data is not None:
+            return pickle.loads(data)
+
+        # Failed parses are raised as usual and not cached
+        result = parser_instance.parse(output=output, **kwargs)
+        self.put(key, pickle.dumps(result, pickle.HIGHEST_PROTOCOL))
+        return result
+
+    def get(self, key):
+        '''Return the pickled result of key, None if there is none'''
+        with self._lock:
+            data = self._get(key)
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return data
+
+    def put(self, key, data):
+        '''Cache the pickled result of key, evicting the least recently
+        used results over maxbytes'''
+        if not self.maxbytes or len(data) > self.maxbytes:
+            return
+        with self._lock:
+            self._put(key, data)
+
+    def clear(self):
+        '''Drop all the results and reset the statistics'''
+        with self._lock:
+            self._clear()
+            self.hits = self.misses = 0
+
+    def info(self):
+        '''Return the cache statistics'''
+        with self._lock:
+            currbytes, currsize = self._usage()
+            return ResultCacheInfo(self.hits, self.misses, self.maxbytes,
+                                   currbytes, currsize)
+
+    def _get(self, key):
+        raise NotImplementedError
+
+    def _put(self, key, data):
+        raise NotImplementedError
+
+    def _clear(self):
+        raise NotImplementedError
+
+    def _usage(self):
+        raise NotImplementedError
+
+
+class MemoryResultCache(ResultCache):
+    '''Parsed outputs held in the process, in LRU order'''
+
+    def __init__(self, maxbytes=64 * 2 ** 20):
+        super().__init__(maxbytes)
+        self._entries = collections.OrderedDict()
+        self._bytes = 0
+
+    def _get(self, key):
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        return data
+
+    def _put(self, key, data):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = data
+        self._bytes += len(data)
+        while self._bytes > self.maxbytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def _clear(self):
+        self._entries.clear()
+        self._bytes = 0
+
+    def _usage(self):
+        return self._bytes, len(self._entries)
+
+
+class SqliteResultCache(ResultCache):
+    '''Parsed outputs held in a SQLite file, in LRU order'''
+
+    def __init__(self, path, maxbytes=256 * 2 ** 20):
+        ''' Open the cache file, created if needed.
+
+            Args:
+                path (`str`): the SQLite file, ':memory:' for none
+                maxbytes (`int`): size of the pickled results kept
+        '''
+        super().__init__(maxbytes)
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False,
+                                   isolation_level=None)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS results ('
+                         'key TEXT PRIMARY KEY, data BLOB NOT NULL, '
+                         'size INTEGER NOT NULL, used INTEGER NOT NULL)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS results_used '
+                         'ON results (used)')
+
+    def _clock(self):
+        '''Next use count, ordering the results from the least recently
+        used, shared by the processes using the file'''
+        used, = self._db.execute(
+            'SELECT COALESCE(MAX(used), 0) + 1 FROM results').fetchone()
+        return used
+
+    def _get(self, key):
+        row = self._db.execute('SELECT data FROM results WHERE key = ?',
+                               (key,)).fetchone()
+        if row is None:
+            return None
+        self._db.execute('UPDATE results SET used = ? WHERE key = ?',
+                         (self._clock(), key))
+        return bytes(row[0])
+
+    def _put(self, key, data):
+        with self._db:
+            self._db.execute('BEGIN IMMEDIATE')
+            self._db.execute('INSERT OR REPLACE INTO results '
+                             '(key, data, size, used) VALUES (?, ?, ?, ?)',
+                             (key, sqlite3.Binary(data), len(data),
+                              self._clock()))
+            total, = self._db.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM results').fetchone()
+            if total <= self.maxbytes:
+                return
+            evicted = []
+            for old_key, size in self._db.execute(
+                    'SELECT key, size FROM results ORDER BY used'):
+                if total <= self.maxbytes:
+                    break
+                evicted.append((old_key,))
+                total -= size
+            self._db.executemany('DELETE FROM results WHERE key = ?',
+                                 evicted)
+
+    def _clear(self):
+        self._db.execute('DELETE FROM results')
+
+    def _usage(self):
+        return self._db.execute('SELECT COALESCE(SUM(size), 0), COUNT(*) '
+                                'FROM results').fetchone()
+
+    def close(self):
+        '''Close the cache file'''
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,262 @@
+'''Collection session caching the outputs and parsed results of a device
+
+Some parsers execute other commands or call other parsers behind the
+caller's back: `ShowBgpSummarySuperParser` on iosxe parses `show vrf` and
+executes `show run | sec address-family ...`, `ShowRunningConfigVrf` on nxos
+parses `show vrf`, `ShowOspfVrfAllInclusiveInterface` on iosxr parses the
+virtual links once per area. Over a sweep of the commands of a device, the
+same commands are executed again and again.
+
+A session holds each output and parsed result for its lifetime, and hands
+the parsers a device which executes each command once:
+
+    with CollectionSession(device) as session:
+        summary = session.parse('show ip bgp all summary')
+        vrfs = session.parse(ShowVrf)
+        config = session.execute('show running-config')
+
+The parsers call their nested parsers through `nested_parse`, which takes
+the result from the session of the device when there is one:
+
+    vrfs = nested_parse(ShowVrf, self.device)
+
+Parsers executing other commands declare them with `prerequisites()`,
+given the arguments of the parser, so `collect_and_parse` executes the
+commands of all the parsers and the ones they need in one batch before
+parsing them:
+
+    results, errors = collect_and_parse(device, ['show ip bgp all summary',
+                                                 'show vrf'])
+
+The outputs may go stale as the device changes, a session is meant to last
+one collection sweep.
+'''
+
+# python
+import copy
+import threading
+import collections
+
+from .common import get_parser, get_parsers
+
+
+class SessionDevice(object):
+    '''Device of a session, executing each command once and delegating
+    everything else to the device'''
+
+    def __init__(self, device, session):
+        self.__dict__['device'] = device
+        self.__dict__['session'] = session
+
+    def execute(self, command, **kwargs):
+        return self.session.execute(command, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.device, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.device, name, value)
+
+
+class CollectionSession(object):
+    '''Outputs and parsed results of the commands of a device'''
+
+    def __init__(self, device):
+        ''' Start a session.
+
+            Args:
+                device (`Device`): the device to collect from
+        '''
+        self.device = SessionDevice(device, self)
+        # Round trips to the device
+        self.executed = 0
+        self._outputs = {}
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.clear()
+
+    def execute(self, command, **kwargs):
+        ''' Return the output of a command, only executed on the device the
+            first time.
+
+            Args:
+                command (`str`): the command
+                kwargs (`dict`): arguments of the device execute
+        '''
+        if not isinstance(command, str):
+            return self.device.device.execute(command, **kwargs)
+
+        key = ' '.join(command.split())
+        with self._lock:
+            if key in self._outputs:
+                return self._outputs[key]
+
+        output = self.device.device.execute(command, **kwargs)
+        with self._lock:
+            self.executed += 1
+            return self._outputs.setdefault(key, output)
+
+    def execute_many(self, commands):
+        ''' Execute the commands not executed yet in one batch, sent to the
+            device as one list.
+
+            Args:
+                commands (`list`): the commands
+
+            Returns:
+                dict: the output of each command
+        '''
+        with self._lock:
+            missing = list(collections.OrderedDict.fromkeys(
+                command for command in commands
+                if ' '.join(command.split()) not in self._outputs))
+
+        if len(missing) > 1:
+            outputs = self.device.device.execute(missing)
+            if isinstance(outputs, dict):
+                with self._lock:
+                    self.executed += 1
+                    for command in missing:
+                        if command in outputs:
+                            self._outputs.setdefault(
+                                ' '.join(command.split()), outputs[command])
+        # Devices not taking a list get the commands one at a time
+
+        return {command: self.execute(command) for command in commands}
+
+    def parse(self, parser, output=None, **kwargs):
+        ''' Return the parsed output of a parser, only parsed the first time.
+
+            Args:
+                parser (`str`): the command, or the parser class
+                output (`str`): the output, executed through the session if
+                                None
+                kwargs (`dict`): arguments of the parser
+
+            Returns:
+                dict: a copy of the parsed output
+        '''
+        if isinstance(parser, str):
+            parser, command_kwargs = get_parser(parser, self.device)
+            command_kwargs.update(kwargs)
+            kwargs = command_kwargs
+
+        # An output given is not the one of the device
+        if output is not None:
+            return parser(device=self.device).parse(output=output, **kwargs)
+
+        key = (parser, tuple(sorted((name, repr(value))
+                                    for name, value in kwargs.items())))
+        with self._lock:
+            result = self._results.get(key)
+        if result is None:
+            # Failed parses are raised every time
+            result = parser(device=self.device).parse(**kwargs)
+            with self._lock:
+                result = self._results.setdefault(key, result)
+
+        return copy.deepcopy(result)
+
+    def clear(self):
+        '''Drop the outputs and parsed results'''
+        with self._lock:
+            self._outputs.clear()
+            self._results.clear()
+
+
+def nested_parse(parser_cls, device, **kwargs):
+    ''' Parse the output of a command from within another parser, taken from
+        the session of the device if it is in one.
+
+        Args:
+            parser_cls (`class`): the parser
+            device (`Device`): the device of the calling parser
+            kwargs (`dict`): arguments of the parser
+
+        Returns:
+            dict: the parsed output
+    '''
+    if isinstance(device, SessionDevice):
+        return device.session.parse(parser_cls, **kwargs)
+    return parser_cls(device=device).parse(**kwargs)
+
+
+def prerequisites(parser_cls, device, **kwargs):
+    ''' Return the commands a parser executes besides its own command.
+
+        Args:
+            parser_cls (`class`): the parser
+            device (`Device`): the device
+            kwargs (`dict`): arguments of the parser
+
+        Returns:
+            list: the commands declared by the parser, none if it does not
+                  declare them
+    '''
+    if not hasattr(parser_cls, 'prerequisites'):
+        return []
+    return list(parser_cls(device=device).prerequisites(**kwargs))
+
+
+def collect_and_parse(device, commands, session=None):
+    ''' Execute show commands, with the commands their parsers need, in one
+        batch and parse them.
+
+        The commands declared by the parsers are added to the batch, with
+        the ones declared by their own parsers, and given back to the
+        parsers, nested ones included, through the session. A parser
+        executing a command it did not declare still gets it from the
+        device.
+
+        Args:
+            device (`Device`): the device
+            commands (`list`): the show commands
+            session (`CollectionSession`): the session to collect in, a new
+                                           one if None
+
+        Returns:
+            tuple: dict of command to parsed output, and dict of command to
+                   the exception raised for the others
+    '''
+    if session is None:
+        session = CollectionSession(device)
+
+    parsers, errors = get_parsers(commands, session.device)
+    batch = [command for command, _, _ in parsers]
+    declared = set()
+    pending = list(parsers)
+
+    while pending:
+        command, parser_cls, kwargs = pending.pop(0)
+        try:
+            needed = prerequisites(parser_cls, session.device, **kwargs)
+        except Exception as e:
+            errors.setdefault(command, e)
+            continue
+
+        needed = [need for need in needed
+                  if need not in declared and need not in batch]
+        declared.update(needed)
+        batch.extend(needed)
+
+        # Parsers of the commands needed may need others, the commands
+        # without parser are only executed
+        pending.extend(get_parsers(needed, session.device)[0])
+
+    session.execute_many(batch)
+
+    results = {}
+    for command, parser_cls, kwargs in parsers:
+        if command in errors:
+            continue
+        try:
+            results[command] = session.parse(parser_cls, **kwargs)
+        except Exception as e:
+            errors[command] = e
+
+    return results, errors
@@ -0,0 +1,56 @@
+import os
+import json
+import atexit
+import shutil
+import tempfile
+import collections
+
+from genie.libs import parser
+from genie.libs.parser.utils import entry_points
+
+# Keep the entry points found by the tests out of the user's cache
+_cache_directory = tempfile.mkdtemp()
+atexit.register(shutil.rmtree, _cache_directory, True)
+entry_points.ENTRY_POINT_CACHE = os.path.join(_cache_directory,
+                                              'parser_entry_points.json')
+
+# A golden output of the unittests of a parser, such as golden_output_1
+Golden = collections.namedtuple('Golden', ['name', 'path', 'output',
+                                           'arguments', 'expected'])
+
+
+def golden(os_name, class_name, name):
+    ''' Golden output of a parser, from its cli/equal unittest folder
+
+        Args:
+            os_name (`str`): os of the parser, such as 'nxos'
+            class_name (`str`): class of the parser, such as 'ShowVrf'
+            name (`str`): name of the golden output, such as
+                          'golden_output_1'
+
+        Returns:
+            Golden: the output, the arguments of the parser and the
+                    expected parsed output
+    '''
+    stem = os.path.join(os.path.dirname(parser.__file__), os_name, 'tests',
+                        class_name, 'cli', 'equal', name)
+    with open(stem + '_output.txt') as f:
+        output = f.read()
+    expected = {}
+    with open(stem + '_expected.py') as f:
+        exec(f.read(), expected)
+    arguments = {}
+    if os.path.exists(stem + '_arguments.json'):
+        with open(stem + '_arguments.json') as f:
+            arguments = json.load(f)
+    return Golden(name, stem + '_output.txt', output, arguments,
+                  expected['expected_output'])
+
+
+def goldens(os_name, class_name):
+    ''' Golden outputs of a parser, by name'''
+    folder = os.path.join(os.path.dirname(parser.__file__), os_name, 'tests',
+                          class_name, 'cli', 'equal')
+    for name in sorted(os.listdir(folder)):
+        if name.endswith('_output.txt'):
+            yield golden(os_name, class_name, name[:-len('_output.txt')])
@@ -0,0 +1,184 @@
+import os
+import io
+import json
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from genie.libs import parser
+from genie.libs.parser.utils.backtracking import PatternSource, \
+                                                 extract_patterns, \
+                                                 golden_lines, scan, \
+                                                 scan_pattern, variants, \
+                                                 compare_baseline, growth, \
+                                                 report, main, confirm, \
+                                                 load_baseline, BASELINE, \
+                                                 DEFAULT_TIMEOUT, \
+                                                 DEFAULT_MIN_SECONDS
+
+MODULE = r"""
+import re
+from genie.libs.parser.utils.patterns import Patterns
+
+
+class ShowThing(object):
+
+    patterns = Patterns(
+        p1=r'^Interface +(?P<name>\S+)$',
+        p2=(r'^mtu +(?P<mtu>\d+)$', re.I),
+    )
+
+    def cli(self, output):
+        p3 = re.compile(r'^(?P<words>[\w\s]+)+ +end$', re.I | re.M)
+        if re.match(r'^ *Total +(\d+)', output):
+            pass
+        name = re.compile(pattern_name)
+"""
+
+# Quadratic: every start of the run of spaces is tried to the end of the line
+QUADRATIC = PatternSource('module.py', 1, 'os', 'ShowThing', 'p1',
+                          r'^Total\s+(?P<words>[\w\s]+)\s+count$', 0,
+                          'match')
+LINEAR = PatternSource('module.py', 2, 'os', 'ShowThing', 'p2',
+                       r'^Total +(?P<count>\d+) +(?P<name>\S+)$', 0,
+                       'match')
+
+
+class TestBacktracking(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+        os.makedirs(os.path.join(self.root, 'os', 'tests', 'ShowThing',
+                                 'cli', 'equal'))
+        with open(os.path.join(self.root, 'os', 'show_thing.py'), 'w') as f:
+            f.write(MODULE)
+        with open(os.path.join(self.root, 'os', 'tests', 'ShowThing', 'cli',
+                               'equal', 'golden_output_output.txt'),
+                  'w') as f:
+            f.write('Interface Ethernet1/1\n  mtu 1500\n')
+
+    def test_extract_patterns(self):
+        sources = extract_patterns(self.root)
+        self.assertEqual(
+            [(source.name, source.pattern, source.flags, source.method)
+                for source in sources],
+            [('p1', r'^Interface +(?P<name>\S+)$', 0, 'match'),
+             ('p2', r'^mtu +(?P<mtu>\d+)$', 2, 'match'),
+             ('p3', r'^(?P<words>[\w\s]+)+ +end$', 2 | 8, 'match'),
+             ('line 15', r'^ *Total +(\d+)', 0, 'match')])
+        for source in sources:
+            self.assertEqual((source.path, source.os, source.class_name),
+                             (os.path.join('os', 'show_thing.py'), 'os',
+                              'ShowThing'))
+        self.assertEqual(extract_patterns(self.root, os_names=['other']), [])
+
+    def test_golden_lines(self):
+        self.assertEqual(golden_lines(self.root),
+                         {('os', 'ShowThing'): ['Interface Ethernet1/1',
+                                                '  mtu 1500']})
+
+    def test_golden_corpus(self):
+        root = os.path.dirname(parser.__file__)
+        sources = extract_patterns(
+            root, paths=[os.path.join('nxos', 'show_bgp.py')])
+        self.assertIn('p3_3', [source.name for source in sources])
+        self.assertTrue(golden_lines(root, ['nxos'])[
+            ('nxos', 'ShowBgpVrfAllAll')])
+
+    def test_variants(self):
+        families = dict(variants(r'^Total +(?P<count>\d+)', 0,
+                                 ['Total 12 routes']))
+        self.assertEqual(families['seed0 tail'](30),
+                         'Total 12 routes' + ' routes' * 3 + '!')
+        self.assertEqual(families['letters'](10), 'Total aaaa!')
+        for family in families.values():
+            self.assertGreaterEqual(len(family(256)), 256)
+
+    def test_growth(self):
+        self.assertAlmostEqual(growth([(100, 1.0), (200, 4.0)]), 2)
+        self.assertAlmostEqual(growth([(100, 1.0), (200, 2.0)]), 1)
+        self.assertIsNone(growth([(100, 1.0)]))
+
+    def test_scan_pattern(self):
+        finding = scan_pattern(QUADRATIC, min_seconds=0.0005)
+        self.assertIsNotNone(finding)
+        self.assertGreater(finding['exponent'], 1.5)
+        self.assertIsNone(scan_pattern(LINEAR, min_seconds=0.0005))
+
+    def test_scan_pattern_methods(self):
+        # Timed as the scan they do through the whole line
+        for method in ('sub', 'subn', 'finditer', 'split', 'search'):
+            source = PatternSource('module.py', 1, 'os', None, 'p1',
+                                   QUADRATIC.pattern, 0, method)
+            self.assertIsNotNone(scan_pattern(source, min_seconds=0.0005),
+                                 method)
+
+    def test_scan_timeout(self):
+        exponential = PatternSource('module.py', 3, 'os', None, 'p3',
+                                    r'^(a|a)+$', 0, 'match')
+        findings = scan([LINEAR, exponential], processes=1, timeout=2)
+        self.assertEqual([finding['name'] for finding in findings], ['p3'])
+        self.assertTrue(findings[0]['timeout'])
+        self.assertIn('timeout', report(findings))
+
+    def test_compare_baseline(self):
+        finding = dict(QUADRATIC.to_dict(), key=QUADRATIC.key)
+        self.assertEqual(compare_baseline([finding], {'findings': []}),
+                         [finding])
+        self.assertEqual(compare_baseline([finding],
+                                          {'findings': [finding]}), [])
+        # Moved within its module
+        moved = PatternSource(QUADRATIC.path, 10, 'os', 'ShowThing', 'p1',
+                              QUADRATIC.pattern, 0, 'match')
+        self.assertEqual(moved.key, QUADRATIC.key)
+
+    def test_confirm(self):
+        finding = scan_pattern(QUADRATIC, min_seconds=0.0005)
+        finding = dict(finding, key=QUADRATIC.key)
+        confirmed = confirm([finding], [LINEAR, QUADRATIC], processes=0,
+                            min_seconds=0.0005, factor=1)
+        self.assertEqual([found['key'] for found in confirmed],
+                         [QUADRATIC.key])
+        # Not as slow as the higher minimum
+        self.assertEqual(confirm([finding], [LINEAR, QUADRATIC], processes=0,
+                                 min_seconds=0.0005, factor=10 ** 6), [])
+
+    def test_main(self):
+        path = os.path.join(self.root, 'baseline.json')
+        with open(path, 'w') as f:
+            json.dump({'findings': []}, f)
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['--module', os.path.join('nxos', 'show_feature.py'),
+                         '--processes', '0', '--json', '--baseline', path])
+        self.assertIsNone(code)
+        results = json.loads(out.getvalue())
+        self.assertGreater(results['patterns'], 0)
+        self.assertEqual(results['findings'], [])
+        self.assertEqual(results['options']['timeout'], DEFAULT_TIMEOUT)
+
+    @unittest.skipUnless(os.path.exists(BASELINE),
+                         'not run from the source checkout')
+    def test_baseline(self):
+        baseline = load_baseline()
+        self.assertTrue(baseline['findings'])
+        # Made with the default options, as make backtracking_baseline does
+        self.assertEqual(baseline['options']['timeout'], DEFAULT_TIMEOUT)
+        self.assertEqual(baseline['options']['min_seconds'],
+                         DEFAULT_MIN_SECONDS)
+        path = os.path.join('asa', 'show_inventory.py')
+        self.assertIn(path, [finding['path']
+                                for finding in baseline['findings']])
+
+        # Its patterns are all known to backtrack, one past the timeout
+        out = io.StringIO()
+        with redirect_stdout(out):
+            code = main(['--module', path, '--processes', '0', '--json'])
+        self.assertIsNone(code)
+        self.assertEqual(json.loads(out.getvalue())['patterns'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from genie.libs.parser.utils.benchmark import (
+    percentile,
+    lookup_queries,
+    bench_lookup,
+    compare_baseline
+)
+
+
+class TestLookupBenchmark(unittest.TestCase):
+
+    def test_percentile(self):
+        timings = list(range(1, 101))
+        self.assertEqual(percentile(timings, 50), 50)
+        self.assertEqual(percentile(timings, 99), 99)
+        self.assertEqual(percentile([3], 99), 3)
+        self.assertIsNone(percentile([], 50))
+
+    def test_lookup_queries(self):
+        self.assertEqual(lookup_queries('show version'),
+                         [('exact', 'show version'), ('regex', 'show .*')])
+        self.assertEqual(lookup_queries('show ip route vrf {vrf}'),
+                         [('arguments', 'show ip route vrf argument'),
+                          ('regex', 'show ip route vrf .*')])
+
+    def test_bench_lookup(self):
+        results = bench_lookup(['nxos'], step=200)
+        self.assertEqual(results['os'], ['nxos'])
+        for name in ['get_parser_commands',
+                     'fuzzy_search_command[exact]',
+                     'fuzzy_search_command_fuzzy[regex]',
+                     'get_parser_fuzzy[regex]']:
+            result = results['results'][name]
+            self.assertLessEqual(result['p50'], result['p99'])
+
+    def test_compare_baseline(self):
+        baseline = {'results': {'get_parser[exact]': {'p50': 1.0, 'p99': 2.0},
+                                'removed': {'p50': 1.0, 'p99': 1.0}}}
+        results = {'results': {'get_parser[exact]': {'p50': 1.2, 'p99': 4.0},
+                               'added': {'p50': 9.0, 'p99': 9.0}}}
+        self.assertEqual(compare_baseline(results, baseline),
+                         [('get_parser[exact]', 'p99', 2.0, 4.0)])
+        self.assertEqual(compare_baseline(results, baseline, tolerance=2), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
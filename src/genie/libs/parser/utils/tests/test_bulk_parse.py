@@ -0,0 +1,132 @@
+import io
+import os
+import json
+import shutil
+import tarfile
+import tempfile
+import unittest
+import concurrent.futures
+
+from genie.libs.parser.utils.bulk_parse import bulk_parse, command_of, \
+                                              done_files, iter_captures, main
+
+SHOW_VRF = '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+default                                 1 Up      --
+'''
+
+FILES = {
+    'R1/nxos/show vrf.txt': SHOW_VRF,
+    'R1/nxos/show_vrf_all.txt': '',
+    'R2/nxos/show_vrf.txt': SHOW_VRF,
+    'R2/nxos/show nothing.txt': 'nothing',
+    'R2/nxos/notes.md': 'not a capture',
+}
+
+
+def _lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestBulkParse(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.archive = os.path.join(self.directory, 'archive')
+        for name, output in FILES.items():
+            path = os.path.join(self.archive, *name.split('/'))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(output)
+        self.output = os.path.join(self.directory, 'parsed.jsonl')
+        self.executor = concurrent.futures.ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def _tarball(self):
+        path = os.path.join(self.directory, 'captures.tar.gz')
+        with tarfile.open(path, 'w:gz') as tar:
+            for name, output in FILES.items():
+                data = output.encode()
+                info = tarfile.TarInfo('captures/' + name)
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+        return path
+
+    def test_command_of(self):
+        self.assertEqual(command_of('show_ip_route.txt'), 'show ip route')
+        self.assertEqual(command_of('show ip route vrf my_vrf.txt'),
+                         'show ip route vrf my_vrf')
+
+    def test_iter_captures(self):
+        captures = list(iter_captures(self.archive))
+        self.assertEqual([(c.device, c.os, c.command) for c in captures],
+                         [('R1', 'nxos', 'show vrf'),
+                          ('R1', 'nxos', 'show vrf all'),
+                          ('R2', 'nxos', 'show nothing'),
+                          ('R2', 'nxos', 'show vrf')])
+        self.assertTrue(all(c.output is None for c in captures))
+
+        captures = list(iter_captures(self._tarball()))
+        self.assertEqual(len(captures), 4)
+        self.assertEqual({c.output for c in captures if c.device == 'R2'},
+                         {SHOW_VRF, 'nothing'})
+
+    def test_bulk_parse(self):
+        summary = bulk_parse([self.archive, self._tarball()], self.output,
+                             chunk=1, executor=self.executor)
+        self.assertEqual((summary['parsed'], summary['errors'],
+                          summary['skipped']), (4, 4, 0))
+
+        lines = {(line['file'].startswith(self.archive), line['device'],
+                  line['command']): line for line in _lines(self.output)}
+        self.assertEqual(len(lines), 8)
+        parsed = lines[(True, 'R2', 'show vrf')]
+        self.assertEqual(set(parsed['parsed']['vrfs']), {'VRF1', 'default'})
+        self.assertIsNone(parsed['error'])
+        # Empty output, and a command without parser
+        self.assertIn('SchemaEmptyParserError',
+                      lines[(False, 'R1', 'show vrf all')]['error'])
+        self.assertIsNone(lines[(False, 'R2', 'show nothing')]['parsed'])
+        self.assertTrue(lines[(False, 'R2', 'show nothing')]['error'])
+
+    def test_resume(self):
+        bulk_parse([self.archive], self.output, executor=self.executor)
+        with open(self.output) as f:
+            lines = f.readlines()
+        # Interrupted in the middle of the third line
+        with open(self.output, 'w') as f:
+            f.writelines(lines[:2])
+            f.write(lines[2][:10])
+
+        self.assertEqual(len(done_files(self.output)), 2)
+        with open(self.output) as f:
+            self.assertEqual(f.readlines(), lines[:2])
+
+        summary = bulk_parse([self.archive], self.output, resume=True,
+                             executor=self.executor)
+        self.assertEqual(summary['skipped'], 2)
+        self.assertEqual(summary['parsed'] + summary['errors'], 2)
+        self.assertEqual(sorted(line['file'] for line in _lines(self.output)),
+                         sorted(json.loads(line)['file'] for line in lines))
+
+    def test_processes(self):
+        summary = bulk_parse([self.archive], self.output, processes=2,
+                             chunk=2)
+        self.assertEqual((summary['parsed'], summary['errors']), (2, 2))
+
+    def test_main(self):
+        self.assertEqual(main([self.archive, '-o', self.output,
+                               '--processes', '1']), 0)
+        self.assertEqual(len(_lines(self.output)), 4)
+        self.assertEqual(main([os.path.join(self.archive, 'R1', 'nxos',
+                                            'show vrf.txt'),
+                               '-o', self.output]), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
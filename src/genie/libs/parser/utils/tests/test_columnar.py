@@ -0,0 +1,117 @@
+import array
+import unittest
+import importlib
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.records import RouteRecord, BgpRecord
+from genie.libs.parser.utils.columnar import Columns, parse_columns, \
+                                             MISSING, NOT_PREFIX
+from genie.libs.parser.utils.benchmark import bench_columnar
+from genie.libs.parser.utils.tests import goldens
+from genie.libs.parser.utils.tests.test_records import RECORD_PARSERS
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestColumns(unittest.TestCase):
+
+    def test_parsers(self):
+        for os_name, module, class_name, _, _ in RECORD_PARSERS:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            for golden in goldens(os_name, class_name):
+                msg = '{} {} {}'.format(os_name, class_name, golden.name)
+                records = list(parser_cls(device=Mock()).parse_records(
+                    output=golden.output, **golden.arguments))
+                columns = parse_columns(parser_cls(device=Mock()),
+                                        output=golden.output,
+                                        **golden.arguments)
+                self.assertEqual(len(columns), len(records), msg)
+                self.assertEqual(list(columns), records, msg)
+                self.assertEqual(columns[-1], records[-1], msg)
+
+    def test_prefixes(self):
+        prefixes = ['10.1.2.0/24', '0.0.0.0/0', '2001:db8::/32', '::/0',
+                    '2001:DB8::/32', '10.1.2.0', '10.1.2.0/33', '[2]:[0]:[0]',
+                    '010.1.2.0/24']
+        columns = Columns(BgpRecord, [BgpRecord(prefix=prefix)
+                                      for prefix in prefixes])
+        self.assertEqual(columns.values('prefix'), prefixes)
+        self.assertEqual(list(columns.columns['prefix_length']),
+                         [24, 0, 32, 0] + [NOT_PREFIX] * 5)
+        # IPv4 mapped into IPv6
+        self.assertEqual(columns.columns['prefix_high'][0], 0)
+        self.assertEqual(columns.columns['prefix_low'][0], 0xffff0a010200)
+        self.assertEqual(columns.columns['prefix_high'][2],
+                         0x20010db800000000)
+        self.assertEqual(list(columns.columns['prefix_family']),
+                         [4, 4, 6, 6] + [0] * 5)
+
+    def test_mapped_prefixes(self):
+        # IPv6 prefixes in the range of the mapped IPv4 addresses stay IPv6
+        prefixes = ['::ffff:10.0.0.0/104', '10.0.0.0/8', '::ffff:0.0.0.0/96']
+        columns = Columns(RouteRecord, [RouteRecord(route=prefix)
+                                        for prefix in prefixes])
+        self.assertEqual(columns.values('route'), prefixes)
+        self.assertEqual(columns.columns['route_low'][0],
+                         columns.columns['route_low'][1])
+        self.assertEqual(list(columns.columns['route_family']), [6, 4, 6])
+
+    def test_kinds(self):
+        columns = Columns(RouteRecord, [
+            RouteRecord(route='10.0.0.0/8', active=True, metric=20,
+                        source_protocol='ospf', next_hop='10.1.1.1'),
+            RouteRecord(route='10.0.0.0/8', active=False,
+                        source_protocol='ospf', next_hop='10.1.1.2')])
+        self.assertEqual(columns.columns['active'],
+                         array.array('b', [1, 0]))
+        self.assertEqual(columns.columns['metric'],
+                         array.array('q', [20, MISSING]))
+        # The values are stored once
+        self.assertEqual(columns.strings,
+                         [None, 'ospf', '10.1.1.1', '10.1.1.2'])
+        self.assertEqual(columns.value('metric', 1), None)
+        self.assertIs(columns.value('active', 1), False)
+
+        taken = columns.take([1])
+        self.assertEqual(list(taken), [columns[1]])
+        with self.assertRaises(IndexError):
+            taken[1]
+        # The taken columns have their own strings
+        taken.append(RouteRecord(route='10.0.0.0/8', source_protocol='bgp'))
+        self.assertEqual(taken.values('source_protocol'), ['ospf', 'bgp'])
+        self.assertEqual(columns.strings,
+                         [None, 'ospf', '10.1.1.1', '10.1.1.2'])
+        self.assertNotIn('bgp', columns._index)
+
+    def test_empty(self):
+        with self.assertRaises(SchemaEmptyParserError):
+            parse_columns(ShowIpRoute(device=Mock()), output='')
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self):
+        columns = Columns(RouteRecord, [
+            RouteRecord(route='10.{}.0.0/16'.format(number), metric=number,
+                        source_protocol='ospf' if number % 2 else 'bgp')
+            for number in range(10)])
+        arrays = columns.to_numpy()
+        ospf = columns.strings.index('ospf')
+        selected = numpy.flatnonzero((arrays['source_protocol'] == ospf) &
+                                     (arrays['metric'] > 4))
+        self.assertEqual(columns.take(selected).values('metric'), [5, 7, 9])
+
+    def test_bench_columnar(self):
+        result = bench_columnar(routes=2000)
+        self.assertGreater(result['reduction'], 5)
+        self.assertLess(result['columns']['arrays'], 100 * 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
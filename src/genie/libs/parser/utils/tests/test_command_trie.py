@@ -0,0 +1,125 @@
+import unittest
+
+from genie.libs.parser.utils.common import (
+    CommandTrie,
+    _matches_fuzzy,
+    _fuzzy_search_command,
+    parser_data
+)
+from genie.libs.parser.utils.index import ParserData
+
+
+class TestCommandTrie(unittest.TestCase):
+
+    def setUp(self):
+        self.data = {
+            'show version': {},
+            'show version {arg}': {},
+            'show ip route': {},
+            'show ip route vrf {vrf}': {},
+            'show ip route vrf {vrf} {protocol}': {},
+            'show bgp instance {instance} all all summary': {},
+            '/dna/intent/api/v1/interface/{interface}': {},
+        }
+        self.trie = CommandTrie(self.data)
+
+    def test_search_prefix(self):
+        self.assertEqual(self.trie.search('sh ver'.split()),
+                         ['show version'])
+        self.assertEqual(self.trie.search('s ip ro'.split()),
+                         ['show ip route'])
+        self.assertEqual(self.trie.search('show xyz'.split()), [])
+        self.assertEqual(self.trie.search([]), [])
+
+    def test_search_arguments(self):
+        self.assertEqual(self.trie.search('sh ver blue'.split()),
+                         ['show version {arg}'])
+        self.assertEqual(self.trie.search('sh ip ro vrf blue'.split()),
+                         ['show ip route vrf {vrf}'])
+        self.assertEqual(self.trie.search('sh ip ro vrf a b'.split()),
+                         ['show ip route vrf {vrf}',
+                          'show ip route vrf {vrf} {protocol}'])
+        self.assertEqual(self.trie.search('sh ip ro vrf a b c'.split()),
+                         ['show ip route vrf {vrf} {protocol}'])
+        self.assertEqual(
+            self.trie.search(['/dna/intent/api/v1/interface/argument']),
+            ['/dna/intent/api/v1/interface/{interface}'])
+
+    def test_search_regex(self):
+        self.assertEqual(self.trie.search('sh ip .*'.split(), True),
+                         ['show ip route',
+                          'show ip route vrf {vrf}',
+                          'show ip route vrf {vrf} {protocol}'])
+        self.assertEqual(len(self.trie.search('.*'.split(), True)),
+                         len(self.data))
+
+    def test_search_added_commands(self):
+        self.assertEqual(self.trie.search('sh clock'.split()), [])
+        self.data['show clock'] = {}
+        self.assertEqual(self.trie.search('sh clock'.split()), ['show clock'])
+
+    def test_search_replaced_commands(self):
+        data = ParserData(data=self.data)
+        trie = CommandTrie(data)
+        self.assertEqual(trie.search('sh ver'.split()), ['show version'])
+        # Same number of commands
+        del data['show version']
+        data['show clock'] = {}
+        self.assertEqual(trie.search('sh ver'.split()), [])
+        self.assertEqual(trie.search('sh clock'.split()), ['show clock'])
+
+    def test_search_superset(self):
+        trie = CommandTrie(parser_data)
+        for search, fuzzy in [('sh ver', False),
+                              ('sh ip route vrf blue', False),
+                              ('sh bgp vrf X all neighbors Y advertised-routes',
+                                                                        False),
+                              ('sh .* vrf', True),
+                              ('s e \\| .* p', True)]:
+            tokens = search.split()
+            candidates = set(trie.search(tokens, fuzzy))
+            for command in parser_data:
+                if _matches_fuzzy(0, 0, tokens.copy(), command, {}, fuzzy):
+                    self.assertIn(command, candidates, search)
+
+    def test_match(self):
+        self.assertEqual(self.trie.match('sh ver'.split()),
+                         [('show version', {}, 200)])
+        self.assertEqual(self.trie.match('show ip route vrf blue'.split()),
+                         [('show ip route vrf {vrf}', {'vrf': 'blue'}, 508)])
+        self.assertEqual(self.trie.match('sh ip ro vrf a b'.split()),
+                         [('show ip route vrf {vrf} {protocol}',
+                           {'vrf': 'a', 'protocol': 'b'}, 604)])
+        self.assertEqual(
+            self.trie.match(['/dna/intent/api/v1/interface/Gi1']),
+            [('/dna/intent/api/v1/interface/{interface}',
+              {'interface': 'Gi1'}, 103)])
+        self.assertEqual(self.trie.match('sh ip .*'.split()), [])
+
+    def test_match_same_as_matches_fuzzy(self):
+        trie = CommandTrie(parser_data)
+        for search in ['sh ver',
+                       'show ip route vrf blue',
+                       'sh bgp vrf X all neighbors Y advertised-routes',
+                       'show interface GigabitEthernet1 detail',
+                       'show lisp all instance-id 1 ipv4 server summary',
+                       'show platform software fed switch active acl']:
+            tokens = search.split()
+            expected = []
+            for command in parser_data:
+                if command == 'tokens':
+                    continue
+                result = _matches_fuzzy(0, 0, tokens.copy(), command, {},
+                                        False)
+                if result:
+                    expected.append((command,) + result)
+            self.assertEqual(trie.match(tokens), expected, search)
+
+    def test_search_command_unchanged(self):
+        results = _fuzzy_search_command('sh ver', False)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][0], 'show version')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common, entry_points
+from genie.libs.parser.utils.common import get_parser, get_parser_cache
+
+
+class TestDiscoverEntryPoints(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        cache = patch.object(entry_points, 'ENTRY_POINT_CACHE',
+                             os.path.join(directory, 'cache.json'))
+        cache.start()
+        self.addCleanup(cache.stop)
+
+    def test_discover_cached(self):
+        with patch.object(entry_points, '_scan_entry_points',
+                          return_value=[('mine', 'mine.parsers:load')]) as scan:
+            self.assertEqual(entry_points.discover_entry_points(),
+                             [('mine', 'mine.parsers:load')])
+            self.assertEqual(entry_points.discover_entry_points(),
+                             [('mine', 'mine.parsers:load')])
+            self.assertEqual(scan.call_count, 1)
+
+            entry_points.discover_entry_points(refresh=True)
+            self.assertEqual(scan.call_count, 2)
+
+    def test_discover_sys_path_changed(self):
+        with patch.object(entry_points, '_scan_entry_points',
+                          return_value=[]) as scan:
+            entry_points.discover_entry_points()
+            with patch.object(entry_points, '_sys_path_fingerprint',
+                              return_value=[]):
+                entry_points.discover_entry_points()
+            self.assertEqual(scan.call_count, 2)
+
+    def test_load_entry_point(self):
+        self.assertIs(entry_points._load_entry_point('os.path:join'),
+                      os.path.join)
+        self.assertIs(entry_points._load_entry_point('os.path:join [extra]'),
+                      os.path.join)
+
+    def test_load_entry_points(self):
+        parser = Mock()
+        with patch.object(entry_points, 'discover_entry_points',
+                          return_value=[('mine', 'mine.parsers:load')]), \
+             patch.object(entry_points, '_load_entry_point',
+                          return_value=lambda: {'nxos': [parser]}), \
+             patch.object(entry_points, 'add_parser') as add_parser:
+            entry_points.load_entry_points()
+            add_parser.assert_called_once_with(parser=parser, os_name='nxos')
+
+
+class TestDeferredEntryPoints(unittest.TestCase):
+
+    def setUp(self):
+        get_parser_cache.clear()
+        loaded = patch.object(entry_points, '_loaded', False)
+        loaded.start()
+        self.addCleanup(loaded.stop)
+        self.device = Mock(os='nxos', platform=None, model=None, custom={})
+
+    def test_loaded_on_first_lookup(self):
+        def load():
+            entry_points._loaded = True
+            # Overrides a command of this package
+            get_parser_cache.invalidate()
+
+        with patch.object(entry_points, 'load_entry_points',
+                          side_effect=load) as load_entry_points, \
+             patch.object(common, '_get_parser',
+                          return_value=('cls', {})) as _get_parser:
+            self.assertEqual(get_parser('show version', self.device),
+                             ('cls', {}))
+            get_parser('show version', self.device)
+            get_parser('show clock', self.device)
+            load_entry_points.assert_called_once_with()
+            self.assertEqual(_get_parser.call_count, 2)
+
+    def test_loaded_once(self):
+        with patch.object(entry_points, 'load_entry_points',
+                    side_effect=lambda: setattr(entry_points, '_loaded',
+                                                True)) as load:
+            self.assertTrue(entry_points.ensure_entry_points())
+            self.assertFalse(entry_points.ensure_entry_points())
+            self.assertEqual(load.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
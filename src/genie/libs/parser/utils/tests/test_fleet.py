@@ -0,0 +1,106 @@
+import asyncio
+import unittest
+import concurrent.futures
+
+from genie.libs.parser.utils.fleet import FleetPipeline, ReplayDevice, \
+                                         parse_fleet
+from genie.libs.parser.utils.benchmark import bench_fleet
+
+SHOW_VRF = '''
+VRF-Name                           VRF-ID State   Reason
+VRF1                                    3 Up      --
+default                                 1 Up      --
+'''
+
+
+def _devices(count, delay=0):
+    return [ReplayDevice('R{}'.format(number), 'nxos',
+                         {'show vrf': SHOW_VRF, 'show vrf VRF1': ''},
+                         delay=delay * (count - number))
+            for number in range(count)]
+
+
+class TestFleetPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = concurrent.futures.ThreadPoolExecutor(2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_ordered(self):
+        # The first devices are the slowest
+        results = parse_fleet(_devices(6, delay=0.01),
+                              ['show vrf', 'show vrf VRF1', 'show nothing'],
+                              executor=self.executor, concurrency=3)
+
+        self.assertEqual([result.device for result in results],
+                         ['R{}'.format(number) for number in range(6)])
+        for result in results:
+            self.assertEqual(set(result.parsed['show vrf']['vrfs']),
+                             {'VRF1', 'default'})
+            self.assertEqual(set(result.errors),
+                             {'show vrf VRF1', 'show nothing'})
+
+    def test_timeout(self):
+        devices = _devices(2)
+        devices.append(ReplayDevice('slow', 'nxos', {'show vrf': SHOW_VRF},
+                                    delay=5))
+        results = parse_fleet(devices, ['show vrf'], executor=self.executor,
+                              timeout=0.2)
+
+        self.assertEqual([result.device for result in results],
+                         ['R0', 'R1', 'slow'])
+        self.assertIn('show vrf', results[1].parsed)
+        self.assertIsInstance(results[2].errors['show vrf'],
+                              asyncio.TimeoutError)
+        self.assertLess(results[2].seconds, 1)
+
+    def test_backpressure(self):
+        in_flight = []
+
+        class CountingDevice(ReplayDevice):
+            async def execute(self, command):
+                in_flight.append(self.name)
+                try:
+                    return await super().execute(command)
+                finally:
+                    in_flight.remove(self.name)
+
+        devices = [CountingDevice('R{}'.format(number), 'nxos',
+                                  {'show vrf': SHOW_VRF}, delay=0.01)
+                   for number in range(10)]
+        most = []
+
+        async def consume(pipeline):
+            async for result in pipeline.results(devices):
+                most.append(len(in_flight))
+                # A slow consumer
+                await asyncio.sleep(0.02)
+
+        loop = asyncio.new_event_loop()
+        try:
+            with FleetPipeline(['show vrf'], executor=self.executor,
+                               concurrency=2) as pipeline:
+                loop.run_until_complete(consume(pipeline))
+        finally:
+            loop.close()
+
+        self.assertEqual(len(most), 10)
+        self.assertLessEqual(max(most), 2)
+
+    def test_processes(self):
+        results = parse_fleet(_devices(4), ['show vrf'], processes=2)
+        self.assertEqual([set(result.parsed['show vrf']['vrfs'])
+                          for result in results],
+                         [{'VRF1', 'default'}] * 4)
+
+    def test_bench_fleet(self):
+        results = bench_fleet(devices=4, delay=0, processes=(1, 2))
+        self.assertEqual([result['processes'] for result in results], [1, 2])
+        for result in results:
+            self.assertEqual(result['errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from genie.libs.parser.utils.common import (
     _fuzzy_search_command,
     parser_data
 )
+from genie.libs.parser.utils.benchmark import synthetic_search
 
 class TestFuzzyRegexSearchCommand(unittest.TestCase):
     def test_search_normal_arguments(self):
@@ -447,5 +448,22 @@ class TestFuzzyRegexSearchCommand(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0][0], 'show ipv6 prefix-list detail')
 
+    def test_memoized_subproblems(self):
+        # Spanning each argument over one or two tokens leads to the same
+        # subproblems, which must be compared once
+        for fuzzy in [False, True]:
+            sizes = []
+            for arguments in [8, 16]:
+                command, search = synthetic_search(arguments, fuzzy)
+                memo = {}
+                self.assertIsNone(_matches_fuzzy(0, 0, search.split(),
+                                    command, {}, fuzzy, None, 0, memo))
+                sizes.append(len(memo))
+            self.assertLessEqual(sizes[1], sizes[0] * 4)
+
+        self.assertEqual(_matches_fuzzy(0, 0, 'show t t t t'.split(),
+                        'show {a} {b} {c}', {}, False),
+                        ({'a': 't', 'b': 't', 'c': 't t'}, 402))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common
+from genie.libs.parser.utils.common import (
+    ParserCache,
+    get_parser,
+    get_parser_cache,
+    parser_class_cache,
+    _find_parser_cls,
+    _get_parser
+)
+from genie.libs.parser.utils.entry_points import add_parser
+
+
+class TestParserCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = ParserCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 1, 2))
+
+    def test_invalidate(self):
+        cache = ParserCache()
+        cache.put('a', 1)
+        cache.invalidate()
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.info().version, 1)
+
+
+class TestGetParserCache(unittest.TestCase):
+
+    def setUp(self):
+        get_parser_cache.clear()
+        self.device = Mock(os='nxos', platform=None, model=None, custom={})
+
+    def test_get_parser_memoized(self):
+        with patch.object(common, '_get_parser',
+                          return_value=('cls', {'vrf': 'blue'})) as resolve:
+            self.assertEqual(get_parser('show ip route vrf blue', self.device),
+                             ('cls', {'vrf': 'blue'}))
+            self.assertEqual(get_parser('show  ip route vrf blue',
+                                        self.device),
+                             ('cls', {'vrf': 'blue'}))
+
+            # Returned kwargs are copies
+            get_parser('show ip route vrf blue', self.device)[1]['vrf'] = 'x'
+            self.assertEqual(
+                get_parser('show ip route vrf blue', self.device)[1],
+                {'vrf': 'blue'})
+
+            self.assertEqual(resolve.call_count, 1)
+            info = get_parser_cache.info()
+            self.assertEqual((info.hits, info.misses), (3, 1))
+
+    def test_get_parser_key(self):
+        with patch.object(common, '_get_parser',
+                          return_value=('cls', {})) as resolve:
+            get_parser('show version', self.device)
+            get_parser('show version', Mock(os='iosxe', platform=None,
+                                            model=None, custom={}))
+            get_parser('show version', Mock(os='nxos', platform='aci',
+                                            model=None, custom={}))
+            self.assertEqual(resolve.call_count, 3)
+
+    def test_get_parser_invalidated_by_add_parser(self):
+        mock_parser = Mock(cli_command='show test_get_parser_cache')
+        mock_parser.__name__ = 'MockParser'
+        mock_parser.__module__ = __name__
+
+        with patch.object(common, '_get_parser',
+                          return_value=('cls', {})) as resolve:
+            get_parser('show version', self.device)
+            add_parser(parser=mock_parser, os_name='nxos')
+            get_parser('show version', self.device)
+            self.assertEqual(resolve.call_count, 2)
+
+        common.parser_data.pop('show test_get_parser_cache')
+
+
+class TestParserClassCache(unittest.TestCase):
+
+    data = {'package': 'genie.libs.parser', 'module_name': 'show_platform',
+            'class': 'ShowVersion'}
+
+    def setUp(self):
+        parser_class_cache.clear()
+        self.device = Mock(os='nxos', platform=None, model=None, custom={})
+        lookup = patch.object(common, 'Lookup')
+        self.Lookup = lookup.start()
+        self.addCleanup(lookup.stop)
+        self.Lookup.from_device.return_value._tokens = ['nxos']
+
+    def test_resolved_once(self):
+        cls = _find_parser_cls(self.device, self.data)
+        self.assertIs(_find_parser_cls(self.device, self.data), cls)
+        self.assertEqual(self.Lookup.from_device.call_count, 1)
+
+        _find_parser_cls(Mock(os='nxos', platform='n9k', model=None,
+                              custom={}), self.data)
+        self.assertEqual(self.Lookup.from_device.call_count, 2)
+
+    def test_only_first_resolved(self):
+        results = [('show version', {'nxos': self.data}, {}),
+                   ('show version detail', {'nxos': self.data}, {})]
+        with patch.object(common, '_fuzzy_search_command',
+                          return_value=results), \
+             patch.object(common, '_find_parser_cls',
+                          return_value='cls') as find:
+            self.assertEqual(_get_parser('show version', self.device),
+                             ('cls', {}))
+            self.assertEqual(find.call_count, 1)
+
+            self.assertEqual(len(_get_parser('show version', self.device,
+                                             fuzzy=True)), 2)
+            self.assertEqual(find.call_count, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
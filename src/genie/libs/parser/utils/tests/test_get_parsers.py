@@ -0,0 +1,55 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from genie.libs.parser.utils import common, entry_points
+from genie.libs.parser.utils import get_parsers
+from genie.libs.parser.utils.common import get_parser_cache
+
+
+def _resolve(command, device, fuzzy=False, lookup=None, tokens=None):
+    if command == 'show nonsense':
+        raise Exception("Could not find parser for '{c}'".format(c=command))
+    return 'cls ' + command, {'vrf': 'blue'} if 'vrf' in command else {}
+
+
+class TestGetParsers(unittest.TestCase):
+
+    def setUp(self):
+        get_parser_cache.clear()
+        self.device = Mock(os='nxos', platform=None, model=None, custom={})
+
+        for target, attribute, kwargs in [
+                (common, 'Lookup', {}),
+                (common, '_get_parser', {'side_effect': _resolve}),
+                (entry_points, '_loaded', {'new': True})]:
+            patcher = patch.object(target, attribute, **kwargs)
+            setattr(self, attribute.strip('_'), patcher.start())
+            self.addCleanup(patcher.stop)
+
+    def test_get_parsers(self):
+        parsers, errors = get_parsers(['show version',
+                                       'show nonsense',
+                                       'show ip route vrf blue'], self.device)
+
+        self.assertEqual(parsers, [
+            ('show version', 'cls show version', {}),
+            ('show ip route vrf blue', 'cls show ip route vrf blue',
+                                                            {'vrf': 'blue'})])
+        self.assertEqual(list(errors), ['show nonsense'])
+
+    def test_get_parsers_shared_lookup(self):
+        get_parsers(['show version', 'show clock'], self.device)
+        self.assertEqual(self.Lookup.from_device.call_count, 1)
+
+        lookup = self.Lookup.from_device.return_value
+        for call in self.get_parser.call_args_list:
+            self.assertIs(call[0][3], lookup)
+
+    def test_get_parsers_cached(self):
+        get_parsers(['show version', 'show clock'], self.device)
+        get_parsers(['show version', 'show  clock'], self.device)
+        self.assertEqual(self.get_parser.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import threading
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser import MetaParser
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.incremental import IncrementalParser
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.iosxe.show_platform import ShowVersion
+from genie.libs.parser.utils.tests import golden
+
+
+class ShowLines(MetaParser):
+    '''Records the lines as it reads them'''
+
+    schema = {'lines': list}
+    streaming = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lines = []
+        self.read = threading.Event()
+
+    def cli(self, output=None):
+        for line in Common.iter_lines(output):
+            self.lines.append(line)
+            self.read.set()
+        return {'lines': self.lines}
+
+
+class TestIncrementalParser(unittest.TestCase):
+
+    def test_split_lines(self):
+        bgp = golden('nxos', 'ShowBgpVrfAllAll', 'golden_output_1')
+        output, expected = bgp.output, bgp.expected
+        for size in (1, 7, 4096):
+            incremental = IncrementalParser(ShowBgpVrfAllAll(device=Mock()))
+            self.assertTrue(incremental.streaming)
+            for i in range(0, len(output), size):
+                incremental.feed(output[i:i + size])
+            self.assertEqual(incremental.close(), expected)
+
+    def test_bytes(self):
+        output = 'café\r\n\r\nnaïve\rend'
+        data = output.encode()
+        incremental = IncrementalParser(ShowLines(device=Mock()))
+        for i in range(len(data)):
+            incremental.feed(data[i:i + 1])
+        self.assertEqual(incremental.close(),
+                         {'lines': output.splitlines()})
+
+    def test_parsed_while_fed(self):
+        show = ShowLines(device=Mock())
+        incremental = IncrementalParser(show)
+        incremental.feed('first\nsec')
+        self.assertTrue(show.read.wait(5))
+        self.assertEqual(show.lines, ['first'])
+
+        show.read.clear()
+        # The rest of the second line completes it
+        incremental.feed('ond\nthird')
+        self.assertTrue(show.read.wait(5))
+        self.assertEqual(show.lines, ['first', 'second'])
+        self.assertEqual(incremental.close(),
+                         {'lines': ['first', 'second', 'third']})
+        # Closing again returns the same result
+        self.assertEqual(incremental.close()['lines'][-1], 'third')
+
+    def test_not_streaming(self):
+        version = golden('iosxe', 'ShowVersion', 'golden_output_1')
+        output, expected = version.output, version.expected
+        with IncrementalParser(ShowVersion(device=Mock())) as incremental:
+            self.assertFalse(incremental.streaming)
+            for line in output.splitlines(True):
+                incremental.feed(line)
+            self.assertEqual(incremental.close(), expected)
+
+    def test_errors(self):
+        incremental = IncrementalParser(ShowBgpVrfAllAll(device=Mock()))
+        incremental.feed('\n')
+        with self.assertRaises(SchemaEmptyParserError):
+            incremental.close()
+        with self.assertRaises(ValueError):
+            incremental.feed('more')
+
+        # Closed on leaving the block, the parser thread does not wait
+        with IncrementalParser(ShowLines(device=Mock())) as incremental:
+            incremental.feed('a\n')
+        self.assertFalse(incremental._thread.is_alive())
+
+
+if __name__ == '__main__':
+    unittest.main()
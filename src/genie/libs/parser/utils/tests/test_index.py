@@ -0,0 +1,172 @@
+import os
+import copy
+import json
+import shutil
+import tempfile
+import unittest
+
+from genie.libs.parser.utils.index import (
+    split_parser_data,
+    shard_parser_data,
+    make_index,
+    load_parser_shards,
+    ParserData,
+    SHARD_INDEX
+)
+
+
+class TestIndex(unittest.TestCase):
+
+    parser_data = {
+        'show version': {
+            'iosxe': {
+                'module_name': 'show_platform',
+                'package': 'genie.libs.parser',
+                'class': 'ShowVersion',
+                'doc': 'Parser for show version',
+                'schema': '{}',
+                'uid': 'show_version',
+                'url': 'https://github.com/',
+                'c9500': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                    'doc': 'Parser for show version on c9500',
+                },
+            },
+        },
+        'tokens': ['iosxe', 'c9500'],
+    }
+
+    def test_split_parser_data(self):
+        routing, metadata = split_parser_data(self.parser_data)
+
+        self.assertEqual(routing, {
+            'show version': {
+                'iosxe': {
+                    'module_name': 'show_platform',
+                    'package': 'genie.libs.parser',
+                    'class': 'ShowVersion',
+                    'c9500': {
+                        'module_name': 'show_platform',
+                        'package': 'genie.libs.parser',
+                        'class': 'ShowVersion',
+                    },
+                },
+            },
+            'tokens': ['iosxe', 'c9500'],
+        })
+        self.assertEqual(metadata, {
+            'show version': {
+                'iosxe': {
+                    'doc': 'Parser for show version',
+                    'schema': '{}',
+                    'uid': 'show_version',
+                    'url': 'https://github.com/',
+                    'c9500': {
+                        'doc': 'Parser for show version on c9500',
+                    },
+                },
+            },
+        })
+
+    def test_make_index(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+
+        parser_json = os.path.join(directory, 'parser.json')
+        with open(parser_json, 'w') as f:
+            json.dump(self.parser_data, f)
+
+        make_index(parser_json)
+
+        with open(os.path.join(directory, 'parser_routing.json')) as f:
+            routing = json.load(f)
+        with open(os.path.join(directory, 'parser_metadata.json')) as f:
+            metadata = json.load(f)
+
+        self.assertEqual((routing, metadata),
+                         split_parser_data(self.parser_data))
+
+        shard_dir = os.path.join(directory, 'parser_routing')
+        self.assertEqual(sorted(os.listdir(shard_dir)),
+                         [SHARD_INDEX, 'iosxe.json'])
+
+        parser_data = load_parser_shards(shard_dir)
+        self.assertEqual(parser_data, routing)
+
+
+class TestParserData(unittest.TestCase):
+
+    routing = {
+        'show version': {
+            'iosxe': {'module_name': 'show_platform', 'class': 'ShowVersion'},
+            'nxos': {'module_name': 'show_platform', 'class': 'ShowVersion'},
+        },
+        'show bgp vrf {vrf} all': {
+            'nxos': {'module_name': 'show_bgp', 'class': 'ShowBgpVrfAllAll'},
+        },
+        'tokens': ['iosxe', 'nxos'],
+    }
+
+    def setUp(self):
+        index, shards = shard_parser_data(self.routing)
+        self.loaded = []
+
+        def loader(os_name):
+            self.loaded.append(os_name)
+            return shards[os_name]
+
+        self.parser_data = ParserData(index=index, loader=loader)
+
+    def test_keys_without_loading(self):
+        self.assertEqual(list(self.parser_data), list(self.routing))
+        self.assertEqual(len(self.parser_data), len(self.routing))
+        self.assertIn('show bgp vrf {vrf} all', self.parser_data)
+        self.assertTrue(self.parser_data.supports('show version', 'iosxe'))
+        self.assertFalse(self.parser_data.supports('show bgp vrf {vrf} all',
+                                                   'iosxe'))
+        self.assertTrue(self.parser_data.supports('tokens', 'nxos'))
+        self.assertEqual(self.parser_data.commands('nxos'),
+                         ['show version', 'show bgp vrf {vrf} all'])
+        self.assertEqual(self.loaded, [])
+
+    def test_entry_loads_one_shard(self):
+        self.assertEqual(self.parser_data.entry('show version', 'nxos'),
+                         {'nxos': self.routing['show version']['nxos']})
+        self.parser_data.entry('show bgp vrf {vrf} all', 'nxos')
+        self.assertEqual(self.loaded, ['nxos'])
+
+    def test_merged_view(self):
+        self.assertEqual(self.parser_data['show version'],
+                         self.routing['show version'])
+        self.assertEqual(dict(self.parser_data.items()), self.routing)
+        self.assertEqual(self.parser_data, self.routing)
+        self.assertEqual(sorted(self.loaded), ['iosxe', 'nxos'])
+
+    def test_copies_load(self):
+        self.assertEqual(dict(self.parser_data), self.routing)
+        self.assertEqual({**self.parser_data}, self.routing)
+        self.assertEqual(copy.copy(self.parser_data), self.routing)
+        self.assertEqual(sorted(self.loaded), ['iosxe', 'nxos'])
+
+    def test_register(self):
+        entry = {'module_name': 'show_version', 'class': 'MyShowVersion'}
+        self.parser_data.register('show version', 'nxos', entry)
+        self.parser_data.register('show clock', 'nxos', entry)
+
+        # Registered entries are not overridden by the shard
+        self.assertEqual(self.parser_data.entry('show version', 'nxos'),
+                         {'nxos': entry})
+        self.assertEqual(self.parser_data.commands('nxos'),
+                         ['show version', 'show bgp vrf {vrf} all',
+                          'show clock'])
+
+    def test_from_dict(self):
+        parser_data = ParserData(self.routing)
+        self.assertEqual(parser_data, self.routing)
+        self.assertEqual(parser_data.commands('iosxe'), ['show version'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.libs.parser.utils import interning
+from genie.libs.parser.utils.interning import Interner
+from genie.libs.parser.utils.benchmark import synthetic_routes, \
+                                              synthetic_bgp, bench_interning
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+
+
+class TestInterner(unittest.TestCase):
+
+    def tearDown(self):
+        interning.INTERN = True
+
+    def test_intern(self):
+        intern = Interner()
+        first = ''.join(['Gigabit', 'Ethernet0/1'])
+        second = ''.join(['Gigabit', 'Ethernet0/1'])
+        self.assertIsNot(first, second)
+        self.assertIs(intern(first), first)
+        self.assertIs(intern(second), first)
+        self.assertIsNone(intern(None))
+        self.assertEqual(len(intern), 1)
+
+    def test_groups(self):
+        intern = Interner()
+        first = intern(''.join(['192.168.', '0.1']))
+        group = {'next_hop': ''.join(['192.168.', '0.1']), 'metric': None,
+                 'route': '10.0.0.0/8'}
+        self.assertIs(intern.groups(group, 'next_hop', 'metric', 'age'),
+                      group)
+        self.assertIs(group['next_hop'], first)
+        self.assertEqual(group, {'next_hop': '192.168.0.1', 'metric': None,
+                                 'route': '10.0.0.0/8'})
+        self.assertEqual(len(intern), 1)
+
+    def test_off(self):
+        interning.INTERN = False
+        intern = Interner()
+        value = ''.join(['Gigabit', 'Ethernet0/1'])
+        intern(value)
+        self.assertIsNot(intern(''.join(['Gigabit', 'Ethernet0/1'])), value)
+        self.assertEqual(len(intern), 0)
+
+
+class TestParsers(unittest.TestCase):
+
+    def tearDown(self):
+        interning.INTERN = True
+
+    def parse(self, parser_cls, lines, intern):
+        interning.INTERN = intern
+        return parser_cls(device=Mock()).parse(output=''.join(lines))
+
+    def test_routes(self):
+        parsed = self.parse(ShowIpRoute, synthetic_routes(500), True)
+        self.assertEqual(parsed, self.parse(ShowIpRoute,
+                                            synthetic_routes(500), False))
+        routes = parsed['vrf']['default']['address_family']['ipv4']['routes']
+        hops = [route['next_hop']['next_hop_list'][1]
+                for route in routes.values()]
+        self.assertEqual(len(hops), 500)
+        same = [hop for hop in hops if hop['next_hop'] == hops[0]['next_hop']]
+        self.assertGreater(len(same), 1)
+        for hop in same:
+            self.assertIs(hop['next_hop'], hops[0]['next_hop'])
+            self.assertIs(hop['outgoing_interface'],
+                          hops[0]['outgoing_interface'])
+
+    def test_bgp(self):
+        parsed = self.parse(ShowBgpVrfAllAll, synthetic_bgp(500), True)
+        self.assertEqual(parsed, self.parse(ShowBgpVrfAllAll,
+                                            synthetic_bgp(500), False))
+        prefixes = parsed['vrf']['default']['address_family'][
+            'ipv4 unicast']['prefixes']
+        paths = [prefix['index'][1] for prefix in prefixes.values()]
+        self.assertEqual(len(paths), 500)
+        for path in paths[4::4]:
+            self.assertIs(path['next_hop'], paths[0]['next_hop'])
+            self.assertIs(path['status_codes'], paths[0]['status_codes'])
+            self.assertIs(path['origin_codes'], paths[0]['origin_codes'])
+
+    def test_bench_interning(self):
+        results = bench_interning(routes=20000)
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertGreater(result['saved'], 0, result['parser'])
+
+
+if __name__ == '__main__':
+    unittest.main()
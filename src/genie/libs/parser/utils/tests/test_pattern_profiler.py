@@ -0,0 +1,102 @@
+import io
+import re
+import json
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import Mock
+
+from genie.libs.parser.iosxe import show_routing
+from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+from genie.libs.parser.utils.pattern_profiler import PatternProfiler, \
+                                                     ProfiledPattern, \
+                                                     profile_parse, main
+from genie.libs.parser.utils.tests import golden
+
+
+class TestPatternProfiler(unittest.TestCase):
+
+    def test_declared_patterns(self):
+        bgp = golden('nxos', 'ShowBgpVrfAllAll', 'golden_output_1')
+        output, expected = bgp.output, bgp.expected
+        parsed, profiler = profile_parse(ShowBgpVrfAllAll, output,
+                                         device=Mock())
+        self.assertEqual(parsed, expected)
+
+        stats = {stat.name: stat for stat in profiler.stats()}
+        # Every line is tried against the first pattern of the rows
+        self.assertEqual(stats['p0'].attempts, len(output.splitlines()))
+        self.assertEqual(stats['p0'].hits, 11)
+        self.assertIn('p3_2', stats)
+        self.assertEqual(stats['p3_2'].owner,
+                         'genie.libs.parser.nxos.show_bgp.ShowBgpVrfAllAll')
+        self.assertEqual(profiler.stats()[0].seconds,
+                         max(stat.seconds for stat in stats.values()))
+
+        # Back to the regular patterns
+        patterns = ShowBgpVrfAllAll.patterns
+        self.assertIsNone(patterns.profiler)
+        self.assertIsInstance(patterns.p0, type(re.compile('')))
+        self.assertEqual(ShowBgpVrfAllAll(device=Mock()).parse(output=output),
+                         expected)
+
+    def test_inline_patterns(self):
+        route = golden('iosxe', 'ShowIpRouteWord', 'golden_output_2')
+        output, expected = route.output, route.expected
+
+        profiler = PatternProfiler()
+        with profiler.profile(show_routing.ShowIpRouteWord):
+            self.assertIsNot(show_routing.re, re)
+            parsed = show_routing.ShowIpRouteWord(device=Mock()).parse(
+                route='192.168.154.0', output=output)
+        self.assertIs(show_routing.re, re)
+
+        self.assertEqual(parsed, expected)
+        self.assertEqual(profiler.parses, 1)
+        for stat in profiler.stats():
+            self.assertEqual(stat.owner, 'genie.libs.parser.iosxe.show_routing')
+            self.assertTrue(stat.name.startswith('line '))
+        self.assertTrue(any(stat.hits for stat in profiler.stats()))
+
+    def test_profiled_pattern(self):
+        profiler = PatternProfiler()
+        p = profiler.wrap('owner', 'p1', re.compile(r'^(?P<a>\d+)$'))
+        self.assertIsInstance(p, ProfiledPattern)
+        self.assertEqual(p.match('12').group('a'), '12')
+        self.assertIsNone(p.match('ab'))
+        self.assertEqual(p.groupindex, {'a': 1})
+
+        stat, = profiler.stats()
+        self.assertEqual((stat.attempts, stat.hits), (2, 1))
+
+    def test_report(self):
+        output = golden('nxos', 'ShowBgpVrfAllAll', 'golden_output_1').output
+        _, profiler = profile_parse(ShowBgpVrfAllAll, output, device=Mock(),
+                                    repeat=2)
+        self.assertEqual(profiler.parses, 2)
+        report = profiler.report(top=3).splitlines()
+        self.assertTrue(report[0].endswith('in 2 parse(s)'))
+        self.assertEqual(len(report), 5)
+
+    def test_main(self):
+        path = golden('nxos', 'ShowBgpVrfAllAll', 'golden_output_1').path
+        out = io.StringIO()
+        with redirect_stdout(out):
+            main(['--parser', 'nxos.show_bgp.ShowBgpVrfAllAll', path,
+                  '--json'])
+        results = json.loads(out.getvalue())
+        self.assertEqual(results['parser'],
+                         'genie.libs.parser.nxos.show_bgp.ShowBgpVrfAllAll')
+        self.assertEqual(results['parses'], 1)
+        self.assertIn('p3_1', [stat['name'] for stat in results['patterns']])
+
+    def test_main_command_without_os(self):
+        path = golden('nxos', 'ShowBgpVrfAllAll', 'golden_output_1').path
+        with redirect_stderr(io.StringIO()) as err, \
+                self.assertRaises(SystemExit) as raised:
+            main(['--command', 'show bgp vrf all all', path])
+        self.assertEqual(raised.exception.code, 2)
+        self.assertIn('--command needs --os', err.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,233 @@
+import os
+import re
+import unittest
+import importlib
+from unittest.mock import patch
+
+from genie.libs import parser
+from genie.libs.parser.utils import patterns
+from genie.libs.parser.utils.patterns import Patterns, compile_pattern, \
+                                            purge, literal_prefixes, \
+                                            first_characters, Alternation
+from genie.libs.parser.utils.benchmark import bench_patterns, \
+                                             bench_dispatch, \
+                                             replicate_interfaces, \
+                                             DISPATCH_BENCHMARKS
+
+
+class ShowExample(object):
+
+    patterns = Patterns(
+        # Version 1.0
+        p1=r'^Version +(?P<version>\S+)$',
+        # VERSION 1.0
+        p2=(r'^version +(?P<version>\S+)$', re.IGNORECASE),
+    )
+
+
+class TestPatterns(unittest.TestCase):
+
+    def setUp(self):
+        purge()
+
+    def test_compiled_once(self):
+        with patch.object(patterns.re, 'compile',
+                          side_effect=re.compile) as compile:
+            p = ShowExample.patterns
+            self.assertEqual(p.p1.match('Version 1.0').group('version'),
+                             '1.0')
+            self.assertIs(p.p1, p.p1)
+            self.assertTrue(p.p2.match('VERSION 1.0'))
+            self.assertEqual(compile.call_count, 2)
+
+    def test_shared(self):
+        other = Patterns(p=r'^Version +(?P<version>\S+)$')
+        self.assertIs(other.p, ShowExample.patterns.p1)
+        self.assertIs(compile_pattern(r'^Version +(?P<version>\S+)$'),
+                      other.p)
+
+    def test_unknown(self):
+        with self.assertRaises(AttributeError):
+            ShowExample.patterns.p3
+
+    def test_registry(self):
+        p = patterns.registry[__name__ + '.ShowExample']
+        self.assertIs(p, ShowExample.patterns)
+        self.assertEqual(p.names(), ['p1', 'p2'])
+        self.assertEqual(p.pattern('p2'),
+                         (r'^version +(?P<version>\S+)$', re.IGNORECASE))
+
+    def test_purge(self):
+        p = ShowExample.patterns
+        p.compile()
+        self.assertIn('p1', vars(p))
+        purge()
+        self.assertNotIn('p1', vars(p))
+        self.assertTrue(p.p1.match('Version 1.0'))
+
+    def test_bench_patterns(self):
+        results = bench_patterns(repeat=1)
+        self.assertEqual([result['parser'] for result in results],
+                         ['iosxe.show_interface.ShowInterfaces',
+                          'nxos.show_bgp.ShowBgpVrfAllAll'])
+
+
+class TestDispatch(unittest.TestCase):
+
+    def setUp(self):
+        purge()
+
+    def test_literal_prefixes(self):
+        for pattern, prefixes in [
+                (r'^Hardware +is +(?P<type>.+)$', ['Hardware']),
+                (r'^ *MTU +(?P<mtu>\d+)', ['MTU']),
+                (r'^\s*Description: +(?P<description>.*)$', ['Description:']),
+                (r'^No\. +of +members', ['No.']),
+                (r'^(input|output) +rate', ['input', 'output']),
+                (r'^[U|u]nknown', ['Unknown', 'unknown', '|nknown']),
+                (r'^(?P<interface>\S+) +is +up', []),
+                (r'^(Type: +\S+, )?Link-level', []),
+                (r'Hardware +is', []),
+                (r'^hardware', ['hardware']),
+                ]:
+            self.assertEqual(sorted(literal_prefixes(pattern)),
+                             sorted(prefixes), pattern)
+        self.assertEqual(literal_prefixes(r'^hardware', re.IGNORECASE), [])
+
+    def test_first_characters(self):
+        accepts = first_characters(r'^(?P<in_pkts>[0-9]+) +packets +input')
+        self.assertTrue(accepts('5'))
+        self.assertFalse(accepts('G'))
+
+        accepts = first_characters(r'^(?P<interface>\S+) +is')
+        self.assertTrue(accepts('G'))
+        self.assertIsNone(first_characters(r'^(?P<key>[\w\s]+):'))
+        self.assertIsNone(first_characters(r'^.*packets'))
+
+    def test_dispatch(self):
+        p = Patterns(p1=r'^Hardware +is +(?P<type>.+)$',
+                     p2=r'^(?P<pkts>\d+) +packets +input$',
+                     p3=r'^(?P<interface>\S+) +is +up$')
+
+        lp = p.dispatch('Hardware is Ethernet')
+        self.assertIs(lp.p1, p.p1)
+        self.assertIsNone(lp.p2.match('Hardware is Ethernet'))
+        self.assertIs(lp.p3, p.p3)
+        self.assertIs(p.dispatch('Hardware is Loopback'), lp)
+
+        lp = p.dispatch('  5 packets input')
+        self.assertIsNone(lp.p1.search('5 packets input'))
+        self.assertEqual(lp.p2.match('5 packets input').group('pkts'), '5')
+
+        with patch.object(patterns, 'DISPATCH', False):
+            self.assertIs(p.dispatch('Hardware is Ethernet'), p)
+
+    def test_dispatch_same_matches(self):
+        # Every line of the outputs of the dispatching parsers is matched
+        # the same way with and without dispatch
+        base = os.path.dirname(parser.__file__)
+        for os_name, module, class_name, path, _ in DISPATCH_BENCHMARKS:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            p = parser_cls.patterns
+            with open(os.path.join(base, path)) as f:
+                lines = f.read().splitlines()
+
+            for line in lines + [line.strip() for line in lines]:
+                lp = p.dispatch(line)
+                for name in p:
+                    self.assertEqual(
+                        bool(getattr(lp, name).match(line)),
+                        bool(getattr(p, name).match(line)),
+                        '{c} {n} {l!r}'.format(c=class_name, n=name, l=line))
+
+    def test_replicate_interfaces(self):
+        output = ('Ethernet1 is up\n'
+                  '  MTU 1500 bytes\n'
+                  'Ethernet2 is down\n'
+                  '  MTU 9000 bytes\n')
+        self.assertEqual(
+            replicate_interfaces(output, r'^(?P<name>\S+) is ', 3),
+            'Ethernet1 is up\n'
+            '  MTU 1500 bytes\n'
+            'Ethernet2 is down\n'
+            '  MTU 9000 bytes\n'
+            'Ethernet100002 is up\n'
+            '  MTU 1500 bytes\n')
+
+    def test_bench_dispatch(self):
+        results = bench_dispatch(interfaces=50, repeat=1)
+        self.assertEqual(len(results), 4)
+        for result in results:
+            self.assertTrue(result['identical'], result['parser'])
+        self.assertTrue(patterns.DISPATCH)
+
+
+class TestAlternation(unittest.TestCase):
+
+    def test_first_match(self):
+        p = Patterns(p1=r'^(?P<pkts>\d+) +packets$',
+                     p2=r'^(?P<count>\d+) +(?P<unit>\w+)$',
+                     p3=r'^(?P<word>\w+)(?: +(?P=word))?$')
+        rows = p.alternation('p1', 'p2', 'p3')
+        self.assertIs(p.alternation('p1', 'p2', 'p3'), rows)
+
+        m = rows.match('5 packets')
+        self.assertEqual(m.name, 'p1')
+        self.assertEqual(m.groupdict(), {'pkts': '5'})
+
+        m = rows.match('5 bytes')
+        self.assertEqual(m.name, 'p2')
+        self.assertEqual(m.groupdict(), {'count': '5', 'unit': 'bytes'})
+        self.assertEqual(m.group('unit'), 'bytes')
+        self.assertEqual(m.group(1, 2), ('5', 'bytes'))
+        self.assertEqual(m.groups(), ('5', 'bytes'))
+        self.assertEqual(m.span('unit'), (2, 7))
+        self.assertEqual(m.group(), '5 bytes')
+
+        m = rows.match('up up')
+        self.assertEqual(m.name, 'p3')
+        self.assertEqual(m.groupdict(), {'word': 'up'})
+        self.assertIsNone(rows.match('up down'))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Alternation([('p1', r'^a$', 0), ('p2', r'^b$', re.IGNORECASE)])
+        with self.assertRaises(ValueError):
+            Alternation([('p1', r'^(a)\1$', 0)])
+        with self.assertRaises(ValueError):
+            Alternation([('p1', r'(?i)^a$', 0)])
+        # Escaped, not back references nor groups
+        rows = Alternation([('p1', r'^\\1\(\?P<a>$', 0)])
+        self.assertEqual(rows.match('\\1(?P<a>').name, 'p1')
+
+    def test_same_as_sequential(self):
+        from genie.libs.parser.nxos.show_bgp import ShowBgpVrfAllAll
+        p = ShowBgpVrfAllAll.patterns
+        names = ('p0', 'p1', 'p2', 'p3_4', 'p3_1', 'p3_1_2', 'p3_3',
+                 'p3_3_1', 'p4', 'p3_2', 'p3_2_1')
+        rows = p.alternation(*names)
+
+        path = os.path.join(os.path.dirname(parser.__file__), 'nxos', 'tests',
+                            'ShowBgpVrfAllAll', 'cli', 'equal',
+                            'golden_output_1_output.txt')
+        with open(path) as f:
+            lines = f.read().splitlines()
+
+        for line in lines:
+            line = line.rstrip()
+            expected = next(((name, getattr(p, name).match(line))
+                             for name in names
+                                if getattr(p, name).match(line)), None)
+            m = rows.match(line)
+            if expected is None:
+                self.assertIsNone(m, line)
+                continue
+            self.assertEqual(m.name, expected[0], line)
+            self.assertEqual(m.groupdict(), expected[1].groupdict(), line)
+            self.assertEqual(m.groups(), expected[1].groups(), line)
+
+
+if __name__ == '__main__':
+    unittest.main()
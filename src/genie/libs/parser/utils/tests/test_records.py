@@ -0,0 +1,202 @@
+import unittest
+import importlib
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.records import RouteRecord, MacRecord, \
+                                            ArpRecord, BgpRecord
+from genie.libs.parser.iosxe.show_routing import ShowIpRoute
+from genie.libs.parser.nxos.show_fdb import ShowMacAddressTable
+from genie.libs.parser.utils.tests import goldens
+
+
+# The records expected from the parsed output, by the fields identifying them
+
+def _arp_records(parsed):
+    records = {}
+    for intf, value in parsed.get('interfaces', {}).items():
+        for ip, neighbor in value['ipv4']['neighbors'].items():
+            records[(intf, ip)] = ArpRecord(
+                interface=intf, ip=neighbor['ip'],
+                mac_address=neighbor['link_layer_address'],
+                origin=neighbor['origin'], age=neighbor['age'],
+                encap_type=neighbor.get('type'),
+                protocol=neighbor.get('protocol'),
+                flags=neighbor.get('flags'))
+    for ip, entry in parsed.get('global_static_table', {}).items():
+        records[(None, ip)] = ArpRecord(
+            ip=entry['ip_address'], mac_address=entry['mac_address'],
+            age=entry['age'], encap_type=entry['encap_type'],
+            protocol=entry['protocol'])
+    return records
+
+
+def _arp_key(record):
+    return record.interface, record.ip
+
+
+def _mac_records(parsed):
+    records = {}
+    for vlan in parsed['mac_table']['vlans'].values():
+        for mac, address in vlan.get('mac_addresses', {}).items():
+            if 'drop' in address:
+                drop = address['drop']
+                records[(vlan['vlan'], mac, None)] = MacRecord(
+                    vlan=vlan['vlan'], mac_address=mac, drop=True,
+                    mac_type=drop.get('mac_type', drop.get('entry_type')),
+                    age=drop.get('age'), entry=address.get('entry'),
+                    secure=address.get('secure'), ntfy=address.get('ntfy'))
+            for intf, value in address.get('interfaces', {}).items():
+                protocols = value.get('protocols')
+                records[(vlan['vlan'], mac, intf)] = MacRecord(
+                    vlan=vlan['vlan'], mac_address=mac, interface=intf,
+                    mac_type=value.get('mac_type', value.get('entry_type')),
+                    entry=value.get('entry', address.get('entry')),
+                    age=value.get('age'), learn=value.get('learn'),
+                    secure=address.get('secure'), ntfy=address.get('ntfy'),
+                    protocols=tuple(protocols) if protocols else None)
+    return records
+
+
+def _mac_key(record):
+    return record.vlan, record.mac_address, record.interface
+
+
+def _route_records(parsed):
+    records = {}
+    for vrf, value in parsed['vrf'].items():
+        for af, family in value.get('address_family', {}).items():
+            for route, entry in family.get('routes', {}).items():
+                next_hop = entry.get('next_hop', {})
+                keys = dict(vrf=vrf, address_family=af, route=route,
+                            active=entry.get('active'),
+                            source_protocol_codes=entry.get(
+                                'source_protocol_codes'))
+                hops = next_hop.get('next_hop_list', {})
+                # The route keeps the metric of its last path only
+                single = len(hops) == 1
+                for index, hop in hops.items():
+                    tag = hop.get('tag', entry.get('tag'))
+                    records[(vrf, af, route, index, None)] = RouteRecord(
+                        source_protocol=hop.get('source_protocol',
+                                                entry.get('source_protocol')),
+                        route_preference=hop.get(
+                            'route_preference',
+                            entry.get('route_preference') if single else None),
+                        metric=hop.get(
+                            'metric', entry.get('metric') if single else None),
+                        tag=None if tag is None else int(tag),
+                        index=index, next_hop=hop['next_hop'],
+                        next_hop_vrf=hop.get('next_hop_vrf', hop.get('vrf')),
+                        outgoing_interface=hop.get('outgoing_interface'),
+                        updated=hop.get('updated'), **keys)
+                for intf, hop in next_hop.get('outgoing_interface',
+                                              {}).items():
+                    records[(vrf, af, route, None, intf)] = RouteRecord(
+                        source_protocol=entry.get('source_protocol'),
+                        route_preference=hop.get(
+                            'route_preference',
+                            entry.get('route_preference')),
+                        metric=hop.get('metric', entry.get('metric')),
+                        tag=entry.get('tag'), outgoing_interface=intf,
+                        updated=hop.get('updated'), **keys)
+    return records
+
+
+def _route_key(record):
+    return (record.vrf, record.address_family, record.route, record.index,
+            record.outgoing_interface if record.index is None else None)
+
+
+def _bgp_records(parsed):
+    records = {}
+    for vrf, value in parsed['vrf'].items():
+        for af, family in value['address_family'].items():
+            for prefix, entry in family.get('prefixes', {}).items():
+                for index, path in entry['index'].items():
+                    records[(vrf, af, prefix, index)] = BgpRecord(
+                        vrf, af, prefix, index, **path)
+    return records
+
+
+def _bgp_key(record):
+    return record[:4]
+
+
+RECORD_PARSERS = [
+    ('iosxe', 'show_arp', 'ShowArp', _arp_records, _arp_key),
+    ('iosxe', 'show_arp', 'ShowIpArp', _arp_records, _arp_key),
+    ('nxos', 'show_arp', 'ShowIpArp', _arp_records, _arp_key),
+    ('iosxe', 'show_fdb', 'ShowMacAddressTable', _mac_records, _mac_key),
+    ('nxos', 'show_fdb', 'ShowMacAddressTable', _mac_records, _mac_key),
+    ('iosxe', 'show_routing', 'ShowIpRoute', _route_records, _route_key),
+    ('iosxe', 'show_routing', 'ShowIpv6Route', _route_records, _route_key),
+    ('nxos', 'show_routing', 'ShowIpRoute', _route_records, _route_key),
+    ('iosxr', 'show_routing', 'ShowRouteIpv4', _route_records, _route_key),
+    ('nxos', 'show_bgp', 'ShowBgpVrfAllAll', _bgp_records, _bgp_key),
+]
+
+
+class TestParseRecords(unittest.TestCase):
+
+    def assertRecords(self, records, expected, msg):
+        self.assertEqual(set(records), set(expected), msg)
+        for key, record in records.items():
+            # The parsed output leaves out some of the fields of the records
+            for field, value in zip(record._fields, expected[key]):
+                if value is not None:
+                    self.assertEqual(getattr(record, field), value,
+                                     '{} {} {}'.format(msg, key, field))
+
+    def test_parsers(self):
+        for os_name, module, class_name, flatten, key in RECORD_PARSERS:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            for golden in goldens(os_name, class_name):
+                msg = '{} {} {}'.format(os_name, class_name, golden.name)
+                records = list(parser_cls(device=Mock()).parse_records(
+                    output=golden.output, **golden.arguments))
+                self.assertTrue(records, msg)
+                self.assertRecords({key(record): record
+                                    for record in records},
+                                   flatten(golden.expected), msg)
+
+    def test_execute(self):
+        output = '''\
+            Legend: * - primary entry, G - Gateway MAC, (R) - Routed MAC, O - Overlay MAC
+            age - seconds since last seen,+ - primary entry using vPC Peer-Link
+               VLAN     MAC Address      Type      age     Secure NTFY Ports/SWID.SSID.LID
+            ---------+-----------------+--------+---------+------+----+------------------
+            * 10       aaaa.bbff.8888   static   -         F    F  Eth1/2
+        '''
+        device = Mock(**{'execute.return_value': output})
+        records = list(ShowMacAddressTable(device=device).parse_records(
+            vlan='10'))
+        device.execute.assert_called_once_with(
+            'show mac address-table vlan 10')
+        self.assertEqual(records, [MacRecord(
+            vlan='10', mac_address='aaaa.bbff.8888', interface='Ethernet1/2',
+            mac_type='static', entry='*', age='-', secure='F', ntfy='F')])
+
+    def test_lazy(self):
+        lines = iter([
+            'Codes: L - local, C - connected, S - static, R - RIP',
+            '',
+            'Gateway of last resort is not set',
+            '',
+            '      10.1.0.0/32 is subnetted, 1 subnets',
+            'C        10.4.1.1 is directly connected, Loopback0',
+            'S        10.16.2.2 [1/0] via 10.186.2.2, GigabitEthernet0/1',
+        ])
+        records = ShowIpRoute(device=Mock()).parse_records(output=lines)
+        record = next(records)
+        self.assertEqual(record.route, '10.4.1.1/32')
+        self.assertEqual(record.outgoing_interface, 'Loopback0')
+        # The next route is not read yet
+        self.assertEqual(next(lines), 'S        10.16.2.2 [1/0] via '
+                                      '10.186.2.2, GigabitEthernet0/1')
+        self.assertEqual(list(records), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
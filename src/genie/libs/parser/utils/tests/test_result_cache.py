@@ -0,0 +1,164 @@
+import os
+import pickle
+import unittest
+import tempfile
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.result_cache import MemoryResultCache, \
+                                                 SqliteResultCache, result_key
+from genie.libs.parser.utils.benchmark import bench_result_cache
+from genie.libs.parser.iosxe.show_vrf import ShowVrf
+
+BASE = os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))))
+
+
+def _device(os='iosxe', platform=None):
+    return Mock(os=os, platform=platform, model=None, custom={})
+
+
+class CountingParser(object):
+    '''Parser returning a new result per call, counting them'''
+
+    def __init__(self, device):
+        self.device = device
+        self.calls = 0
+
+    def parse(self, output=None, **kwargs):
+        self.calls += 1
+        if not output:
+            raise SchemaEmptyParserError('empty')
+        return {'output': output, 'kwargs': kwargs, 'lines': [1, 2]}
+
+
+class ResultCacheTests(object):
+
+    def make_cache(self, maxbytes=2 ** 20):
+        raise NotImplementedError
+
+    def test_hit(self):
+        cache = self.make_cache()
+        parser = CountingParser(_device())
+        first = cache.parse(parser, output='output', vrf='blue')
+        second = cache.parse(parser, output='output', vrf='blue')
+
+        self.assertEqual(parser.calls, 1)
+        self.assertEqual(first, second)
+        # Hits are copies
+        second['lines'].append(3)
+        self.assertEqual(cache.parse(parser, output='output',
+                                     vrf='blue')['lines'], [1, 2])
+        info = cache.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 1, 1))
+
+    def test_key(self):
+        cache = self.make_cache()
+        parser = CountingParser(_device())
+        cache.parse(parser, output='output', vrf='blue')
+        cache.parse(parser, output='output', vrf='red')
+        cache.parse(parser, output='output 2', vrf='blue')
+        cache.parse(CountingParser(_device(platform='cat9k')),
+                    output='output', vrf='blue')
+        self.assertEqual(parser.calls, 3)
+        self.assertEqual(cache.info().currsize, 4)
+
+    def test_not_cached(self):
+        cache = self.make_cache()
+        parser = CountingParser(_device())
+        for output in ('', ['line\n'], ['line\n']):
+            try:
+                cache.parse(parser, output=output)
+            except SchemaEmptyParserError:
+                pass
+        self.assertEqual(parser.calls, 3)
+        self.assertEqual(cache.info().currsize, 0)
+
+    def test_eviction(self):
+        parser = CountingParser(_device())
+        size = len(pickle.dumps(parser.parse(output='a' * 100),
+                                pickle.HIGHEST_PROTOCOL))
+        cache = self.make_cache(maxbytes=int(size * 2.5))
+        cache.parse(parser, output='a' * 100)
+        cache.parse(parser, output='b' * 100)
+        cache.parse(parser, output='a' * 100)
+        cache.parse(parser, output='c' * 100)
+
+        info = cache.info()
+        self.assertEqual(info.currsize, 2)
+        self.assertLessEqual(info.currbytes, info.maxbytes)
+        calls = parser.calls
+        cache.parse(parser, output='a' * 100)
+        self.assertEqual(parser.calls, calls)
+        cache.parse(parser, output='b' * 100)
+        self.assertEqual(parser.calls, calls + 1)
+
+    def test_clear(self):
+        cache = self.make_cache()
+        cache.parse(CountingParser(_device()), output='output')
+        cache.clear()
+        self.assertEqual(tuple(cache.info()), (0, 0, 2 ** 20, 0, 0))
+
+
+class TestMemoryResultCache(ResultCacheTests, unittest.TestCase):
+
+    def make_cache(self, maxbytes=2 ** 20):
+        return MemoryResultCache(maxbytes=maxbytes)
+
+
+class TestSqliteResultCache(ResultCacheTests, unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.caches = []
+
+    def tearDown(self):
+        for cache in self.caches:
+            cache.close()
+        self.directory.cleanup()
+
+    def make_cache(self, maxbytes=2 ** 20):
+        cache = SqliteResultCache(os.path.join(
+            self.directory.name, '{}.db'.format(len(self.caches))),
+            maxbytes=maxbytes)
+        self.caches.append(cache)
+        return cache
+
+    def test_shared(self):
+        path = os.path.join(self.directory.name, 'shared.db')
+        parser = CountingParser(_device())
+        cache = SqliteResultCache(path)
+        cache.parse(parser, output='output')
+        cache.close()
+
+        cache = SqliteResultCache(path)
+        self.caches.append(cache)
+        self.assertEqual(cache.parse(parser, output='output')['output'],
+                         'output')
+        self.assertEqual(parser.calls, 1)
+
+
+class TestParser(unittest.TestCase):
+
+    def test_show_vrf(self):
+        with open(os.path.join(BASE, 'iosxe/tests/ShowVrf/cli/equal/'
+                                     'golden_output_output.txt')) as f:
+            output = f.read()
+        parser = ShowVrf(device=_device())
+        cache = MemoryResultCache()
+        expected = parser.parse(output=output)
+        self.assertEqual(cache.parse(parser, output=output), expected)
+        self.assertEqual(cache.parse(parser, output=output), expected)
+        self.assertEqual(cache.info().hits, 1)
+        self.assertNotEqual(result_key(parser, output, {}),
+                            result_key(parser, output, {'vrf': 'VRF1'}))
+
+    def test_bench_result_cache(self):
+        for result in bench_result_cache(repeat=3):
+            self.assertLess(result['memory'], result['parse'],
+                            result['parser'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import unittest
+from unittest.mock import Mock
+
+from genie.metaparser.util.exceptions import SchemaEmptyParserError
+
+from genie.libs.parser.utils.session import CollectionSession, \
+                                           SessionDevice, nested_parse, \
+                                           prerequisites, collect_and_parse
+from genie.libs.parser.nxos.show_vrf import ShowVrf, ShowRunningConfigVrf
+from genie.libs.parser.nxos.show_mcast import \
+                                    ShowForwardingDistributionMulticastRoute
+from genie.libs.parser.iosxe.show_bgp import ShowBgpSummary, \
+                                             ShowBgpAllSummary, \
+                                             ShowIpBgpAllSummary
+
+OUTPUTS = {
+    'show vrf': '''
+        VRF-Name                           VRF-ID State   Reason
+        VRF1                                    3 Up      --
+        default                                 1 Up      --
+    ''',
+    "show running-config vrf VRF1 | sec '^vrf'": '''
+vrf context VRF1
+  vni 10100
+  rd auto
+  address-family ipv4 unicast
+    route-target both auto
+    ''',
+    "show running-config vrf default | sec '^vrf'": '',
+    'show forwarding distribution multicast route vrf all': '''
+IPv4 Multicast Routing Table for table-id: 3
+Total number of groups: 1
+
+  (*, 224.0.0.0/4), RPF Interface: NULL, flags: D
+    Received Packets: 0 Bytes: 0
+    Number of Outgoing Interfaces: 0
+    Null Outgoing Interface List
+    ''',
+}
+
+
+def _execute(command):
+    # A list of commands is executed in one go
+    if isinstance(command, list):
+        return {c: OUTPUTS[c] for c in command}
+    return OUTPUTS[command]
+
+
+def _device():
+    return Mock(os='nxos', platform=None, model=None, custom={},
+                **{'execute.side_effect': _execute})
+
+
+class TestCollectionSession(unittest.TestCase):
+
+    def test_execute(self):
+        device = _device()
+        with CollectionSession(device) as session:
+            self.assertEqual(session.execute('show vrf'), OUTPUTS['show vrf'])
+            self.assertEqual(session.execute('show  vrf'),
+                             OUTPUTS['show vrf'])
+            self.assertEqual(session.device.execute('show vrf'),
+                             OUTPUTS['show vrf'])
+            self.assertEqual(session.executed, 1)
+        device.execute.assert_called_once_with('show vrf')
+
+    def test_device(self):
+        device = _device()
+        session = CollectionSession(device)
+        self.assertIsInstance(session.device, SessionDevice)
+        self.assertEqual(session.device.os, 'nxos')
+        self.assertIs(session.device.session, session)
+        session.device.platform = 'n9k'
+        self.assertEqual(device.platform, 'n9k')
+
+    def test_parse(self):
+        device = _device()
+        with CollectionSession(device) as session:
+            vrfs = session.parse(ShowVrf)
+            self.assertEqual(set(vrfs['vrfs']), {'VRF1', 'default'})
+            # Copies of the cached result
+            vrfs['vrfs'].clear()
+            self.assertEqual(set(session.parse('show vrf')['vrfs']),
+                             {'VRF1', 'default'})
+        self.assertEqual(device.execute.call_count, 1)
+
+    def test_nested(self):
+        device = _device()
+        with CollectionSession(device) as session:
+            session.parse(ShowVrf)
+            config = session.parse(ShowRunningConfigVrf)
+            self.assertEqual(config['vrf']['VRF1']['vni'], 10100)
+            self.assertEqual(session.parse(ShowRunningConfigVrf), config)
+            self.assertEqual(session.parse(ShowRunningConfigVrf, vrf='VRF1'),
+                             config)
+
+        commands = [call[0][0] for call in device.execute.call_args_list]
+        self.assertEqual(sorted(commands),
+                         sorted(['show vrf',
+                                 "show running-config vrf VRF1 | sec '^vrf'",
+                                 "show running-config vrf default | "
+                                 "sec '^vrf'"]))
+
+    def test_output(self):
+        device = _device()
+        with CollectionSession(device) as session:
+            vrfs = session.parse(ShowVrf, output=OUTPUTS['show vrf'])
+            self.assertIn('VRF1', vrfs['vrfs'])
+            with self.assertRaises(SchemaEmptyParserError):
+                session.parse(ShowVrf, output='')
+        device.execute.assert_not_called()
+
+    def test_nested_parse_without_session(self):
+        device = _device()
+        nested_parse(ShowVrf, device)
+        nested_parse(ShowVrf, device)
+        self.assertEqual(device.execute.call_count, 2)
+
+
+class TestCollectAndParse(unittest.TestCase):
+
+    def test_prerequisites(self):
+        device = _device()
+        mcast = ShowForwardingDistributionMulticastRoute
+        self.assertEqual(prerequisites(mcast, device, vrf='all'),
+                         ['show vrf'])
+        self.assertEqual(prerequisites(mcast, device, vrf='VRF1'), [])
+        self.assertEqual(prerequisites(ShowRunningConfigVrf, device),
+                         ['show vrf'])
+        self.assertEqual(prerequisites(ShowVrf, device), [])
+
+    def test_bgp_summary_prerequisites(self):
+        device = _device()
+        self.assertEqual(prerequisites(ShowIpBgpAllSummary, device,
+                                       address_family='vpnv4 unicast'),
+                         ['show run | sec address-family ipv4 vrf'])
+        self.assertEqual(prerequisites(ShowIpBgpAllSummary, device,
+                                       address_family='ipv4 unicast'), [])
+        self.assertEqual(prerequisites(ShowBgpSummary, device,
+                                       address_family='vpnv4 unicast',
+                                       rd='65000:1'),
+                         ['show vrf'])
+        self.assertEqual(prerequisites(ShowBgpAllSummary, device), [])
+
+    def test_collect_and_parse(self):
+        device = _device()
+        command = 'show forwarding distribution multicast route vrf all'
+        with CollectionSession(device) as session:
+            results, errors = collect_and_parse(device, [command, 'show vrf',
+                                                         'show nothing'],
+                                                session=session)
+            self.assertEqual(session.executed, 1)
+
+        self.assertEqual(set(results), {command, 'show vrf'})
+        self.assertEqual(set(errors), {'show nothing'})
+        self.assertEqual(set(results['show vrf']['vrfs']), {'VRF1', 'default'})
+        device.execute.assert_called_once_with([command, 'show vrf'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import io
+import unittest
+import importlib
+from unittest.mock import Mock
+
+from genie.libs.parser.utils.common import Common
+from genie.libs.parser.utils.benchmark import STREAMING_BENCHMARKS, \
+                                              bench_streaming
+from genie.libs.parser.utils.tests import golden
+
+# Parsers reading their output line by line, with a golden output
+STREAMING_PARSERS = [
+    ('iosxe', 'show_routing', 'ShowIpRoute', 'golden_output_2_with_vrf'),
+    ('iosxe', 'show_routing', 'ShowIpv6Route', 'golden_output6'),
+    ('nxos', 'show_bgp', 'ShowBgpVrfAllAll', 'golden_output_1'),
+    ('iosxr', 'show_routing', 'ShowRouteIpv4', 'golden_output_1'),
+    ('junos', 'show_route', 'ShowRoute', 'golden_output_6'),
+    ('iosxe', 'show_fdb', 'ShowMacAddressTable', 'golden_output_2'),
+    ('nxos', 'show_fdb', 'ShowMacAddressTable', 'golden_output'),
+]
+
+
+class TestIterLines(unittest.TestCase):
+
+    OUTPUTS = ['', 'a', 'a\n', 'a\n\n', '\n', 'a\r\nb', 'x\n\r\ny',
+               'a\rb\r', 'a\x0cb\n\nc\r', '\r\n\r\n', '  a  \n  b']
+
+    def test_string(self):
+        for output in self.OUTPUTS:
+            self.assertEqual(list(Common.iter_lines(output)),
+                             output.splitlines(), repr(output))
+
+    def test_file(self):
+        for output in self.OUTPUTS:
+            self.assertEqual(
+                list(Common.iter_lines(io.StringIO(output, newline=''))),
+                output.splitlines(), repr(output))
+            self.assertEqual(
+                list(Common.iter_lines(io.BytesIO(output.encode()))),
+                output.splitlines(), repr(output))
+
+    def test_iterable(self):
+        self.assertEqual(list(Common.iter_lines(['a', '', 'b\n', 'c\nd'])),
+                         ['a', '', 'b', 'c', 'd'])
+        self.assertEqual(list(Common.iter_lines(iter([]))), [])
+
+    def test_lazy(self):
+        lines = Common.iter_lines('a\nb\n')
+        self.assertEqual(next(lines), 'a')
+        self.assertEqual(list(lines), ['b'])
+
+
+class TestStreamingParse(unittest.TestCase):
+
+    def test_parsers(self):
+        for os_name, module, class_name, name in STREAMING_PARSERS:
+            parser_cls = getattr(importlib.import_module(
+                'genie.libs.parser.{o}.{m}'.format(o=os_name, m=module)),
+                class_name)
+            _, path, output, arguments, expected = golden(os_name,
+                                                          class_name, name)
+
+            with open(path) as f:
+                from_file = parser_cls(device=Mock()).parse(output=f,
+                                                            **arguments)
+            from_lines = parser_cls(device=Mock()).parse(
+                output=iter(output.splitlines(True)), **arguments)
+            from_string = parser_cls(device=Mock()).parse(output=output,
+                                                          **arguments)
+
+            self.assertEqual(from_file, from_string, class_name)
+            self.assertEqual(from_lines, from_string, class_name)
+            self.assertEqual(from_string, expected, class_name)
+
+    def test_bench_streaming(self):
+        benchmark, = [benchmark for benchmark in STREAMING_BENCHMARKS
+                        if benchmark[:3] == ('nxos', 'show_fdb',
+                                             'ShowMacAddressTable')]
+        result, = bench_streaming([benchmark], size=1)
+        self.assertTrue(result['identical'])
+        self.assertGreaterEqual(result['bytes'], 1024 * 1024 - 2579)
+        # The file is read line by line, not held whole
+        self.assertLess(result['file']['peak'], result['bytes'] / 2)
+        self.assertGreater(result['string']['peak'], result['bytes'])
+
+
+if __name__ == '__main__':
+    unittest.main()